@@ -12,6 +12,9 @@ from src.clients.discord import (
     register_global_checks,
     register_image_commands,
 )
+from src.core.bulkhead import bulkhead_stats
+from src.core.circuit_breaker import get_circuit_breaker
+from src.core.haiku_cache import get_haiku_cache
 from src.core.health import (
     HealthChecker,
     ServiceCheck,
@@ -43,14 +46,16 @@ def create_health_checker(bot: DiscordBot) -> HealthChecker:
     async def check_database() -> ServiceCheck:
         """Check database connectivity."""
         try:
-            if bot._repository is None:
-                return ServiceCheck(
-                    name="database",
-                    status=ServiceStatus.UNHEALTHY,
-                    message="Database not initialized",
-                )
+            repository = bot.sqlite_repository
+        except RuntimeError:
+            return ServiceCheck(
+                name="database",
+                status=ServiceStatus.UNHEALTHY,
+                message="Database not initialized",
+            )
+        try:
             # Check that connection exists
-            if bot._repository._connection is None:
+            if not repository.is_connected:
                 return ServiceCheck(
                     name="database",
                     status=ServiceStatus.UNHEALTHY,
@@ -60,6 +65,10 @@ def create_health_checker(bot: DiscordBot) -> HealthChecker:
                 name="database",
                 status=ServiceStatus.HEALTHY,
                 message="Connected",
+                details={
+                    "executor": repository.executor_stats(),
+                    "context_cache": bot.repo.context_cache_stats(),
+                },
             )
         except Exception as ex:
             return ServiceCheck(
@@ -104,6 +113,10 @@ def create_health_checker(bot: DiscordBot) -> HealthChecker:
                 name="anthropic",
                 status=ServiceStatus.HEALTHY,
                 message="API key configured",
+                details={
+                    "haiku_cache": get_haiku_cache().stats().to_dict(),
+                    "bulkheads": bulkhead_stats("anthropic", "haiku"),
+                },
             )
         return ServiceCheck(
             name="anthropic",
@@ -124,6 +137,7 @@ def create_health_checker(bot: DiscordBot) -> HealthChecker:
                 name="fal",
                 status=ServiceStatus.HEALTHY,
                 message="API key configured",
+                details={"bulkheads": bulkhead_stats("fal", "serpapi")},
             )
         return ServiceCheck(
             name="fal",
@@ -135,6 +149,12 @@ def create_health_checker(bot: DiscordBot) -> HealthChecker:
     checker.add_check("discord", check_discord)
     checker.add_check("anthropic", check_anthropic)
     checker.add_check("fal", check_fal)
+    checker.add_circuit_breakers(
+        "anthropic", get_circuit_breaker("anthropic"), get_circuit_breaker("haiku")
+    )
+    checker.add_circuit_breakers(
+        "fal", get_circuit_breaker("fal"), get_circuit_breaker("serpapi")
+    )
 
     return checker
 
@@ -4,18 +4,26 @@ This module contains implementations of the repository protocols
 for various storage backends.
 """
 
+from src.adapters.access_cache import AccessControlCache
+from src.adapters.context_cache import ContextCache
+from src.adapters.db_executor import DatabaseExecutor
 from src.adapters.factory import create_repository
 from src.adapters.gcs_adapter import GCSAdapter, GCSUploadError
 from src.adapters.memory_repository import MemoryRepository
 from src.adapters.repository_compat import WINDOW, RepositoryAdapter
 from src.adapters.sqlite_repository import SQLiteRepository
+from src.adapters.usage_logger import UsageLogger
 
 __all__ = [
+    "AccessControlCache",
+    "ContextCache",
+    "DatabaseExecutor",
     "GCSAdapter",
     "GCSUploadError",
     "MemoryRepository",
     "RepositoryAdapter",
     "SQLiteRepository",
+    "UsageLogger",
     "WINDOW",
     "create_repository",
 ]
@@ -0,0 +1,179 @@
+"""In-process copy of the whitelist and ban list.
+
+Every slash command passes through BanCheckCommandTree.interaction_check,
+which needs to know whether the user is whitelisted, whether they are banned,
+and if so why. Both tables are tiny and only change through the admin
+commands, so AccessControlCache keeps them in memory. RepositoryAdapter loads
+the cache at startup, writes through it when a ban or whitelist entry changes,
+and the bot reloads it periodically to pick up edits made outside this
+process (for example directly in SQLite).
+
+Until the first load completes the cache reports itself as not loaded and
+RepositoryAdapter falls back to querying the database.
+
+Example:
+    cache = AccessControlCache()
+    token = cache.start_reload()
+    whitelist, bans = await repo.get_access_lists()
+    cache.finish_reload(token, whitelist, bans)
+    if cache.is_whitelisted(user_id) and not cache.is_banned(user_id):
+        ...
+"""
+
+from dataclasses import dataclass
+
+from src.core.logging import get_logger
+from src.core.stats import StatsSnapshot
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class AccessControlCacheStats(StatsSnapshot):
+    """Snapshot of access control cache metrics.
+
+    Attributes:
+        lookups: Access checks answered from memory.
+        reloads: Full reloads applied from the database.
+        stale_reloads: Reloads discarded because a write raced them.
+        drift: Entries a reload found out of sync with the database.
+        whitelisted: Users currently whitelisted.
+        banned: Users currently banned.
+    """
+
+    lookups: int = 0
+    reloads: int = 0
+    stale_reloads: int = 0
+    drift: int = 0
+    whitelisted: int = 0
+    banned: int = 0
+
+
+class AccessControlCache:
+    """Whitelisted user IDs and ban reasons held in memory."""
+
+    def __init__(self) -> None:
+        """Initialize an empty, not yet loaded cache."""
+        self._whitelist: set[int] = set()
+        self._bans: dict[int, str] = {}
+        self._loaded = False
+        # Writes bump the generation so a reload that raced a write is discarded
+        self._generation = 0
+        self._stats = AccessControlCacheStats()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the cache holds a full copy of both lists."""
+        return self._loaded
+
+    def is_whitelisted(self, user_id: int) -> bool:
+        """Check if a user is whitelisted.
+
+        Args:
+            user_id: The Discord user ID to check.
+
+        Returns:
+            True if the user is whitelisted, False otherwise.
+        """
+        self._stats.lookups += 1
+        return user_id in self._whitelist
+
+    def is_banned(self, user_id: int) -> bool:
+        """Check if a user is banned.
+
+        Args:
+            user_id: The Discord user ID to check.
+
+        Returns:
+            True if the user is banned, False otherwise.
+        """
+        self._stats.lookups += 1
+        return user_id in self._bans
+
+    def ban_reason(self, user_id: int) -> str | None:
+        """Get the ban reason for a user.
+
+        Args:
+            user_id: The Discord user ID to check.
+
+        Returns:
+            The ban reason if the user is banned, None otherwise.
+        """
+        self._stats.lookups += 1
+        return self._bans.get(user_id)
+
+    def add_whitelisted(self, user_id: int) -> None:
+        """Record that a user was added to the whitelist."""
+        self._generation += 1
+        self._whitelist.add(user_id)
+
+    def remove_whitelisted(self, user_id: int) -> None:
+        """Record that a user was removed from the whitelist."""
+        self._generation += 1
+        self._whitelist.discard(user_id)
+
+    def add_ban(self, user_id: int, reason: str) -> None:
+        """Record that a user was banned."""
+        self._generation += 1
+        self._bans[user_id] = reason
+
+    def remove_ban(self, user_id: int) -> None:
+        """Record that a user was unbanned."""
+        self._generation += 1
+        self._bans.pop(user_id, None)
+
+    def start_reload(self) -> int:
+        """Begin a reload from the database.
+
+        Returns:
+            Token to pass to finish_reload.
+        """
+        return self._generation
+
+    def finish_reload(
+        self,
+        token: int,
+        whitelist: set[int],
+        bans: dict[int, str],
+    ) -> bool:
+        """Replace the cached lists unless a write happened meanwhile.
+
+        Args:
+            token: Value returned by the matching start_reload.
+            whitelist: Every whitelisted user ID.
+            bans: Mapping of every banned user ID to the ban reason.
+
+        Returns:
+            True if the reload was applied.
+        """
+        if token != self._generation:
+            # The lists were read before a write that is already applied here
+            self._stats.stale_reloads += 1
+            return False
+
+        if self._loaded:
+            drift = len(self._whitelist ^ whitelist) + sum(
+                1
+                for user_id in self._bans.keys() | bans.keys()
+                if self._bans.get(user_id) != bans.get(user_id)
+            )
+            if drift:
+                self._stats.drift += drift
+                logger.warning("access_cache_drift_corrected", entries=drift)
+
+        self._whitelist = set(whitelist)
+        self._bans = dict(bans)
+        self._loaded = True
+        self._stats.reloads += 1
+        return True
+
+    def stats(self) -> AccessControlCacheStats:
+        """Return a copy of the current metrics."""
+        return AccessControlCacheStats(
+            lookups=self._stats.lookups,
+            reloads=self._stats.reloads,
+            stale_reloads=self._stats.stale_reloads,
+            drift=self._stats.drift,
+            whitelisted=len(self._whitelist),
+            banned=len(self._bans),
+        )
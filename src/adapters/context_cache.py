@@ -0,0 +1,283 @@
+"""In-process cache of conversation context per channel.
+
+Every /prompt writes the prompt, reads the visible history back, and writes
+the response, so most context reads fetch rows this process just wrote.
+ContextCache keeps the text context of recently active channels in memory.
+RepositoryAdapter writes through it: new messages are appended to the cached
+context after they are saved to SQLite, sliding the context window forward
+trims the cached views to the new watermark, and anything else that hides
+messages (clear, image-limit enforcement, summaries) drops the channel's
+entry.
+
+The cache is an LRU over channels bounded by both channel count and an
+estimate of the bytes held. It assumes this process is the only writer for
+the channels it caches.
+
+Example:
+    cache = ContextCache(max_channels=256)
+    messages = cache.get(channel_id, "All Models")
+    if messages is None:
+        token = cache.start_load(channel_id)
+        messages = await load_from_db()
+        cache.finish_load(channel_id, "All Models", token, messages)
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.logging import get_logger
+from src.core.stats import StatsSnapshot
+
+logger = get_logger(__name__)
+
+# Vendor filter that matches messages from every vendor
+ALL_VENDORS = "All Models"
+
+DEFAULT_MAX_CHANNELS = 256
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Rough per-message overhead of the dict and its keys, on top of the text
+_MESSAGE_OVERHEAD_BYTES = 256
+
+
+@dataclass
+class ContextCacheStats(StatsSnapshot):
+    """Snapshot of context cache metrics.
+
+    Attributes:
+        hits: Reads served from memory.
+        misses: Reads that had to go to the database.
+        evictions: Channels dropped to stay within the size limits.
+        invalidations: Channels dropped because their context changed.
+        channels: Channels currently cached.
+        bytes: Estimated memory held by cached messages.
+    """
+
+    derived = ("hit_ratio",)
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    channels: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of reads served from memory."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+
+class _ChannelEntry:
+    """Cached context views for one channel, keyed by vendor filter."""
+
+    def __init__(self) -> None:
+        self.views: dict[str, list[dict[str, Any]]] = {}
+        self.size = 0
+
+
+class ContextCache:
+    """LRU cache of visible text context, per channel and vendor filter.
+
+    Attributes:
+        max_channels: Maximum number of channels kept in memory.
+        max_bytes: Approximate upper bound on memory held by cached messages.
+    """
+
+    def __init__(
+        self,
+        max_channels: int = DEFAULT_MAX_CHANNELS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_channels: Maximum number of channels kept in memory.
+            max_bytes: Approximate upper bound on memory held by cached messages.
+
+        Raises:
+            ValueError: If either limit is less than 1.
+        """
+        if max_channels < 1 or max_bytes < 1:
+            raise ValueError("max_channels and max_bytes must be at least 1")
+        self.max_channels = max_channels
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[int, _ChannelEntry] = OrderedDict()
+        # Channels with a database load in flight map to (loads, generation).
+        # Writes bump the generation so a load that raced a write is discarded.
+        self._loading: dict[int, tuple[int, int]] = {}
+        self._bytes = 0
+        self._stats = ContextCacheStats()
+
+    def get(self, channel_id: int, vendor_name: str) -> list[dict[str, Any]] | None:
+        """Return a copy of the cached context, or None on a miss.
+
+        Args:
+            channel_id: The Discord channel ID.
+            vendor_name: The vendor filter the context was loaded with.
+
+        Returns:
+            Message dicts in chronological order, or None if not cached.
+        """
+        entry = self._entries.get(channel_id)
+        view = entry.views.get(vendor_name) if entry is not None else None
+        if view is None:
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(channel_id)
+        self._stats.hits += 1
+        return [dict(message) for message in view]
+
+    def start_load(self, channel_id: int) -> int:
+        """Register a database load for a channel that missed.
+
+        Args:
+            channel_id: The Discord channel ID being loaded.
+
+        Returns:
+            Token to pass to finish_load.
+        """
+        loads, generation = self._loading.get(channel_id, (0, 0))
+        self._loading[channel_id] = (loads + 1, generation)
+        return generation
+
+    def finish_load(
+        self,
+        channel_id: int,
+        vendor_name: str,
+        token: int,
+        messages: list[dict[str, Any]] | None,
+    ) -> None:
+        """Store loaded context unless the channel was written meanwhile.
+
+        Args:
+            channel_id: The Discord channel ID that was loaded.
+            vendor_name: The vendor filter the context was loaded with.
+            token: Value returned by the matching start_load.
+            messages: The loaded context, or None if the load failed.
+        """
+        loads, generation = self._loading.pop(channel_id, (1, token))
+        if loads > 1:
+            self._loading[channel_id] = (loads - 1, generation)
+        if messages is None or generation != token:
+            return
+
+        entry = self._entries.get(channel_id)
+        if entry is None:
+            entry = _ChannelEntry()
+            self._entries[channel_id] = entry
+        old_view = entry.views.get(vendor_name, [])
+        view = [dict(message) for message in messages]
+        entry.views[vendor_name] = view
+        self._resize(entry, self._view_size(view) - self._view_size(old_view))
+        self._entries.move_to_end(channel_id)
+        self._evict()
+
+    def append(
+        self,
+        channel_id: int,
+        vendor_name: str,
+        message: dict[str, Any],
+    ) -> None:
+        """Append a newly saved message to the channel's cached views.
+
+        The message is added to the view for its own vendor and to the
+        all-vendors view. Other vendors' views are unaffected. A view that
+        already holds the message, because a load ran after the write
+        committed, is left as is.
+
+        Args:
+            channel_id: The Discord channel ID the message was saved to.
+            vendor_name: The vendor the message was saved under.
+            message: The message dict, in the shape the views hold.
+        """
+        self._bump(channel_id)
+        entry = self._entries.get(channel_id)
+        if entry is None:
+            return
+        message_id = message["channel_message_id"]
+        for view_vendor, view in entry.views.items():
+            if view_vendor not in (vendor_name, ALL_VENDORS):
+                continue
+            # IDs grow with every write, so a loaded copy is always the newest
+            if view and view[-1]["channel_message_id"] >= message_id:
+                continue
+            view.append(dict(message))
+            self._resize(entry, self._message_size(message))
+        self._evict()
+
+    def trim(self, channel_id: int, before_id: int) -> None:
+        """Drop cached messages older than a channel's new watermark.
+
+        Used when the context window slides forward, which hides every
+        message below before_id. The rest of the cached context is kept.
+
+        Args:
+            channel_id: The Discord channel ID whose window moved.
+            before_id: Messages with lower IDs are no longer visible.
+        """
+        self._bump(channel_id)
+        entry = self._entries.get(channel_id)
+        if entry is None:
+            return
+        for vendor_name, view in entry.views.items():
+            kept = [m for m in view if m["channel_message_id"] >= before_id]
+            if len(kept) < len(view):
+                entry.views[vendor_name] = kept
+                self._resize(entry, self._view_size(kept) - self._view_size(view))
+
+    def invalidate(self, channel_id: int) -> None:
+        """Drop every cached view of a channel.
+
+        Args:
+            channel_id: The Discord channel ID whose context changed.
+        """
+        self._bump(channel_id)
+        entry = self._entries.pop(channel_id, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        self._stats.invalidations += 1
+
+    def stats(self) -> ContextCacheStats:
+        """Return a copy of the current cache metrics."""
+        return ContextCacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            invalidations=self._stats.invalidations,
+            channels=len(self._entries),
+            bytes=self._bytes,
+        )
+
+    def _bump(self, channel_id: int) -> None:
+        """Mark in-flight loads of a channel as stale."""
+        if channel_id in self._loading:
+            loads, generation = self._loading[channel_id]
+            self._loading[channel_id] = (loads, generation + 1)
+
+    def _resize(self, entry: _ChannelEntry, delta: int) -> None:
+        entry.size += delta
+        self._bytes += delta
+
+    def _evict(self) -> None:
+        """Drop least recently used channels until within both limits."""
+        while self._entries and (
+            len(self._entries) > self.max_channels or self._bytes > self.max_bytes
+        ):
+            channel_id, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._stats.evictions += 1
+            logger.debug("context_cache_evicted", channel_id=channel_id)
+
+    @classmethod
+    def _view_size(cls, view: list[dict[str, Any]]) -> int:
+        return sum(cls._message_size(message) for message in view)
+
+    @staticmethod
+    def _message_size(message: dict[str, Any]) -> int:
+        return len(message.get("message_data") or "") + _MESSAGE_OVERHEAD_BYTES
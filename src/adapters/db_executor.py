@@ -0,0 +1,210 @@
+"""Dedicated thread pools for database work.
+
+SQLite calls are blocking, so the repository has to run them off the event
+loop. Using asyncio.to_thread puts them on the loop's default executor, where
+they compete with Fal polling, GCS uploads and image compression; when those
+saturate the pool a trivial ban check can wait seconds for a thread.
+
+DatabaseExecutor gives the repository its own threads instead: a single
+writer thread (which also serializes writes) and a pool of reader threads.
+Each lane tracks queue depth and how long jobs waited for a thread.
+
+Example:
+    executor = DatabaseExecutor(reader_threads=4)
+    rows = await executor.run_read(query_sync, conn)
+    await executor.run_write(insert_sync, conn)
+    print(executor.stats())
+    await executor.shutdown()
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, ParamSpec, TypeVar
+
+from src.core.logging import get_logger
+from src.core.stats import StatsSnapshot
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Jobs that wait longer than this for a thread are logged as warnings
+SLOW_QUEUE_WAIT_SECONDS = 1.0
+
+
+@dataclass
+class LaneStats(StatsSnapshot):
+    """Snapshot of queue and timing metrics for one executor lane.
+
+    Attributes:
+        threads: Number of worker threads serving the lane.
+        queue_depth: Jobs submitted but not yet picked up by a thread.
+        in_flight: Jobs currently running on a thread.
+        completed: Jobs finished since the executor started.
+        total_wait_ms: Sum of time jobs spent waiting for a thread.
+        max_wait_ms: Longest time any job spent waiting for a thread.
+    """
+
+    derived = ("avg_wait_ms",)
+    hidden = ("total_wait_ms",)
+    precision = 2
+
+    threads: int
+    queue_depth: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        """Average time a completed job waited for a thread."""
+        if self.completed == 0:
+            return 0.0
+        return self.total_wait_ms / self.completed
+
+
+class _Lane:
+    """A thread pool plus the counters describing its backlog."""
+
+    def __init__(self, name: str, threads: int) -> None:
+        self.name = name
+        self._pool = ThreadPoolExecutor(
+            max_workers=threads,
+            thread_name_prefix=f"db-{name}",
+        )
+        self._stats = LaneStats(threads=threads)
+        self._lock = threading.Lock()
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run func on this lane's threads and await the result."""
+        submitted_at = time.monotonic()
+        # started/abandoned are shared with the worker thread and guarded by
+        # the lane lock so a cancelled job is never counted twice
+        job = {"started": False, "abandoned": False}
+        with self._lock:
+            self._stats.queue_depth += 1
+
+        def call() -> T:
+            self._record_start(job, time.monotonic() - submitted_at)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._stats.in_flight -= 1
+                    self._stats.completed += 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._pool, call)
+        finally:
+            with self._lock:
+                if not job["started"]:
+                    # Cancelled before a thread picked it up
+                    job["abandoned"] = True
+                    self._stats.queue_depth -= 1
+
+    def _record_start(self, job: dict[str, bool], waited: float) -> None:
+        """Move a job from queued to in-flight and record its wait."""
+        waited_ms = waited * 1000
+        with self._lock:
+            job["started"] = True
+            if not job["abandoned"]:
+                self._stats.queue_depth -= 1
+            self._stats.in_flight += 1
+            self._stats.total_wait_ms += waited_ms
+            self._stats.max_wait_ms = max(self._stats.max_wait_ms, waited_ms)
+            queue_depth = self._stats.queue_depth
+        if waited >= SLOW_QUEUE_WAIT_SECONDS:
+            logger.warning(
+                "db_queue_wait_slow",
+                lane=self.name,
+                wait_ms=round(waited_ms, 2),
+                queue_depth=queue_depth,
+            )
+
+    def stats(self) -> LaneStats:
+        """Return a copy of the current lane metrics."""
+        with self._lock:
+            return LaneStats(**vars(self._stats))
+
+    def shutdown(self) -> None:
+        """Wait for queued jobs to finish and stop the threads."""
+        self._pool.shutdown(wait=True)
+
+
+class DatabaseExecutor:
+    """Isolated thread pools for blocking database calls.
+
+    Writes run on a single thread, so they execute strictly in submission
+    order. Reads run on a separate pool sized for the reader connections.
+
+    Attributes:
+        reader_threads: Number of threads in the read lane.
+    """
+
+    def __init__(self, reader_threads: int) -> None:
+        """Initialize the executor.
+
+        Args:
+            reader_threads: Number of threads serving read jobs.
+
+        Raises:
+            ValueError: If reader_threads is less than 1.
+        """
+        if reader_threads < 1:
+            raise ValueError("reader_threads must be at least 1")
+        self.reader_threads = reader_threads
+        self._writer = _Lane("writer", 1)
+        self._readers = _Lane("reader", reader_threads)
+
+    async def run_read(
+        self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run a blocking read on the reader threads.
+
+        Args:
+            func: Blocking function to call.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            Whatever func returns.
+        """
+        return await self._readers.run(func, *args, **kwargs)
+
+    async def run_write(
+        self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run a blocking write on the single writer thread.
+
+        Args:
+            func: Blocking function to call.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            Whatever func returns.
+        """
+        return await self._writer.run(func, *args, **kwargs)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get queue-depth and wait-time metrics for both lanes.
+
+        Returns:
+            Dict with "reader" and "writer" entries (see LaneStats.to_dict).
+        """
+        return {
+            "reader": self._readers.stats().to_dict(),
+            "writer": self._writer.stats().to_dict(),
+        }
+
+    async def shutdown(self) -> None:
+        """Finish queued jobs and stop all threads."""
+        await asyncio.to_thread(self._readers.shutdown)
+        await asyncio.to_thread(self._writer.shutdown)
@@ -15,11 +15,14 @@ from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from src.core.conversation import SUMMARY_PROMPT
+from src.core.token_counting import try_count_tokens
 from src.ports.repositories import (
     ApiKey,
     Channel,
     Message,
     MessageImage,
+    UsageEvent,
     Vendor,
 )
 
@@ -61,6 +64,13 @@ class MemoryRepository:
         self._messages: list[Message] = []
         self._message_id_counter: int = 1
 
+        # Unfilled summary slots: slot message id -> (channel external id,
+        # id of the summary prompt saved ahead of the slot)
+        self._summary_slots: dict[int, tuple[int, int]] = {}
+
+        # Rolling summaries: channel external id -> summary message id
+        self._channel_summaries: dict[int, int] = {}
+
         # API Key storage: key_hash -> ApiKey
         self._api_keys: dict[str, ApiKey] = {}
         self._api_key_id_counter: int = 1
@@ -216,6 +226,7 @@ class MemoryRepository:
             message,
             id=self._message_id_counter,
             timestamp=self._now() if message.timestamp is None else message.timestamp,
+            token_count=self._message_token_count(message),
         )
         self._messages.append(new_message)
         self._message_id_counter += 1
@@ -244,12 +255,20 @@ class MemoryRepository:
             id=self._message_id_counter,
             timestamp=self._now() if message.timestamp is None else message.timestamp,
             images=images,
+            token_count=self._message_token_count(message),
         )
         self._messages.append(new_message)
         self._message_id_counter += 1
 
         return new_message.id  # type: ignore[return-value]
 
+    @staticmethod
+    def _message_token_count(message: Message) -> int | None:
+        """Return the message's token count, counting it if the caller did not."""
+        if message.token_count is not None:
+            return message.token_count
+        return try_count_tokens(message.content)
+
     async def get_visible_messages(
         self,
         channel_external_id: int,
@@ -291,6 +310,34 @@ class MemoryRepository:
         result.sort(key=lambda m: m.timestamp or datetime.min.replace(tzinfo=UTC))
         return result
 
+    async def get_visible_text_messages(
+        self,
+        channel_external_id: int,
+        vendor_name: str,
+    ) -> list[Message]:
+        """Get visible messages for text context without their images."""
+        visible = await self.get_visible_messages(channel_external_id, vendor_name)
+        return [replace(msg, images=[]) for msg in visible]
+
+    async def load_message_images(
+        self,
+        message_ids: list[int],
+    ) -> dict[int, list[MessageImage]]:
+        """Load images for the given messages."""
+        self._ensure_connected()
+
+        wanted = set(message_ids)
+        return {
+            msg.id: list(msg.images)
+            for msg in self._messages
+            if msg.id in wanted and msg.id is not None and msg.images
+        }
+
+    async def get_context_token_count(self, channel_external_id: int) -> int:
+        """Get the total token count of a channel's text context."""
+        context = await self.get_visible_text_messages(channel_external_id, "All Models")
+        return sum(msg.token_count or 0 for msg in context)
+
     async def get_latest_messages(
         self,
         channel_external_id: int,
@@ -363,7 +410,7 @@ class MemoryRepository:
         channel_external_id: int,
         vendor_name: str,
         window_size: int,
-    ) -> None:
+    ) -> int | None:
         """Mark messages outside the context window as inactive."""
         self._ensure_connected()
 
@@ -389,11 +436,19 @@ class MemoryRepository:
             reverse=True,
         )
 
+        if len(visible_messages) <= window_size:
+            return None
+
         # Mark messages beyond window_size as invisible
         for idx, (list_index, msg) in enumerate(visible_messages):
             if idx >= window_size:
                 self._messages[list_index] = replace(msg, visible=False)
 
+        kept = [msg.id or 0 for _, msg in visible_messages[:window_size]]
+        if kept:
+            return min(kept)
+        return max(msg.id or 0 for _, msg in visible_messages) + 1
+
     async def clear_messages(
         self,
         channel_external_id: int,
@@ -415,6 +470,14 @@ class MemoryRepository:
 
             self._messages[i] = replace(msg, visible=False)
 
+        # A full clear supersedes any summary still being generated
+        if vendor_name == "All Models":
+            self._summary_slots = {
+                slot_id: slot
+                for slot_id, slot in self._summary_slots.items()
+                if slot[0] != channel_external_id
+            }
+
     async def deactivate_image_messages(
         self,
         channel_external_id: int,
@@ -439,6 +502,90 @@ class MemoryRepository:
             if msg.id in message_id_set:
                 self._messages[i] = replace(msg, visible=False)
 
+    async def reserve_summary_slot(
+        self,
+        channel_external_id: int,
+        vendor_name: str,
+    ) -> int:
+        """Reserve the position a background summary will take in the context."""
+        self._ensure_connected()
+
+        vendor = self._vendors.get(vendor_name)
+        if vendor is None:
+            raise ValueError(f"Vendor {vendor_name} not found")
+
+        prompt_id = await self.save_message(
+            Message(
+                channel_id=channel_external_id,
+                vendor_id=vendor.id,
+                message_type="prompt",
+                content=SUMMARY_PROMPT,
+                visible=False,
+            )
+        )
+        slot_id = await self.save_message(
+            Message(
+                channel_id=channel_external_id,
+                vendor_id=vendor.id,
+                message_type="assistant",
+                content="",
+                visible=False,
+                token_count=0,
+            )
+        )
+        self._summary_slots[slot_id] = (channel_external_id, prompt_id)
+        return slot_id
+
+    async def fill_summary_slot(
+        self,
+        channel_external_id: int,
+        slot_id: int,
+        summary: str,
+        token_count: int | None,
+    ) -> bool:
+        """Atomically replace the context before a slot with its summary."""
+        self._ensure_connected()
+
+        slot = self._summary_slots.get(slot_id)
+        if slot is None or slot[0] != channel_external_id:
+            return False
+        del self._summary_slots[slot_id]
+        prompt_id = slot[1]
+
+        for i, msg in enumerate(self._messages):
+            if msg.channel_id != channel_external_id or msg.id is None:
+                continue
+            if msg.id == slot_id:
+                self._messages[i] = replace(
+                    msg, content=summary, token_count=token_count, visible=True
+                )
+            elif msg.id == prompt_id:
+                self._messages[i] = replace(msg, visible=True)
+            elif msg.id < slot_id and msg.visible:
+                self._messages[i] = replace(msg, visible=False)
+        self._channel_summaries[channel_external_id] = slot_id
+        return True
+
+    async def release_summary_slot(self, slot_id: int) -> None:
+        """Delete a summary placeholder and its prompt if it was not filled."""
+        self._ensure_connected()
+
+        slot = self._summary_slots.pop(slot_id, None)
+        if slot is None:
+            return
+        released = {slot_id, slot[1]}
+        self._messages = [msg for msg in self._messages if msg.id not in released]
+
+    async def get_rolling_summary(self, channel_external_id: int) -> Message | None:
+        """Get the channel's rolling summary if it is still in the context."""
+        self._ensure_connected()
+
+        summary_id = self._channel_summaries.get(channel_external_id)
+        for msg in self._messages:
+            if msg.id == summary_id and msg.visible:
+                return replace(msg, images=[])
+        return None
+
     # =========================================================================
     # AsyncRateLimitRepository Implementation
     # =========================================================================
@@ -619,6 +766,16 @@ class MemoryRepository:
         self._ensure_connected()
         return user_id in self._bans
 
+    async def get_access_lists(self) -> tuple[set[int], dict[int, str]]:
+        """Get every whitelisted user ID and every ban, for in-memory checks.
+
+        Returns:
+            Tuple of (whitelisted user IDs, mapping of banned user ID to reason).
+        """
+        self._ensure_connected()
+        bans = {user_id: ban[1] for user_id, ban in self._bans.items()}
+        return set(self._whitelist), bans
+
     async def get_ban_reason(self, user_id: int) -> str | None:
         """Get the ban reason for a user.
 
@@ -966,6 +1123,31 @@ class MemoryRepository:
         })
         self._usage_log_id_counter += 1
 
+    async def log_command_usage_batch(self, events: list[UsageEvent]) -> int:
+        """Log a batch of command usage events.
+
+        Only events for whitelisted, unbanned users are recorded.
+        """
+        self._ensure_connected()
+
+        written = 0
+        for event in events:
+            if event.user_id not in self._whitelist or event.user_id in self._bans:
+                continue
+            self._usage_log.append({
+                "id": self._usage_log_id_counter,
+                "user_id": event.user_id,
+                "username": event.username,
+                "guild_id": event.guild_id,
+                "command_name": event.command_name,
+                "command_type": event.command_type,
+                "outcome": event.outcome,
+                "timestamp": event.timestamp.isoformat(),
+            })
+            self._usage_log_id_counter += 1
+            written += 1
+        return written
+
     async def get_top_users_by_usage(
         self,
         guild_id: int | None,
@@ -1151,6 +1333,8 @@ class MemoryRepository:
 
         self._messages.clear()
         self._message_id_counter = 1
+        self._summary_slots.clear()
+        self._channel_summaries.clear()
 
         self._api_keys.clear()
         self._api_key_id_counter = 1
@@ -10,12 +10,16 @@ All methods are async and delegate to the underlying repository.
 
 import asyncio
 import json
+from datetime import UTC, datetime
 from os import getenv
 from typing import Any, cast
 
+from src.adapters.access_cache import AccessControlCache
+from src.adapters.context_cache import ContextCache
 from src.adapters.sqlite_repository import SQLiteRepository
 from src.core.logging import get_logger
-from src.ports.repositories import Message
+from src.core.token_counting import try_count_tokens
+from src.ports.repositories import Message, UsageEvent
 
 logger = get_logger(__name__)
 
@@ -39,6 +43,8 @@ class RepositoryAdapter:
     - Vendor validation from allowed_vendors.json
     - Channel creation
     - Message storage and retrieval
+    - Caching of per-channel text context (write-through)
+    - Caching of the whitelist and ban list (write-through)
     - Rate limit enforcement
 
     Example:
@@ -52,14 +58,25 @@ class RepositoryAdapter:
         await adapter.add_message(channel_id, 'Anthropic', 'prompt', False, "Hello")
     """
 
-    def __init__(self, repository: SQLiteRepository) -> None:
+    def __init__(
+        self,
+        repository: SQLiteRepository,
+        context_cache: ContextCache | None = None,
+        access_cache: AccessControlCache | None = None,
+    ) -> None:
         """Initialize the adapter with a repository instance.
 
         Args:
             repository: An already-connected SQLiteRepository instance.
+            context_cache: Cache for get_visible_text_messages. Defaults to a
+                ContextCache with default limits.
+            access_cache: Cache for whitelist and ban checks. Defaults to an
+                empty AccessControlCache; call reload_access_lists() to fill it.
         """
         self._repo = repository
         self._vendor_cache: dict[str, int] = {}
+        self._context_cache = context_cache or ContextCache()
+        self._access_cache = access_cache or AccessControlCache()
 
     async def validate_vendors(self) -> None:
         """Load vendors from allowed_vendors.json and ensure they exist in DB.
@@ -141,7 +158,7 @@ class RepositoryAdapter:
         is_image_prompt: bool,
         message_data: str,
         is_image_only_context: bool = False,
-    ) -> None:
+    ) -> int:
         """Add a message to the database.
 
         Args:
@@ -153,6 +170,9 @@ class RepositoryAdapter:
             is_image_only_context: Whether this message is for image-only context.
                 When True, excluded from /prompt text context but available for
                 /describe_this and /modify_image commands.
+
+        Returns:
+            The ID of the saved message.
         """
         logger.debug("Adding message to database...")
         vendor_id = await self._get_vendor_id(vendor_name)
@@ -163,9 +183,13 @@ class RepositoryAdapter:
             content=message_data,
             is_image_prompt=is_image_prompt,
             is_image_only_context=is_image_only_context,
+            # Counted here so the stored and cached counts are the same value
+            token_count=await asyncio.to_thread(try_count_tokens, message_data),
         )
-        await self._repo.save_message(message)
+        message_id = await self._repo.save_message(message)
+        self._cache_new_message(message_id, vendor_name, message)
         logger.debug("Message added to database.")
+        return message_id
 
     async def add_message_with_images(
         self,
@@ -202,10 +226,13 @@ class RepositoryAdapter:
             content=message_data,
             is_image_prompt=is_image_prompt,
             is_image_only_context=is_image_only_context,
+            # Counted here so the stored and cached counts are the same value
+            token_count=await asyncio.to_thread(try_count_tokens, message_data),
         )
         # Parse the images JSON to extract URLs/data
         image_urls = json.loads(message_images) if message_images else []
-        await self._repo.save_message_with_images(message, image_urls)
+        message_id = await self._repo.save_message_with_images(message, image_urls)
+        self._cache_new_message(message_id, vendor_name, message)
         logger.debug("Message with images added to database.")
 
         # Enforce carousel image limit by deactivating oldest image messages
@@ -257,6 +284,7 @@ class RepositoryAdapter:
                 await self._repo.deactivate_image_messages(
                     discord_id, messages_to_deactivate
                 )
+                self._context_cache.invalidate(discord_id)
                 logger.debug(
                     f"Deactivated {len(messages_to_deactivate)} old image messages "
                     f"for channel {discord_id} to enforce {MAX_CAROUSEL_IMAGES}-image limit."
@@ -286,6 +314,52 @@ class RepositoryAdapter:
         )
         return result
 
+    async def get_visible_text_messages(
+        self,
+        discord_id: int,
+        vendor_name: str,
+    ) -> list[dict[str, Any]]:
+        """Get visible messages for building chat context, without images.
+
+        Same rows as get_visible_messages, but image data is never read, so
+        "message_images" is always "[]". Use this for text-only consumers
+        such as convert_context_to_messages. Results are served from the
+        context cache when the channel is cached.
+
+        Args:
+            discord_id: The Discord channel ID.
+            vendor_name: The vendor name to filter by (or 'All Models').
+
+        Returns:
+            List of message dictionaries in chronological order.
+        """
+        cached = self._context_cache.get(discord_id, vendor_name)
+        if cached is not None:
+            return cached
+
+        token = self._context_cache.start_load(discord_id)
+        result: list[dict[str, Any]] | None = None
+        try:
+            messages = await self._repo.get_visible_text_messages(discord_id, vendor_name)
+            result = [self._message_to_dict(msg) for msg in messages]
+        finally:
+            self._context_cache.finish_load(discord_id, vendor_name, token, result)
+        return result
+
+    async def get_context_token_count(self, discord_id: int) -> int:
+        """Get the running token total of a channel's text context.
+
+        The total is maintained as messages are saved and hidden, so this is
+        a single-row lookup regardless of conversation length.
+
+        Args:
+            discord_id: The Discord channel ID.
+
+        Returns:
+            Approximate tokens across the "All Models" text context.
+        """
+        return await self._repo.get_context_token_count(discord_id)
+
     async def get_latest_images(
         self,
         discord_id: int,
@@ -396,7 +470,17 @@ class RepositoryAdapter:
         logger.debug(
             f"Deactivating old messages for channel {discord_id} and vendor {vendor_name}..."
         )
-        await self._repo.deactivate_old_messages(discord_id, vendor_name, window)
+        cutoff = await self._repo.deactivate_old_messages(
+            discord_id, vendor_name, window
+        )
+        if vendor_name == "All Models":
+            # Busy channels slide their window every turn; keep what is left
+            if cutoff is not None:
+                self._context_cache.trim(discord_id, cutoff)
+        else:
+            # Cached views do not record vendors, so one vendor's rows cannot
+            # be picked out of the all-vendors view
+            self._context_cache.invalidate(discord_id)
         logger.debug(
             f"Old messages deactivated for channel {discord_id} and vendor {vendor_name}."
         )
@@ -416,10 +500,76 @@ class RepositoryAdapter:
             f"Clearing messages for channel {discord_id} and vendor {vendor_name}..."
         )
         await self._repo.clear_messages(discord_id, vendor_name)
+        self._context_cache.invalidate(discord_id)
         logger.debug(
             f"Messages cleared for channel {discord_id} and vendor {vendor_name}."
         )
 
+    async def reserve_summary_slot(
+        self,
+        discord_id: int,
+        vendor_name: str = TEXT_VENDOR_NAME,
+    ) -> int:
+        """Reserve the context position for a background summary.
+
+        Call before reading the context to summarize: every message older
+        than the slot is replaced when the slot is filled, and messages saved
+        after it are kept.
+
+        Args:
+            discord_id: The Discord channel ID.
+            vendor_name: The vendor the summary is saved under.
+
+        Returns:
+            The slot ID to pass to fill_summary_slot or release_summary_slot.
+        """
+        return await self._repo.reserve_summary_slot(discord_id, vendor_name)
+
+    async def fill_summary_slot(
+        self,
+        discord_id: int,
+        slot_id: int,
+        summary: str,
+    ) -> bool:
+        """Swap a summary in for the context older than its slot.
+
+        Args:
+            discord_id: The Discord channel ID.
+            slot_id: ID returned by reserve_summary_slot.
+            summary: The summary text.
+
+        Returns:
+            True if the summary was applied, False if the context was cleared
+            or summarized after the slot was reserved.
+        """
+        token_count = await asyncio.to_thread(try_count_tokens, summary)
+        filled = await self._repo.fill_summary_slot(
+            discord_id, slot_id, summary, token_count
+        )
+        if filled:
+            self._context_cache.invalidate(discord_id)
+        return filled
+
+    async def release_summary_slot(self, slot_id: int) -> None:
+        """Discard a summary slot that will not be filled.
+
+        Args:
+            slot_id: ID returned by reserve_summary_slot.
+        """
+        await self._repo.release_summary_slot(slot_id)
+
+    async def get_rolling_summary(self, discord_id: int) -> dict[str, Any] | None:
+        """Get the channel's rolling summary, if it is still in the context.
+
+        Args:
+            discord_id: The Discord channel ID.
+
+        Returns:
+            The summary message dict, or None.
+        """
+        message = await self._repo.get_rolling_summary(discord_id)
+        return self._message_to_dict(message) if message is not None else None
+
     async def enforce_text_rate_limits(
         self,
         channel_id: int,
@@ -470,6 +620,54 @@ class RepositoryAdapter:
             logger.warning("image_rate_limit_exceeded", channel_id=channel_id)
             return False
 
+    def _cache_new_message(
+        self,
+        message_id: int,
+        vendor_name: str,
+        message: Message,
+    ) -> None:
+        """Write a just-saved message through to the context cache.
+
+        Image prompts and image-only messages are not part of the text
+        context, so they leave the cache untouched.
+
+        Args:
+            message_id: ID the repository assigned to the message.
+            vendor_name: The vendor the message was saved under.
+            message: The message that was saved.
+        """
+        if message.is_image_prompt or message.is_image_only_context:
+            return
+        self._context_cache.append(
+            message.channel_id,
+            vendor_name,
+            {
+                "channel_message_id": message_id,
+                "message_type": message.message_type,
+                "message_data": message.content,
+                "message_images": "[]",
+                # Same format as SQLite's CURRENT_TIMESTAMP default
+                "message_timestamp": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+                "token_count": message.token_count,
+            },
+        )
+
+    def context_cache_stats(self) -> dict[str, Any]:
+        """Get hit/miss and size metrics for the context cache.
+
+        Returns:
+            Dict of cache metrics (see ContextCacheStats.to_dict).
+        """
+        return self._context_cache.stats().to_dict()
+
+    def access_cache_stats(self) -> dict[str, Any]:
+        """Get lookup and reload metrics for the access control cache.
+
+        Returns:
+            Dict of cache metrics (see AccessControlCacheStats.to_dict).
+        """
+        return self._access_cache.stats().to_dict()
+
     @staticmethod
     def _message_to_dict(message: Message) -> dict[str, Any]:
         """Convert a Message object to a dict for backward compatibility.
@@ -491,12 +689,28 @@ class RepositoryAdapter:
             "message_data": message.content,
             "message_images": json.dumps(images_data) if images_data else "[]",
             "message_timestamp": message.timestamp,
+            "token_count": message.token_count,
         }
 
     # =========================================================================
     # Ban Management Methods
     # =========================================================================
 
+    async def reload_access_lists(self) -> bool:
+        """Load the whitelist and ban list from the database into memory.
+
+        Called at startup and then periodically to pick up changes made
+        outside this process. A reload that overlaps a ban or whitelist
+        change made through this adapter is discarded, since the change is
+        already applied in memory and the lists read may predate it.
+
+        Returns:
+            True if the cache was replaced with the lists read.
+        """
+        token = self._access_cache.start_reload()
+        whitelist, bans = await self._repo.get_access_lists()
+        return self._access_cache.finish_reload(token, whitelist, bans)
+
     async def is_user_banned(self, user_id: int) -> bool:
         """Check if a user is banned.
 
@@ -506,6 +720,8 @@ class RepositoryAdapter:
         Returns:
             True if the user is banned, False otherwise.
         """
+        if self._access_cache.loaded:
+            return self._access_cache.is_banned(user_id)
         return await self._repo.is_user_banned(user_id)
 
     async def get_ban_reason(self, user_id: int) -> str | None:
@@ -517,6 +733,8 @@ class RepositoryAdapter:
         Returns:
             The ban reason if the user is banned, None otherwise.
         """
+        if self._access_cache.loaded:
+            return self._access_cache.ban_reason(user_id)
         return await self._repo.get_ban_reason(user_id)
 
     async def add_ban(
@@ -535,6 +753,7 @@ class RepositoryAdapter:
             performed_by: The username of the person performing the ban.
         """
         await self._repo.add_ban(user_id, username, reason, performed_by)
+        self._access_cache.add_ban(user_id, reason)
 
     async def remove_ban(self, user_id: int, performed_by: str) -> None:
         """Remove a ban for a user.
@@ -544,6 +763,7 @@ class RepositoryAdapter:
             performed_by: The username of the person performing the unban.
         """
         await self._repo.remove_ban(user_id, performed_by)
+        self._access_cache.remove_ban(user_id)
 
     # =========================================================================
     # Preset Management Methods
@@ -712,6 +932,20 @@ class RepositoryAdapter:
             user_id, username, guild_id, command_name, command_type, outcome
         )
 
+    async def log_command_usage_batch(self, events: list[UsageEvent]) -> int:
+        """Log a batch of command usage events in one transaction.
+
+        Events for users who are not whitelisted, or who are banned, are
+        skipped.
+
+        Args:
+            events: The usage events to record.
+
+        Returns:
+            Number of events written to the usage log.
+        """
+        return await self._repo.log_command_usage_batch(events)
+
     async def get_top_users_by_usage(
         self,
         guild_id: int | None,
@@ -762,6 +996,8 @@ class RepositoryAdapter:
         Returns:
             True if the user is whitelisted, False otherwise.
         """
+        if self._access_cache.loaded:
+            return self._access_cache.is_whitelisted(user_id)
         return await self._repo.is_user_whitelisted(user_id)
 
     async def get_whitelist_entry(self, user_id: int) -> dict[str, Any] | None:
@@ -791,6 +1027,7 @@ class RepositoryAdapter:
             notes: Optional notes about the user.
         """
         await self._repo.add_to_whitelist(user_id, username, added_by, notes)
+        self._access_cache.add_whitelisted(user_id)
 
     async def remove_from_whitelist(self, user_id: int) -> None:
         """Remove a user from the whitelist.
@@ -799,6 +1036,7 @@ class RepositoryAdapter:
             user_id: The Discord user ID to remove.
         """
         await self._repo.remove_from_whitelist(user_id)
+        self._access_cache.remove_whitelisted(user_id)
 
     async def list_whitelist(self) -> list[dict[str, Any]]:
         """List all whitelisted users.
@@ -6,22 +6,37 @@ This module provides a SQLite-backed implementation of all repository protocols:
 - MessageRepository
 - RateLimitRepository
 
-All methods are async, wrapping synchronous sqlite3 calls with asyncio.to_thread.
-The class supports both file-based and in-memory (:memory:) databases.
+All methods are async. Synchronous sqlite3 calls run on the repository's own
+DatabaseExecutor (one writer thread plus reader threads) rather than the event
+loop's default executor, so database latency is isolated from other blocking
+work. Reads go through `_read` and writes through `_write`, which serializes
+them on a single writer connection. The class supports both file-based and in-memory
+(:memory:) databases; file-based databases can opt into WAL mode with a pool of
+read-only connections.
 """
 
 import asyncio
+import base64
+import binascii
+import hashlib
 import json
 import sqlite3
+import time
+from collections.abc import Callable
+from datetime import UTC
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
+from src.adapters.db_executor import DatabaseExecutor
+from src.core.conversation import SUMMARY_PROMPT
 from src.core.logging import get_logger
+from src.core.token_counting import try_count_tokens
 from src.ports.repositories import (
     ApiKey,
     Channel,
     Message,
     MessageImage,
+    UsageEvent,
     Vendor,
 )
 
@@ -65,6 +80,33 @@ CREATE TABLE IF NOT EXISTS channel_messages(
 );
 """
 
+_CREATE_IMAGE_BLOBS_TABLE = """
+CREATE TABLE IF NOT EXISTS image_blobs(
+    blob_hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    byte_size INTEGER NOT NULL,
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Messages are only soft-deleted today, but if rows are ever purged their blob
+# references are released and unreferenced blobs are dropped with them
+_CREATE_RELEASE_IMAGE_BLOBS_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS trg_channel_messages_release_image_blobs
+AFTER DELETE ON channel_messages
+BEGIN
+    UPDATE image_blobs
+    SET ref_count = ref_count - 1
+    WHERE blob_hash IN (
+        SELECT json_extract(value, '$.blob')
+        FROM json_each(OLD.message_images)
+        WHERE json_type(value) = 'object'
+    );
+    DELETE FROM image_blobs WHERE ref_count <= 0;
+END;
+"""
+
 _CREATE_API_KEYS_TABLE = """
 CREATE TABLE IF NOT EXISTS api_keys(
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -206,6 +248,282 @@ CREATE INDEX IF NOT EXISTS idx_usage_log_timestamp
 ON usage_log(timestamp);
 """
 
+# =============================================================================
+# Schema Migrations
+# =============================================================================
+
+# Channels created concurrently before discord_id was unique may be duplicated.
+# Messages are repointed at the oldest row for each discord_id before the
+# extra rows are dropped, so the unique index can be built.
+_REPOINT_DUPLICATE_CHANNEL_MESSAGES = """
+UPDATE channel_messages
+SET channel_id = (
+    SELECT MIN(keeper.channel_id)
+    FROM channels AS keeper
+    JOIN channels AS current
+        ON current.discord_id = keeper.discord_id
+    WHERE current.channel_id = channel_messages.channel_id
+)
+WHERE channel_id NOT IN (SELECT MIN(channel_id) FROM channels GROUP BY discord_id)
+;
+"""
+
+_DELETE_DUPLICATE_CHANNELS = """
+DELETE FROM channels
+WHERE channel_id NOT IN (SELECT MIN(channel_id) FROM channels GROUP BY discord_id)
+;
+"""
+
+_CREATE_CHANNELS_DISCORD_ID_INDEX = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_channels_discord_id
+ON channels(discord_id);
+"""
+
+# Serves the context, image and deactivate queries, which filter on channel
+# and visibility and order by timestamp
+_CREATE_CHANNEL_MESSAGES_CONTEXT_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_channel_messages_context
+ON channel_messages(channel_id, visible, is_image_prompt, message_timestamp);
+"""
+
+# Serves the rate-limit counts, which filter on channel, type and time range
+_CREATE_CHANNEL_MESSAGES_TYPE_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_channel_messages_type
+ON channel_messages(channel_id, message_type, message_timestamp);
+"""
+
+_ADD_CHANNELS_VISIBLE_FROM_ID = """
+ALTER TABLE channels ADD COLUMN visible_from_id INTEGER NOT NULL DEFAULT 0;
+"""
+
+# Start each channel's window at its oldest visible message (or past its
+# newest message when nothing is visible), so hidden history is skipped
+_BACKFILL_CHANNELS_VISIBLE_FROM_ID = """
+UPDATE channels
+SET visible_from_id = COALESCE(
+    (
+        SELECT MIN(channel_message_id)
+        FROM channel_messages
+        WHERE channel_messages.channel_id = channels.channel_id
+        AND visible = TRUE
+    ),
+    (
+        SELECT MAX(channel_message_id) + 1
+        FROM channel_messages
+        WHERE channel_messages.channel_id = channels.channel_id
+    ),
+    0
+)
+;
+"""
+
+_DROP_CHANNEL_MESSAGES_CONTEXT_INDEX = """
+DROP INDEX IF EXISTS idx_channel_messages_context;
+"""
+
+# Context queries are a range scan from the channel's watermark
+_CREATE_CHANNEL_MESSAGES_WINDOW_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_channel_messages_window
+ON channel_messages(channel_id, channel_message_id);
+"""
+
+_ADD_CHANNEL_MESSAGES_TOKEN_COUNT = """
+ALTER TABLE channel_messages ADD COLUMN token_count INTEGER;
+"""
+
+_ADD_CHANNELS_CONTEXT_TOKEN_COUNT = """
+ALTER TABLE channels ADD COLUMN context_token_count INTEGER NOT NULL DEFAULT 0;
+"""
+
+# Only rows still waiting for the token backfill are indexed, so the check on
+# connect stays cheap once every row has been counted
+_CREATE_CHANNEL_MESSAGES_UNCOUNTED_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_channel_messages_uncounted
+ON channel_messages(channel_message_id)
+WHERE token_count IS NULL;
+"""
+
+# channels.context_token_count is the sum of token_count over the channel's
+# text context: visible rows at or above the watermark that are neither image
+# prompts nor image-only context. These triggers keep it in step with every
+# write that changes that set, whichever code path performs it.
+_CREATE_COUNT_INSERTED_TOKENS_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS count_inserted_message_tokens
+AFTER INSERT ON channel_messages
+WHEN NEW.visible AND NOT NEW.is_image_prompt AND NOT NEW.is_image_only_context
+BEGIN
+    UPDATE channels
+    SET context_token_count = context_token_count + COALESCE(NEW.token_count, 0)
+    WHERE channel_id = NEW.channel_id
+    AND NEW.channel_message_id >= visible_from_id;
+END;
+"""
+
+_CREATE_COUNT_VISIBILITY_TOKENS_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS count_message_visibility_tokens
+AFTER UPDATE OF visible ON channel_messages
+WHEN OLD.visible != NEW.visible
+AND NOT NEW.is_image_prompt AND NOT NEW.is_image_only_context
+BEGIN
+    UPDATE channels
+    SET context_token_count = context_token_count
+        + CASE WHEN NEW.visible THEN 1 ELSE -1 END * COALESCE(NEW.token_count, 0)
+    WHERE channel_id = NEW.channel_id
+    AND NEW.channel_message_id >= visible_from_id;
+END;
+"""
+
+_CREATE_COUNT_WATERMARK_TOKENS_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS count_watermark_tokens
+AFTER UPDATE OF visible_from_id ON channels
+WHEN NEW.visible_from_id > OLD.visible_from_id
+BEGIN
+    UPDATE channels
+    SET context_token_count = context_token_count - (
+        SELECT COALESCE(SUM(token_count), 0)
+        FROM channel_messages
+        WHERE channel_id = NEW.channel_id
+        AND channel_message_id >= OLD.visible_from_id
+        AND channel_message_id < NEW.visible_from_id
+        AND visible = TRUE
+        AND is_image_prompt = FALSE
+        AND is_image_only_context = FALSE
+    )
+    WHERE channel_id = NEW.channel_id;
+END;
+"""
+
+# Id of the message holding the channel's rolling summary. Everything older
+# has been folded into it; later summaries only add the messages after it.
+_ADD_CHANNELS_SUMMARY_MESSAGE_ID = """
+ALTER TABLE channels ADD COLUMN summary_message_id INTEGER;
+"""
+
+# Persistent tier of the Haiku completion cache (see src/core/haiku_cache.py)
+_CREATE_HAIKU_CACHE_TABLE = """
+CREATE TABLE IF NOT EXISTS haiku_cache (
+    cache_key TEXT PRIMARY KEY,
+    feature TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+_CREATE_HAIKU_CACHE_EXPIRY_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_haiku_cache_expires_at
+ON haiku_cache(expires_at);
+"""
+
+_SELECT_HAIKU_CACHE = """
+SELECT value, expires_at FROM haiku_cache WHERE cache_key = ?;
+"""
+
+_UPSERT_HAIKU_CACHE = """
+INSERT INTO haiku_cache (cache_key, feature, value, expires_at)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(cache_key) DO UPDATE SET
+    feature = excluded.feature,
+    value = excluded.value,
+    expires_at = excluded.expires_at;
+"""
+
+_DELETE_EXPIRED_HAIKU_CACHE = """
+DELETE FROM haiku_cache WHERE expires_at <= ?;
+"""
+
+
+def _migrate_inline_images(conn: sqlite3.Connection) -> None:
+    """Move base64 images still stored inline in message rows into image_blobs.
+
+    Rows written before the blob store existed carry the full base64
+    payload in message_images. Rows whose images hold nothing to move
+    (plain URLs or undecodable payloads) are left as they are.
+    """
+    last_id = 0
+    migrated = 0
+    while True:
+        rows = conn.execute(
+            _SELECT_INLINE_IMAGE_MESSAGES,
+            (last_id, _IMAGE_MIGRATION_BATCH_SIZE),
+        ).fetchall()
+        if not rows:
+            break
+        for row in rows:
+            last_id = row["channel_message_id"]
+            try:
+                images = json.loads(row["message_images"] or "[]")
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(images, list):
+                continue
+            stored = SQLiteRepository._store_image_blobs_sync(conn, images)
+            if stored == images:
+                continue
+            conn.execute(_UPDATE_MESSAGE_IMAGES, (json.dumps(stored), last_id))
+            migrated += 1
+
+    if migrated:
+        logger.info("inline_images_migrated_to_blobs", message_count=migrated)
+
+
+# Applied in order on connect. PRAGMA user_version records how many have run,
+# so each migration executes exactly once per database. Append new migrations;
+# never edit or reorder ones that have shipped.
+_SCHEMA_MIGRATIONS: tuple[
+    tuple[str, tuple[str | Callable[[sqlite3.Connection], None], ...]], ...
+] = (
+    (
+        "unique_channel_discord_id",
+        (
+            _REPOINT_DUPLICATE_CHANNEL_MESSAGES,
+            _DELETE_DUPLICATE_CHANNELS,
+            _CREATE_CHANNELS_DISCORD_ID_INDEX,
+        ),
+    ),
+    (
+        "channel_messages_indexes",
+        (
+            _CREATE_CHANNEL_MESSAGES_CONTEXT_INDEX,
+            _CREATE_CHANNEL_MESSAGES_TYPE_INDEX,
+        ),
+    ),
+    (
+        "channel_visibility_watermark",
+        (
+            _ADD_CHANNELS_VISIBLE_FROM_ID,
+            _BACKFILL_CHANNELS_VISIBLE_FROM_ID,
+            _DROP_CHANNEL_MESSAGES_CONTEXT_INDEX,
+            _CREATE_CHANNEL_MESSAGES_WINDOW_INDEX,
+        ),
+    ),
+    (
+        "message_token_counts",
+        (
+            _ADD_CHANNEL_MESSAGES_TOKEN_COUNT,
+            _ADD_CHANNELS_CONTEXT_TOKEN_COUNT,
+            _CREATE_CHANNEL_MESSAGES_UNCOUNTED_INDEX,
+            _CREATE_COUNT_INSERTED_TOKENS_TRIGGER,
+            _CREATE_COUNT_VISIBILITY_TOKENS_TRIGGER,
+            _CREATE_COUNT_WATERMARK_TOKENS_TRIGGER,
+        ),
+    ),
+    (
+        "channel_rolling_summary",
+        (_ADD_CHANNELS_SUMMARY_MESSAGE_ID,),
+    ),
+    (
+        "haiku_cache",
+        (
+            _CREATE_HAIKU_CACHE_TABLE,
+            _CREATE_HAIKU_CACHE_EXPIRY_INDEX,
+        ),
+    ),
+    (
+        "inline_image_blobs",
+        (_migrate_inline_images,),
+    ),
+)
+
 # =============================================================================
 # SQL Query Definitions
 # =============================================================================
@@ -233,7 +551,8 @@ INSERT INTO channel_messages(
     message_type,
     message_data,
     is_image_prompt,
-    is_image_only_context
+    is_image_only_context,
+    token_count
 )
 SELECT
     (SELECT channel_id FROM channels WHERE discord_id = ?),
@@ -241,6 +560,7 @@ SELECT
     ?,
     ?,
     ?,
+    ?,
     ?
 ;
 """
@@ -253,7 +573,8 @@ INSERT INTO channel_messages(
     message_data,
     message_images,
     is_image_prompt,
-    is_image_only_context
+    is_image_only_context,
+    token_count
 )
 SELECT
     (SELECT channel_id FROM channels WHERE discord_id = ?),
@@ -262,6 +583,7 @@ SELECT
     ?,
     ?,
     ?,
+    ?,
     ?
 ;
 """
@@ -281,6 +603,7 @@ JOIN vendors
     ON channel_messages.vendor_id = vendors.vendor_id
 WHERE channels.discord_id = ?
 AND (vendors.vendor_name = ? OR ? = "All Models")
+AND channel_messages.channel_message_id >= channels.visible_from_id
 AND channel_messages.visible = TRUE
 AND channel_messages.is_image_prompt = FALSE
 AND channel_messages.is_image_only_context = FALSE
@@ -288,6 +611,39 @@ ORDER BY channel_messages.message_timestamp ASC
 ;
 """
 
+_SELECT_VISIBLE_TEXT_MESSAGES = """
+SELECT
+    channel_messages.channel_message_id,
+    message_type,
+    message_data,
+    message_timestamp,
+    token_count,
+    vendors.vendor_name
+FROM channels
+JOIN channel_messages
+    ON channel_messages.channel_id = channels.channel_id
+JOIN vendors
+    ON channel_messages.vendor_id = vendors.vendor_id
+WHERE channels.discord_id = ?
+AND (vendors.vendor_name = ? OR ? = "All Models")
+AND channel_messages.channel_message_id >= channels.visible_from_id
+AND channel_messages.visible = TRUE
+AND channel_messages.is_image_prompt = FALSE
+AND channel_messages.is_image_only_context = FALSE
+ORDER BY channel_messages.message_timestamp ASC
+;
+"""
+
+_SELECT_MESSAGE_IMAGES = """
+SELECT
+    channel_message_id,
+    message_images
+FROM channel_messages
+WHERE channel_message_id IN ({placeholders})
+AND message_images != "[]"
+;
+"""
+
 _SELECT_LATEST_MESSAGES = """
 SELECT
     channel_messages.channel_message_id,
@@ -303,6 +659,7 @@ JOIN vendors
     ON channel_messages.vendor_id = vendors.vendor_id
 WHERE channels.discord_id = ?
 AND (vendors.vendor_name = ? OR ? = "All Models")
+AND channel_messages.channel_message_id >= channels.visible_from_id
 AND channel_messages.visible = TRUE
 AND channel_messages.is_image_prompt = FALSE
 AND channel_messages.is_image_only_context = FALSE
@@ -316,7 +673,6 @@ SELECT
     channel_messages.channel_message_id,
     message_type,
     message_data,
-    message_images,
     message_timestamp,
     vendors.vendor_name
 FROM channels
@@ -326,6 +682,7 @@ JOIN vendors
     ON channel_messages.vendor_id = vendors.vendor_id
 WHERE channels.discord_id = ?
 AND (vendors.vendor_name = ? OR ? = "All Models")
+AND channel_messages.channel_message_id >= channels.visible_from_id
 AND channel_messages.visible = TRUE
 AND channel_messages.is_image_prompt = FALSE
 AND channel_messages.message_images != "[]"
@@ -344,6 +701,7 @@ JOIN vendors
     ON channel_messages.vendor_id = vendors.vendor_id
 WHERE channels.discord_id = ?
 AND (vendors.vendor_name = ? OR ? = "All Models")
+AND channel_messages.channel_message_id >= channels.visible_from_id
 AND channel_messages.visible = TRUE
 AND channel_messages.is_image_prompt = FALSE
 AND channel_messages.message_images != "[]"
@@ -352,29 +710,52 @@ LIMIT 1
 ;
 """
 
-_DEACTIVATE_OLD_MESSAGES = """
-UPDATE channel_messages
-SET visible = FALSE
-WHERE channel_id = (SELECT channel_id FROM channels WHERE discord_id = ?)
-AND (vendor_id = (SELECT vendor_id FROM vendors WHERE vendor_name = ?) OR ? = "All Models")
-AND channel_message_id NOT IN (
-    SELECT
-        channel_message_id
-    FROM channel_messages
-    WHERE channel_id = (SELECT channel_id FROM channels WHERE discord_id = ?)
-    AND (vendor_id = (SELECT vendor_id FROM vendors WHERE vendor_name = ?) OR ? = "All Models")
-    AND visible = TRUE
-    ORDER BY message_timestamp DESC, channel_message_id DESC
-    LIMIT ?
-)
+# Id of the oldest message that stays in a window of OFFSET + 1 messages
+_SELECT_WINDOW_START = """
+SELECT
+    channel_messages.channel_message_id
+FROM channels
+JOIN channel_messages
+    ON channel_messages.channel_id = channels.channel_id
+JOIN vendors
+    ON channel_messages.vendor_id = vendors.vendor_id
+WHERE channels.discord_id = ?
+AND (vendors.vendor_name = ? OR ? = "All Models")
+AND channel_messages.channel_message_id >= channels.visible_from_id
+AND channel_messages.visible = TRUE
+ORDER BY channel_messages.channel_message_id DESC
+LIMIT 1 OFFSET ?
+;
+"""
+
+_SELECT_NEXT_MESSAGE_ID = """
+SELECT
+    COALESCE(MAX(channel_messages.channel_message_id), 0) + 1
+FROM channels
+JOIN channel_messages
+    ON channel_messages.channel_id = channels.channel_id
+WHERE channels.discord_id = ?
 ;
 """
 
-_CLEAR_MESSAGES = """
+_ADVANCE_VISIBLE_FROM_ID = """
+UPDATE channels
+SET visible_from_id = MAX(visible_from_id, ?)
+WHERE discord_id = ?
+;
+"""
+
+# Per-vendor windows cannot move the channel watermark, so the vendor's
+# messages below the cutoff are hidden individually. Only rows at or above
+# the watermark are touched.
+_HIDE_VENDOR_MESSAGES_BEFORE = """
 UPDATE channel_messages
 SET visible = FALSE
 WHERE channel_id = (SELECT channel_id FROM channels WHERE discord_id = ?)
-AND (vendor_id = (SELECT vendor_id FROM vendors WHERE vendor_name = ?) Or ? = "All Models")
+AND channel_message_id >= (SELECT visible_from_id FROM channels WHERE discord_id = ?)
+AND channel_message_id < ?
+AND vendor_id = (SELECT vendor_id FROM vendors WHERE vendor_name = ?)
+AND visible = TRUE
 ;
 """
 
@@ -385,6 +766,133 @@ WHERE channel_message_id IN ({placeholders})
 ;
 """
 
+# A summary slot is a hidden, empty assistant message reserved ahead of a
+# background summarization, so the summary sorts before anything saved while
+# it was being generated. It is preceded by a hidden SUMMARY_PROMPT user
+# message, so the filled summary is answering a user turn like any other.
+_INSERT_SUMMARY_PROMPT = """
+INSERT INTO channel_messages(
+    channel_id,
+    vendor_id,
+    message_type,
+    message_data,
+    is_image_prompt,
+    is_image_only_context,
+    token_count,
+    visible
+)
+SELECT
+    (SELECT channel_id FROM channels WHERE discord_id = ?),
+    (SELECT vendor_id FROM vendors WHERE vendor_name = ?),
+    "prompt",
+    ?,
+    FALSE,
+    FALSE,
+    ?,
+    FALSE
+;
+"""
+
+_INSERT_SUMMARY_SLOT = """
+INSERT INTO channel_messages(
+    channel_id,
+    vendor_id,
+    message_type,
+    message_data,
+    is_image_prompt,
+    is_image_only_context,
+    token_count,
+    visible
+)
+SELECT
+    (SELECT channel_id FROM channels WHERE discord_id = ?),
+    (SELECT vendor_id FROM vendors WHERE vendor_name = ?),
+    "assistant",
+    "",
+    FALSE,
+    FALSE,
+    0,
+    FALSE
+;
+"""
+
+# The slot is still fillable if it is unfilled and no clear or earlier
+# summary has moved the watermark past it
+_SELECT_FILLABLE_SUMMARY_SLOT = """
+SELECT channel_messages.channel_message_id
+FROM channels
+JOIN channel_messages
+    ON channel_messages.channel_id = channels.channel_id
+WHERE channels.discord_id = ?
+AND channel_messages.channel_message_id = ?
+AND channel_messages.channel_message_id >= channels.visible_from_id
+AND channel_messages.visible = FALSE
+AND channel_messages.message_data = ""
+;
+"""
+
+# The slot's prompt is the newest hidden summary prompt before it in the
+# channel; both are inserted by the same write
+_SELECT_SUMMARY_SLOT_PROMPT = """
+SELECT MAX(prompts.channel_message_id) AS channel_message_id
+FROM channel_messages AS slots
+JOIN channel_messages AS prompts
+    ON prompts.channel_id = slots.channel_id
+WHERE slots.channel_message_id = ?
+AND prompts.channel_message_id < slots.channel_message_id
+AND prompts.message_type = "prompt"
+AND prompts.message_data = ?
+AND prompts.visible = FALSE
+;
+"""
+
+_SHOW_SUMMARY_PROMPT = """
+UPDATE channel_messages SET visible = TRUE WHERE channel_message_id = ?;
+"""
+
+_FILL_SUMMARY_SLOT = """
+UPDATE channel_messages
+SET message_data = ?, token_count = ?, visible = TRUE
+WHERE channel_message_id = ?
+;
+"""
+
+_SET_CHANNEL_SUMMARY_MESSAGE_ID = """
+UPDATE channels SET summary_message_id = ? WHERE discord_id = ?;
+"""
+
+# The rolling summary only counts while it is still in the context window
+_SELECT_ROLLING_SUMMARY = """
+SELECT
+    channel_messages.channel_message_id,
+    message_type,
+    message_data,
+    message_timestamp,
+    token_count
+FROM channels
+JOIN channel_messages
+    ON channel_messages.channel_message_id = channels.summary_message_id
+WHERE channels.discord_id = ?
+AND channel_messages.channel_message_id >= channels.visible_from_id
+AND channel_messages.visible = TRUE
+;
+"""
+
+_DELETE_SUMMARY_SLOT = """
+DELETE FROM channel_messages
+WHERE channel_message_id = ?
+AND visible = FALSE
+AND message_data = ""
+;
+"""
+
+_DELETE_SUMMARY_PROMPT = """
+DELETE FROM channel_messages
+WHERE channel_message_id = ?
+AND visible = FALSE
+;
+"""
+
 _COUNT_RECENT_TEXT_REQUESTS = """
 SELECT
     COUNT(channel_messages.channel_message_id) AS count
@@ -416,6 +924,65 @@ AND channel_messages.message_timestamp BETWEEN datetime('now', '-1 hour') AND da
 ;
 """
 
+# Image blob queries
+_INSERT_IMAGE_BLOB = """
+INSERT INTO image_blobs(blob_hash, data, byte_size, ref_count)
+VALUES (?, ?, ?, 1)
+ON CONFLICT(blob_hash) DO UPDATE SET ref_count = ref_count + 1;
+"""
+
+_SELECT_IMAGE_BLOBS = """
+SELECT blob_hash, data FROM image_blobs WHERE blob_hash IN ({placeholders});
+"""
+
+_SELECT_IMAGE_BLOB_STATS = """
+SELECT COUNT(*) AS blob_count, COALESCE(SUM(byte_size), 0) AS total_bytes
+FROM image_blobs;
+"""
+
+_SELECT_INLINE_IMAGE_MESSAGES = """
+SELECT channel_message_id, message_images
+FROM channel_messages
+WHERE message_images LIKE '%"image":%'
+AND channel_message_id > ?
+ORDER BY channel_message_id
+LIMIT ?;
+"""
+
+_UPDATE_MESSAGE_IMAGES = """
+UPDATE channel_messages SET message_images = ? WHERE channel_message_id = ?;
+"""
+
+_SELECT_UNCOUNTED_MESSAGES = """
+SELECT channel_message_id, message_data
+FROM channel_messages
+WHERE token_count IS NULL
+AND channel_message_id > ?
+ORDER BY channel_message_id
+LIMIT ?;
+"""
+
+_UPDATE_MESSAGE_TOKEN_COUNT = """
+UPDATE channel_messages SET token_count = ? WHERE channel_message_id = ?;
+"""
+
+_RECOMPUTE_CONTEXT_TOKEN_COUNTS = """
+UPDATE channels
+SET context_token_count = (
+    SELECT COALESCE(SUM(token_count), 0)
+    FROM channel_messages
+    WHERE channel_messages.channel_id = channels.channel_id
+    AND channel_message_id >= channels.visible_from_id
+    AND visible = TRUE
+    AND is_image_prompt = FALSE
+    AND is_image_only_context = FALSE
+);
+"""
+
+_SELECT_CONTEXT_TOKEN_COUNT = """
+SELECT context_token_count FROM channels WHERE discord_id = ?;
+"""
+
 # API Keys queries
 _INSERT_API_KEY = """
 INSERT INTO api_keys(key_hash, user_id, name, scopes, expires_at)
@@ -457,6 +1024,12 @@ DELETE FROM bans
 WHERE user_id = ?;
 """
 
+# Only the columns needed for access checks, for loading into memory
+_SELECT_BAN_REASONS = """
+SELECT user_id, reason
+FROM bans;
+"""
+
 _INSERT_BAN_HISTORY = """
 INSERT INTO ban_history (user_id, username, action, reason, performed_by)
 VALUES (?, ?, ?, ?, ?);
@@ -543,12 +1116,28 @@ FROM whitelist
 ORDER BY added_at DESC;
 """
 
+_SELECT_WHITELISTED_USER_IDS = """
+SELECT user_id
+FROM whitelist;
+"""
+
 # Usage log queries
 _INSERT_USAGE_LOG = """
 INSERT INTO usage_log (user_id, username, guild_id, command_name, command_type, outcome)
 VALUES (?, ?, ?, ?, ?, ?);
 """
 
+# Batched usage events are only kept for whitelisted, unbanned users; checking
+# that here saves two lookups per event
+_INSERT_USAGE_LOG_IF_ELIGIBLE = """
+INSERT INTO usage_log (
+    user_id, username, guild_id, command_name, command_type, outcome, timestamp
+)
+SELECT ?, ?, ?, ?, ?, ?, ?
+WHERE EXISTS (SELECT 1 FROM whitelist WHERE user_id = ?)
+AND NOT EXISTS (SELECT 1 FROM bans WHERE user_id = ?);
+"""
+
 _SELECT_TOP_USERS_BY_USAGE = """
 SELECT
     user_id,
@@ -583,18 +1172,55 @@ GROUP BY user_id;
 # Repository Implementation
 # =============================================================================
 
+T = TypeVar("T")
+
+_MEMORY_DB_PATH = ":memory:"
+
+# Connection pool defaults for WAL mode
+DEFAULT_READ_POOL_SIZE = 4
+DEFAULT_WRITE_QUEUE_SIZE = 256
+
+# How long a connection waits on a locked database before raising
+_BUSY_TIMEOUT_MS = 5000
+
+# Key that replaces the inline base64 "image" field in stored image entries
+_BLOB_REF_KEY = "blob"
+_INLINE_IMAGE_KEY = "image"
+
+# Rows converted per transaction when moving legacy inline images to blobs
+_IMAGE_MIGRATION_BATCH_SIZE = 100
+
+# Rows counted per transaction when backfilling token counts
+_TOKEN_BACKFILL_BATCH_SIZE = 500
+
 
 class SQLiteRepository:
     """SQLite implementation of all repository protocols.
 
     This class implements ChannelRepository, VendorRepository, MessageRepository,
-    and RateLimitRepository. It manages a single SQLite connection that is shared
-    across all operations.
+    and RateLimitRepository.
+
+    Two connection-management modes are supported:
+
+    - Default: a single SQLite connection is shared across all operations.
+    - WAL mode (``wal_mode=True``): the database runs with write-ahead logging,
+      reads are served from a pool of read-only connections, and every write
+      is funneled through one dedicated writer connection fed by a bounded
+      queue. Reads never block behind a commit and writes cannot interleave.
+
+    All blocking calls run on a dedicated DatabaseExecutor: the writer
+    connection is only ever touched by the single writer thread, and each
+    reader connection by one reader thread at a time. In the default mode
+    reads share the writer thread, since they share its connection.
+
+    WAL mode requires a file-backed database; for ``:memory:`` it falls back
+    to the single-connection mode since each connection would otherwise see
+    its own private database.
 
     The class supports async context manager protocol for automatic resource cleanup.
 
     Example:
-        async with SQLiteRepository("data/app.db") as repo:
+        async with SQLiteRepository("data/app.db", wal_mode=True) as repo:
             channel = await repo.get_or_create_channel(12345)
             await repo.save_message(message)
 
@@ -603,15 +1229,55 @@ class SQLiteRepository:
         await repo.connect()
     """
 
-    def __init__(self, db_path: str | Path) -> None:
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        wal_mode: bool = False,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        write_queue_size: int = DEFAULT_WRITE_QUEUE_SIZE,
+    ) -> None:
         """Initialize the repository with a database path.
 
         Args:
             db_path: Path to the SQLite database file, or ":memory:" for
                 an in-memory database (useful for testing).
+            wal_mode: Enable WAL journaling with a read-only connection pool
+                and a single serialized writer connection.
+            read_pool_size: Number of read-only connections (and reader
+                threads) in WAL mode.
+            write_queue_size: Maximum number of pending writes before callers
+                wait for the writer to catch up.
+
+        Raises:
+            ValueError: If read_pool_size or write_queue_size is less than 1.
         """
+        if read_pool_size < 1:
+            raise ValueError("read_pool_size must be at least 1")
+        if write_queue_size < 1:
+            raise ValueError("write_queue_size must be at least 1")
+
         self._db_path = str(db_path)
+        self._wal_mode = wal_mode and self._db_path != _MEMORY_DB_PATH
+        self._read_pool_size = read_pool_size
+        self._write_queue_size = write_queue_size
+
+        # Writer connection (also serves reads when WAL mode is off)
         self._connection: sqlite3.Connection | None = None
+        self._readers: list[sqlite3.Connection] = []
+        self._reader_pool: asyncio.Queue[sqlite3.Connection] | None = None
+        self._write_slots: asyncio.Semaphore | None = None
+        self._executor: DatabaseExecutor | None = None
+
+    @property
+    def wal_mode(self) -> bool:
+        """Whether the repository runs in WAL mode with a reader pool."""
+        return self._wal_mode
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether connect() has opened the writer connection."""
+        return self._connection is not None
 
     async def __aenter__(self) -> "SQLiteRepository":
         """Async context manager entry: connect to the database."""
@@ -633,24 +1299,52 @@ class SQLiteRepository:
         This method must be called before using any repository methods,
         unless using the async context manager.
         """
-        logger.debug("connecting_to_database", path=self._db_path)
-        self._connection = await asyncio.to_thread(self._connect_sync)
+        logger.debug("connecting_to_database", path=self._db_path, wal_mode=self._wal_mode)
+        self._executor = DatabaseExecutor(
+            reader_threads=self._read_pool_size if self._wal_mode else 1
+        )
+        self._connection = await self._executor.run_write(self._connect_sync)
         await self._initialize_schema()
+
+        if self._wal_mode:
+            self._readers = await self._executor.run_read(self._open_readers_sync)
+            self._reader_pool = asyncio.Queue()
+            for reader in self._readers:
+                self._reader_pool.put_nowait(reader)
+
+        self._write_slots = asyncio.Semaphore(self._write_queue_size)
         logger.debug("Database connection established and schema initialized")
 
     def _connect_sync(self) -> sqlite3.Connection:
-        """Synchronous connection setup.
+        """Synchronous connection setup for the writer connection.
 
-        Note: check_same_thread=False is required because we use asyncio.to_thread()
-        to run synchronous SQLite operations. The connection is created in one thread
-        but may be used from different thread pool workers. This is safe as long as
-        we don't have concurrent writes (our async wrapper ensures sequential access).
+        Note: check_same_thread=False is required because connections are opened
+        and closed by whichever executor thread runs connect()/close(). Each
+        connection is still only used by one thread at a time: the writer
+        connection by the single writer thread, readers while checked out.
         """
         conn = sqlite3.connect(self._db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
+        if self._wal_mode:
+            conn.execute("PRAGMA journal_mode = WAL")
+            # NORMAL is durable across application crashes in WAL mode and
+            # avoids an fsync on every commit
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
         return conn
 
+    def _open_readers_sync(self) -> list[sqlite3.Connection]:
+        """Open the pool of read-only connections used in WAL mode."""
+        uri = f"{Path(self._db_path).resolve().as_uri()}?mode=ro"
+        readers: list[sqlite3.Connection] = []
+        for _ in range(self._read_pool_size):
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+            readers.append(conn)
+        return readers
+
     async def _initialize_schema(self) -> None:
         """Create database tables if they don't exist."""
         if self._connection is None:
@@ -661,6 +1355,8 @@ class SQLiteRepository:
             self._connection.execute(_CREATE_CHANNELS_TABLE)
             self._connection.execute(_CREATE_VENDORS_TABLE)
             self._connection.execute(_CREATE_CHANNEL_MESSAGES_TABLE)
+            self._connection.execute(_CREATE_IMAGE_BLOBS_TABLE)
+            self._connection.execute(_CREATE_RELEASE_IMAGE_BLOBS_TRIGGER)
             self._connection.execute(_CREATE_API_KEYS_TABLE)
             self._connection.execute(_CREATE_API_KEYS_INDEX)
             self._connection.execute(_CREATE_BANS_TABLE)
@@ -680,26 +1376,173 @@ class SQLiteRepository:
             self._connection.execute(_CREATE_USAGE_LOG_TIMESTAMP_INDEX)
             self._connection.commit()
 
-        await asyncio.to_thread(init_sync)
+        assert self._executor is not None
+        await self._executor.run_write(init_sync)
+        await self._executor.run_write(self._apply_schema_migrations_sync, self._connection)
+        await self._executor.run_write(self._backfill_token_counts_sync, self._connection)
+
+    @staticmethod
+    def _apply_schema_migrations_sync(conn: sqlite3.Connection) -> None:
+        """Run schema migrations newer than the database's user_version.
+
+        Each migration and its version bump commit together, so a failed
+        migration leaves the database at the previous version. Steps are SQL
+        statements or functions that rewrite data on the connection.
+        """
+        current = conn.execute("PRAGMA user_version").fetchone()[0]
+        for version, (name, statements) in enumerate(_SCHEMA_MIGRATIONS, start=1):
+            if version <= current:
+                continue
+            conn.execute("BEGIN")
+            try:
+                for statement in statements:
+                    if callable(statement):
+                        statement(conn)
+                    else:
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {version}")
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+            logger.info("schema_migration_applied", version=version, migration=name)
+
+    @staticmethod
+    def _backfill_token_counts_sync(conn: sqlite3.Connection) -> None:
+        """Count tokens for messages saved before token_count existed.
+
+        Each batch is counted in its own transaction, then every channel's
+        context total is recomputed once. When no row is missing a count
+        this is a lookup on an empty partial index.
+        """
+        last_id = 0
+        counted = 0
+        while True:
+            rows = conn.execute(
+                _SELECT_UNCOUNTED_MESSAGES,
+                (last_id, _TOKEN_BACKFILL_BATCH_SIZE),
+            ).fetchall()
+            if not rows:
+                break
+            counts: list[tuple[int, int]] = []
+            for row in rows:
+                count = try_count_tokens(row["message_data"] or "")
+                if count is None:
+                    break
+                counts.append((count, row["channel_message_id"]))
+            conn.executemany(_UPDATE_MESSAGE_TOKEN_COUNT, counts)
+            conn.commit()
+            counted += len(counts)
+            if len(counts) < len(rows):
+                # Tokenizer unavailable; the rest is counted on a later connect
+                break
+            last_id = rows[-1]["channel_message_id"]
+
+        if counted:
+            conn.execute(_RECOMPUTE_CONTEXT_TOKEN_COUNTS)
+            conn.commit()
+            logger.info("message_token_counts_backfilled", message_count=counted)
 
     async def close(self) -> None:
         """Close the database connection.
 
+        Pending writes are drained before the writer connection is closed.
         This method should be called when the repository is no longer needed,
         unless using the async context manager.
         """
+        if self._executor is None:
+            return
+
+        # The writer thread runs jobs in order, so this close is queued
+        # behind every pending write
+        for reader in self._readers:
+            await self._executor.run_read(reader.close)
+        self._readers = []
+        self._reader_pool = None
+
         if self._connection is not None:
             logger.debug("Closing database connection")
-            await asyncio.to_thread(self._connection.close)
+            await self._executor.run_write(self._connection.close)
             self._connection = None
 
-    def _ensure_connected(self) -> sqlite3.Connection:
-        """Ensure the database is connected and return the connection."""
-        if self._connection is None:
-            raise RuntimeError(
-                "Database not connected. Call connect() or use async context manager."
-            )
-        return self._connection
+        await self._executor.shutdown()
+        self._executor = None
+        self._write_slots = None
+
+    def _ensure_connected(self) -> sqlite3.Connection:
+        """Ensure the database is connected and return the connection."""
+        if self._connection is None:
+            raise RuntimeError(
+                "Database not connected. Call connect() or use async context manager."
+            )
+        return self._connection
+
+    async def _read(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a read-only query on a pooled reader connection.
+
+        In WAL mode a reader connection is checked out of the pool for the
+        duration of the query and run on a reader thread; otherwise the shared
+        connection is used on the writer thread.
+
+        Args:
+            func: Synchronous function receiving the connection to query.
+
+        Returns:
+            Whatever func returns.
+        """
+        conn = self._ensure_connected()
+        assert self._executor is not None
+        if self._reader_pool is None:
+            return await self._executor.run_write(func, conn)
+
+        reader = await self._reader_pool.get()
+        try:
+            return await self._executor.run_read(func, reader)
+        finally:
+            self._reader_pool.put_nowait(reader)
+
+    async def _write(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """Queue a write for the dedicated writer connection and await it.
+
+        The writer commits after func returns and rolls back if it raises,
+        so func must not manage the transaction itself. When the queue is
+        full, callers wait until the writer has capacity.
+
+        Args:
+            func: Synchronous function receiving the writer connection.
+
+        Returns:
+            Whatever func returns.
+        """
+        conn = self._ensure_connected()
+        assert self._executor is not None and self._write_slots is not None
+        async with self._write_slots:
+            return await self._executor.run_write(self._apply_write_sync, conn, func)
+
+    def executor_stats(self) -> dict[str, dict[str, Any]]:
+        """Get queue-depth and wait-time metrics for the database threads.
+
+        Returns:
+            Dict with "reader" and "writer" lane metrics, or an empty dict
+            when the repository is not connected.
+        """
+        if self._executor is None:
+            return {}
+        return self._executor.stats()
+
+    @staticmethod
+    def _apply_write_sync(
+        conn: sqlite3.Connection,
+        func: Callable[[sqlite3.Connection], T],
+    ) -> T:
+        """Run a write function as one transaction on the writer connection."""
+        try:
+            result = func(conn)
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+        return result
 
     @staticmethod
     def _row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
@@ -712,13 +1555,11 @@ class SQLiteRepository:
 
     async def get_channel(self, external_id: int) -> Channel | None:
         """Retrieve a channel by its external platform ID."""
-        conn = self._ensure_connected()
-
-        def query_sync() -> sqlite3.Row | None:
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
             cursor = conn.execute(_SELECT_CHANNEL, (external_id,))
             return cast(sqlite3.Row | None, cursor.fetchone())
 
-        row = await asyncio.to_thread(query_sync)
+        row = await self._read(query_sync)
         if row is None:
             return None
         return Channel(id=row["channel_id"], external_id=row["discord_id"])
@@ -733,14 +1574,15 @@ class SQLiteRepository:
             logger.debug("channel_already_exists", external_id=external_id)
             return existing
 
-        conn = self._ensure_connected()
-
-        def insert_sync() -> int:
+        def insert_sync(conn: sqlite3.Connection) -> int:
+            # Re-check on the writer: a concurrent create may have won the race
+            row = conn.execute(_SELECT_CHANNEL, (external_id,)).fetchone()
+            if row is not None:
+                return cast(int, row["channel_id"])
             cursor = conn.execute(_INSERT_CHANNEL, (external_id,))
-            conn.commit()
             return cursor.lastrowid or 0
 
-        channel_id = await asyncio.to_thread(insert_sync)
+        channel_id = await self._write(insert_sync)
         logger.debug("channel_created", external_id=external_id, channel_id=channel_id)
         return Channel(id=channel_id, external_id=external_id)
 
@@ -754,13 +1596,11 @@ class SQLiteRepository:
 
     async def get_vendor(self, name: str) -> Vendor | None:
         """Retrieve a vendor by its name."""
-        conn = self._ensure_connected()
-
-        def query_sync() -> sqlite3.Row | None:
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
             cursor = conn.execute(_SELECT_VENDOR, (name,))
             return cast(sqlite3.Row | None, cursor.fetchone())
 
-        row = await asyncio.to_thread(query_sync)
+        row = await self._read(query_sync)
         if row is None:
             return None
         return Vendor(
@@ -779,14 +1619,15 @@ class SQLiteRepository:
             logger.debug("vendor_already_exists", name=name)
             return existing
 
-        conn = self._ensure_connected()
-
-        def insert_sync() -> int:
+        def insert_sync(conn: sqlite3.Connection) -> int:
+            # Re-check on the writer: a concurrent create may have won the race
+            row = conn.execute(_SELECT_VENDOR, (name,)).fetchone()
+            if row is not None:
+                return cast(int, row["vendor_id"])
             cursor = conn.execute(_INSERT_VENDOR, (name, model_name))
-            conn.commit()
             return cursor.lastrowid or 0
 
-        vendor_id = await asyncio.to_thread(insert_sync)
+        vendor_id = await self._write(insert_sync)
         logger.debug("vendor_created", name=name, vendor_id=vendor_id)
         return Vendor(id=vendor_id, name=name, model_name=model_name)
 
@@ -798,16 +1639,148 @@ class SQLiteRepository:
     # MessageRepository Implementation
     # =========================================================================
 
-    def _row_to_message(self, row: sqlite3.Row, vendor_name: str) -> Message:
-        """Convert a database row to a Message object."""
-        # Parse images from JSON string
-        images_json = row["message_images"] or "[]"
+    @staticmethod
+    def _decode_inline_image(image_b64: str) -> bytes | None:
+        """Decode an inline base64 image, or None if it cannot round-trip exactly.
+
+        Only payloads whose re-encoding reproduces the original string are
+        moved to the blob store, so callers always get back the exact string
+        they stored.
+        """
+        try:
+            data = base64.b64decode(image_b64, validate=True)
+        except (binascii.Error, ValueError):
+            return None
+        if base64.b64encode(data).decode("ascii") != image_b64:
+            return None
+        return data
+
+    @staticmethod
+    def _store_image_blobs_sync(
+        conn: sqlite3.Connection,
+        images: list[Any],
+    ) -> list[Any]:
+        """Move inline image payloads into image_blobs and return references.
+
+        Each {"filename": ..., "image": <base64>} entry is stored once per
+        distinct SHA-256 of its bytes and replaced by {"filename": ...,
+        "blob": <sha256>}. Blob ref_count is incremented once per message
+        that references it. Entries without an inline payload (e.g. plain
+        URLs) are returned unchanged.
+        """
+        referenced: set[str] = set()
+        stored: list[Any] = []
+        for entry in images:
+            image_b64 = entry.get(_INLINE_IMAGE_KEY) if isinstance(entry, dict) else None
+            data = (
+                SQLiteRepository._decode_inline_image(image_b64)
+                if isinstance(image_b64, str)
+                else None
+            )
+            if data is None:
+                stored.append(entry)
+                continue
+
+            blob_hash = hashlib.sha256(data).hexdigest()
+            if blob_hash not in referenced:
+                conn.execute(_INSERT_IMAGE_BLOB, (blob_hash, data, len(data)))
+                referenced.add(blob_hash)
+
+            ref = {k: v for k, v in entry.items() if k != _INLINE_IMAGE_KEY}
+            ref[_BLOB_REF_KEY] = blob_hash
+            stored.append(ref)
+        return stored
+
+    @staticmethod
+    def _fetch_image_blobs_sync(
+        conn: sqlite3.Connection,
+        blob_hashes: set[str],
+    ) -> dict[str, bytes]:
+        """Load blob bytes for the given hashes in one query."""
+        if not blob_hashes:
+            return {}
+        placeholders = ",".join("?" for _ in blob_hashes)
+        cursor = conn.execute(
+            _SELECT_IMAGE_BLOBS.format(placeholders=placeholders),
+            tuple(blob_hashes),
+        )
+        return {row["blob_hash"]: row["data"] for row in cursor.fetchall()}
+
+    def _load_message_images_sync(
+        self,
+        conn: sqlite3.Connection,
+        message_ids: list[int],
+    ) -> dict[int, list[Any]]:
+        """Load image entries for messages with blob references expanded to base64."""
+        if not message_ids:
+            return {}
+        placeholders = ",".join("?" for _ in message_ids)
+        cursor = conn.execute(
+            _SELECT_MESSAGE_IMAGES.format(placeholders=placeholders),
+            tuple(message_ids),
+        )
+        parsed: dict[int, list[Any]] = {}
+        wanted: set[str] = set()
+        for row in cursor.fetchall():
+            images = self._parse_images(row["message_images"])
+            for entry in images:
+                if isinstance(entry, dict) and _BLOB_REF_KEY in entry:
+                    wanted.add(entry[_BLOB_REF_KEY])
+            parsed[row["channel_message_id"]] = images
+
+        blobs = self._fetch_image_blobs_sync(conn, wanted)
+        resolved: dict[int, list[Any]] = {}
+        for message_id, images in parsed.items():
+            expanded: list[Any] = []
+            for entry in images:
+                if isinstance(entry, dict) and _BLOB_REF_KEY in entry:
+                    data = blobs.get(entry[_BLOB_REF_KEY])
+                    if data is None:
+                        logger.warning("image_blob_missing", blob_hash=entry[_BLOB_REF_KEY])
+                        continue
+                    entry = {k: v for k, v in entry.items() if k != _BLOB_REF_KEY}
+                    entry[_INLINE_IMAGE_KEY] = base64.b64encode(data).decode("ascii")
+                if entry:
+                    expanded.append(entry)
+            if expanded:
+                resolved[message_id] = expanded
+        return resolved
+
+    @staticmethod
+    def _parse_images(images_json: str | None) -> list[Any]:
+        """Parse a message_images column value, tolerating bad JSON."""
         try:
-            image_urls = json.loads(images_json)
+            images = json.loads(images_json or "[]")
         except json.JSONDecodeError:
-            image_urls = []
+            return []
+        return images if isinstance(images, list) else []
+
+    async def get_image_blob_stats(self) -> dict[str, int]:
+        """Get the number of stored image blobs and their total size.
+
+        Returns:
+            Dict with "blob_count" and "total_bytes" keys.
+        """
+
+        def query_sync(conn: sqlite3.Connection) -> dict[str, int]:
+            row = conn.execute(_SELECT_IMAGE_BLOB_STATS).fetchone()
+            return {"blob_count": row["blob_count"], "total_bytes": row["total_bytes"]}
+
+        return await self._read(query_sync)
+
+    def _row_to_message(
+        self,
+        row: sqlite3.Row,
+        vendor_name: str,
+        images: list[Any] | None = None,
+    ) -> Message:
+        """Convert a database row to a Message object.
 
-        images = [MessageImage(url=url) for url in image_urls if url]
+        Image entries are parsed from the row's message_images column unless
+        already loaded (or deliberately skipped) by the caller.
+        """
+        if images is None:
+            images = self._parse_images(row["message_images"])
 
         return Message(
             id=row["channel_message_id"],
@@ -816,18 +1789,39 @@ class SQLiteRepository:
             message_type=row["message_type"],
             content=row["message_data"] or "",
             timestamp=row["message_timestamp"],
-            images=images,
+            images=[MessageImage(url=url) for url in images if url],
+            token_count=row["token_count"] if "token_count" in row.keys() else None,
         )
 
+    async def _count_tokens(self, text: str) -> int | None:
+        """Count tokens on a reader thread, before the write is queued.
+
+        Tokenizing is CPU work (and the first call loads the encoding), so it
+        runs neither on the event loop nor on the single writer thread.
+        """
+        self._ensure_connected()
+        assert self._executor is not None
+        return await self._executor.run_read(try_count_tokens, text)
+
+    async def _message_token_count(self, message: Message) -> int | None:
+        """Return the message's token count, counting it if the caller did not.
+
+        None is stored if counting fails; the backfill on the next connect
+        counts the row then.
+        """
+        if message.token_count is not None:
+            return message.token_count
+        return await self._count_tokens(message.content)
+
     async def save_message(self, message: Message) -> int:
         """Save a message to the repository."""
-        conn = self._ensure_connected()
-
         # We need to look up channel and vendor by their external identifiers
         # The message contains channel_id which is actually the external_id (discord_id)
         # and vendor_id which we need to resolve to vendor_name
+        # Counted before queuing so tokenization never holds up the writer thread
+        token_count = await self._message_token_count(message)
 
-        def insert_sync() -> int:
+        def insert_sync(conn: sqlite3.Connection) -> int:
             # Get vendor name from vendor_id
             cursor = conn.execute(
                 "SELECT vendor_name FROM vendors WHERE vendor_id = ?",
@@ -847,12 +1841,12 @@ class SQLiteRepository:
                     message.content,
                     message.is_image_prompt,
                     message.is_image_only_context,
+                    token_count,
                 ),
             )
-            conn.commit()
             return cursor.lastrowid or 0
 
-        message_id = await asyncio.to_thread(insert_sync)
+        message_id = await self._write(insert_sync)
         logger.debug("message_saved", message_id=message_id)
         return message_id
 
@@ -862,9 +1856,9 @@ class SQLiteRepository:
         image_urls: list[str],
     ) -> int:
         """Save a message with associated image URLs."""
-        conn = self._ensure_connected()
+        token_count = await self._message_token_count(message)
 
-        def insert_sync() -> int:
+        def insert_sync(conn: sqlite3.Connection) -> int:
             # Get vendor name from vendor_id
             cursor = conn.execute(
                 "SELECT vendor_name FROM vendors WHERE vendor_id = ?",
@@ -875,7 +1869,7 @@ class SQLiteRepository:
                 raise ValueError(f"Vendor with id {message.vendor_id} not found")
             vendor_name = vendor_row["vendor_name"]
 
-            images_json = json.dumps(image_urls)
+            images_json = json.dumps(self._store_image_blobs_sync(conn, image_urls))
             cursor = conn.execute(
                 _INSERT_MESSAGE_WITH_IMAGES,
                 (
@@ -886,12 +1880,12 @@ class SQLiteRepository:
                     images_json,
                     message.is_image_prompt,
                     message.is_image_only_context,
+                    token_count,
                 ),
             )
-            conn.commit()
             return cursor.lastrowid or 0
 
-        message_id = await asyncio.to_thread(insert_sync)
+        message_id = await self._write(insert_sync)
         logger.debug("message_with_images_saved", message_id=message_id)
         return message_id
 
@@ -901,16 +1895,14 @@ class SQLiteRepository:
         vendor_name: str,
     ) -> list[Message]:
         """Get all visible (active) messages for a channel and vendor."""
-        conn = self._ensure_connected()
-
-        def query_sync() -> list[sqlite3.Row]:
+        def query_sync(conn: sqlite3.Connection) -> list[sqlite3.Row]:
             cursor = conn.execute(
                 _SELECT_VISIBLE_MESSAGES,
                 (channel_external_id, vendor_name, vendor_name),
             )
             return cursor.fetchall()
 
-        rows = await asyncio.to_thread(query_sync)
+        rows = await self._read(query_sync)
         return [self._row_to_message(row, vendor_name) for row in rows]
 
     async def get_latest_messages(
@@ -920,36 +1912,84 @@ class SQLiteRepository:
         limit: int,
     ) -> list[Message]:
         """Get the most recent messages for a channel and vendor."""
-        conn = self._ensure_connected()
-
-        def query_sync() -> list[sqlite3.Row]:
+        def query_sync(conn: sqlite3.Connection) -> list[sqlite3.Row]:
             cursor = conn.execute(
                 _SELECT_LATEST_MESSAGES,
                 (channel_external_id, vendor_name, vendor_name, limit),
             )
             return cursor.fetchall()
 
-        rows = await asyncio.to_thread(query_sync)
+        rows = await self._read(query_sync)
         return [self._row_to_message(row, vendor_name) for row in rows]
 
+    async def get_visible_text_messages(
+        self,
+        channel_external_id: int,
+        vendor_name: str,
+    ) -> list[Message]:
+        """Get visible messages for text context without reading image data."""
+        def query_sync(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            cursor = conn.execute(
+                _SELECT_VISIBLE_TEXT_MESSAGES,
+                (channel_external_id, vendor_name, vendor_name),
+            )
+            return cursor.fetchall()
+
+        rows = await self._read(query_sync)
+        return [self._row_to_message(row, vendor_name, images=[]) for row in rows]
+
+    async def load_message_images(
+        self,
+        message_ids: list[int],
+    ) -> dict[int, list[MessageImage]]:
+        """Load images for the given messages, with payloads from the blob store."""
+        def query_sync(conn: sqlite3.Connection) -> dict[int, list[Any]]:
+            return self._load_message_images_sync(conn, message_ids)
+
+        loaded = await self._read(query_sync)
+        return {
+            message_id: [MessageImage(url=url) for url in images]
+            for message_id, images in loaded.items()
+        }
+
+    async def get_context_token_count(self, channel_external_id: int) -> int:
+        """Get the running token total of a channel's text context."""
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            cursor = conn.execute(_SELECT_CONTEXT_TOKEN_COUNT, (channel_external_id,))
+            return cast(sqlite3.Row | None, cursor.fetchone())
+
+        row = await self._read(query_sync)
+        return int(row["context_token_count"]) if row else 0
+
     async def get_latest_images(
         self,
         channel_external_id: int,
         vendor_name: str,
         limit: int,
     ) -> list[Message]:
-        """Get the most recent image messages for a channel and vendor."""
-        conn = self._ensure_connected()
+        """Get the most recent image messages for a channel and vendor.
 
-        def query_sync() -> list[sqlite3.Row]:
+        Unlike the text queries, image entries are returned with their base64
+        payloads loaded from the blob store.
+        """
+        def query_sync(
+            conn: sqlite3.Connection,
+        ) -> tuple[list[sqlite3.Row], dict[int, list[Any]]]:
             cursor = conn.execute(
                 _SELECT_LATEST_IMAGES,
                 (channel_external_id, vendor_name, vendor_name, limit),
             )
-            return cursor.fetchall()
+            rows = cursor.fetchall()
+            message_ids = [row["channel_message_id"] for row in rows]
+            return rows, self._load_message_images_sync(conn, message_ids)
 
-        rows = await asyncio.to_thread(query_sync)
-        return [self._row_to_message(row, vendor_name) for row in rows]
+        rows, images = await self._read(query_sync)
+        return [
+            self._row_to_message(
+                row, vendor_name, images=images.get(row["channel_message_id"], [])
+            )
+            for row in rows
+        ]
 
     async def has_images_in_context(
         self,
@@ -957,16 +1997,14 @@ class SQLiteRepository:
         vendor_name: str,
     ) -> bool:
         """Check if the channel's context contains any images."""
-        conn = self._ensure_connected()
-
-        def query_sync() -> sqlite3.Row | None:
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
             cursor = conn.execute(
                 _SELECT_HAS_IMAGES_IN_CONTEXT,
                 (channel_external_id, vendor_name, vendor_name),
             )
             return cast(sqlite3.Row | None, cursor.fetchone())
 
-        row = await asyncio.to_thread(query_sync)
+        row = await self._read(query_sync)
         return row is not None
 
     async def deactivate_old_messages(
@@ -974,30 +2012,39 @@ class SQLiteRepository:
         channel_external_id: int,
         vendor_name: str,
         window_size: int,
-    ) -> None:
-        """Mark messages outside the context window as inactive."""
-        conn = self._ensure_connected()
-
-        def update_sync() -> None:
-            conn.execute(
-                _DEACTIVATE_OLD_MESSAGES,
-                (
-                    channel_external_id,  # WHERE clause channel
-                    vendor_name,  # WHERE clause vendor
-                    vendor_name,  # WHERE clause "All Models" check
-                    channel_external_id,  # Subquery channel
-                    vendor_name,  # Subquery vendor
-                    vendor_name,  # Subquery "All Models" check
-                    window_size,  # LIMIT
-                ),
-            )
-            conn.commit()
+    ) -> int | None:
+        """Mark messages outside the context window as inactive.
 
-        await asyncio.to_thread(update_sync)
+        For "All Models" this only advances the channel's visible_from_id
+        watermark to the oldest message in the window; no message rows are
+        rewritten. Returns the cutoff id so callers can trim cached context
+        the same way.
+        """
+        def update_sync(conn: sqlite3.Connection) -> int | None:
+            if window_size > 0:
+                row = conn.execute(
+                    _SELECT_WINDOW_START,
+                    (channel_external_id, vendor_name, vendor_name, window_size - 1),
+                ).fetchone()
+                if row is None:
+                    # Fewer messages than the window; nothing to hide
+                    return None
+                cutoff = int(row[0])
+            else:
+                cutoff = int(
+                    conn.execute(
+                        _SELECT_NEXT_MESSAGE_ID, (channel_external_id,)
+                    ).fetchone()[0]
+                )
+            self._hide_messages_before_sync(conn, channel_external_id, vendor_name, cutoff)
+            return cutoff
+
+        cutoff = await self._write(update_sync)
         logger.debug(
             f"Deactivated old messages for channel {channel_external_id}, "
             f"vendor {vendor_name}, keeping {window_size}"
         )
+        return cutoff
 
     async def clear_messages(
         self,
@@ -1005,20 +2052,37 @@ class SQLiteRepository:
         vendor_name: str,
     ) -> None:
         """Soft-delete all messages for a channel and vendor."""
-        conn = self._ensure_connected()
-
-        def update_sync() -> None:
-            conn.execute(
-                _CLEAR_MESSAGES,
-                (channel_external_id, vendor_name, vendor_name),
-            )
-            conn.commit()
+        def update_sync(conn: sqlite3.Connection) -> None:
+            cutoff = conn.execute(
+                _SELECT_NEXT_MESSAGE_ID, (channel_external_id,)
+            ).fetchone()[0]
+            self._hide_messages_before_sync(conn, channel_external_id, vendor_name, cutoff)
 
-        await asyncio.to_thread(update_sync)
+        await self._write(update_sync)
         logger.debug(
             f"Cleared messages for channel {channel_external_id}, vendor {vendor_name}"
         )
 
+    @staticmethod
+    def _hide_messages_before_sync(
+        conn: sqlite3.Connection,
+        channel_external_id: int,
+        vendor_name: str,
+        cutoff: int,
+    ) -> None:
+        """Hide a channel's messages with ids below cutoff.
+
+        "All Models" moves the channel watermark; a single vendor has its
+        rows in the current window flagged invisible instead.
+        """
+        if vendor_name == "All Models":
+            conn.execute(_ADVANCE_VISIBLE_FROM_ID, (cutoff, channel_external_id))
+        else:
+            conn.execute(
+                _HIDE_VENDOR_MESSAGES_BEFORE,
+                (channel_external_id, channel_external_id, cutoff, vendor_name),
+            )
+
     async def deactivate_image_messages(
         self,
         channel_external_id: int,
@@ -1036,20 +2100,100 @@ class SQLiteRepository:
         if not message_ids:
             return
 
-        conn = self._ensure_connected()
-
-        def update_sync() -> None:
+        def update_sync(conn: sqlite3.Connection) -> None:
             # Build the query with correct number of placeholders
             placeholders = ",".join("?" for _ in message_ids)
             query = _DEACTIVATE_IMAGE_MESSAGES_BY_ID.format(placeholders=placeholders)
             conn.execute(query, message_ids)
-            conn.commit()
 
-        await asyncio.to_thread(update_sync)
+        await self._write(update_sync)
         logger.debug(
             f"Deactivated {len(message_ids)} image messages for channel {channel_external_id}"
         )
 
+    async def reserve_summary_slot(
+        self,
+        channel_external_id: int,
+        vendor_name: str,
+    ) -> int:
+        """Reserve the position a background summary will take in the context."""
+        prompt_token_count = await self._count_tokens(SUMMARY_PROMPT)
+
+        def insert_sync(conn: sqlite3.Connection) -> int:
+            conn.execute(
+                _INSERT_SUMMARY_PROMPT,
+                (channel_external_id, vendor_name, SUMMARY_PROMPT, prompt_token_count),
+            )
+            cursor = conn.execute(
+                _INSERT_SUMMARY_SLOT, (channel_external_id, vendor_name)
+            )
+            return cursor.lastrowid or 0
+
+        slot_id = await self._write(insert_sync)
+        logger.debug("summary_slot_reserved", slot_id=slot_id)
+        return slot_id
+
+    async def fill_summary_slot(
+        self,
+        channel_external_id: int,
+        slot_id: int,
+        summary: str,
+        token_count: int | None,
+    ) -> bool:
+        """Atomically replace the context before a slot with its summary.
+
+        Advancing the watermark to the slot's prompt hides everything older
+        in one statement; the token count triggers then drop the hidden rows
+        and add the prompt and summary. The slot becomes the channel's
+        rolling summary.
+        """
+        def update_sync(conn: sqlite3.Connection) -> bool:
+            row = conn.execute(
+                _SELECT_FILLABLE_SUMMARY_SLOT, (channel_external_id, slot_id)
+            ).fetchone()
+            if row is None:
+                return False
+            prompt_id = conn.execute(
+                _SELECT_SUMMARY_SLOT_PROMPT, (slot_id, SUMMARY_PROMPT)
+            ).fetchone()["channel_message_id"]
+            conn.execute(
+                _ADVANCE_VISIBLE_FROM_ID, (prompt_id or slot_id, channel_external_id)
+            )
+            if prompt_id is not None:
+                conn.execute(_SHOW_SUMMARY_PROMPT, (prompt_id,))
+            conn.execute(_FILL_SUMMARY_SLOT, (summary, token_count, slot_id))
+            conn.execute(
+                _SET_CHANNEL_SUMMARY_MESSAGE_ID, (slot_id, channel_external_id)
+            )
+            return True
+
+        filled = await self._write(update_sync)
+        logger.debug("summary_slot_filled", slot_id=slot_id, filled=filled)
+        return filled
+
+    async def release_summary_slot(self, slot_id: int) -> None:
+        """Delete a summary placeholder and its prompt if it was not filled."""
+        def delete_sync(conn: sqlite3.Connection) -> None:
+            prompt_id = conn.execute(
+                _SELECT_SUMMARY_SLOT_PROMPT, (slot_id, SUMMARY_PROMPT)
+            ).fetchone()["channel_message_id"]
+            cursor = conn.execute(_DELETE_SUMMARY_SLOT, (slot_id,))
+            if cursor.rowcount and prompt_id is not None:
+                conn.execute(_DELETE_SUMMARY_PROMPT, (prompt_id,))
+
+        await self._write(delete_sync)
+
+    async def get_rolling_summary(self, channel_external_id: int) -> Message | None:
+        """Get the channel's rolling summary if it is still in the context."""
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            cursor = conn.execute(_SELECT_ROLLING_SUMMARY, (channel_external_id,))
+            return cast(sqlite3.Row | None, cursor.fetchone())
+
+        row = await self._read(query_sync)
+        if row is None:
+            return None
+        return self._row_to_message(row, "", images=[])
+
     # =========================================================================
     # RateLimitRepository Implementation
     # =========================================================================
@@ -1060,9 +2204,7 @@ class SQLiteRepository:
         vendor_name: str,
     ) -> int:
         """Get the count of recent text requests for a channel and vendor."""
-        conn = self._ensure_connected()
-
-        def query_sync() -> int:
+        def query_sync(conn: sqlite3.Connection) -> int:
             cursor = conn.execute(
                 _COUNT_RECENT_TEXT_REQUESTS,
                 (channel_external_id, vendor_name),
@@ -1070,7 +2212,7 @@ class SQLiteRepository:
             row = cursor.fetchone()
             return row["count"] if row else 0
 
-        return await asyncio.to_thread(query_sync)
+        return await self._read(query_sync)
 
     async def get_recent_image_request_count(
         self,
@@ -1078,9 +2220,7 @@ class SQLiteRepository:
         vendor_name: str,
     ) -> int:
         """Get the count of recent image requests for a channel and vendor."""
-        conn = self._ensure_connected()
-
-        def query_sync() -> int:
+        def query_sync(conn: sqlite3.Connection) -> int:
             cursor = conn.execute(
                 _COUNT_RECENT_IMAGE_REQUESTS,
                 (channel_external_id, vendor_name),
@@ -1088,7 +2228,7 @@ class SQLiteRepository:
             row = cursor.fetchone()
             return row["count"] if row else 0
 
-        return await asyncio.to_thread(query_sync)
+        return await self._read(query_sync)
 
     # =========================================================================
     # ApiKeyRepository Implementation
@@ -1117,25 +2257,21 @@ class SQLiteRepository:
 
     async def get_by_hash(self, key_hash: str) -> ApiKey | None:
         """Retrieve an API key by its hash."""
-        conn = self._ensure_connected()
-
-        def query_sync() -> sqlite3.Row | None:
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
             cursor = conn.execute(_SELECT_API_KEY_BY_HASH, (key_hash,))
             return cast(sqlite3.Row | None, cursor.fetchone())
 
-        row = await asyncio.to_thread(query_sync)
+        row = await self._read(query_sync)
         if row is None:
             return None
         return self._row_to_api_key(row)
 
     async def create(self, api_key: ApiKey) -> ApiKey:
         """Create a new API key record."""
-        conn = self._ensure_connected()
-
         scopes_json = json.dumps(api_key.scopes)
         expires_at = api_key.expires_at.isoformat() if api_key.expires_at else None
 
-        def insert_sync() -> int:
+        def insert_sync(conn: sqlite3.Connection) -> int:
             cursor = conn.execute(
                 _INSERT_API_KEY,
                 (
@@ -1146,10 +2282,9 @@ class SQLiteRepository:
                     expires_at,
                 ),
             )
-            conn.commit()
             return cursor.lastrowid or 0
 
-        api_key_id = await asyncio.to_thread(insert_sync)
+        api_key_id = await self._write(insert_sync)
         logger.debug("api_key_created", api_key_id=api_key_id)
 
         # Return the created key with ID populated
@@ -1167,25 +2302,19 @@ class SQLiteRepository:
 
     async def update_last_used(self, key_hash: str) -> None:
         """Update the last_used_at timestamp for an API key."""
-        conn = self._ensure_connected()
-
-        def update_sync() -> None:
+        def update_sync(conn: sqlite3.Connection) -> None:
             conn.execute(_UPDATE_API_KEY_LAST_USED, (key_hash,))
-            conn.commit()
 
-        await asyncio.to_thread(update_sync)
+        await self._write(update_sync)
         logger.debug("api_key_last_used_updated", key_hash_prefix=key_hash[:8])
 
     async def revoke(self, key_hash: str) -> bool:
         """Revoke an API key by setting is_active to False."""
-        conn = self._ensure_connected()
-
-        def update_sync() -> int:
+        def update_sync(conn: sqlite3.Connection) -> int:
             cursor = conn.execute(_REVOKE_API_KEY, (key_hash,))
-            conn.commit()
             return cursor.rowcount
 
-        rows_affected = await asyncio.to_thread(update_sync)
+        rows_affected = await self._write(update_sync)
         if rows_affected > 0:
             logger.info("api_key_revoked", key_hash_prefix=key_hash[:8])
             return True
@@ -1204,15 +2333,32 @@ class SQLiteRepository:
         Returns:
             True if the user is banned, False otherwise.
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> sqlite3.Row | None:
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
             cursor = conn.execute(_SELECT_BAN_BY_USER_ID, (user_id,))
             return cast(sqlite3.Row | None, cursor.fetchone())
 
-        row = await asyncio.to_thread(query_sync)
+        row = await self._read(query_sync)
         return row is not None
 
+    async def get_access_lists(self) -> tuple[set[int], dict[int, str]]:
+        """Get every whitelisted user ID and every ban, for in-memory checks.
+
+        Returns:
+            Tuple of (whitelisted user IDs, mapping of banned user ID to reason).
+        """
+        def query_sync(
+            conn: sqlite3.Connection,
+        ) -> tuple[list[sqlite3.Row], list[sqlite3.Row]]:
+            whitelist = conn.execute(_SELECT_WHITELISTED_USER_IDS).fetchall()
+            bans = conn.execute(_SELECT_BAN_REASONS).fetchall()
+            return whitelist, bans
+
+        whitelist_rows, ban_rows = await self._read(query_sync)
+        return (
+            {row["user_id"] for row in whitelist_rows},
+            {row["user_id"]: row["reason"] for row in ban_rows},
+        )
+
     async def get_ban_reason(self, user_id: int) -> str | None:
         """Get the ban reason for a user.
 
@@ -1222,13 +2368,11 @@ class SQLiteRepository:
         Returns:
             The ban reason if the user is banned, None otherwise.
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> sqlite3.Row | None:
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
             cursor = conn.execute(_SELECT_BAN_BY_USER_ID, (user_id,))
             return cast(sqlite3.Row | None, cursor.fetchone())
 
-        row = await asyncio.to_thread(query_sync)
+        row = await self._read(query_sync)
         if row is None:
             return None
         return cast(str, row["reason"])
@@ -1251,17 +2395,14 @@ class SQLiteRepository:
         Raises:
             sqlite3.IntegrityError: If the user is already banned.
         """
-        conn = self._ensure_connected()
-
-        def insert_sync() -> None:
+        def insert_sync(conn: sqlite3.Connection) -> None:
             conn.execute(_INSERT_BAN, (user_id, username, reason))
             conn.execute(
                 _INSERT_BAN_HISTORY,
                 (user_id, username, "ban", reason, performed_by),
             )
-            conn.commit()
 
-        await asyncio.to_thread(insert_sync)
+        await self._write(insert_sync)
         logger.info(
             "user_banned",
             user_id=user_id,
@@ -1277,25 +2418,19 @@ class SQLiteRepository:
             user_id: The Discord user ID to unban.
             performed_by: The username of the person performing the unban.
         """
-        conn = self._ensure_connected()
-
-        # Get the username for the history record before deleting
-        def get_username_sync() -> str | None:
+        def delete_sync(conn: sqlite3.Connection) -> None:
+            # Read the username for the history record inside the same write
+            # so a concurrent ban/unban cannot slip in between
             cursor = conn.execute(_SELECT_BAN_BY_USER_ID, (user_id,))
             row = cursor.fetchone()
-            return row["username"] if row else None
-
-        username = await asyncio.to_thread(get_username_sync)
-
-        def delete_sync() -> None:
+            username = row["username"] if row else None
             conn.execute(_DELETE_BAN, (user_id,))
             conn.execute(
                 _INSERT_BAN_HISTORY,
                 (user_id, username or "unknown", "unban", None, performed_by),
             )
-            conn.commit()
 
-        await asyncio.to_thread(delete_sync)
+        await self._write(delete_sync)
         logger.info("user_unbanned", user_id=user_id, performed_by=performed_by)
 
     # =========================================================================
@@ -1312,13 +2447,11 @@ class SQLiteRepository:
         Returns:
             The preset as a dictionary, or None if not found.
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> sqlite3.Row | None:
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
             cursor = conn.execute(_SELECT_PRESET, (guild_id, name))
             return cast(sqlite3.Row | None, cursor.fetchone())
 
-        row = await asyncio.to_thread(query_sync)
+        row = await self._read(query_sync)
         if row is None:
             return None
         return self._row_to_dict(row)
@@ -1332,13 +2465,11 @@ class SQLiteRepository:
         Returns:
             List of presets as dictionaries, ordered by name.
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> list[sqlite3.Row]:
+        def query_sync(conn: sqlite3.Connection) -> list[sqlite3.Row]:
             cursor = conn.execute(_SELECT_PRESETS_BY_GUILD, (guild_id,))
             return cursor.fetchall()
 
-        rows = await asyncio.to_thread(query_sync)
+        rows = await self._read(query_sync)
         return [self._row_to_dict(row) for row in rows]
 
     async def count_presets(self, guild_id: str) -> int:
@@ -1350,14 +2481,12 @@ class SQLiteRepository:
         Returns:
             The number of presets in the guild.
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> int:
+        def query_sync(conn: sqlite3.Connection) -> int:
             cursor = conn.execute(_COUNT_PRESETS_BY_GUILD, (guild_id,))
             row = cursor.fetchone()
             return row["count"] if row else 0
 
-        return await asyncio.to_thread(query_sync)
+        return await self._read(query_sync)
 
     async def create_preset(
         self,
@@ -1376,16 +2505,13 @@ class SQLiteRepository:
             prompt_text: The full behavior prompt text.
             created_by: The Discord user ID who created the preset.
         """
-        conn = self._ensure_connected()
-
-        def insert_sync() -> None:
+        def insert_sync(conn: sqlite3.Connection) -> None:
             conn.execute(
                 _INSERT_PRESET,
                 (guild_id, name, description, prompt_text, created_by),
             )
-            conn.commit()
 
-        await asyncio.to_thread(insert_sync)
+        await self._write(insert_sync)
         logger.debug("preset_created", name=name, guild_id=guild_id)
 
     async def update_preset(
@@ -1403,16 +2529,13 @@ class SQLiteRepository:
             description: New description (optional, None keeps existing).
             prompt_text: New prompt text (optional, None keeps existing).
         """
-        conn = self._ensure_connected()
-
-        def update_sync() -> None:
+        def update_sync(conn: sqlite3.Connection) -> None:
             conn.execute(
                 _UPDATE_PRESET,
                 (description, prompt_text, guild_id, name),
             )
-            conn.commit()
 
-        await asyncio.to_thread(update_sync)
+        await self._write(update_sync)
         logger.debug("preset_updated", name=name, guild_id=guild_id)
 
     async def delete_preset(self, guild_id: str, name: str) -> None:
@@ -1422,13 +2545,10 @@ class SQLiteRepository:
             guild_id: The Discord guild ID.
             name: The preset name to delete.
         """
-        conn = self._ensure_connected()
-
-        def delete_sync() -> None:
+        def delete_sync(conn: sqlite3.Connection) -> None:
             conn.execute(_DELETE_PRESET, (guild_id, name))
-            conn.commit()
 
-        await asyncio.to_thread(delete_sync)
+        await self._write(delete_sync)
         logger.debug("preset_deleted", name=name, guild_id=guild_id)
 
     # =========================================================================
@@ -1455,16 +2575,13 @@ class SQLiteRepository:
             query_text: The search query that was rejected.
             rejection_reason: The reason the query was rejected.
         """
-        conn = self._ensure_connected()
-
-        def insert_sync() -> None:
+        def insert_sync(conn: sqlite3.Connection) -> None:
             conn.execute(
                 _INSERT_SEARCH_REJECTION,
                 (user_id, channel_id, guild_id, query_text, rejection_reason),
             )
-            conn.commit()
 
-        await asyncio.to_thread(insert_sync)
+        await self._write(insert_sync)
         logger.debug(
             f"Logged search rejection for user {user_id} in channel {channel_id}"
         )
@@ -1496,16 +2613,13 @@ class SQLiteRepository:
                 or 'describe_this').
             was_used: Whether the user selected the refined version.
         """
-        conn = self._ensure_connected()
-
-        def insert_sync() -> None:
+        def insert_sync(conn: sqlite3.Connection) -> None:
             conn.execute(
                 _INSERT_PROMPT_REFINEMENT,
                 (channel_id, user_id, original_prompt, refined_prompt, refinement_type, was_used),
             )
-            conn.commit()
 
-        await asyncio.to_thread(insert_sync)
+        await self._write(insert_sync)
         logger.debug(
             f"Saved prompt refinement for user {user_id} in channel {channel_id}, "
             f"type={refinement_type}, was_used={was_used}"
@@ -1529,13 +2643,11 @@ class SQLiteRepository:
                 'modify_image': {'total': 50, 'used': 30, 'usage_rate': 60},
             }
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> list[sqlite3.Row]:
+        def query_sync(conn: sqlite3.Connection) -> list[sqlite3.Row]:
             cursor = conn.execute(_SELECT_REFINEMENT_STATS)
             return cursor.fetchall()
 
-        rows = await asyncio.to_thread(query_sync)
+        rows = await self._read(query_sync)
 
         stats: dict[str, dict[str, int]] = {}
         for row in rows:
@@ -1578,21 +2690,57 @@ class SQLiteRepository:
             outcome: The outcome ('success', 'error', 'timeout', 'cancelled',
                 'rate_limited').
         """
-        conn = self._ensure_connected()
-
-        def insert_sync() -> None:
+        def insert_sync(conn: sqlite3.Connection) -> None:
             conn.execute(
                 _INSERT_USAGE_LOG,
                 (user_id, username, guild_id, command_name, command_type, outcome),
             )
-            conn.commit()
 
-        await asyncio.to_thread(insert_sync)
+        await self._write(insert_sync)
         logger.debug(
             f"Logged command usage: user={user_id}, command={command_name}, "
             f"type={command_type}, outcome={outcome}"
         )
 
+    async def log_command_usage_batch(self, events: list[UsageEvent]) -> int:
+        """Log a batch of command usage events in one transaction.
+
+        Only events for users who are whitelisted and not banned at the time
+        of the write are recorded; others are silently skipped.
+
+        Args:
+            events: The usage events to record.
+
+        Returns:
+            Number of events written to the usage log.
+        """
+        if not events:
+            return 0
+
+        params = [
+            (
+                event.user_id,
+                event.username,
+                event.guild_id,
+                event.command_name,
+                event.command_type,
+                event.outcome,
+                # Same format as SQLite's CURRENT_TIMESTAMP default
+                event.timestamp.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+                event.user_id,
+                event.user_id,
+            )
+            for event in events
+        ]
+
+        def insert_sync(conn: sqlite3.Connection) -> int:
+            cursor = conn.executemany(_INSERT_USAGE_LOG_IF_ELIGIBLE, params)
+            return cursor.rowcount
+
+        written = await self._write(insert_sync)
+        logger.debug("usage_batch_logged", received=len(events), written=written)
+        return written
+
     async def get_top_users_by_usage(
         self,
         guild_id: int | None,
@@ -1611,16 +2759,14 @@ class SQLiteRepository:
             List of dicts with keys: user_id, username, image_count, text_count, score.
             Ordered by score descending.
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> list[sqlite3.Row]:
+        def query_sync(conn: sqlite3.Connection) -> list[sqlite3.Row]:
             cursor = conn.execute(
                 _SELECT_TOP_USERS_BY_USAGE,
                 (guild_id, guild_id, limit),
             )
             return cursor.fetchall()
 
-        rows = await asyncio.to_thread(query_sync)
+        rows = await self._read(query_sync)
 
         return [
             {
@@ -1648,16 +2794,14 @@ class SQLiteRepository:
             Dict with keys: user_id, username, image_count, text_count, score.
             Returns None if the user has no usage records.
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> sqlite3.Row | None:
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
             cursor = conn.execute(
                 _SELECT_USER_USAGE_STATS,
                 (user_id, guild_id, guild_id),
             )
             return cast(sqlite3.Row | None, cursor.fetchone())
 
-        row = await asyncio.to_thread(query_sync)
+        row = await self._read(query_sync)
 
         if row is None:
             return None
@@ -1683,13 +2827,11 @@ class SQLiteRepository:
         Returns:
             True if the user is whitelisted, False otherwise.
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> sqlite3.Row | None:
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
             cursor = conn.execute(_SELECT_WHITELIST_BY_USER_ID, (user_id,))
             return cast(sqlite3.Row | None, cursor.fetchone())
 
-        row = await asyncio.to_thread(query_sync)
+        row = await self._read(query_sync)
         return row is not None
 
     async def get_whitelist_entry(self, user_id: int) -> dict[str, Any] | None:
@@ -1701,13 +2843,11 @@ class SQLiteRepository:
         Returns:
             The whitelist entry as a dictionary, or None if not found.
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> sqlite3.Row | None:
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
             cursor = conn.execute(_SELECT_WHITELIST_BY_USER_ID, (user_id,))
             return cast(sqlite3.Row | None, cursor.fetchone())
 
-        row = await asyncio.to_thread(query_sync)
+        row = await self._read(query_sync)
         if row is None:
             return None
         return self._row_to_dict(row)
@@ -1730,13 +2870,10 @@ class SQLiteRepository:
         Raises:
             sqlite3.IntegrityError: If the user is already whitelisted.
         """
-        conn = self._ensure_connected()
-
-        def insert_sync() -> None:
+        def insert_sync(conn: sqlite3.Connection) -> None:
             conn.execute(_INSERT_WHITELIST, (user_id, username, added_by, notes))
-            conn.commit()
 
-        await asyncio.to_thread(insert_sync)
+        await self._write(insert_sync)
         logger.info(
             "user_whitelisted",
             user_id=user_id,
@@ -1750,13 +2887,10 @@ class SQLiteRepository:
         Args:
             user_id: The Discord user ID to remove.
         """
-        conn = self._ensure_connected()
-
-        def delete_sync() -> None:
+        def delete_sync(conn: sqlite3.Connection) -> None:
             conn.execute(_DELETE_WHITELIST, (user_id,))
-            conn.commit()
 
-        await asyncio.to_thread(delete_sync)
+        await self._write(delete_sync)
         logger.info("user_removed_from_whitelist", user_id=user_id)
 
     async def list_whitelist(self) -> list[dict[str, Any]]:
@@ -1765,11 +2899,50 @@ class SQLiteRepository:
         Returns:
             List of whitelist entries as dictionaries, ordered by added_at desc.
         """
-        conn = self._ensure_connected()
-
-        def query_sync() -> list[sqlite3.Row]:
+        def query_sync(conn: sqlite3.Connection) -> list[sqlite3.Row]:
             cursor = conn.execute(_SELECT_ALL_WHITELIST)
             return cursor.fetchall()
 
-        rows = await asyncio.to_thread(query_sync)
+        rows = await self._read(query_sync)
         return [self._row_to_dict(row) for row in rows]
+
+    # =========================================================================
+    # Haiku cache persistent tier
+    # =========================================================================
+
+    async def get_cached_completion(self, key: str) -> tuple[str, float] | None:
+        """Get a persisted Haiku completion.
+
+        Args:
+            key: Cache key built by make_cache_key.
+
+        Returns:
+            Tuple of (completion, expiry as a Unix timestamp), or None.
+        """
+        def query_sync(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            cursor = conn.execute(_SELECT_HAIKU_CACHE, (key,))
+            return cast(sqlite3.Row | None, cursor.fetchone())
+
+        row = await self._read(query_sync)
+        if row is None:
+            return None
+        return str(row["value"]), float(row["expires_at"])
+
+    async def put_cached_completion(
+        self, key: str, feature: str, value: str, expires_at: float
+    ) -> None:
+        """Persist a Haiku completion, dropping entries that have expired.
+
+        Args:
+            key: Cache key built by make_cache_key.
+            feature: The feature that produced the completion.
+            value: The completion text.
+            expires_at: Unix timestamp after which the entry is stale.
+        """
+        now = time.time()
+
+        def upsert_sync(conn: sqlite3.Connection) -> None:
+            conn.execute(_DELETE_EXPIRED_HAIKU_CACHE, (now,))
+            conn.execute(_UPSERT_HAIKU_CACHE, (key, feature, value, expires_at))
+
+        await self._write(upsert_sync)
@@ -0,0 +1,187 @@
+"""Background, batched writer for command usage events.
+
+Logging usage used to cost every command a whitelist lookup, a ban lookup
+and a committed INSERT, all awaited on the command's own task. UsageLogger
+takes that off the command path: record() appends to an in-memory ring
+buffer and returns immediately, and a background task writes the buffer to
+the usage log in batches, one transaction per batch.
+
+A batch is flushed when batch_size events are waiting or flush_interval
+seconds have passed, whichever comes first. close() stops the task and
+flushes whatever is left, so a clean shutdown loses nothing. If the buffer
+fills up (the database is unavailable for a long time), the oldest events
+are dropped and counted.
+
+Example:
+    usage_logger = UsageLogger(repo.log_command_usage_batch)
+    usage_logger.start()
+    usage_logger.record(event)
+    ...
+    await usage_logger.close()
+"""
+
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from src.core.logging import get_logger
+from src.core.stats import StatsSnapshot
+from src.ports.repositories import UsageEvent
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+DEFAULT_CAPACITY = 10_000
+
+# Writes a batch of events and returns how many were stored
+UsageSink = Callable[[list[UsageEvent]], Awaitable[int]]
+
+
+@dataclass
+class UsageLoggerStats(StatsSnapshot):
+    """Snapshot of usage logger metrics.
+
+    Attributes:
+        recorded: Events accepted by record().
+        written: Events the sink reported as stored.
+        dropped: Events discarded because the buffer was full.
+        batches: Batches handed to the sink.
+        failed_batches: Batches whose write raised.
+        pending: Events waiting in the buffer.
+    """
+
+    recorded: int = 0
+    written: int = 0
+    dropped: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    pending: int = 0
+
+
+class UsageLogger:
+    """Buffers usage events and writes them to a sink in batches.
+
+    Attributes:
+        batch_size: Events per write, and the backlog that triggers a flush.
+        flush_interval: Maximum seconds an event waits before being written.
+        capacity: Maximum events buffered before the oldest are dropped.
+    """
+
+    def __init__(
+        self,
+        sink: UsageSink,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        """Initialize the logger. Call start() to begin background flushing.
+
+        Args:
+            sink: Async function that stores a batch of events.
+            batch_size: Events per write, and the backlog that triggers a flush.
+            flush_interval: Maximum seconds an event waits before being written.
+            capacity: Maximum events buffered before the oldest are dropped.
+
+        Raises:
+            ValueError: If batch_size or capacity is less than 1, or
+                flush_interval is not positive.
+        """
+        if batch_size < 1 or capacity < 1:
+            raise ValueError("batch_size and capacity must be at least 1")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.capacity = capacity
+        self._sink = sink
+        self._buffer: deque[UsageEvent] = deque(maxlen=capacity)
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._stats = UsageLoggerStats()
+
+    def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="usage-logger")
+
+    def record(self, event: UsageEvent) -> None:
+        """Queue an event for the next batch. Never blocks or raises.
+
+        Args:
+            event: The usage event to record.
+        """
+        if len(self._buffer) == self.capacity:
+            # deque(maxlen) discards the oldest entry on append
+            self._stats.dropped += 1
+            if self._stats.dropped == 1 or self._stats.dropped % 1000 == 0:
+                logger.warning("usage_events_dropped", dropped=self._stats.dropped)
+        self._buffer.append(event)
+        self._stats.recorded += 1
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Write every buffered event, one batch_size batch at a time."""
+        async with self._flush_lock:
+            while self._buffer:
+                batch = [
+                    self._buffer.popleft()
+                    for _ in range(min(self.batch_size, len(self._buffer)))
+                ]
+                if not await self._write_batch(batch):
+                    break
+
+    async def close(self) -> None:
+        """Stop background flushing and write everything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+        logger.info("usage_logger_closed", **self.stats().to_dict())
+
+    def stats(self) -> UsageLoggerStats:
+        """Return a copy of the current metrics."""
+        return UsageLoggerStats(
+            recorded=self._stats.recorded,
+            written=self._stats.written,
+            dropped=self._stats.dropped,
+            batches=self._stats.batches,
+            failed_batches=self._stats.failed_batches,
+            pending=len(self._buffer),
+        )
+
+    async def _run(self) -> None:
+        """Flush whenever a batch fills up or the interval elapses."""
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+    async def _write_batch(self, batch: list[UsageEvent]) -> bool:
+        """Hand a batch to the sink, requeueing it if the write fails.
+
+        Returns:
+            True if the batch was written.
+        """
+        self._stats.batches += 1
+        try:
+            self._stats.written += await self._sink(batch)
+            return True
+        except Exception as ex:
+            self._stats.failed_batches += 1
+            logger.warning("usage_flush_failed", error=str(ex), batch_size=len(batch))
+            # Put the batch back in front of newer events, as far as capacity
+            # allows; whatever does not fit is dropped
+            room = self.capacity - len(self._buffer)
+            kept = batch[len(batch) - room :] if room < len(batch) else batch
+            self._stats.dropped += len(batch) - len(kept)
+            self._buffer.extendleft(reversed(kept))
+            return False
@@ -28,6 +28,9 @@ from src.api.routes import (
     websocket_router,
 )
 from src.api.routes.auth import configure_api_key_repository
+from src.core.bulkhead import bulkhead_stats
+from src.core.circuit_breaker import get_circuit_breaker
+from src.core.haiku_cache import get_haiku_cache
 from src.core.health import HealthChecker, ServiceCheck, ServiceStatus
 from src.core.logging import get_logger
 
@@ -63,6 +66,10 @@ def _create_health_checker(app_state: AppState) -> HealthChecker:
                 name="database",
                 status=ServiceStatus.HEALTHY,
                 message="Connected",
+                details={
+                    "executor": app_state.sqlite_repository.executor_stats(),
+                    "context_cache": app_state.repository.context_cache_stats(),
+                },
             )
         except Exception as ex:
             return ServiceCheck(
@@ -86,6 +93,10 @@ def _create_health_checker(app_state: AppState) -> HealthChecker:
                     name="anthropic",
                     status=ServiceStatus.HEALTHY,
                     message="API key configured",
+                    details={
+                        "haiku_cache": get_haiku_cache().stats().to_dict(),
+                        "bulkheads": bulkhead_stats("anthropic", "haiku"),
+                    },
                 )
             return ServiceCheck(
                 name="anthropic",
@@ -114,6 +125,7 @@ def _create_health_checker(app_state: AppState) -> HealthChecker:
                     name="fal",
                     status=ServiceStatus.HEALTHY,
                     message="API key configured",
+                    details={"bulkheads": bulkhead_stats("fal", "serpapi")},
                 )
             return ServiceCheck(
                 name="fal",
@@ -130,6 +142,12 @@ def _create_health_checker(app_state: AppState) -> HealthChecker:
     checker.add_check("database", check_database)
     checker.add_check("anthropic", check_anthropic)
     checker.add_check("fal", check_fal)
+    checker.add_circuit_breakers(
+        "anthropic", get_circuit_breaker("anthropic"), get_circuit_breaker("haiku")
+    )
+    checker.add_circuit_breakers(
+        "fal", get_circuit_breaker("fal"), get_circuit_breaker("serpapi")
+    )
 
     return checker
 
@@ -159,6 +177,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         fal_api_key=fal_key,
         chat_rate_limit=chat_limit,
         image_rate_limit=image_limit,
+        persist_haiku_cache=os.getenv("HAIKU_CACHE_PERSIST", "").lower() == "true",
     )
 
     # Configure API key repository for persistent storage
@@ -20,6 +20,12 @@ Example:
 from collections.abc import AsyncGenerator
 
 from src.adapters import GCSAdapter, RepositoryAdapter, SQLiteRepository
+from src.core.anthropic_clients import (
+    close_anthropic_clients,
+    get_anthropic_client_registry,
+)
+from src.core.conversation import ContextBuilder
+from src.core.haiku_cache import get_haiku_cache
 from src.core.logging import get_logger
 from src.core.providers import AIProvider, ImageProvider
 from src.core.rate_limit import (
@@ -45,6 +51,8 @@ class AppState:
         self._image_provider: ImageProvider | None = None
         self._rate_limiter: SlidingWindowRateLimiter | None = None
         self._gcs_adapter: GCSAdapter | None = None
+        # Pure logic with no resources to set up, so it exists from the start
+        self._context_builder = ContextBuilder(max_messages=50, max_tokens=100000)
         self._initialized = False
 
     @property
@@ -59,6 +67,7 @@ class AppState:
         fal_api_key: str | None = None,
         chat_rate_limit: int = 30,
         image_rate_limit: int = 8,
+        persist_haiku_cache: bool = False,
     ) -> None:
         """Initialize all providers and repositories.
 
@@ -68,6 +77,8 @@ class AppState:
             fal_api_key: Fal.AI API key (or None to use env var).
             chat_rate_limit: Max chat requests per hour.
             image_rate_limit: Max image requests per hour.
+            persist_haiku_cache: Keep cached Haiku completions in the
+                database so they survive restarts.
         """
         if self._initialized:
             logger.warning("app_state_already_initialized")
@@ -78,21 +89,34 @@ class AppState:
         from src.providers.fal_provider import FalAIProvider
 
         # Initialize repository
-        self._repository = SQLiteRepository(db_path)
+        self._repository = SQLiteRepository(db_path, wal_mode=True)
         await self._repository.connect()
         self._repo_adapter = RepositoryAdapter(self._repository)
         await self._repo_adapter.validate_vendors()
-        logger.info("repository_initialized", db_path=db_path)
+        logger.info(
+            "repository_initialized",
+            db_path=db_path,
+            wal_mode=self._repository.wal_mode,
+        )
 
         # Initialize AI providers
         if not anthropic_api_key:
             raise RuntimeError("Anthropic API key is required")
         if not fal_api_key:
             raise RuntimeError("Fal.AI API key is required")
-        self._ai_provider = AnthropicProvider(api_key=anthropic_api_key)
+        self._ai_provider = AnthropicProvider(
+            api_key=anthropic_api_key, prompt_caching=True
+        )
         self._image_provider = FalAIProvider(api_key=fal_api_key)
         logger.info("ai_providers_initialized", providers=["anthropic", "fal"])
 
+        # Open the shared Anthropic connection pool before the first request
+        await get_anthropic_client_registry().warm_up(anthropic_api_key)
+
+        # Keep deterministic Haiku completions across restarts if requested
+        if persist_haiku_cache:
+            get_haiku_cache().attach_store(self._repository)
+
         # Initialize GCS adapter
         self._gcs_adapter = GCSAdapter()
         logger.info("gcs_adapter_initialized")
@@ -117,9 +141,11 @@ class AppState:
 
     async def shutdown(self) -> None:
         """Clean up resources on shutdown."""
+        get_haiku_cache().attach_store(None)
         if self._repository is not None:
             await self._repository.close()
             logger.info("repository_closed")
+        await close_anthropic_clients()
         self._initialized = False
         logger.info("app_state_shutdown")
 
@@ -162,6 +188,11 @@ class AppState:
             raise RuntimeError("App state not initialized")
         return self._rate_limiter
 
+    @property
+    def context_builder(self) -> ContextBuilder:
+        """Get the context builder used to window conversation history."""
+        return self._context_builder
+
     @property
     def gcs_adapter(self) -> GCSAdapter:
         """Get the GCS adapter."""
@@ -202,3 +233,8 @@ async def get_rate_limiter() -> AsyncGenerator[SlidingWindowRateLimiter, None]:
 async def get_gcs_adapter() -> AsyncGenerator[GCSAdapter, None]:
     """FastAPI dependency for GCS adapter."""
     yield _app_state.gcs_adapter
+
+
+async def get_context_builder() -> AsyncGenerator[ContextBuilder, None]:
+    """FastAPI dependency for context builder."""
+    yield _app_state.context_builder
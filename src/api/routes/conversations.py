@@ -3,13 +3,22 @@
 These routes provide endpoints for managing conversations and messages.
 """
 
+import json
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from src.adapters import RepositoryAdapter
 from src.api.auth import AuthUser, get_current_user
-from src.api.dependencies import get_ai_provider, get_rate_limiter, get_repository
+from src.api.dependencies import (
+    get_ai_provider,
+    get_context_builder,
+    get_rate_limiter,
+    get_repository,
+)
 from src.api.schemas import (
     ChatCompletionRequest,
     ChatCompletionResponse,
@@ -18,7 +27,14 @@ from src.api.schemas import (
     ErrorResponse,
     MessageResponse,
 )
-from src.core.conversation import convert_context_to_messages
+from src.api.websocket import (
+    ConnectionManager,
+    create_error_event,
+    create_message_chunk_event,
+    create_new_message_event,
+    get_connection_manager,
+)
+from src.core.conversation import ContextBuilder
 from src.core.logging import bind_contextvars, clear_contextvars, get_logger
 from src.core.providers import AIProvider
 from src.core.rate_limit import SlidingWindowRateLimiter
@@ -44,6 +60,7 @@ async def create_conversation(
     repo: RepositoryAdapter = Depends(get_repository),
     ai_provider: AIProvider = Depends(get_ai_provider),
     rate_limiter: SlidingWindowRateLimiter = Depends(get_rate_limiter),
+    context_builder: ContextBuilder = Depends(get_context_builder),
 ) -> ConversationResponse:
     """Create a new conversation.
 
@@ -108,11 +125,11 @@ async def create_conversation(
             msg_id += 1
 
             # Get AI response
-            context = await repo.get_visible_messages(conversation_id, "All Models")
-            chat_messages, system_prompt = convert_context_to_messages(context)
+            context = await repo.get_visible_text_messages(conversation_id, "All Models")
+            conversation = context_builder.build_from_context(context)
 
             chat_response = await ai_provider.chat(
-                chat_messages, system_prompt=system_prompt
+                conversation.messages, system_prompt=conversation.system_prompt
             )
 
             # Save assistant response
@@ -170,7 +187,7 @@ async def get_conversation(
         logger.info("retrieving_conversation", user_id=user.user_id)
 
         # Get all visible messages
-        context = await repo.get_visible_messages(conversation_id, "All Models")
+        context = await repo.get_visible_text_messages(conversation_id, "All Models")
 
         if not context:
             # Check if channel exists but has no messages
@@ -231,6 +248,7 @@ async def send_message(
     repo: RepositoryAdapter = Depends(get_repository),
     ai_provider: AIProvider = Depends(get_ai_provider),
     rate_limiter: SlidingWindowRateLimiter = Depends(get_rate_limiter),
+    context_builder: ContextBuilder = Depends(get_context_builder),
 ) -> ChatCompletionResponse:
     """Send a message in a conversation and get an AI response."""
     bind_contextvars(conversation_id=conversation_id, user_id=user.user_id)
@@ -262,11 +280,11 @@ async def send_message(
         )
 
         # Get context and generate response
-        context = await repo.get_visible_messages(conversation_id, "All Models")
-        chat_messages, system_prompt = convert_context_to_messages(context)
+        context = await repo.get_visible_text_messages(conversation_id, "All Models")
+        conversation = context_builder.build_from_context(context)
 
         chat_response = await ai_provider.chat(
-            chat_messages, system_prompt=system_prompt
+            conversation.messages, system_prompt=conversation.system_prompt
         )
 
         # Save assistant response
@@ -308,6 +326,130 @@ async def send_message(
         clear_contextvars()
 
 
+def _sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format a Server-Sent Events frame with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post(
+    "/{conversation_id}/messages:stream",
+    responses={
+        200: {
+            "description": "Response streamed as Server-Sent Events",
+            "content": {"text/event-stream": {}},
+        },
+        401: {"model": ErrorResponse, "description": "Authentication required"},
+        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
+    },
+)
+async def stream_message(
+    conversation_id: int,
+    request: ChatCompletionRequest,
+    user: AuthUser = Depends(get_current_user),
+    repo: RepositoryAdapter = Depends(get_repository),
+    ai_provider: AIProvider = Depends(get_ai_provider),
+    rate_limiter: SlidingWindowRateLimiter = Depends(get_rate_limiter),
+    context_builder: ContextBuilder = Depends(get_context_builder),
+    connections: ConnectionManager = Depends(get_connection_manager),
+) -> StreamingResponse:
+    """Send a message and stream the AI response as Server-Sent Events.
+
+    Emits a "chunk" event per piece of generated text, then a "done" event
+    with the saved assistant message and its database ID, or an "error"
+    event if generation fails. Chunks are mirrored to /ws/conversations/{id} subscribers. The
+    assistant message is saved once, when the stream completes.
+    """
+    bind_contextvars(conversation_id=conversation_id, user_id=user.user_id)
+
+    try:
+        logger.info("streaming_message", user_id=user.user_id)
+
+        # Check rate limit using authenticated user's ID
+        rate_check = await rate_limiter.check(user.user_id, "chat")
+        if not rate_check.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail={
+                    "error": "Rate limit exceeded",
+                    "wait_seconds": rate_check.wait_seconds,
+                },
+            )
+
+        await repo.create_channel(conversation_id)
+        await repo.add_message(
+            conversation_id,
+            "Anthropic",
+            "prompt",
+            False,
+            request.content,
+        )
+
+        context = await repo.get_visible_text_messages(conversation_id, "All Models")
+        conversation = context_builder.build_from_context(context)
+
+    finally:
+        clear_contextvars()
+
+    async def events() -> AsyncIterator[str]:
+        bind_contextvars(conversation_id=conversation_id, user_id=user.user_id)
+        chunks: list[str] = []
+        try:
+            async for delta in ai_provider.chat_stream(
+                conversation.messages, system_prompt=conversation.system_prompt
+            ):
+                if not delta:
+                    continue
+                index = len(chunks)
+                chunks.append(delta)
+                yield _sse_event("chunk", {"index": index, "delta": delta})
+                await connections.send_to_conversation(
+                    conversation_id,
+                    create_message_chunk_event(conversation_id, index, delta),
+                )
+
+            content = "".join(chunks)
+            message_id = await repo.add_message(
+                conversation_id,
+                "Anthropic",
+                "assistant",
+                False,
+                content,
+            )
+            await rate_limiter.record(user.user_id, "chat")
+
+            assistant_message = MessageResponse(
+                id=message_id,
+                role="assistant",
+                content=content,
+                created_at=datetime.now(UTC),
+            )
+            await connections.send_to_conversation(
+                conversation_id,
+                create_new_message_event(
+                    conversation_id, message_id, "assistant", content
+                ),
+            )
+            logger.info("message_streamed", chunks=len(chunks))
+            yield _sse_event("done", assistant_message.model_dump(mode="json"))
+
+        except Exception as e:
+            logger.exception("message_stream_failed", error=str(e))
+            await connections.send_to_conversation(
+                conversation_id,
+                create_error_event("Response generation failed", code="STREAM_FAILED"),
+            )
+            yield _sse_event("error", {"error": "Response generation failed"})
+
+        finally:
+            clear_contextvars()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.delete(
     "/{conversation_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -220,6 +220,7 @@ class MessageTypes:
 
     # Conversation events
     NEW_MESSAGE = "new_message"
+    MESSAGE_CHUNK = "message_chunk"
     MESSAGE_UPDATED = "message_updated"
     MESSAGE_DELETED = "message_deleted"
     CONVERSATION_CLEARED = "conversation_cleared"
@@ -269,6 +270,31 @@ def create_new_message_event(
     )
 
 
+def create_message_chunk_event(
+    conversation_id: int,
+    index: int,
+    delta: str,
+) -> WebSocketMessage:
+    """Create an event carrying one chunk of a streaming assistant response.
+
+    Args:
+        conversation_id: The conversation ID.
+        index: Position of the chunk in the stream, starting at 0.
+        delta: The text generated since the previous chunk.
+
+    Returns:
+        WebSocketMessage to broadcast.
+    """
+    return WebSocketMessage(
+        type=MessageTypes.MESSAGE_CHUNK,
+        payload={
+            "conversation_id": conversation_id,
+            "index": index,
+            "delta": delta,
+        },
+    )
+
+
 def create_typing_event(
     conversation_id: int,
     user_id: int,
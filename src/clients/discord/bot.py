@@ -1,13 +1,21 @@
 """Discord bot core - setup and lifecycle management."""
 
+import asyncio
+import contextlib
 from os import getenv
 from typing import TYPE_CHECKING
 
 import discord
 
-from src.adapters import GCSAdapter, RepositoryAdapter, SQLiteRepository
+from src.adapters import GCSAdapter, RepositoryAdapter, SQLiteRepository, UsageLogger
 from src.clients.discord.checks import BanCheckCommandTree
+from src.core.anthropic_clients import (
+    close_anthropic_clients,
+    get_anthropic_client_registry,
+)
+from src.core.auto_summarization import get_auto_summarization_manager
 from src.core.conversation import ContextBuilder
+from src.core.haiku_cache import get_haiku_cache
 from src.core.logging import get_logger
 from src.core.rate_limit import (
     InMemoryRateLimitStorage,
@@ -22,6 +30,10 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# How often the in-memory whitelist and ban list are re-read from SQLite, to
+# pick up changes made outside this process
+ACCESS_RECONCILE_INTERVAL_SECONDS = 300
+
 
 class DiscordBot(discord.Client):
     """Discord bot with AI providers and database integration.
@@ -39,6 +51,8 @@ class DiscordBot(discord.Client):
         self.tree = BanCheckCommandTree(self)
         self._repository: SQLiteRepository | None = None
         self._repo_adapter: RepositoryAdapter | None = None
+        self._usage_logger: UsageLogger | None = None
+        self._access_reconcile_task: asyncio.Task[None] | None = None
         self._ai_provider: AIProvider | None = None
         self._image_provider: ImageProvider | None = None
         self._context_builder: ContextBuilder | None = None
@@ -54,6 +68,28 @@ class DiscordBot(discord.Client):
             )
         return self._repo_adapter
 
+    @property
+    def sqlite_repository(self) -> SQLiteRepository:
+        """Get the underlying SQLite repository, raising if not initialized.
+
+        Used for diagnostics not exposed through RepositoryAdapter, such as
+        connection state and executor metrics.
+        """
+        if self._repository is None:
+            raise RuntimeError(
+                "Repository not initialized. setup_hook must complete first."
+            )
+        return self._repository
+
+    @property
+    def usage_logger(self) -> UsageLogger:
+        """Get the background usage logger, raising if not initialized."""
+        if self._usage_logger is None:
+            raise RuntimeError(
+                "Usage logger not initialized. setup_hook must complete first."
+            )
+        return self._usage_logger
+
     @property
     def ai_provider(self) -> "AIProvider":
         """Get the AI provider, raising if not initialized."""
@@ -102,11 +138,26 @@ class DiscordBot(discord.Client):
     async def setup_hook(self) -> None:
         """Initialize providers and sync commands with Discord."""
         # Initialize repository
-        self._repository = SQLiteRepository("data/app.db")
+        self._repository = SQLiteRepository("data/app.db", wal_mode=True)
         await self._repository.connect()
         self._repo_adapter = RepositoryAdapter(self._repository)
         await self._repo_adapter.validate_vendors()
-        logger.info("repository_initialized", db_path="data/app.db")
+        logger.info(
+            "repository_initialized",
+            db_path="data/app.db",
+            wal_mode=self._repository.wal_mode,
+        )
+
+        # Whitelist and ban checks are answered from memory
+        await self._repo_adapter.reload_access_lists()
+        self._access_reconcile_task = asyncio.create_task(
+            self._reconcile_access_lists(), name="access-reconcile"
+        )
+        logger.info("access_cache_loaded", **self._repo_adapter.access_cache_stats())
+
+        # Usage events are written in batches off the command path
+        self._usage_logger = UsageLogger(self._repo_adapter.log_command_usage_batch)
+        self._usage_logger.start()
 
         # Initialize AI providers
         anthropic_key = getenv("ANTHROPIC_API_KEY")
@@ -115,10 +166,19 @@ class DiscordBot(discord.Client):
             raise RuntimeError("ANTHROPIC_API_KEY environment variable is required")
         if not fal_key:
             raise RuntimeError("FAL_KEY environment variable is required")
-        self._ai_provider = AnthropicProvider(api_key=anthropic_key)
+        self._ai_provider = AnthropicProvider(
+            api_key=anthropic_key, prompt_caching=True
+        )
         self._image_provider = FalAIProvider(api_key=fal_key)
         logger.info("ai_providers_initialized", providers=["anthropic", "fal"])
 
+        # Open the shared Anthropic connection pool before the first request
+        await get_anthropic_client_registry().warm_up(anthropic_key)
+
+        # Keep deterministic Haiku completions across restarts if requested
+        if getenv("HAIKU_CACHE_PERSIST", "").lower() == "true":
+            get_haiku_cache().attach_store(self._repository)
+
         # Initialize GCS adapter for cloud storage uploads
         self._gcs_adapter = GCSAdapter()
         logger.info("gcs_adapter_initialized")
@@ -155,11 +215,32 @@ class DiscordBot(discord.Client):
 
     async def close(self) -> None:
         """Clean up resources when the client is closing."""
+        if self._access_reconcile_task is not None:
+            self._access_reconcile_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._access_reconcile_task
+        # Background summaries need the repository; stop them before it closes
+        await get_auto_summarization_manager().close()
+        if self._usage_logger is not None:
+            # Flush buffered usage events while the repository is still open
+            await self._usage_logger.close()
+        get_haiku_cache().attach_store(None)
         if self._repository is not None:
             await self._repository.close()
             logger.info("repository_closed")
+        await close_anthropic_clients()
         await super().close()
 
+    async def _reconcile_access_lists(self) -> None:
+        """Periodically re-read the whitelist and ban list into memory."""
+        while True:
+            await asyncio.sleep(ACCESS_RECONCILE_INTERVAL_SECONDS)
+            try:
+                await self.repo.reload_access_lists()
+            except Exception as ex:
+                # Keep serving the last good copy; the next pass retries
+                logger.warning("access_reconcile_failed", error=str(ex))
+
     async def register_commands(self, guild: discord.Guild) -> None:
         """Register commands for a specific guild.
 
@@ -49,7 +49,7 @@ class BanCheckCommandTree(app_commands.CommandTree["DiscordBot"]):
         if command_name in self.EXEMPT_COMMANDS:
             return True
 
-        # Check whitelist first
+        # Check whitelist first (answered from the adapter's in-memory copy)
         is_whitelisted = await bot.repo.is_user_whitelisted(user_id)
 
         if not is_whitelisted:
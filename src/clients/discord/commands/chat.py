@@ -13,6 +13,7 @@ from discord import app_commands
 
 from src.adapters import WINDOW
 from src.clients.discord.decorators import count_command
+from src.clients.discord.streaming import ThrottledStreamEditor, stream_preview
 from src.clients.discord.utils import create_embed_user, handle_text_overflow
 from src.clients.discord.views.carousel import (
     ClearHistoryConfirmationView,
@@ -23,16 +24,17 @@ from src.clients.discord.views.carousel import (
 from src.core.auto_summarization import (
     SUMMARIZATION_CONFIRMATION,
     THRESHOLD_WARNING,
-    convert_context_to_chat_messages,
+    check_threshold_for_summarization,
     get_auto_summarization_manager,
-    perform_summarization,
+    summarize_channel,
 )
 from src.core.chart_utils import UserStats, generate_usage_chart
-from src.core.conversation import convert_context_to_messages
+from src.core.conversation import SUMMARY_PROMPT
 from src.core.haiku import SummarizationError, haiku_summarize_conversation
 from src.core.image_utils import compress_image
 from src.core.logging import get_logger
-from src.core.token_counting import check_token_threshold, count_tokens
+from src.core.providers import ChatMessage
+from src.core.token_counting import count_tokens
 
 if TYPE_CHECKING:
     from src.clients.discord.bot import DiscordBot
@@ -43,6 +45,63 @@ logger = get_logger(__name__)
 DEFAULT_PROMPT_TIMEOUT = 240.0
 DEFAULT_CLEAR_TIMEOUT = 60.0
 
+# Stream /prompt responses into the embed as they are generated (opt-in)
+PROMPT_STREAMING = getenv("PROMPT_STREAMING", "false").lower() in ("1", "true")
+
+
+async def _stream_prompt_response(
+    bot: "DiscordBot",
+    interaction: discord.Interaction,
+    processing_view: InfoEmbedView,
+    messages: list[ChatMessage],
+    system_prompt: str | None,
+    response_prefix: str,
+) -> str:
+    """Stream a response into the processing embed and return the full text.
+
+    Chunks are coalesced and the embed is edited at a rate-limit-safe
+    cadence on a background task, so slow edits never stall the stream.
+    Partial text is only trimmed to fit the embed field; overflow handling
+    is left to the final render.
+
+    Args:
+        bot: The Discord bot instance.
+        interaction: The interaction whose response shows the embed.
+        processing_view: The already initialized "Thinking..." view.
+        messages: The windowed conversation to send.
+        system_prompt: Optional system prompt.
+        response_prefix: Text shown ahead of the streamed response.
+
+    Returns:
+        The complete response text, without the prefix.
+    """
+
+    async def render_partial(text: str) -> None:
+        embed = processing_view.embed
+        if embed is None:
+            return
+        embed.description = None
+        value = stream_preview(response_prefix + text)
+        if len(embed.fields) > 1:
+            embed.set_field_at(1, name="Response", value=value, inline=False)
+        else:
+            embed.add_field(name="Response", value=value, inline=False)
+        if processing_view.message is not None:
+            await processing_view.message.edit(embed=embed)
+        else:
+            await interaction.edit_original_response(embed=embed)
+
+    editor = ThrottledStreamEditor(render_partial)
+    try:
+        async for chunk in bot.ai_provider.chat_stream(
+            messages, system_prompt=system_prompt
+        ):
+            editor.feed(chunk)
+    finally:
+        await editor.close()
+    logger.debug("prompt_streamed", edits=editor.edits, chars=len(editor.text))
+    return editor.text
+
 
 class SetBehaviorGroup(app_commands.Group):
     """Command group for setting AI behavior."""
@@ -88,7 +147,7 @@ class SetBehaviorGroup(app_commands.Group):
                 )
 
                 # Refresh context after adding message
-                await self.bot.repo.get_visible_messages(channel_id, "All Models")
+                await self.bot.repo.get_visible_text_messages(channel_id, "All Models")
 
                 display_prompt, full_prompt_url = await handle_text_overflow(
                     self.bot, "prompt", prompt, channel_id
@@ -240,7 +299,7 @@ class SetBehaviorGroup(app_commands.Group):
                     display_prompt = prompt_text
 
                 # Refresh context
-                await self.bot.repo.get_visible_messages(channel_id, "All Models")
+                await self.bot.repo.get_visible_text_messages(channel_id, "All Models")
 
                 # Handle text overflow for display
                 display_prompt_truncated, full_prompt_url = await handle_text_overflow(
@@ -908,7 +967,7 @@ If you need help or have questions, please contact `@aghs` on Discord.
                             channel_id, "Anthropic", "prompt", False, prompt
                         )
 
-                    context = await bot.repo.get_visible_messages(
+                    context = await bot.repo.get_visible_text_messages(
                         channel_id, "All Models"
                     )
 
@@ -945,98 +1004,32 @@ If you need help or have questions, please contact `@aghs` on Discord.
                         bot, "prompt", prompt, channel_id
                     )
 
-                    # Get auto-summarization manager
+                    # Announce a background summary applied since the last
+                    # response; summarization never runs on this request
                     summarization_manager = get_auto_summarization_manager()
-                    summarization_performed = False
                     response_prefix = ""
-
-                    # Check if auto-summarization is pending for this channel
-                    if summarization_manager.should_summarize(channel_id):
-                        # Perform auto-summarization before processing
-                        try:
-                            # Convert context to format for summarization
-                            messages_for_summary = convert_context_to_chat_messages(
-                                context
-                            )
-
-                            if messages_for_summary:
-                                # Perform summarization
-                                summary = await perform_summarization(
-                                    messages_for_summary
-                                )
-
-                                # Clear existing messages and replace with summary
-                                await bot.repo.clear_messages(channel_id, "All Models")
-                                await bot.repo.create_channel(channel_id)
-
-                                # Add the summary as an assistant message
-                                await bot.repo.add_message(
-                                    channel_id,
-                                    "Anthropic",
-                                    "assistant",
-                                    False,
-                                    summary,
-                                )
-
-                                # Re-add the current user prompt
-                                if images:
-                                    await bot.repo.add_message_with_images(
-                                        channel_id,
-                                        "Anthropic",
-                                        "prompt",
-                                        False,
-                                        prompt,
-                                        str_images,
-                                    )
-                                else:
-                                    await bot.repo.add_message(
-                                        channel_id,
-                                        "Anthropic",
-                                        "prompt",
-                                        False,
-                                        prompt,
-                                    )
-
-                                # Refresh context with summarized version
-                                context = await bot.repo.get_visible_messages(
-                                    channel_id, "All Models"
-                                )
-
-                                summarization_performed = True
-                                response_prefix = SUMMARIZATION_CONFIRMATION + "\n\n"
-
-                            # Clear the pending flag
-                            summarization_manager.clear_pending(channel_id)
-
-                        except Exception as e:
-                            logger.warning("auto_summarization_failed", error=str(e))
-                            # If summarization fails, continue without it
-                            # Clear the flag to avoid repeated failures
-                            summarization_manager.clear_pending(channel_id)
-
-                    # Convert context to ChatMessages and extract system prompt
-                    chat_messages, system_prompt = convert_context_to_messages(context)
-                    chat_response = await bot.ai_provider.chat(
-                        chat_messages, system_prompt=system_prompt
-                    )
-                    response = chat_response.content
-
-                    # Check token threshold after processing to set pending for next msg
-                    # Only check if we didn't just perform summarization
-                    if not summarization_performed:
-                        _, threshold_exceeded = check_token_threshold(
-                            system_prompt=system_prompt or "",
-                            messages=[
-                                {"role": m.role, "content": m.content}
-                                for m in chat_messages
-                            ],
-                            current_prompt=prompt,
+                    if summarization_manager.pop_completed(channel_id):
+                        response_prefix = SUMMARIZATION_CONFIRMATION + "\n\n"
+
+                    # Window the context to the token budget and extract the
+                    # system prompt, using the stored per-message token counts
+                    conversation = bot.context_builder.build_from_context(context)
+                    chat_messages = conversation.messages
+                    system_prompt = conversation.system_prompt
+                    if PROMPT_STREAMING:
+                        response = await _stream_prompt_response(
+                            bot,
+                            interaction,
+                            processing_view,
+                            chat_messages,
+                            system_prompt,
+                            response_prefix,
                         )
-
-                        if threshold_exceeded:
-                            # Set pending for next message and add warning to response
-                            summarization_manager.set_pending(channel_id)
-                            response = response + "\n\n" + THRESHOLD_WARNING
+                    else:
+                        chat_response = await bot.ai_provider.chat(
+                            chat_messages, system_prompt=system_prompt
+                        )
+                        response = chat_response.content
 
                     # Add confirmation prefix if summarization was performed
                     if response_prefix:
@@ -1046,6 +1039,17 @@ If you need help or have questions, please contact `@aghs` on Discord.
                         channel_id, "Anthropic", "assistant", False, response
                     )
 
+                    # Summarize in the background once the saved context,
+                    # including this response, is over the threshold
+                    context_tokens = await bot.repo.get_context_token_count(channel_id)
+                    _, threshold_exceeded = check_threshold_for_summarization(
+                        context_tokens
+                    )
+                    if threshold_exceeded and summarization_manager.schedule(
+                        channel_id, lambda: summarize_channel(bot.repo, channel_id)
+                    ):
+                        response = response + "\n\n" + THRESHOLD_WARNING
+
                     await bot.rate_limiter.record(interaction.user.id, "chat")
 
                     if deactivate_old_messages:
@@ -1536,7 +1540,7 @@ If you need help or have questions, please contact `@aghs` on Discord.
         try:
             # Get current context
             await bot.repo.create_channel(channel_id)
-            context = await bot.repo.get_visible_messages(channel_id, "All Models")
+            context = await bot.repo.get_visible_text_messages(channel_id, "All Models")
 
             # Filter to get only prompt and assistant messages for summarization
             messages_to_summarize = []
@@ -1599,7 +1603,7 @@ If you need help or have questions, please contact `@aghs` on Discord.
                         "Anthropic",
                         "prompt",
                         False,
-                        "[Previous conversation summarized]",
+                        SUMMARY_PROMPT,
                     )
                     await bot.repo.add_message(
                         channel_id,
@@ -5,12 +5,14 @@ from __future__ import annotations
 import asyncio
 import functools
 from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, TypeVar
 from uuid import uuid4
 
 import discord
 
 from src.core.logging import bind_contextvars, clear_contextvars, get_logger
+from src.ports.repositories import UsageEvent
 
 if TYPE_CHECKING:
     from src.clients.discord.bot import DiscordBot
@@ -88,12 +90,15 @@ def _classify_exception(ex: BaseException) -> str:
     return "error"
 
 
-async def _log_usage(
+def _log_usage(
     interaction: discord.Interaction[DiscordBot],
     command_name: str,
     outcome: str,
 ) -> None:
-    """Log command usage if user is whitelisted and not banned.
+    """Queue a usage event for the bot's background usage logger.
+
+    The event is written later in a batch; whitelist and ban status are
+    checked at write time, so this adds no database work to the command.
 
     Args:
         interaction: The Discord interaction.
@@ -106,38 +111,17 @@ async def _log_usage(
         return
 
     try:
-        bot = interaction.client
-        user_id = interaction.user.id
-        username = interaction.user.name
-        guild_id = interaction.guild_id
-
-        # Only log for whitelisted, unbanned users
-        is_whitelisted = await bot.repo.is_user_whitelisted(user_id)
-        if not is_whitelisted:
-            return
-
-        is_banned = await bot.repo.is_user_banned(user_id)
-        if is_banned:
-            return
-
-        # Log the usage
-        await bot.repo.log_command_usage(
-            user_id=user_id,
-            username=username,
-            guild_id=guild_id,
-            command_name=command_name,
-            command_type=command_type,
-            outcome=outcome,
+        interaction.client.usage_logger.record(
+            UsageEvent(
+                user_id=interaction.user.id,
+                username=interaction.user.name,
+                guild_id=interaction.guild_id,
+                command_name=command_name,
+                command_type=command_type,
+                outcome=outcome,
+                timestamp=datetime.now(UTC),
+            )
         )
-
-        structured_logger.debug(
-            "usage_logged",
-            command=command_name,
-            command_type=command_type,
-            outcome=outcome,
-            user_id=user_id,
-        )
-
     except Exception as log_ex:
         # Don't let logging failures break the command
         structured_logger.warning(
@@ -152,7 +136,7 @@ def count_command(func: CommandHandler[T]) -> CommandHandler[T]:
 
     Also generates a correlation ID for request tracing, binds it
     to the logging context for the duration of the command, and
-    logs command usage for whitelisted users.
+    queues a usage event for the background usage logger.
     """
 
     @functools.wraps(func)
@@ -191,8 +175,8 @@ def count_command(func: CommandHandler[T]) -> CommandHandler[T]:
             structured_logger.exception("command_failed", error=str(ex))
             raise
         finally:
-            # Log usage before clearing context
-            await _log_usage(interaction, command_name, outcome)
+            # Queue usage before clearing context
+            _log_usage(interaction, command_name, outcome)
             clear_contextvars()
 
     return wrapper
@@ -0,0 +1,180 @@
+"""Throttled progressive rendering of streamed AI responses.
+
+Streaming a response into Discord means editing the same message as chunks
+arrive, but Discord rate-limits message edits. ThrottledStreamEditor
+coalesces chunks and renders at most once per interval, or sooner once
+enough new tokens have accumulated. The first chunk is rendered immediately
+so the user sees text at time-to-first-token.
+
+Renders run on a background task, so a slow or rate-limited edit never
+holds up reading the stream. Renders requested while an edit is in flight
+collapse into one that shows the newest text once it completes.
+
+Example:
+    editor = ThrottledStreamEditor(render_partial)
+    try:
+        async for chunk in provider.chat_stream(messages):
+            editor.feed(chunk)
+    finally:
+        await editor.close()
+    text = editor.text
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+STREAM_EDIT_INTERVAL_SECONDS = 0.75
+STREAM_EDIT_TOKENS = 200
+
+# Discord embed field values are limited to 1024 characters
+STREAM_PREVIEW_LIMIT = 1024
+
+# Rough heuristic of ~4 characters per token, as in ContextBuilder
+_CHARS_PER_TOKEN = 4
+
+
+def stream_preview(text: str, limit: int = STREAM_PREVIEW_LIMIT) -> str:
+    """Fit a partial response into an embed field, keeping the newest text.
+
+    Args:
+        text: The response text received so far.
+        limit: Maximum length of the returned string.
+
+    Returns:
+        The text itself if it fits, otherwise its tail prefixed with an
+        ellipsis.
+    """
+    if len(text) <= limit:
+        return text
+    return "…" + text[-(limit - 1) :]
+
+
+class ThrottledStreamEditor:
+    """Accumulates streamed chunks and renders them at a throttled rate.
+
+    Attributes:
+        interval: Minimum seconds between renders.
+        token_threshold: Estimated new tokens that trigger a render before
+            the interval has elapsed.
+        edits: Number of renders performed.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[str], Awaitable[None]],
+        *,
+        interval: float = STREAM_EDIT_INTERVAL_SECONDS,
+        token_threshold: int = STREAM_EDIT_TOKENS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the editor.
+
+        Args:
+            render: Async callback that displays the text received so far.
+            interval: Minimum seconds between renders.
+            token_threshold: Estimated new tokens that trigger a render
+                before the interval has elapsed.
+            clock: Monotonic time source, injectable for tests.
+        """
+        self.interval = interval
+        self.token_threshold = token_threshold
+        self.edits = 0
+        self._render = render
+        self._clock = clock
+        self._chunks: list[str] = []
+        self._pending_chars = 0
+        self._last_render: float | None = None
+        self._render_requested = False
+        self._closing = False
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def text(self) -> str:
+        """The full text received so far."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> None:
+        """Add a chunk, requesting a render if the interval or threshold is hit.
+
+        Never waits for the render itself.
+
+        Args:
+            chunk: The next piece of streamed text.
+        """
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        self._pending_chars += len(chunk)
+
+        now = self._clock()
+        due = (
+            self._last_render is None
+            or now - self._last_render >= self.interval
+            or self._pending_chars // _CHARS_PER_TOKEN >= self.token_threshold
+        )
+        if due:
+            self._request_render(now)
+
+    async def flush(self) -> None:
+        """Render any text received since the last render, then stop.
+
+        Waits until every requested render has completed.
+        """
+        if self._pending_chars:
+            self._request_render(self._clock())
+        await self._stop()
+
+    async def close(self) -> None:
+        """Stop rendering without showing text that is still pending.
+
+        Waits for an edit already in flight, so it cannot land after a
+        final render made by the caller.
+        """
+        self._render_requested = False
+        await self._stop()
+
+    def _request_render(self, now: float) -> None:
+        self._last_render = now
+        self._pending_chars = 0
+        self._render_requested = True
+        self._wake.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._render_loop())
+
+    async def _stop(self) -> None:
+        if self._task is None:
+            return
+        self._closing = True
+        self._wake.set()
+        try:
+            await asyncio.shield(self._task)
+        except asyncio.CancelledError:
+            self._task.cancel()
+            raise
+        finally:
+            self._task = None
+            self._closing = False
+
+    async def _render_loop(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            while self._render_requested:
+                self._render_requested = False
+                await self._render_latest()
+            if self._closing:
+                return
+
+    async def _render_latest(self) -> None:
+        try:
+            await self._render(self.text)
+            self.edits += 1
+        except Exception as ex:
+            # A failed progress edit is not fatal; the final render follows
+            logger.warning("stream_edit_failed", error=str(ex))
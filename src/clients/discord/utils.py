@@ -6,12 +6,15 @@ from typing import TYPE_CHECKING, Any
 import discord
 
 from src.core.logging import get_logger
+from src.core.singleflight import SingleFlight
 
 if TYPE_CHECKING:
     from src.clients.discord.bot import DiscordBot
 
 logger = get_logger(__name__)
 
+_uploads = SingleFlight()
+
 
 async def handle_text_overflow(
     bot: "DiscordBot", text_type: str, text: str, channel_id: int
@@ -29,8 +32,13 @@ async def handle_text_overflow(
     """
     if len(text) > 1024:
         try:
-            cloud_url = await asyncio.to_thread(
-                bot.gcs_adapter.upload_text, text_type, channel_id, text
+            # The same overflow (e.g. a prompt shown in several embeds at
+            # once) is uploaded once and its URL shared
+            cloud_url = await _uploads.do(
+                (text_type, channel_id, text),
+                lambda: asyncio.to_thread(
+                    bot.gcs_adapter.upload_text, text_type, channel_id, text
+                ),
             )
             modified_text = (
                 text[:950]
@@ -89,6 +89,7 @@ class AIAssistModal(discord.ui.Modal, title="AI Assist - Describe Your Edit"):
                     system_prompt=system_prompt,
                     user_message=rough_description,
                     max_tokens=256,
+                    cache_feature="refine",
                 )
                 break  # Success, exit retry loop
             except HaikuError as e:
@@ -47,6 +47,7 @@ import base64
 import io
 import json
 from collections.abc import Callable, Coroutine
+from contextlib import aclosing
 from os import getenv
 from typing import TYPE_CHECKING, Any
 
@@ -99,8 +100,8 @@ from src.core.image_utils import (
 from src.core.image_variations import (
     RateLimitExceededError,
     VariationError,
-    generate_variation_remixed,
-    generate_variation_same_prompt,
+    generate_variations_remixed,
+    generate_variations_same_prompt,
 )
 from src.core.logging import get_logger
 from src.core.providers import ImageModifyRequest, ImageRequest
@@ -5035,7 +5036,10 @@ class VariationCarouselView(discord.ui.View):
 
     Allows users to navigate between an original image and up to 3 variations.
     Provides buttons for generating variations (Same Prompt or AI Remix) and
-    adding the selected image to context.
+    adding the selected image to context. A generate button fills every
+    remaining variation slot at once, showing each variation as it finishes;
+    its label says how many images that is (e.g. "Same Prompt ×3"). All
+    buttons stay disabled until the batch is done.
 
     UI Layout:
     - Embed shows current image with position indicator
@@ -5184,10 +5188,31 @@ class VariationCarouselView(discord.ui.View):
             view=self,
         )
 
-    async def _update_embed(self) -> None:
-        """Update the embed with the current image after navigation."""
+    def _remaining_variations(self) -> int:
+        """Number of variations one generate click will produce."""
+        return self.MAX_VARIATIONS - len(self.variations)
+
+    def _describe(self, status: str | None) -> None:
+        """Show the position indicator, with a status line under it."""
         if self.embed:
             self.embed.description = self._generate_position_indicator()
+            if status:
+                self.embed.description += f"\n{status}"
+
+    async def _show_status(self, status: str | None) -> None:
+        """Redraw the description and buttons without re-uploading the image."""
+        self._describe(status)
+        self._update_buttons()
+        await self.message.edit(embed=self.embed, view=self)
+
+    async def _update_embed(self, status: str | None = None) -> None:
+        """Update the embed with the current image after navigation.
+
+        Args:
+            status: Optional line shown under the position indicator, such
+                as generation progress.
+        """
+        self._describe(status)
 
         # Create the current image file
         current_image = self._get_current_image()
@@ -5217,6 +5242,11 @@ class VariationCarouselView(discord.ui.View):
 
     def _update_buttons(self) -> None:
         """Update button disabled states based on current state."""
+        if self._generating:
+            # Nothing may change the carousel until the batch has finished
+            self._disable_all_buttons()
+            return
+
         all_images = self._get_all_images()
         total = len(all_images)
 
@@ -5224,10 +5254,14 @@ class VariationCarouselView(discord.ui.View):
         self.previous_button.disabled = self.current_index <= 0
         self.next_button.disabled = self.current_index >= total - 1
 
-        # Variation buttons: disabled after 3 variations generated
-        at_max_variations = len(self.variations) >= self.MAX_VARIATIONS
-        self.same_prompt_button.disabled = at_max_variations
-        self.ai_remix_button.disabled = at_max_variations
+        # Variation buttons: disabled after 3 variations generated, otherwise
+        # labelled with how many images a click generates and charges
+        remaining = self._remaining_variations()
+        self.same_prompt_button.disabled = remaining <= 0
+        self.ai_remix_button.disabled = remaining <= 0
+        suffix = f" ×{remaining}" if remaining > 0 else ""
+        self.same_prompt_button.label = f"Same Prompt{suffix}"
+        self.ai_remix_button.label = f"AI Remix{suffix}"
 
         # Action buttons: always enabled (unless view is stopped)
         self.add_to_context_button.disabled = False
@@ -5376,7 +5410,7 @@ class VariationCarouselView(discord.ui.View):
         interaction: discord.Interaction,
         button: discord.ui.Button["VariationCarouselView"],
     ) -> None:
-        """Generate a variation using the same prompt.
+        """Generate the remaining variations using the same prompt.
 
         Relies on model randomness to produce variations of the original image.
         """
@@ -5410,49 +5444,57 @@ class VariationCarouselView(discord.ui.View):
 
         await interaction.response.defer()
         self._generating = True
+        count = self._remaining_variations()
+        delivered = 0
+        status: str | None = None
 
-        # Show generating status
-        if self.embed:
-            self.embed.description = f"{self._generate_position_indicator()}\nGenerating variation..."
-
-        # Disable buttons during generation
-        self._disable_all_buttons()
-        await self.message.edit(embed=self.embed, view=self)
+        # Show generating status; buttons stay off until the batch is done
+        await self._show_status(f"Generating {count} variation(s)...")
 
         try:
-            variation_image = await generate_variation_same_prompt(
-                original_prompt=self.prompt,
-                image_provider=self.image_provider,
-                user_id=self.user_id,
-                rate_limiter=self.rate_limiter,
-                reference_images=self.source_image_list,
-            )
+            async with aclosing(
+                generate_variations_same_prompt(
+                    original_prompt=self.prompt,
+                    image_provider=self.image_provider,
+                    user_id=self.user_id,
+                    count=count,
+                    rate_limiter=self.rate_limiter,
+                    reference_images=self.source_image_list,
+                )
+            ) as variations:
+                async for variation_image in variations:
+                    if self.is_finished():
+                        # Timed out mid-batch; closing cancels the rest
+                        break
 
-            # Add the variation and navigate to it
-            self.variations.append(variation_image)
-            self.current_index = len(self._get_all_images()) - 1
+                    # Add each variation as it finishes and navigate to it
+                    self.variations.append(variation_image)
+                    self.current_index = len(self._get_all_images()) - 1
+                    delivered += 1
 
-            logger.info(
-                "same_prompt_variation_added",
-                view="VariationCarouselView",
-                variation_count=len(self.variations),
-            )
+                    logger.info(
+                        "same_prompt_variation_added",
+                        view="VariationCarouselView",
+                        variation_count=len(self.variations),
+                    )
 
-            # Update the embed with the new variation
-            await self._update_embed()
+                    # Update the embed with the new variation
+                    await self._update_embed(
+                        f"Generating variations... ({delivered}/{count} done)"
+                    )
+
+            if delivered < count:
+                status = (
+                    f"Generated {delivered} of {count} variation(s); "
+                    "image rate limit reached."
+                )
 
         except RateLimitExceededError as e:
             retry_msg = ""
             if e.retry_after:
                 minutes = int(e.retry_after // 60)
                 retry_msg = f" Try again in {minutes} minute(s)."
-            if self.embed:
-                self.embed.description = (
-                    f"{self._generate_position_indicator()}\n"
-                    f"Rate limit exceeded.{retry_msg}"
-                )
-            self._update_buttons()
-            await self.message.edit(embed=self.embed, view=self)
+            status = f"Rate limit exceeded.{retry_msg}"
 
         except VariationError as e:
             logger.error(
@@ -5460,27 +5502,24 @@ class VariationCarouselView(discord.ui.View):
                 view="VariationCarouselView",
                 error=str(e),
             )
-            if self.embed:
-                self.embed.description = (
-                    f"{self._generate_position_indicator()}\n"
-                    f"Failed to generate variation: {e}"
-                )
-            self._update_buttons()
-            await self.message.edit(embed=self.embed, view=self)
+            status = f"Failed to generate variation: {e}"
 
         finally:
             self._generating = False
 
+        if not self.is_finished():
+            await self._show_status(status)
+
     @discord.ui.button(label="AI Remix", style=discord.ButtonStyle.secondary, row=1)
     async def ai_remix_button(
         self,
         interaction: discord.Interaction,
         button: discord.ui.Button["VariationCarouselView"],
     ) -> None:
-        """Generate a variation with AI-remixed prompt.
+        """Generate the remaining variations with AI-remixed prompts.
 
         Uses Haiku to slightly modify the prompt while preserving style,
-        then generates a new image.
+        then generates a new image for each remix.
         """
         if self.user_id != interaction.user.id:
             await interaction.response.send_message(
@@ -5512,66 +5551,73 @@ class VariationCarouselView(discord.ui.View):
 
         await interaction.response.defer()
         self._generating = True
+        count = self._remaining_variations()
+        delivered = 0
+        status: str | None = None
 
-        # Show generating status
-        if self.embed:
-            self.embed.description = (
-                f"{self._generate_position_indicator()}\n"
-                "Remixing prompt and generating variation..."
-            )
-
-        # Disable buttons during generation
-        self._disable_all_buttons()
-        await self.message.edit(embed=self.embed, view=self)
+        # Show generating status; buttons stay off until the batch is done
+        await self._show_status(
+            f"Remixing prompt and generating {count} variation(s)..."
+        )
 
         try:
-            remixed_prompt, variation_image = await generate_variation_remixed(
-                original_prompt=self.prompt,
-                image_provider=self.image_provider,
-                user_id=self.user_id,
-                rate_limiter=self.rate_limiter,
-                reference_images=self.source_image_list,
-            )
+            async with aclosing(
+                generate_variations_remixed(
+                    original_prompt=self.prompt,
+                    image_provider=self.image_provider,
+                    user_id=self.user_id,
+                    count=count,
+                    rate_limiter=self.rate_limiter,
+                    reference_images=self.source_image_list,
+                )
+            ) as variations:
+                async for remixed_prompt, variation_image in variations:
+                    if self.is_finished():
+                        # Timed out mid-batch; closing cancels the rest
+                        break
 
-            # Add the variation and navigate to it
-            self.variations.append(variation_image)
-            self.current_index = len(self._get_all_images()) - 1
+                    # Add each variation as it finishes and navigate to it
+                    self.variations.append(variation_image)
+                    self.current_index = len(self._get_all_images()) - 1
+                    delivered += 1
 
-            logger.info(
-                "remixed_variation_added",
-                view="VariationCarouselView",
-                variation_count=len(self.variations),
-                remixed_prompt_preview=remixed_prompt[:100] if remixed_prompt else "",
-            )
-
-            # Update the embed with the new variation
-            # Also update the prompt field to show the remixed prompt
-            if self.embed and self.embed.fields:
-                # Update the prompt field to show remixed prompt
-                display_prompt = remixed_prompt
-                if len(display_prompt) > 1024:
-                    display_prompt = display_prompt[:1021] + "..."
-                self.embed.set_field_at(
-                    0,
-                    name="Prompt (AI Remixed)",
-                    value=display_prompt,
-                    inline=False,
-                )
+                    logger.info(
+                        "remixed_variation_added",
+                        view="VariationCarouselView",
+                        variation_count=len(self.variations),
+                        remixed_prompt_preview=remixed_prompt[:100] if remixed_prompt else "",
+                    )
 
-            await self._update_embed()
+                    # Update the embed with the new variation
+                    # Also update the prompt field to show the remixed prompt
+                    if self.embed and self.embed.fields:
+                        # Update the prompt field to show remixed prompt
+                        display_prompt = remixed_prompt
+                        if len(display_prompt) > 1024:
+                            display_prompt = display_prompt[:1021] + "..."
+                        self.embed.set_field_at(
+                            0,
+                            name="Prompt (AI Remixed)",
+                            value=display_prompt,
+                            inline=False,
+                        )
+
+                    await self._update_embed(
+                        f"Generating variations... ({delivered}/{count} done)"
+                    )
+
+            if delivered < count:
+                status = (
+                    f"Generated {delivered} of {count} variation(s); "
+                    "image rate limit reached."
+                )
 
         except RateLimitExceededError as e:
             retry_msg = ""
             if e.retry_after:
                 minutes = int(e.retry_after // 60)
                 retry_msg = f" Try again in {minutes} minute(s)."
-            if self.embed:
-                self.embed.description = (
-                    f"{self._generate_position_indicator()}\n"
-                    f"Rate limit exceeded.{retry_msg}"
-                )
-            self._update_buttons()
-            await self.message.edit(embed=self.embed, view=self)
+            status = f"Rate limit exceeded.{retry_msg}"
 
         except VariationError as e:
             logger.error(
@@ -5579,17 +5625,14 @@ class VariationCarouselView(discord.ui.View):
                 view="VariationCarouselView",
                 error=str(e),
             )
-            if self.embed:
-                self.embed.description = (
-                    f"{self._generate_position_indicator()}\n"
-                    f"Failed to generate remixed variation: {e}"
-                )
-            self._update_buttons()
-            await self.message.edit(embed=self.embed, view=self)
+            status = f"Failed to generate remixed variation: {e}"
 
         finally:
             self._generating = False
 
+        if not self.is_finished():
+            await self._show_status(status)
+
     @discord.ui.button(label="X", style=discord.ButtonStyle.danger, row=1)
     async def cancel_button(
         self,
@@ -142,6 +142,7 @@ class PromptRefinementView(discord.ui.View):
                     system_prompt=IMAGE_GENERATION_REFINEMENT_PROMPT,
                     user_message=self.prompt,
                     max_tokens=512,
+                    cache_feature="refine",
                 )
                 break  # Success, exit retry loop
             except HaikuError as e:
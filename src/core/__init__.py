@@ -4,6 +4,13 @@ This module contains platform-agnostic business logic and protocol definitions
 for AI providers and other core functionality.
 """
 
+from src.core.bulkhead import AdaptiveBulkhead, BulkheadLimits, get_bulkhead
+from src.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    get_circuit_breaker,
+)
 from src.core.conversation import ContextBuilder, ConversationContext
 from src.core.errors import (
     ErrorCategory,
@@ -49,6 +56,7 @@ from src.core.rate_limit import (
     RateLimitStorage,
     SlidingWindowRateLimiter,
 )
+from src.core.singleflight import SingleFlight
 
 __all__ = [
     # Chat/Text providers
@@ -93,4 +101,13 @@ __all__ = [
     "RateLimitResult",
     "RateLimitStorage",
     "SlidingWindowRateLimiter",
+    # Concurrency
+    "AdaptiveBulkhead",
+    "BulkheadLimits",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "SingleFlight",
+    "get_bulkhead",
+    "get_circuit_breaker",
 ]
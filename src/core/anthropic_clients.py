@@ -0,0 +1,209 @@
+"""Process-wide, long-lived Anthropic API clients.
+
+Every AsyncAnthropic client owns an HTTP connection pool. Creating one per
+call, as the Haiku helpers and content screening used to, throws that pool
+away and pays a new TLS handshake on every request. AnthropicClientRegistry
+keeps one pooled httpx client for the whole process and hands out
+AsyncAnthropic clients built on top of it, one per API key and timeout, so
+the chat provider, Haiku features and screening all reuse the same
+keep-alive connections.
+
+The pool limits come from the environment (see AnthropicPoolLimits). The
+bot and the API warm the pool up at startup and close it on shutdown.
+
+Example:
+    client = get_anthropic_client(api_key, timeout=30.0)
+    response = await client.messages.create(...)
+    ...
+    await close_anthropic_clients()
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+import httpx
+from anthropic import AsyncAnthropic
+
+from src.core.bulkhead import BULKHEAD_LIMITS
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bulkheads whose calls go through the shared pool. The pool has a
+# connection for every slot they can admit, so an admitted call never waits
+# on httpx for a connection. A pool timeout reaches callers as an
+# APITimeoutError, which classify_error calls a network error: it would be
+# retried and counted by the circuit breaker as an outage while the API is
+# healthy.
+POOLED_BULKHEADS = ("anthropic", "haiku")
+
+DEFAULT_MAX_CONNECTIONS = sum(BULKHEAD_LIMITS[name].maximum for name in POOLED_BULKHEADS)
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# Connect timeout applied to every client; read timeouts are per client
+CONNECT_TIMEOUT_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class AnthropicPoolLimits:
+    """Connection pool limits shared by all Anthropic clients.
+
+    Attributes:
+        max_connections: Maximum concurrent connections to the API.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry: Seconds an idle connection is kept open.
+    """
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS
+
+    @classmethod
+    def from_env(cls) -> AnthropicPoolLimits:
+        """Read limits from the environment, falling back to the defaults.
+
+        Uses ANTHROPIC_MAX_CONNECTIONS, ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS
+        and ANTHROPIC_KEEPALIVE_EXPIRY. A warning is logged if the pool is
+        smaller than the pooled bulkheads can admit.
+        """
+        limits = cls(
+            max_connections=int(
+                os.getenv("ANTHROPIC_MAX_CONNECTIONS", str(DEFAULT_MAX_CONNECTIONS))
+            ),
+            max_keepalive_connections=int(
+                os.getenv(
+                    "ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS",
+                    str(DEFAULT_MAX_KEEPALIVE_CONNECTIONS),
+                )
+            ),
+            keepalive_expiry=float(
+                os.getenv(
+                    "ANTHROPIC_KEEPALIVE_EXPIRY",
+                    str(DEFAULT_KEEPALIVE_EXPIRY_SECONDS),
+                )
+            ),
+        )
+        if limits.max_connections < DEFAULT_MAX_CONNECTIONS:
+            logger.warning(
+                "anthropic_pool_smaller_than_bulkheads",
+                max_connections=limits.max_connections,
+                bulkhead_maximum=DEFAULT_MAX_CONNECTIONS,
+            )
+        return limits
+
+    def to_httpx(self) -> httpx.Limits:
+        """Convert to httpx pool limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class AnthropicClientRegistry:
+    """Hands out AsyncAnthropic clients that share one connection pool."""
+
+    def __init__(self, limits: AnthropicPoolLimits | None = None) -> None:
+        """Initialize the registry. The pool is created on first use.
+
+        Args:
+            limits: Pool limits. Defaults to AnthropicPoolLimits.from_env().
+        """
+        self.limits = limits or AnthropicPoolLimits.from_env()
+        self._http_client: httpx.AsyncClient | None = None
+        self._clients: dict[tuple[str, float | None], AsyncAnthropic] = {}
+
+    def get(self, api_key: str, timeout: float | None = None) -> AsyncAnthropic:
+        """Get the client for an API key and read timeout.
+
+        Args:
+            api_key: The Anthropic API key.
+            timeout: Read timeout in seconds, or None for the SDK default.
+
+        Returns:
+            A client backed by the shared connection pool.
+        """
+        key = (api_key, timeout)
+        client = self._clients.get(key)
+        if client is None:
+            if self._http_client is None:
+                self._http_client = httpx.AsyncClient(limits=self.limits.to_httpx())
+            if timeout is None:
+                client = AsyncAnthropic(api_key=api_key, http_client=self._http_client)
+            else:
+                client = AsyncAnthropic(
+                    api_key=api_key,
+                    http_client=self._http_client,
+                    timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT_SECONDS),
+                )
+            self._clients[key] = client
+        return client
+
+    async def warm_up(self, api_key: str) -> bool:
+        """Open a pooled connection before the first real request.
+
+        Lists a single model, which costs no tokens, so the TLS handshake
+        is paid at startup instead of by the first user.
+
+        Args:
+            api_key: The Anthropic API key.
+
+        Returns:
+            True if the API answered. Failures are logged, never raised.
+        """
+        try:
+            await self.get(api_key).models.list(limit=1)
+        except Exception as ex:
+            logger.warning("anthropic_warm_up_failed", error=str(ex))
+            return False
+        logger.info(
+            "anthropic_pool_warmed",
+            max_connections=self.limits.max_connections,
+            max_keepalive_connections=self.limits.max_keepalive_connections,
+        )
+        return True
+
+    async def close(self) -> None:
+        """Close the connection pool. Later calls to get() open a new one."""
+        self._clients.clear()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            logger.info("anthropic_pool_closed")
+
+
+_registry: AnthropicClientRegistry | None = None
+
+
+def get_anthropic_client_registry() -> AnthropicClientRegistry:
+    """Get the global Anthropic client registry.
+
+    Returns:
+        The singleton AnthropicClientRegistry instance.
+    """
+    global _registry
+    if _registry is None:
+        _registry = AnthropicClientRegistry()
+    return _registry
+
+
+def get_anthropic_client(api_key: str, timeout: float | None = None) -> AsyncAnthropic:
+    """Get a pooled client from the global registry.
+
+    Args:
+        api_key: The Anthropic API key.
+        timeout: Read timeout in seconds, or None for the SDK default.
+
+    Returns:
+        A client backed by the process-wide connection pool.
+    """
+    return get_anthropic_client_registry().get(api_key, timeout)
+
+
+async def close_anthropic_clients() -> None:
+    """Close the global registry's connection pool, if one was opened."""
+    if _registry is not None:
+        await _registry.close()
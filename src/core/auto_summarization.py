@@ -1,71 +1,102 @@
 """Auto-summarization trigger and state management.
 
 This module manages the state and logic for automatic context summarization
-when the token count exceeds a threshold. It tracks which channels have
-pending summarization and provides the logic for triggering the summarization
-flow.
+when the token count exceeds a threshold. Summarization runs as a background
+task so no user-facing request waits on the Haiku round-trip.
 
 The flow is:
-1. Token count exceeds threshold during a message
-2. Set pending_summarization flag, add warning prefix to response
-3. On next message with flag set: summarize context, clear flag, add confirmation
+1. A response is saved and the channel's token count exceeds the threshold
+2. A background task reserves a summary slot, summarizes the context older
+   than the slot, and swaps the summary in atomically
+3. Messages saved while the summary was generated sort after the slot and
+   are kept; if the channel was cleared meanwhile, the summary is dropped
+4. The next response in the channel carries a confirmation prefix
 
 Example usage:
-    manager = AutoSummarizationManager()
+    manager = get_auto_summarization_manager()
 
-    # Check if we should summarize on this message
-    if manager.should_summarize(channel_id):
-        # Perform summarization
-        await summarize_and_replace_context(...)
-        manager.clear_pending(channel_id)
-
-    # After processing, check if threshold was exceeded
+    # After saving a response that pushed the channel over the threshold
     if threshold_exceeded:
-        manager.set_pending(channel_id)
+        manager.schedule(channel_id, lambda: summarize_channel(repo, channel_id))
+
+    # Before rendering the next response
+    if manager.pop_completed(channel_id):
+        response = SUMMARIZATION_CONFIRMATION + "\n\n" + response
 """
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
 
-from src.core.haiku import SummarizationError, haiku_summarize_conversation
+from src.core.haiku import (
+    SummarizationError,
+    haiku_extend_summary,
+    haiku_summarize_conversation,
+)
 from src.core.logging import get_logger
-from src.core.token_counting import check_token_threshold
+from src.core.token_counting import DEFAULT_THRESHOLD
 
 logger = get_logger(__name__)
 
 # Warning message shown when threshold is exceeded
 THRESHOLD_WARNING = (
     "*Note: Context is approaching limit. "
-    "Your next message will trigger auto-summarization.*"
+    "Auto-summarization is running in the background.*"
 )
 
 # Confirmation message shown after auto-summarization
 SUMMARIZATION_CONFIRMATION = "*Context auto-summarized to maintain performance.*"
 
 
+class SummaryStore(Protocol):
+    """Repository operations needed to summarize a channel in the background.
+
+    Implemented by RepositoryAdapter.
+    """
+
+    async def get_visible_text_messages(
+        self, discord_id: int, vendor_name: str
+    ) -> list[dict[str, Any]]: ...
+
+    async def reserve_summary_slot(self, discord_id: int) -> int: ...
+
+    async def fill_summary_slot(
+        self, discord_id: int, slot_id: int, summary: str
+    ) -> bool: ...
+
+    async def release_summary_slot(self, slot_id: int) -> None: ...
+
+    async def get_rolling_summary(self, discord_id: int) -> dict[str, Any] | None: ...
+
+
 class AutoSummarizationManager:
-    """Manages auto-summarization state per channel.
+    """Manages auto-summarization state and background tasks per channel.
 
-    This class tracks which channels have pending summarization and provides
-    methods to check, set, and clear the pending state.
+    A channel is pending while its summarization task runs. At most one task
+    runs per channel; scheduling again while one is in flight is a no-op.
 
-    The manager uses an in-memory dict for state tracking. This is appropriate
-    because:
-    - State is transient (only matters between consecutive messages)
+    The manager keeps its state in memory. This is appropriate because:
+    - State is transient (only matters while a summary is being generated)
     - If bot restarts, worst case is missing one auto-summarization
     - Avoids database overhead for every message
 
     Attributes:
         _pending: Dict mapping channel_id to pending summarization state.
+        _tasks: Background summarization task per channel.
+        _completed: Channels whose summary was applied but not yet announced.
     """
 
     def __init__(self) -> None:
         """Initialize the manager with empty state."""
         self._pending: dict[int, bool] = {}
+        self._tasks: dict[int, asyncio.Task[None]] = {}
+        self._completed: set[int] = set()
 
     def should_summarize(self, channel_id: int) -> bool:
-        """Check if this channel should perform auto-summarization.
+        """Check if this channel has auto-summarization pending.
 
         Args:
             channel_id: The Discord channel ID.
@@ -78,8 +109,6 @@ class AutoSummarizationManager:
     def set_pending(self, channel_id: int) -> None:
         """Mark a channel as having pending summarization.
 
-        This should be called when the token threshold is exceeded.
-
         Args:
             channel_id: The Discord channel ID.
         """
@@ -90,15 +119,16 @@ class AutoSummarizationManager:
         )
 
     def clear_pending(self, channel_id: int) -> None:
-        """Clear the pending summarization flag for a channel.
+        """Clear the pending summarization state for a channel.
 
-        This should be called after summarization completes or if the
-        channel history is cleared.
+        This should be called if the channel history is cleared. A task
+        still in flight finds its slot superseded and applies nothing.
 
         Args:
             channel_id: The Discord channel ID.
         """
         self._pending.pop(channel_id, None)
+        self._completed.discard(channel_id)
         logger.info(
             "Auto-summarization cleared",
             extra={"channel_id": channel_id},
@@ -117,6 +147,80 @@ class AutoSummarizationManager:
         """
         return self.should_summarize(channel_id)
 
+    def schedule(
+        self,
+        channel_id: int,
+        job: Callable[[], Awaitable[bool]],
+    ) -> bool:
+        """Run a summarization job in the background.
+
+        Args:
+            channel_id: The Discord channel ID.
+            job: Coroutine factory that summarizes the channel and returns
+                True if a summary was applied. Usually a call to
+                summarize_channel.
+
+        Returns:
+            True if a task was started, False if one is already running.
+        """
+        if channel_id in self._tasks:
+            return False
+        self.set_pending(channel_id)
+        self._tasks[channel_id] = asyncio.create_task(
+            self._run(channel_id, job), name=f"auto-summarize-{channel_id}"
+        )
+        return True
+
+    def pop_completed(self, channel_id: int) -> bool:
+        """Report, once, that a background summary was applied.
+
+        Args:
+            channel_id: The Discord channel ID.
+
+        Returns:
+            True if a summary was applied since the last call.
+        """
+        if channel_id in self._completed:
+            self._completed.discard(channel_id)
+            return True
+        return False
+
+    async def wait(self, channel_id: int) -> None:
+        """Wait for a channel's background summarization, if any, to finish.
+
+        Args:
+            channel_id: The Discord channel ID.
+        """
+        task = self._tasks.get(channel_id)
+        if task is not None:
+            await asyncio.wait([task])
+
+    async def close(self) -> None:
+        """Cancel every background summarization still running."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(
+        self,
+        channel_id: int,
+        job: Callable[[], Awaitable[bool]],
+    ) -> None:
+        """Run a job, recording its outcome and clearing the pending state."""
+        try:
+            if await job():
+                self._completed.add(channel_id)
+        except Exception as ex:
+            logger.warning(
+                "auto_summarization_failed", channel_id=channel_id, error=str(ex)
+            )
+        finally:
+            self._tasks.pop(channel_id, None)
+            self._pending.pop(channel_id, None)
+
 
 # Global manager instance for the application
 _manager: AutoSummarizationManager | None = None
@@ -135,32 +239,25 @@ def get_auto_summarization_manager() -> AutoSummarizationManager:
 
 
 def check_threshold_for_summarization(
-    system_prompt: str,
-    messages: list[dict[str, Any]],
-    current_prompt: str,
-    threshold: int = 10000,
+    context_tokens: int,
+    threshold: int = DEFAULT_THRESHOLD,
 ) -> tuple[int, bool]:
     """Check if token threshold is exceeded for auto-summarization.
 
-    This is a convenience wrapper around check_token_threshold that uses
-    the default summarization threshold.
+    Takes the channel's running context total (see
+    RepositoryAdapter.get_context_token_count) instead of re-encoding the
+    history, so the check costs the same however long the conversation is.
 
     Args:
-        system_prompt: The system prompt text.
-        messages: List of message dictionaries with 'role' and 'content' keys.
-        current_prompt: The current user prompt being processed.
+        context_tokens: Tokens currently in the channel's text context,
+            including the behavior prompt and the prompt being answered.
         threshold: Token threshold for triggering summarization.
             Defaults to 10,000.
 
     Returns:
-        Tuple of (total_token_count, threshold_exceeded).
+        Tuple of (context_tokens, threshold_exceeded).
     """
-    return check_token_threshold(
-        system_prompt=system_prompt,
-        messages=messages,
-        current_prompt=current_prompt,
-        threshold=threshold,
-    )
+    return context_tokens, context_tokens > threshold
 
 
 def convert_context_to_chat_messages(
@@ -200,12 +297,15 @@ def convert_context_to_chat_messages(
 async def perform_summarization(
     messages: list[dict[str, str]],
     guidance: str | None = None,
+    previous_summary: str | None = None,
 ) -> str:
     """Perform conversation summarization using Haiku.
 
     Args:
         messages: List of message dicts with 'role' and 'content' keys.
         guidance: Optional focus area for the summary.
+        previous_summary: Existing rolling summary. If provided, only
+            messages newer than it are expected and they are folded into it.
 
     Returns:
         The summary text.
@@ -218,11 +318,15 @@ async def perform_summarization(
         extra={
             "message_count": len(messages),
             "has_guidance": guidance is not None,
+            "rolling": previous_summary is not None,
         },
     )
 
     try:
-        summary = await haiku_summarize_conversation(messages, guidance)
+        if previous_summary is not None:
+            summary = await haiku_extend_summary(previous_summary, messages, guidance)
+        else:
+            summary = await haiku_summarize_conversation(messages, guidance)
         logger.info(
             "Auto-summarization complete",
             extra={
@@ -234,3 +338,59 @@ async def perform_summarization(
     except SummarizationError:
         logger.error("Auto-summarization failed")
         raise
+
+
+async def summarize_channel(
+    store: SummaryStore, channel_id: int, *, rolling: bool = True
+) -> bool:
+    """Summarize a channel's context and swap the summary in.
+
+    The summary slot is reserved before the context is read, so it covers
+    exactly the messages older than the slot. Messages that arrive while
+    Haiku is working sort after the slot and stay in the context.
+
+    In rolling mode, if the channel still has the summary from its last
+    run, only the messages after it are sent and folded into it, so each
+    run costs the new part of the conversation rather than all of it.
+
+    Args:
+        store: Repository used to read and replace the context.
+        channel_id: The Discord channel ID.
+        rolling: Extend the previous summary instead of re-summarizing it.
+
+    Returns:
+        True if the summary was applied, False if there was nothing to
+        summarize or the context was cleared or summarized meanwhile.
+
+    Raises:
+        SummarizationError: If summarization fails.
+    """
+    slot_id = await store.reserve_summary_slot(channel_id)
+    filled = False
+    try:
+        previous = await store.get_rolling_summary(channel_id) if rolling else None
+        # Everything before the previous summary was hidden when it was filled
+        after_id = previous["channel_message_id"] if previous is not None else 0
+        context = await store.get_visible_text_messages(channel_id, "All Models")
+        messages = convert_context_to_chat_messages(
+            [
+                row
+                for row in context
+                if after_id < row["channel_message_id"] < slot_id
+            ]
+        )
+        if not messages:
+            return False
+
+        summary = await perform_summarization(
+            messages,
+            previous_summary=previous["message_data"] if previous is not None else None,
+        )
+        filled = await store.fill_summary_slot(channel_id, slot_id, summary)
+        if not filled:
+            logger.info("auto_summarization_superseded", channel_id=channel_id)
+        return filled
+    finally:
+        # Also runs when the task is cancelled at shutdown
+        if not filled:
+            await store.release_summary_slot(slot_id)
@@ -0,0 +1,299 @@
+"""Adaptive per-provider concurrency limits.
+
+Without a cap, a burst of users fans out into as many concurrent provider
+calls, which collide with the provider's rate limits and overload responses
+and then retry in lockstep. An AdaptiveBulkhead admits at most `limit` calls
+at a time and queues the rest. The limit adapts the way TCP congestion
+control does (additive increase, multiplicative decrease): every successful
+call nudges it up by about one slot per full window, and a rate limit,
+overload or timeout (as classified by classify_error) halves it, at most
+once per cooldown so one burst of failures counts once. Throughput settles
+near what the provider can actually serve.
+
+Each provider (see BULKHEAD_LIMITS) has one bulkhead per process. Hold a slot
+for one attempt only, so retry backoff does not keep capacity reserved.
+
+Example:
+    async with get_bulkhead("haiku").slot():
+        response = await client.messages.create(...)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.errors import ErrorCategory, classify_error
+from src.core.logging import get_logger
+from src.core.stats import StatsSnapshot
+
+logger = get_logger(__name__)
+
+# Error categories meaning the provider wants less traffic
+OVERLOAD_CATEGORIES = {
+    ErrorCategory.RATE_LIMIT,
+    ErrorCategory.OVERLOADED,
+    ErrorCategory.TIMEOUT,
+}
+
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_DECREASE_COOLDOWN_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class BulkheadLimits:
+    """Bounds for one provider's adaptive limit.
+
+    Attributes:
+        initial: Concurrent calls allowed at startup.
+        minimum: The limit never drops below this.
+        maximum: The limit never grows above this.
+    """
+
+    initial: int
+    minimum: int = 1
+    maximum: int = 32
+
+
+# Per-provider limits. Haiku has its own model rate limits, so it is kept
+# apart from chat even though both go to the Anthropic API.
+BULKHEAD_LIMITS: dict[str, BulkheadLimits] = {
+    "anthropic": BulkheadLimits(initial=8, maximum=32),
+    "haiku": BulkheadLimits(initial=8, maximum=32),
+    "fal": BulkheadLimits(initial=4, maximum=16),
+    "serpapi": BulkheadLimits(initial=4, maximum=8),
+}
+
+
+@dataclass
+class BulkheadStats(StatsSnapshot):
+    """Snapshot of bulkhead metrics.
+
+    Attributes:
+        limit: Current number of concurrent calls allowed.
+        in_flight: Calls currently holding a slot.
+        queued: Calls currently waiting for a slot.
+        acquired: Slots handed out so far.
+        waited: Slots that had to queue before being handed out.
+        total_wait_seconds: Time spent queued, summed over all slots.
+        max_wait_seconds: Longest time any call spent queued.
+        decreases: Times the limit was cut after an overload signal.
+    """
+
+    derived = ("mean_wait_ms", "max_wait_ms")
+    hidden = ("total_wait_seconds", "max_wait_seconds")
+    precision = 1
+
+    limit: float = 0.0
+    in_flight: int = 0
+    queued: int = 0
+    acquired: int = 0
+    waited: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    decreases: int = 0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average time a slot spent queued, over all slots."""
+        if self.acquired == 0:
+            return 0.0
+        return self.total_wait_seconds / self.acquired
+
+    @property
+    def mean_wait_ms(self) -> float:
+        """mean_wait_seconds in milliseconds, as reported by health checks."""
+        return self.mean_wait_seconds * 1000
+
+    @property
+    def max_wait_ms(self) -> float:
+        """max_wait_seconds in milliseconds, as reported by health checks."""
+        return self.max_wait_seconds * 1000
+
+
+class AdaptiveBulkhead:
+    """Async concurrency limiter whose limit adapts to overload signals.
+
+    Attributes:
+        name: The provider this bulkhead protects, used in logs.
+        limits: Bounds for the adaptive limit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limits: BulkheadLimits,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        decrease_cooldown: float = DEFAULT_DECREASE_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize with the limit at limits.initial.
+
+        Args:
+            name: The provider this bulkhead protects, used in logs.
+            limits: Bounds for the adaptive limit.
+            decrease_factor: Multiplier applied to the limit on overload.
+            decrease_cooldown: Seconds after a decrease during which further
+                overload signals are ignored.
+            clock: Time source, injectable for tests.
+
+        Raises:
+            ValueError: If the limits are inconsistent.
+        """
+        if not 1 <= limits.minimum <= limits.initial <= limits.maximum:
+            raise ValueError("limits must satisfy 1 <= minimum <= initial <= maximum")
+        self.name = name
+        self.limits = limits
+        self._decrease_factor = decrease_factor
+        self._decrease_cooldown = decrease_cooldown
+        self._clock = clock
+        self._limit = float(limits.initial)
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._last_decrease: float | None = None
+        self._stats = BulkheadStats()
+
+    @property
+    def limit(self) -> float:
+        """Current (fractional) limit. floor(limit) calls may run at once."""
+        return self._limit
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of the block.
+
+        Success raises the limit; an exception classified as a rate limit,
+        overload or timeout lowers it. Other exceptions leave it unchanged.
+        Exceptions always propagate.
+        """
+        await self.acquire()
+        try:
+            yield
+        except Exception as ex:
+            if classify_error(ex) in OVERLOAD_CATEGORIES:
+                self.record_overload(ex)
+            raise
+        else:
+            self.record_success()
+        finally:
+            self.release()
+
+    async def acquire(self) -> None:
+        """Wait for a slot. Pair with release(); prefer slot()."""
+        started = self._clock()
+        if self._active < self._capacity() and not self._waiters:
+            self._active += 1
+        else:
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Granted a slot just as we were cancelled; pass it on
+                    self.release()
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+            self._stats.waited += 1
+
+        waited = self._clock() - started
+        self._stats.acquired += 1
+        self._stats.total_wait_seconds += waited
+        self._stats.max_wait_seconds = max(self._stats.max_wait_seconds, waited)
+
+    def release(self) -> None:
+        """Give a slot back and admit waiting calls if there is room."""
+        self._active -= 1
+        self._wake()
+
+    def record_success(self) -> None:
+        """Grow the limit by about one slot per window of successes."""
+        self._limit = min(float(self.limits.maximum), self._limit + 1 / self._limit)
+        self._wake()
+
+    def record_overload(self, error: Exception | None = None) -> None:
+        """Cut the limit after a rate limit, overload or timeout.
+
+        Args:
+            error: The error that signalled overload, for logging.
+        """
+        now = self._clock()
+        if (
+            self._last_decrease is not None
+            and now - self._last_decrease < self._decrease_cooldown
+        ):
+            return
+        self._last_decrease = now
+        self._limit = max(
+            float(self.limits.minimum), self._limit * self._decrease_factor
+        )
+        self._stats.decreases += 1
+        logger.warning(
+            "bulkhead_limit_decreased",
+            provider=self.name,
+            limit=round(self._limit, 2),
+            error=str(error) if error else None,
+        )
+
+    def stats(self) -> BulkheadStats:
+        """Return a copy of the current metrics."""
+        return BulkheadStats(
+            limit=self._limit,
+            in_flight=self._active,
+            queued=len(self._waiters),
+            acquired=self._stats.acquired,
+            waited=self._stats.waited,
+            total_wait_seconds=self._stats.total_wait_seconds,
+            max_wait_seconds=self._stats.max_wait_seconds,
+            decreases=self._stats.decreases,
+        )
+
+    def _capacity(self) -> int:
+        return max(self.limits.minimum, int(self._limit))
+
+    def _wake(self) -> None:
+        while self._waiters and self._active < self._capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
+
+
+_bulkheads: dict[str, AdaptiveBulkhead] = {}
+
+
+def get_bulkhead(provider: str) -> AdaptiveBulkhead:
+    """Get the process-wide bulkhead for a provider.
+
+    Args:
+        provider: A key of BULKHEAD_LIMITS.
+
+    Returns:
+        The provider's AdaptiveBulkhead, created on first use.
+
+    Raises:
+        KeyError: If the provider has no configured limits.
+    """
+    bulkhead = _bulkheads.get(provider)
+    if bulkhead is None:
+        bulkhead = AdaptiveBulkhead(provider, BULKHEAD_LIMITS[provider])
+        _bulkheads[provider] = bulkhead
+    return bulkhead
+
+
+def bulkhead_stats(*providers: str) -> dict[str, dict[str, Any]]:
+    """Metrics for the given providers' bulkheads, for health reports.
+
+    Args:
+        providers: Keys of BULKHEAD_LIMITS.
+
+    Returns:
+        A dict mapping each provider to its BulkheadStats.to_dict().
+    """
+    return {name: get_bulkhead(name).stats().to_dict() for name in providers}
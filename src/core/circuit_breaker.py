@@ -0,0 +1,251 @@
+"""Per-provider circuit breakers.
+
+When a provider is down, every request would otherwise wait out its full
+timeout and retry schedule before failing, tying up tasks for minutes. A
+CircuitBreaker watches the outcome of calls to one provider and, after
+enough consecutive outage errors, opens: further calls fail immediately
+with CircuitOpenError. After a recovery timeout it lets a single probe call
+through (half-open); success closes the circuit, another outage error opens
+it again.
+
+Only errors that classify_error places in OUTAGE_CATEGORIES count as
+failures. Any other outcome, including a rejected request, shows the
+provider is reachable and counts as a success.
+
+Example:
+    async with get_circuit_breaker("fal").guard():
+        result = await submit_and_wait(...)
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+
+from src.core.errors import ErrorCategory, TransientError, classify_error
+from src.core.logging import get_logger
+from src.core.stats import StatsSnapshot
+
+logger = get_logger(__name__)
+
+# Error categories meaning the provider is unreachable or failing
+OUTAGE_CATEGORIES = {
+    ErrorCategory.NETWORK,
+    ErrorCategory.TIMEOUT,
+    ErrorCategory.SERVICE_UNAVAILABLE,
+    ErrorCategory.OVERLOADED,
+}
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT_SECONDS = 30.0
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"  # Calls pass through
+    OPEN = "open"  # Calls fail fast
+    HALF_OPEN = "half_open"  # One probe call is let through
+
+
+class CircuitOpenError(TransientError):
+    """Raised instead of calling a provider whose circuit is open.
+
+    Attributes:
+        provider: The provider whose circuit is open.
+    """
+
+    def __init__(self, provider: str, retry_after: float | None = None) -> None:
+        """Initialize the error.
+
+        Args:
+            provider: The provider whose circuit is open.
+            retry_after: Seconds until a probe call will be allowed.
+        """
+        super().__init__(
+            f"{provider} is unavailable (circuit open)",
+            ErrorCategory.SERVICE_UNAVAILABLE,
+            retry_after=retry_after,
+        )
+        self.provider = provider
+
+
+@dataclass
+class CircuitBreakerStats(StatsSnapshot):
+    """Snapshot of circuit breaker metrics.
+
+    Attributes:
+        state: Current state.
+        consecutive_failures: Outage errors since the last success.
+        opened: Times the circuit has opened.
+        rejected: Calls failed fast while open.
+        retry_after: Seconds until a probe is allowed, if open.
+    """
+
+    precision = 1
+
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened: int = 0
+    rejected: int = 0
+    retry_after: float | None = None
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one provider.
+
+    Attributes:
+        name: The provider this breaker protects.
+        failure_threshold: Consecutive outage errors that open the circuit.
+        recovery_timeout: Seconds the circuit stays open before a probe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed circuit.
+
+        Args:
+            name: The provider this breaker protects.
+            failure_threshold: Consecutive outage errors that open the circuit.
+            recovery_timeout: Seconds the circuit stays open before a probe.
+            clock: Time source, injectable for tests.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state. An open circuit turns half-open once it has cooled down."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def check(self) -> None:
+        """Fail fast if the circuit is open, without reserving a call.
+
+        Use before work that precedes the guarded call, such as uploads.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        if self.state == CircuitState.OPEN:
+            self._reject()
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """Run the block as a call to the provider.
+
+        The outcome of the block is recorded. Exceptions always propagate.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its
+                probe call already in flight.
+        """
+        state = self.state
+        if state == CircuitState.OPEN or (state == CircuitState.HALF_OPEN and self._probing):
+            self._reject()
+        probe = state == CircuitState.HALF_OPEN
+        if probe:
+            self._probing = True
+
+        try:
+            yield
+        except Exception as ex:
+            if classify_error(ex) in OUTAGE_CATEGORIES:
+                self.record_failure(ex)
+            else:
+                self.record_success()
+            raise
+        else:
+            self.record_success()
+        finally:
+            # A cancelled probe proves nothing; let the next call probe
+            if probe:
+                self._probing = False
+
+    def record_success(self) -> None:
+        """Record a call the provider answered, closing the circuit."""
+        if self._state != CircuitState.CLOSED:
+            logger.info("circuit_closed", provider=self.name)
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+
+    def record_failure(self, error: Exception | None = None) -> None:
+        """Record an outage error, opening the circuit at the threshold.
+
+        Args:
+            error: The error that was raised, for logging.
+        """
+        self._failures += 1
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED
+            and self._failures >= self.failure_threshold
+        ):
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+            self._opened += 1
+            logger.warning(
+                "circuit_opened",
+                provider=self.name,
+                consecutive_failures=self._failures,
+                recovery_timeout=self.recovery_timeout,
+                error=str(error) if error else None,
+            )
+
+    def stats(self) -> CircuitBreakerStats:
+        """Return a copy of the current metrics."""
+        state = self.state
+        return CircuitBreakerStats(
+            state=state,
+            consecutive_failures=self._failures,
+            opened=self._opened,
+            rejected=self._rejected,
+            retry_after=self._retry_after() if state == CircuitState.OPEN else None,
+        )
+
+    def _retry_after(self) -> float:
+        return max(0.0, self._opened_at + self.recovery_timeout - self._clock())
+
+    def _reject(self) -> None:
+        self._rejected += 1
+        raise CircuitOpenError(self.name, retry_after=self._retry_after())
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a provider.
+
+    Args:
+        provider: The provider name, e.g. "anthropic", "haiku", "fal" or
+            "serpapi".
+
+    Returns:
+        The provider's CircuitBreaker, created on first use.
+    """
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        breaker = CircuitBreaker(provider)
+        _breakers[provider] = breaker
+    return breaker
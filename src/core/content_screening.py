@@ -14,12 +14,20 @@ import json
 import os
 from dataclasses import dataclass
 
-from anthropic import APIStatusError, AsyncAnthropic
+from anthropic import APIStatusError
 
+from src.core.anthropic_clients import get_anthropic_client
+from src.core.bulkhead import get_bulkhead
+from src.core.circuit_breaker import get_circuit_breaker
+from src.core.haiku_cache import get_haiku_cache
 from src.core.logging import get_logger
+from src.core.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
+# Concurrent screenings of the same query share one API call
+_in_flight = SingleFlight()
+
 
 def _strip_markdown_json(response: str) -> str:
     """Strip markdown code block wrappers from JSON response.
@@ -82,6 +90,18 @@ class ScreeningResult:
     reason: str | None
 
 
+async def _cache_verdict(query: str, result: ScreeningResult) -> ScreeningResult:
+    """Remember a screening verdict for identical queries and return it."""
+    await get_haiku_cache().put(
+        "screening",
+        SCREENING_MODEL,
+        SCREENING_PROMPT,
+        query,
+        json.dumps({"allowed": result.allowed, "reason": result.reason}),
+    )
+    return result
+
+
 async def screen_search_query(query: str) -> ScreeningResult:
     """Screen a search query for inappropriate content using Claude Haiku.
 
@@ -99,7 +119,13 @@ async def screen_search_query(query: str) -> ScreeningResult:
     Note:
         Fails closed - if the Haiku API fails for any reason, the function
         returns allowed=False with a service unavailable message.
+        Concurrent screenings of the same query share one API call.
     """
+    return await _in_flight.do(query, lambda: _screen_search_query(query))
+
+
+async def _screen_search_query(query: str) -> ScreeningResult:
+    """Screen a query without de-duplication. See screen_search_query."""
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         logger.error("ANTHROPIC_API_KEY not set, blocking query")
@@ -108,19 +134,28 @@ async def screen_search_query(query: str) -> ScreeningResult:
             reason="Screening service unavailable",
         )
 
-    client = AsyncAnthropic(api_key=api_key)
+    # Popular queries are screened once per TTL; only verdicts are cached
+    cached = await get_haiku_cache().get(
+        "screening", SCREENING_MODEL, SCREENING_PROMPT, query
+    )
+    if cached is not None:
+        verdict = json.loads(cached)
+        return ScreeningResult(allowed=verdict["allowed"], reason=verdict["reason"])
+
+    client = get_anthropic_client(api_key)
 
     try:
-        response = await client.messages.create(
-            model=SCREENING_MODEL,
-            max_tokens=256,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"{SCREENING_PROMPT}{query}",
-                }
-            ],
-        )
+        async with get_circuit_breaker("haiku").guard(), get_bulkhead("haiku").slot():
+            response = await client.messages.create(
+                model=SCREENING_MODEL,
+                max_tokens=256,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": f"{SCREENING_PROMPT}{query}",
+                    }
+                ],
+            )
 
         # Extract content from response
         if not response.content or not hasattr(response.content[0], "text"):
@@ -167,7 +202,7 @@ async def screen_search_query(query: str) -> ScreeningResult:
 
         if result["allowed"]:
             logger.debug("Query allowed", query=query)
-            return ScreeningResult(allowed=True, reason=None)
+            return await _cache_verdict(query, ScreeningResult(allowed=True, reason=None))
         else:
             reason = result.get("reason", "Query blocked by content screening")
             logger.info(
@@ -175,7 +210,9 @@ async def screen_search_query(query: str) -> ScreeningResult:
                 query=query,
                 reason=reason,
             )
-            return ScreeningResult(allowed=False, reason=reason)
+            return await _cache_verdict(
+                query, ScreeningResult(allowed=False, reason=reason)
+            )
 
     except APIStatusError as e:
         logger.error(
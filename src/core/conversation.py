@@ -5,11 +5,20 @@ including message windowing (limiting to most recent messages) and token
 estimation. All logic is pure computation with no I/O dependencies.
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import Any
 
 from src.core.providers import ChatMessage
 
+# Repository message types that become chat turns, and their roles
+_MESSAGE_TYPE_ROLES = {"prompt": "user", "assistant": "assistant"}
+
+# User turn stored ahead of a summary, so the context still opens with a user
+# message once everything before the summary is gone
+SUMMARY_PROMPT = "[Previous conversation summarized]"
+
 
 @dataclass
 class ConversationContext:
@@ -20,12 +29,15 @@ class ConversationContext:
     Attributes:
         messages: List of ChatMessage objects, windowed to fit limits.
             Messages are in chronological order (oldest first).
-        total_tokens_estimate: Rough estimate of total tokens in the context.
-            Uses ~4 characters per token heuristic.
+        total_tokens_estimate: Total tokens in the context, including the
+            system prompt. Uses stored per-message counts where available and
+            the ~4 characters per token heuristic otherwise.
+        system_prompt: The system prompt the context was built with, if any.
     """
 
     messages: list[ChatMessage]
     total_tokens_estimate: int
+    system_prompt: str | None = None
 
 
 class ContextBuilder:
@@ -78,31 +90,95 @@ class ContextBuilder:
         # Start with system prompt token budget if provided
         system_tokens = self.estimate_tokens(system_prompt) if system_prompt else 0
 
-        # Convert history to ChatMessages (most recent first for windowing)
-        reversed_history = list(reversed(history))
+        counts = [self.estimate_tokens(content) for _role, content, _timestamp in history]
+        start, window_tokens = self._window(counts, self.max_tokens - system_tokens)
 
-        windowed_messages: list[ChatMessage] = []
-        total_tokens = system_tokens
+        return ConversationContext(
+            messages=[
+                ChatMessage(role=role, content=content)
+                for role, content, _timestamp in history[start:]
+            ],
+            total_tokens_estimate=system_tokens + window_tokens,
+            system_prompt=system_prompt,
+        )
 
-        for role, content, _timestamp in reversed_history:
-            if len(windowed_messages) >= self.max_messages:
-                break
+    def build_from_context(
+        self,
+        context: list[dict[str, Any]],
+    ) -> ConversationContext:
+        """Build conversation context from repository message dicts.
 
-            message_tokens = self.estimate_tokens(content)
-            if total_tokens + message_tokens > self.max_tokens:
-                break
+        Like build_context, but reads the system prompt from the most recent
+        behavior message and uses each row's stored "token_count" (falling
+        back to estimate_tokens for rows without one). The newest message is
+        always kept, even if it alone exceeds the budget, and the window is
+        trimmed so it starts with a user message, as chat APIs require.
 
-            windowed_messages.append(ChatMessage(role=role, content=content))
-            total_tokens += message_tokens
+        Args:
+            context: Message dicts from the repository in chronological order,
+                with 'message_type', 'message_data' and optionally
+                'token_count' keys.
 
-        # Reverse back to chronological order (oldest first)
-        windowed_messages.reverse()
+        Returns:
+            ConversationContext with the windowed messages and system prompt.
+        """
+        system_row = next(
+            (row for row in reversed(context) if row["message_type"] == "behavior"),
+            None,
+        )
+        system_prompt = system_row["message_data"] if system_row else None
+        system_tokens = self._row_tokens(system_row) if system_row else 0
+
+        messages: list[ChatMessage] = []
+        counts: list[int] = []
+        for row in context:
+            role = _MESSAGE_TYPE_ROLES.get(row["message_type"])
+            if role is None:
+                continue  # Behavior and unknown types are not chat turns
+            messages.append(ChatMessage(role=role, content=row["message_data"]))
+            counts.append(self._row_tokens(row))
+
+        start, window_tokens = self._window(counts, self.max_tokens - system_tokens)
+        if messages and start == len(messages):
+            # Never drop the message being answered
+            start = len(messages) - 1
+            window_tokens = counts[-1]
+        while start < len(messages) - 1 and messages[start].role != "user":
+            window_tokens -= counts[start]
+            start += 1
 
         return ConversationContext(
-            messages=windowed_messages,
-            total_tokens_estimate=total_tokens,
+            messages=messages[start:],
+            total_tokens_estimate=system_tokens + window_tokens,
+            system_prompt=system_prompt,
         )
 
+    def _window(self, counts: list[int], budget: int) -> tuple[int, int]:
+        """Find the longest suffix of counts within the budget and message limit.
+
+        Prefix sums are non-decreasing, so the first index whose remaining
+        suffix fits the budget is found by binary search.
+
+        Args:
+            counts: Token count of each message, oldest first.
+            budget: Tokens available for messages.
+
+        Returns:
+            Tuple of (index of the first kept message, tokens in the window).
+        """
+        prefix = list(accumulate(counts, initial=0))
+        total = prefix[-1]
+        start = bisect_left(prefix, total - budget)
+        start = min(max(start, len(counts) - self.max_messages), len(counts))
+        return start, total - prefix[start]
+
+    def _row_tokens(self, row: dict[str, Any]) -> int:
+        """Return a row's stored token count, estimating it if missing."""
+        count = row.get("token_count")
+        if count is None:
+            return self.estimate_tokens(row["message_data"] or "")
+        return int(count)
+
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count for text.
 
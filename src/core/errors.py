@@ -146,6 +146,10 @@ def classify_error(error: Exception) -> ErrorCategory:
     Returns:
         The ErrorCategory that best matches the error.
     """
+    # Errors that were classified when raised keep their category
+    if isinstance(error, (TransientError, PermanentError)):
+        return error.category
+
     error_str = str(error).lower()
 
     # Check for timeout errors
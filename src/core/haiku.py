@@ -25,11 +25,15 @@ import asyncio
 import os
 from typing import Any, cast
 
-import httpx
-from anthropic import APIStatusError, AsyncAnthropic
+from anthropic import APIStatusError
 from anthropic.types import MessageParam
 
+from src.core.anthropic_clients import get_anthropic_client
+from src.core.bulkhead import get_bulkhead
+from src.core.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from src.core.haiku_cache import get_haiku_cache, make_cache_key
 from src.core.logging import get_logger
+from src.core.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
@@ -43,6 +47,9 @@ DEFAULT_TIMEOUT = 30.0
 MAX_RETRIES = 1
 BACKOFF_DELAYS = [1.0, 2.0]
 
+# Identical cacheable requests in flight at the same time share one API call
+_in_flight = SingleFlight()
+
 
 class HaikuError(Exception):
     """Error raised when Haiku API calls fail after retries."""
@@ -54,6 +61,7 @@ async def haiku_complete(
     system_prompt: str,
     user_message: str,
     max_tokens: int = 1024,
+    cache_feature: str | None = None,
 ) -> str:
     """Complete a text prompt using Claude Haiku.
 
@@ -64,6 +72,9 @@ async def haiku_complete(
         system_prompt: The system prompt to guide the model behavior.
         user_message: The user message/prompt to complete.
         max_tokens: Maximum number of tokens in the response. Defaults to 1024.
+        cache_feature: Feature name under which identical requests are
+            answered from the Haiku cache, with that feature's TTL. None
+            (the default) always calls the API.
 
     Returns:
         The raw text content from the model response.
@@ -84,11 +95,13 @@ async def haiku_complete(
         }
     ]
 
-    return await _call_haiku_api(
+    return await _call_haiku_api_cached(
         api_key=api_key,
         system_prompt=system_prompt,
         messages=messages,
         max_tokens=max_tokens,
+        cache_feature=cache_feature,
+        cache_input=user_message,
     )
 
 
@@ -98,6 +111,7 @@ async def haiku_vision(
     user_message: str | None = None,
     max_tokens: int = 1024,
     media_type: str = "image/jpeg",
+    cache_feature: str | None = None,
 ) -> str:
     """Analyze an image using Claude Haiku vision capabilities.
 
@@ -112,6 +126,9 @@ async def haiku_vision(
         max_tokens: Maximum number of tokens in the response. Defaults to 1024.
         media_type: The MIME type of the image. Defaults to "image/jpeg".
             Common values: "image/jpeg", "image/png", "image/gif", "image/webp".
+        cache_feature: Feature name under which identical requests are
+            answered from the Haiku cache, with that feature's TTL. None
+            (the default) always calls the API.
 
     Returns:
         The raw text content from the model response.
@@ -153,14 +170,63 @@ async def haiku_vision(
         }
     ]
 
-    return await _call_haiku_api(
+    return await _call_haiku_api_cached(
         api_key=api_key,
         system_prompt=system_prompt,
         messages=messages,
         max_tokens=max_tokens,
+        cache_feature=cache_feature,
+        # The image is part of the input, so the same picture hits the cache
+        cache_input=f"{media_type}\n{image_base64}\n{user_message or ''}",
     )
 
 
+async def _call_haiku_api_cached(
+    api_key: str,
+    system_prompt: str,
+    messages: list[dict[str, Any]],
+    max_tokens: int,
+    cache_feature: str | None,
+    cache_input: str,
+) -> str:
+    """Call the Haiku API through the completion cache.
+
+    For cached features, identical requests that arrive while one is
+    already in flight share its result instead of calling the API again.
+    Uncached features (including remix, whose TTL is 0) always get their
+    own call.
+
+    Args:
+        api_key: The Anthropic API key.
+        system_prompt: The system prompt.
+        messages: The messages to send.
+        max_tokens: Maximum tokens in response.
+        cache_feature: Feature selecting the cache TTL, or None.
+        cache_input: The request input as hashed for the cache key.
+
+    Returns:
+        The text content from the response.
+
+    Raises:
+        HaikuError: If all retries fail.
+    """
+    cache = get_haiku_cache()
+    if cache_feature is None or not cache.enabled(cache_feature):
+        return await _call_haiku_api(api_key, system_prompt, messages, max_tokens)
+
+    cached = await cache.get(cache_feature, HAIKU_MODEL, system_prompt, cache_input)
+    if cached is not None:
+        return cached
+
+    async def call() -> str:
+        response = await _call_haiku_api(api_key, system_prompt, messages, max_tokens)
+        await cache.put(cache_feature, HAIKU_MODEL, system_prompt, cache_input, response)
+        return response
+
+    key = make_cache_key(HAIKU_MODEL, system_prompt, cache_input)
+    return await _in_flight.do(key, call)
+
+
 async def _call_haiku_api(
     api_key: str,
     system_prompt: str,
@@ -181,21 +247,19 @@ async def _call_haiku_api(
     Raises:
         HaikuError: If all retries fail.
     """
-    client = AsyncAnthropic(
-        api_key=api_key,
-        timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=10.0),
-    )
+    client = get_anthropic_client(api_key, timeout=DEFAULT_TIMEOUT)
 
     last_error: Exception | None = None
 
     for attempt in range(MAX_RETRIES + 1):
         try:
-            response = await client.messages.create(
-                model=HAIKU_MODEL,
-                max_tokens=max_tokens,
-                system=system_prompt,
-                messages=cast(list[MessageParam], messages),
-            )
+            async with get_circuit_breaker("haiku").guard(), get_bulkhead("haiku").slot():
+                response = await client.messages.create(
+                    model=HAIKU_MODEL,
+                    max_tokens=max_tokens,
+                    system=system_prompt,
+                    messages=cast(list[MessageParam], messages),
+                )
 
             # Extract text content from response
             if not response.content or not hasattr(response.content[0], "text"):
@@ -241,6 +305,10 @@ async def _call_haiku_api(
 
             raise HaikuError("Haiku API request timed out") from e
 
+        except CircuitOpenError as e:
+            # Fail fast while the API is down instead of retrying
+            raise HaikuError(f"Haiku API unavailable: {e}") from e
+
         except Exception as e:
             last_error = e
             logger.error(
@@ -310,6 +378,7 @@ async def haiku_describe_image(
             user_message="Describe this image.",
             max_tokens=512,
             media_type=media_type,
+            cache_feature="describe",
         )
         return description.strip()
     except HaikuError as e:
@@ -425,20 +494,66 @@ async def haiku_summarize_conversation(
         )
         return summary.strip()
     except HaikuError as e:
-        error_message = str(e)
-        if "API key" in error_message:
-            raise SummarizationError(
-                "Failed to summarize: API key not configured"
-            ) from e
-        elif "timed out" in error_message.lower():
-            raise SummarizationError(
-                "Failed to summarize: Request timed out"
-            ) from e
-        elif "Empty response" in error_message:
-            raise SummarizationError(
-                "Failed to summarize: No summary generated"
-            ) from e
-        else:
-            raise SummarizationError(
-                f"Failed to summarize: {error_message}"
-            ) from e
+        raise _summarization_error(e) from e
+
+
+async def haiku_extend_summary(
+    summary: str,
+    messages: list[dict[str, str]],
+    guidance: str | None = None,
+) -> str:
+    """Fold new messages into an existing conversation summary.
+
+    Used for rolling summaries: only the messages since the last summary are
+    sent, so the cost of each summarization stays proportional to the new
+    part of the conversation rather than its whole length.
+
+    Args:
+        summary: The existing summary, as returned by a previous call to
+            haiku_summarize_conversation or haiku_extend_summary.
+        messages: Messages newer than the summary, as dicts with 'role' and
+            'content' keys.
+        guidance: Optional focus area for the updated summary.
+
+    Returns:
+        An updated summary starting with "Summary of conversation:" that
+        covers both the existing summary and the new messages.
+
+    Raises:
+        SummarizationError: If the summarization fails due to API errors,
+            empty input, or other issues.
+    """
+    # Import here to avoid circular imports
+    from src.core.prompts.summarization import build_rolling_summarization_prompt
+
+    conversation_text = _format_conversation_for_summary(messages)
+    if not conversation_text.strip():
+        raise SummarizationError("No new messages to summarize")
+
+    user_message = (
+        f"Existing summary:\n{summary.strip()}\n\n"
+        f"New messages:\n{conversation_text}"
+    )
+
+    try:
+        updated = await haiku_complete(
+            system_prompt=build_rolling_summarization_prompt(guidance),
+            user_message=user_message,
+            max_tokens=2048,
+        )
+        return updated.strip()
+    except HaikuError as e:
+        raise _summarization_error(e) from e
+
+
+def _summarization_error(error: HaikuError) -> SummarizationError:
+    """Map a Haiku API error to a user-facing SummarizationError."""
+    error_message = str(error)
+    if "API key" in error_message:
+        return SummarizationError("Failed to summarize: API key not configured")
+    elif "timed out" in error_message.lower():
+        return SummarizationError("Failed to summarize: Request timed out")
+    elif "Empty response" in error_message:
+        return SummarizationError("Failed to summarize: No summary generated")
+    else:
+        return SummarizationError(f"Failed to summarize: {error_message}")
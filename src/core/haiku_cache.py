@@ -0,0 +1,286 @@
+"""Cache for deterministic Haiku completions.
+
+Several Haiku-backed features see the same input over and over: screening a
+popular search query, describing the same carousel image, refining the same
+prompt. HaikuCache remembers their completions, keyed by the model, a hash
+of the system prompt and a hash of the input, so a repeat costs a dictionary
+lookup instead of an API round trip.
+
+The cache has an in-memory LRU front and an optional persistent tier (any
+CompletionStore, implemented by SQLiteRepository) that survives restarts.
+Each feature has its own TTL in FEATURE_TTLS; a TTL of 0 opts the feature
+out, which is how nondeterministic features such as remix stay uncached.
+
+Example:
+    cache = get_haiku_cache()
+    text = await cache.get("describe", HAIKU_MODEL, system_prompt, image)
+    if text is None:
+        text = await call_haiku(...)
+        await cache.put("describe", HAIKU_MODEL, system_prompt, image, text)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from src.core.logging import get_logger
+from src.core.stats import StatsSnapshot
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Seconds each feature's completions stay valid; 0 disables caching
+FEATURE_TTLS: dict[str, float] = {
+    "refine": 60 * 60,
+    "describe": 7 * 24 * 60 * 60,
+    "screening": 24 * 60 * 60,
+    # Remix is meant to produce a different prompt every time
+    "remix": 0,
+}
+
+
+class CompletionStore(Protocol):
+    """Persistent tier of the Haiku cache.
+
+    Implemented by SQLiteRepository.
+    """
+
+    async def get_cached_completion(self, key: str) -> tuple[str, float] | None: ...
+
+    async def put_cached_completion(
+        self, key: str, feature: str, value: str, expires_at: float
+    ) -> None: ...
+
+
+def make_cache_key(model: str, system_prompt: str, user_input: str) -> str:
+    """Build the cache key for a completion.
+
+    Args:
+        model: The model that produced the completion.
+        system_prompt: The system prompt sent with the input.
+        user_input: The user message, image data, or both.
+
+    Returns:
+        "<model>:<system prompt hash>:<input hash>".
+    """
+    system_hash = hashlib.sha256(system_prompt.encode()).hexdigest()
+    input_hash = hashlib.sha256(user_input.encode()).hexdigest()
+    return f"{model}:{system_hash}:{input_hash}"
+
+
+@dataclass
+class FeatureCacheStats(StatsSnapshot):
+    """Lookup counts for one feature.
+
+    Attributes:
+        hits: Lookups answered from memory.
+        persistent_hits: Lookups answered from the persistent tier.
+        misses: Lookups that had to call Haiku.
+    """
+
+    derived = ("hit_ratio",)
+
+    hits: int = 0
+    persistent_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups answered from either tier."""
+        total = self.hits + self.persistent_hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits + self.persistent_hits) / total
+
+
+@dataclass
+class HaikuCacheStats(StatsSnapshot):
+    """Snapshot of Haiku cache metrics.
+
+    Attributes:
+        entries: Completions held in memory.
+        evictions: Completions dropped to stay within max_entries.
+        persistent: Whether a persistent tier is attached.
+        features: Lookup counts per feature.
+    """
+
+    derived = ("hit_ratio",)
+
+    entries: int = 0
+    evictions: int = 0
+    persistent: bool = False
+    features: dict[str, FeatureCacheStats] = field(default_factory=dict)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups across all features answered from cache."""
+        hits = sum(f.hits + f.persistent_hits for f in self.features.values())
+        total = hits + sum(f.misses for f in self.features.values())
+        if total == 0:
+            return 0.0
+        return hits / total
+
+
+class HaikuCache:
+    """LRU cache of Haiku completions with per-feature TTLs.
+
+    Attributes:
+        max_entries: Maximum number of completions kept in memory.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttls: dict[str, float] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty cache with no persistent tier.
+
+        Args:
+            max_entries: Maximum number of completions kept in memory.
+            ttls: Seconds each feature's completions stay valid. Defaults to
+                FEATURE_TTLS. Features not listed are not cached.
+            clock: Wall-clock time source, injectable for tests. Expiry
+                times are persisted, so this must not be monotonic.
+
+        Raises:
+            ValueError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._ttls = dict(FEATURE_TTLS if ttls is None else ttls)
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._store: CompletionStore | None = None
+        self._evictions = 0
+        self._features: dict[str, FeatureCacheStats] = {}
+
+    def attach_store(self, store: CompletionStore | None) -> None:
+        """Attach (or with None, detach) the persistent tier.
+
+        Args:
+            store: Where completions are persisted across restarts.
+        """
+        self._store = store
+
+    def enabled(self, feature: str) -> bool:
+        """Whether completions for a feature are cached at all."""
+        return self._ttls.get(feature, 0) > 0
+
+    async def get(
+        self, feature: str, model: str, system_prompt: str, user_input: str
+    ) -> str | None:
+        """Look up a cached completion.
+
+        Args:
+            feature: The feature asking, which selects the TTL.
+            model: The model that would produce the completion.
+            system_prompt: The system prompt that would be sent.
+            user_input: The user message, image data, or both.
+
+        Returns:
+            The cached completion, or None on a miss or if the feature is
+            not cached.
+        """
+        if not self.enabled(feature):
+            return None
+        stats = self._features.setdefault(feature, FeatureCacheStats())
+        key = make_cache_key(model, system_prompt, user_input)
+        now = self._clock()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                stats.hits += 1
+                return value
+            del self._entries[key]
+
+        if self._store is not None:
+            try:
+                stored = await self._store.get_cached_completion(key)
+            except Exception as ex:
+                logger.warning("haiku_cache_read_failed", error=str(ex))
+                stored = None
+            if stored is not None and stored[1] > now:
+                self._remember(key, stored[0], stored[1])
+                stats.persistent_hits += 1
+                return stored[0]
+
+        stats.misses += 1
+        return None
+
+    async def put(
+        self,
+        feature: str,
+        model: str,
+        system_prompt: str,
+        user_input: str,
+        value: str,
+    ) -> None:
+        """Store a completion, unless the feature is not cached.
+
+        Args:
+            feature: The feature that produced it, which selects the TTL.
+            model: The model that produced it.
+            system_prompt: The system prompt that was sent.
+            user_input: The user message, image data, or both.
+            value: The completion text.
+        """
+        if not self.enabled(feature):
+            return
+        key = make_cache_key(model, system_prompt, user_input)
+        expires_at = self._clock() + self._ttls[feature]
+        self._remember(key, value, expires_at)
+
+        if self._store is not None:
+            try:
+                await self._store.put_cached_completion(key, feature, value, expires_at)
+            except Exception as ex:
+                logger.warning("haiku_cache_write_failed", error=str(ex))
+
+    def clear(self) -> None:
+        """Drop every completion held in memory."""
+        self._entries.clear()
+
+    def stats(self) -> HaikuCacheStats:
+        """Return a copy of the current metrics."""
+        return HaikuCacheStats(
+            entries=len(self._entries),
+            evictions=self._evictions,
+            persistent=self._store is not None,
+            features={
+                name: FeatureCacheStats(s.hits, s.persistent_hits, s.misses)
+                for name, s in self._features.items()
+            },
+        )
+
+    def _remember(self, key: str, value: str, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+_cache: HaikuCache | None = None
+
+
+def get_haiku_cache() -> HaikuCache:
+    """Get the global Haiku cache instance.
+
+    Returns:
+        The singleton HaikuCache instance.
+    """
+    global _cache
+    if _cache is None:
+        _cache = HaikuCache()
+    return _cache
@@ -11,6 +11,9 @@ Example:
     checker.add_check("database", check_database)
     checker.add_check("anthropic", check_anthropic)
 
+    # Report circuit breaker state with the provider's check
+    checker.add_circuit_breakers("anthropic", get_circuit_breaker("anthropic"))
+
     # Start HTTP server on port 8080
     await start_health_server(checker, port=8080)
 """
@@ -24,6 +27,7 @@ from typing import Any
 
 from aiohttp import web
 
+from src.core.circuit_breaker import CircuitBreaker, CircuitState
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -102,6 +106,7 @@ class HealthChecker:
             version: Application version to include in health reports.
         """
         self._checks: dict[str, HealthCheckFunc] = {}
+        self._circuit_breakers: dict[str, list[CircuitBreaker]] = {}
         self._version = version
 
     def add_check(self, name: str, check_func: HealthCheckFunc) -> None:
@@ -113,6 +118,18 @@ class HealthChecker:
         """
         self._checks[name] = check_func
 
+    def add_circuit_breakers(self, name: str, *breakers: CircuitBreaker) -> None:
+        """Report circuit breaker state as part of a service check.
+
+        The breakers' stats are added to the check's details. A check that
+        passed is reported as degraded while any of its circuits is open.
+
+        Args:
+            name: Name of the service check.
+            breakers: Circuit breakers of the providers behind the service.
+        """
+        self._circuit_breakers.setdefault(name, []).extend(breakers)
+
     def remove_check(self, name: str) -> None:
         """Remove a registered health check.
 
@@ -136,6 +153,25 @@ class HealthChecker:
         if name not in self._checks:
             raise KeyError(f"No health check registered for: {name}")
 
+        result = await self._run_check(name)
+        breakers = self._circuit_breakers.get(name)
+        if breakers:
+            stats = {breaker.name: breaker.stats() for breaker in breakers}
+            result.details["circuit_breakers"] = {
+                provider: breaker_stats.to_dict()
+                for provider, breaker_stats in stats.items()
+            }
+            open_circuits = [
+                provider
+                for provider, breaker_stats in stats.items()
+                if breaker_stats.state == CircuitState.OPEN
+            ]
+            if open_circuits and result.status == ServiceStatus.HEALTHY:
+                result.status = ServiceStatus.DEGRADED
+                result.message = f"Circuit open: {', '.join(open_circuits)}"
+        return result
+
+    async def _run_check(self, name: str) -> ServiceCheck:
         check_func = self._checks[name]
         start = asyncio.get_event_loop().time()
 
@@ -4,14 +4,20 @@ This module provides functions for generating image variations:
 1. Same-prompt variations: regenerate with the same prompt, relying on model randomness
 2. AI-remixed variations: use Haiku to slightly modify the prompt before regenerating
 
-Both functions are designed to work with the VariationCarouselView and integrate
+Each kind comes as a single-variation function and a batch function that
+produces several variations at once and yields each one as it finishes.
+A batch asks Haiku for all of its remixes in one call.
+All of them are designed to work with the VariationCarouselView and integrate
 with the rate limiting system.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+import json
+from collections.abc import AsyncGenerator, Coroutine
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from src.core.haiku import HaikuError, haiku_complete
 from src.core.image_utils import compress_image, image_strip_headers
@@ -19,19 +25,25 @@ from src.core.logging import get_logger
 from src.core.providers import ImageModifyRequest, ImageRequest
 
 if TYPE_CHECKING:
-    from src.core.providers import ImageProvider
+    from src.core.providers import GeneratedImage, ImageProvider
     from src.core.rate_limit import SlidingWindowRateLimiter
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 # Timeout for image generation API calls (seconds)
 API_TIMEOUT_SECONDS = 180
 
+# Maximum image generation calls a batch runs at once
+BATCH_MAX_CONCURRENCY = 3
+
+# Output token budget per remix in a batched request
+REMIX_MAX_TOKENS = 512
 
-# System prompt for remixing image prompts
-REMIX_SYSTEM_PROMPT = """Create a variation of this image generation prompt following these rules:
 
-MUST PRESERVE (copy exactly):
+# Rules shared by the single and batched remix prompts
+_REMIX_RULES = """MUST PRESERVE (copy exactly):
 - Any text, words, letters, or quotes that appear in the prompt
 - The core subject/theme (main character, object, or scene)
 - The overall artistic style and aesthetic
@@ -42,10 +54,24 @@ ALLOWED CHANGES (pick one small variation):
 - Minor details (colors, textures, background elements)
 - Mood or atmosphere
 
-IMPORTANT: If the original prompt contains specific text (like words on a sign, title text, or spoken words), you MUST include that exact text in your output.
+IMPORTANT: If the original prompt contains specific text (like words on a sign, title text, or spoken words), you MUST include that exact text in your output."""
+
+# System prompt for remixing image prompts
+REMIX_SYSTEM_PROMPT = f"""Create a variation of this image generation prompt following these rules:
+
+{_REMIX_RULES}
 
 Your response should ONLY be the modified prompt, with no additional text, explanation, or formatting."""
 
+# System prompt for remixing a prompt several ways in one call
+REMIX_BATCH_SYSTEM_PROMPT = f"""Create the requested number of distinct variations of this image generation prompt. Each variation must follow these rules:
+
+{_REMIX_RULES}
+
+Each variation should change a different aspect, so that no two variations are alike.
+
+Respond with JSON only: an array of strings, one modified prompt per string, with no additional text, explanation, or formatting. Example: ["first variation", "second variation"]"""
+
 
 class VariationError(Exception):
     """Error raised when variation generation fails."""
@@ -101,6 +127,133 @@ async def record_rate_limit(
         await rate_limiter.record(user_id, "image")
 
 
+async def reserve_batch(
+    user_id: int,
+    count: int,
+    rate_limiter: SlidingWindowRateLimiter | None,
+) -> int:
+    """Check how many of a batch of images the user may still generate.
+
+    Each image in a batch counts against the rate limit on its own, so a
+    batch is trimmed to the user's remaining allowance.
+
+    Args:
+        user_id: The user ID to check.
+        count: The number of images requested.
+        rate_limiter: The rate limiter to check against.
+
+    Returns:
+        The number of images to generate, between 1 and count.
+
+    Raises:
+        RateLimitExceededError: If the rate limit is already exhausted.
+    """
+    if rate_limiter is None:
+        return count
+
+    rate_check = await rate_limiter.check(user_id, "image")
+    if not rate_check.allowed:
+        raise RateLimitExceededError(retry_after=rate_check.wait_seconds)
+    return max(1, min(count, rate_check.remaining))
+
+
+async def _request_images(
+    prompt: str,
+    image_provider: ImageProvider,
+    reference_images: list[str] | None,
+    num_images: int = 1,
+) -> list[GeneratedImage]:
+    """Make one generate or modify call for a variation."""
+    async with asyncio.timeout(API_TIMEOUT_SECONDS):
+        if reference_images:
+            # Use image-to-image for visual consistency
+            return await image_provider.modify(
+                ImageModifyRequest(
+                    image_data=reference_images[0],
+                    prompt=prompt,
+                    image_data_list=reference_images,
+                )
+            )
+        return await image_provider.generate(
+            ImageRequest(prompt=prompt, num_images=num_images)
+        )
+
+
+async def _to_variation_image(generated_image: GeneratedImage) -> dict[str, str]:
+    """Convert a provider image into the carousel's image format."""
+    if generated_image.url is None:
+        raise VariationError("Generated image has no URL")
+
+    # Convert URL to base64 and compress
+    image_b64 = image_strip_headers(generated_image.url, "jpeg")
+    image_b64 = await asyncio.to_thread(compress_image, image_b64)
+
+    # Determine filename based on NSFW flag
+    has_nsfw = generated_image.has_nsfw_content or False
+    filename = "SPOILER_variation.jpeg" if has_nsfw else "variation.jpeg"
+    return {"filename": filename, "image": image_b64}
+
+
+async def _batch_images(
+    prompt: str,
+    image_provider: ImageProvider,
+    reference_images: list[str] | None,
+    slots: asyncio.Semaphore,
+    num_images: int = 1,
+) -> list[dict[str, str]]:
+    """Generate up to num_images variations in one provider call.
+
+    Raises:
+        VariationError: If the call fails, times out or returns nothing.
+    """
+    try:
+        async with slots:
+            generated_images = await _request_images(
+                prompt, image_provider, reference_images, num_images
+            )
+        if not generated_images:
+            raise VariationError("No images returned from provider")
+        return [
+            await _to_variation_image(image) for image in generated_images[:num_images]
+        ]
+    except TimeoutError as e:
+        raise VariationError("Image generation timed out") from e
+    except VariationError:
+        raise
+    except Exception as e:
+        raise VariationError(f"Failed to generate variation: {e}") from e
+
+
+async def _as_completed(
+    jobs: list[Coroutine[Any, Any, list[T]]],
+) -> AsyncGenerator[T, None]:
+    """Run jobs concurrently and yield their results as each one finishes.
+
+    A failed job does not stop the others. Once every job has finished,
+    the first failure is raised.
+
+    Raises:
+        VariationError: If any job failed.
+    """
+    tasks = [asyncio.ensure_future(job) for job in jobs]
+    errors: list[VariationError] = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                results = await next_done
+            except VariationError as e:
+                errors.append(e)
+                continue
+            for result in results:
+                yield result
+    finally:
+        # Only has work to do if the caller stopped iterating early
+        for task in tasks:
+            task.cancel()
+    if errors:
+        raise errors[0]
+
+
 async def generate_variation_same_prompt(
     original_prompt: str,
     image_provider: ImageProvider,
@@ -206,6 +359,83 @@ async def generate_variation_same_prompt(
         raise VariationError(f"Failed to generate variation: {e}") from e
 
 
+async def generate_variations_same_prompt(
+    original_prompt: str,
+    image_provider: ImageProvider,
+    user_id: int,
+    count: int,
+    rate_limiter: SlidingWindowRateLimiter | None = None,
+    reference_images: list[str] | None = None,
+    max_concurrency: int = BATCH_MAX_CONCURRENCY,
+) -> AsyncGenerator[dict[str, str], None]:
+    """Generate several same-prompt variations, yielding each as it finishes.
+
+    Text-to-image batches ask the provider for all images in one request
+    via ImageRequest.num_images. Any images the model did not return, and
+    every image-to-image variation, are generated by concurrent calls, at
+    most max_concurrency at a time. Each delivered image is recorded
+    against the rate limit individually.
+
+    Args:
+        original_prompt: The original prompt to reuse.
+        image_provider: The image provider to use for generation.
+        user_id: The user ID for rate limiting.
+        count: How many variations to generate. Trimmed to the user's
+            remaining rate limit.
+        rate_limiter: Optional rate limiter to check/record usage.
+        reference_images: Optional list of base64-encoded reference images.
+            When provided, uses image-to-image (modify) instead of text-to-image
+            (generate) for visual consistency with the source images.
+        max_concurrency: Maximum provider calls in flight at once.
+
+    Yields:
+        Dicts with 'filename' and 'image' (base64) keys, compatible with the
+        carousel view's image format.
+
+    Raises:
+        RateLimitExceededError: If the user has exceeded their rate limit.
+        VariationError: If image generation fails. Raised after every
+            variation that did succeed has been yielded.
+    """
+    count = await reserve_batch(user_id, count, rate_limiter)
+    slots = asyncio.Semaphore(max_concurrency)
+
+    logger.info(
+        "generating_same_prompt_variations",
+        prompt_length=len(original_prompt),
+        user_id=user_id,
+        count=count,
+        using_reference_images=reference_images is not None,
+    )
+
+    delivered = 0
+    if not reference_images:
+        for variation_image in await _batch_images(
+            original_prompt, image_provider, None, slots, num_images=count
+        ):
+            await record_rate_limit(user_id, rate_limiter)
+            delivered += 1
+            yield variation_image
+
+    # Models without num_images support return fewer images than asked for
+    jobs = [
+        _batch_images(original_prompt, image_provider, reference_images, slots)
+        for _ in range(count - delivered)
+    ]
+    # Closing the batch early (aclose) cancels the calls still running
+    async with aclosing(_as_completed(jobs)) as variations:
+        async for variation_image in variations:
+            await record_rate_limit(user_id, rate_limiter)
+            delivered += 1
+            yield variation_image
+
+    logger.info(
+        "same_prompt_variations_generated",
+        user_id=user_id,
+        count=delivered,
+    )
+
+
 async def remix_prompt(original_prompt: str) -> str:
     """Use Haiku to slightly modify an image prompt.
 
@@ -228,6 +458,8 @@ async def remix_prompt(original_prompt: str) -> str:
             system_prompt=REMIX_SYSTEM_PROMPT,
             user_message=user_message,
             max_tokens=512,
+            # Opted out by its 0 TTL: a remix must differ on every call
+            cache_feature="remix",
         )
         # Clean up the response - remove any quotes or extra whitespace
         remixed = remixed.strip().strip('"\'')
@@ -245,6 +477,109 @@ async def remix_prompt(original_prompt: str) -> str:
         raise VariationError(f"Failed to remix prompt: {e}") from e
 
 
+def _parse_remixes(response: str, original_prompt: str) -> list[str]:
+    """Extract valid, distinct remixes from a batched remix response.
+
+    Tolerates markdown fences or stray text around the JSON array. Entries
+    that are not strings, are empty, repeat another entry or merely repeat
+    the original prompt are dropped.
+
+    Args:
+        response: The raw Haiku response.
+        original_prompt: The prompt that was remixed.
+
+    Returns:
+        The valid remixes, possibly empty.
+    """
+    start, end = response.find("["), response.rfind("]")
+    if start == -1 or end < start:
+        return []
+    try:
+        parsed = json.loads(response[start : end + 1])
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(parsed, list):
+        return []
+
+    remixes: list[str] = []
+    for item in parsed:
+        if not isinstance(item, str):
+            continue
+        remixed = item.strip().strip('"\'')
+        if remixed and remixed != original_prompt and remixed not in remixes:
+            remixes.append(remixed)
+    return remixes
+
+
+async def _remix_batch(original_prompt: str, count: int) -> list[str]:
+    """Ask Haiku for count remixes in one call.
+
+    Returns:
+        The valid remixes, possibly fewer than count. Empty if the call
+        or the response was unusable.
+    """
+    user_message = (
+        f"Number of variations: {count}\n\n"
+        f"Original: {original_prompt}\n\n"
+        "Remixed prompts (JSON array):"
+    )
+    try:
+        response = await haiku_complete(
+            system_prompt=REMIX_BATCH_SYSTEM_PROMPT,
+            user_message=user_message,
+            max_tokens=REMIX_MAX_TOKENS * count,
+            # Opted out by its 0 TTL: a remix must differ on every call
+            cache_feature="remix",
+        )
+    except HaikuError as e:
+        logger.warning("batch_remix_failed", error=str(e))
+        return []
+
+    remixes = _parse_remixes(response, original_prompt)
+    if len(remixes) < count:
+        logger.warning(
+            "batch_remix_incomplete",
+            requested=count,
+            valid=len(remixes),
+        )
+    return remixes
+
+
+async def remix_prompts(original_prompt: str, count: int) -> list[str]:
+    """Get count distinct remixes of a prompt, using as few Haiku calls as possible.
+
+    All remixes come from a single Haiku call. If that call fails or
+    returns too few valid remixes, the shortfall falls back to one
+    remix_prompt call per remix.
+
+    Args:
+        original_prompt: The original prompt to remix.
+        count: How many remixes are needed.
+
+    Returns:
+        Exactly count remixed prompts.
+
+    Raises:
+        VariationError: If the fallback remixing fails.
+    """
+    remixes = (await _remix_batch(original_prompt, count))[:count]
+    batched = len(remixes)
+
+    if len(remixes) < count:
+        remixes.extend(
+            await asyncio.gather(
+                *(remix_prompt(original_prompt) for _ in range(count - len(remixes)))
+            )
+        )
+
+    logger.info(
+        "prompts_remixed",
+        count=count,
+        batched=batched,
+    )
+    return remixes
+
+
 async def generate_variation_remixed(
     original_prompt: str,
     image_provider: ImageProvider,
@@ -352,3 +687,77 @@ async def generate_variation_remixed(
             error=str(e),
         )
         raise VariationError(f"Failed to generate remixed variation: {e}") from e
+
+
+async def generate_variations_remixed(
+    original_prompt: str,
+    image_provider: ImageProvider,
+    user_id: int,
+    count: int,
+    rate_limiter: SlidingWindowRateLimiter | None = None,
+    reference_images: list[str] | None = None,
+    max_concurrency: int = BATCH_MAX_CONCURRENCY,
+) -> AsyncGenerator[tuple[str, dict[str, str]], None]:
+    """Generate several remixed variations, yielding each as it finishes.
+
+    All remixed prompts come from one remix_prompts call, so the batch
+    costs a single Haiku request. Every variation has its own prompt, so
+    each one is a separate provider call; at most
+    max_concurrency run at a time. Each delivered image is recorded
+    against the rate limit individually.
+
+    Args:
+        original_prompt: The original prompt to remix.
+        image_provider: The image provider to use for generation.
+        user_id: The user ID for rate limiting.
+        count: How many variations to generate. Trimmed to the user's
+            remaining rate limit.
+        rate_limiter: Optional rate limiter to check/record usage.
+        reference_images: Optional list of base64-encoded reference images.
+            When provided, uses image-to-image (modify) instead of text-to-image
+            (generate) for visual consistency with the source images.
+        max_concurrency: Maximum provider calls in flight at once.
+
+    Yields:
+        Tuples of (remixed_prompt, image_data) where image_data is a dict
+        with 'filename' and 'image' (base64) keys.
+
+    Raises:
+        RateLimitExceededError: If the user has exceeded their rate limit.
+        VariationError: If prompt remixing or image generation fails. Raised
+            after every variation that did succeed has been yielded.
+    """
+    count = await reserve_batch(user_id, count, rate_limiter)
+    slots = asyncio.Semaphore(max_concurrency)
+
+    logger.info(
+        "generating_remixed_variations",
+        prompt_length=len(original_prompt),
+        user_id=user_id,
+        count=count,
+        using_reference_images=reference_images is not None,
+    )
+
+    remixed_prompts = await remix_prompts(original_prompt, count)
+
+    async def generate(remixed_prompt: str) -> list[tuple[str, dict[str, str]]]:
+        images = await _batch_images(
+            remixed_prompt, image_provider, reference_images, slots
+        )
+        return [(remixed_prompt, image) for image in images]
+
+    delivered = 0
+    # Closing the batch early (aclose) cancels the calls still running
+    async with aclosing(
+        _as_completed([generate(remixed_prompt) for remixed_prompt in remixed_prompts])
+    ) as variations:
+        async for remixed_prompt, variation_image in variations:
+            await record_rate_limit(user_id, rate_limiter)
+            delivered += 1
+            yield remixed_prompt, variation_image
+
+    logger.info(
+        "remixed_variations_generated",
+        user_id=user_id,
+        count=delivered,
+    )
@@ -13,13 +13,17 @@ from src.core.prompts.refinement import (
     IMAGE_MODIFICATION_REFINEMENT_PROMPT,
 )
 from src.core.prompts.summarization import (
+    ROLLING_SUMMARIZATION_PROMPT,
     SUMMARIZATION_PROMPT,
+    build_rolling_summarization_prompt,
     build_summarization_prompt,
 )
 
 __all__ = [
     "IMAGE_GENERATION_REFINEMENT_PROMPT",
     "IMAGE_MODIFICATION_REFINEMENT_PROMPT",
+    "ROLLING_SUMMARIZATION_PROMPT",
     "SUMMARIZATION_PROMPT",
+    "build_rolling_summarization_prompt",
     "build_summarization_prompt",
 ]
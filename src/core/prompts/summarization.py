@@ -1,7 +1,8 @@
 """Summarization system prompt for conversation compression.
 
-This module contains the system prompt used by haiku_summarize_conversation()
-to compress conversation history while preserving essential context.
+This module contains the system prompts used by haiku_summarize_conversation()
+to compress conversation history while preserving essential context, and by
+haiku_extend_summary() to fold new messages into an existing summary.
 """
 
 SUMMARIZATION_PROMPT = """You are a conversation summarization assistant. Your task is to compress a conversation to approximately 25% of its original length while preserving the most important information.
@@ -29,6 +30,31 @@ GUIDELINES:
 
 {guidance_section}Summarize the following conversation:"""
 
+ROLLING_SUMMARIZATION_PROMPT = """You are a conversation summarization assistant. You maintain a running summary of a long conversation. You will be given the existing summary followed by the messages exchanged since it was written. Produce a single updated summary that covers both.
+
+PRIORITY ORDER FOR PRESERVATION (highest to lowest):
+1. Key facts and explicit decisions made in the conversation
+2. Current active task or request being worked on
+3. User preferences that were mentioned
+4. Technical details relevant to ongoing work
+5. Recent context over older context
+
+OUTPUT FORMAT:
+- Begin with: "Summary of conversation:"
+- Write in clear, structured prose
+- Maintain chronological flow where important
+- Use bullet points for lists of facts or decisions
+- Preserve exact values, names, and technical terms
+
+GUIDELINES:
+- Keep everything in the existing summary that is still relevant; drop only what the new messages make obsolete
+- Compress the new messages to approximately 25% of their original length
+- Do NOT include meta-commentary about the summarization process
+- Do NOT add information not present in the summary or the new messages
+- Keep actionable context that would be needed to continue the conversation
+
+{guidance_section}Update the summary with the following messages:"""
+
 GUIDANCE_TEMPLATE = """SPECIFIC FOCUS:
 The user has requested emphasis on: {guidance}
 Prioritize information related to this focus while still maintaining overall context.
@@ -52,3 +78,20 @@ def build_summarization_prompt(guidance: str | None = None) -> str:
         guidance_section = ""
 
     return SUMMARIZATION_PROMPT.format(guidance_section=guidance_section)
+
+
+def build_rolling_summarization_prompt(guidance: str | None = None) -> str:
+    """Build the prompt for extending an existing summary with new messages.
+
+    Args:
+        guidance: Optional focus area for the summary.
+
+    Returns:
+        The complete system prompt for rolling summarization.
+    """
+    if guidance:
+        guidance_section = GUIDANCE_TEMPLATE.format(guidance=guidance)
+    else:
+        guidance_section = ""
+
+    return ROLLING_SUMMARIZATION_PROMPT.format(guidance_section=guidance_section)
@@ -0,0 +1,89 @@
+"""De-duplication of identical concurrent calls.
+
+When several users describe the same image or screen the same search query
+at the same moment, each request would otherwise make its own identical
+provider call. SingleFlight lets concurrent callers that pass the same key
+share one in-flight call: the first caller starts it, later callers await
+the same result (or exception), and the key is forgotten as soon as the
+call finishes, so the next request after that makes a fresh call.
+
+The shared call runs as its own task. A caller that is cancelled stops
+waiting without cancelling the call for the others.
+
+Example:
+    searches = SingleFlight()
+    results = await searches.do(query, lambda: fetch(query))
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from src.core.stats import StatsSnapshot
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats(StatsSnapshot):
+    """Snapshot of singleflight metrics.
+
+    Attributes:
+        calls: Calls actually started.
+        shared: Callers that joined a call already in flight.
+        in_flight: Calls currently running.
+    """
+
+    calls: int = 0
+    shared: int = 0
+    in_flight: int = 0
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its result."""
+
+    def __init__(self) -> None:
+        """Initialize with nothing in flight."""
+        self._flights: dict[Hashable, asyncio.Task[Any]] = {}
+        self._calls = 0
+        self._shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Call fn, or join the call already running for key.
+
+        Args:
+            key: Identifies requests whose results are interchangeable.
+            fn: Starts the call. Only invoked if nothing is in flight for key.
+
+        Returns:
+            The result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._flights[key] = task
+            self._calls += 1
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self._shared += 1
+        result: T = await asyncio.shield(task)
+        return result
+
+    def stats(self) -> SingleFlightStats:
+        """Return a copy of the current metrics."""
+        return SingleFlightStats(
+            calls=self._calls,
+            shared=self._shared,
+            in_flight=len(self._flights),
+        )
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Mark the exception retrieved if every caller stopped waiting
+            task.exception()
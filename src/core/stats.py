@@ -0,0 +1,66 @@
+"""Reporting of metrics snapshots.
+
+Components that keep counters (bulkheads, circuit breakers, caches, the
+database executor, ...) expose them through a stats() method returning a
+dataclass snapshot. StatsSnapshot gives those dataclasses one shared
+to_dict(), so health reports and log lines format every snapshot the same
+way instead of each module hand-writing its own dict.
+
+Example:
+    @dataclass
+    class QueueStats(StatsSnapshot):
+        derived = ("mean_wait_ms",)
+        hidden = ("total_wait_ms",)
+
+        waited: int = 0
+        total_wait_ms: float = 0.0
+
+        @property
+        def mean_wait_ms(self) -> float:
+            return self.total_wait_ms / self.waited if self.waited else 0.0
+
+    QueueStats(2, 5.0).to_dict()  # {"waited": 2, "mean_wait_ms": 2.5}
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from enum import Enum
+from typing import Any, ClassVar
+
+
+class StatsSnapshot:
+    """Mixin adding to_dict() to a metrics dataclass.
+
+    Every field is reported in declaration order, followed by the
+    properties named in ``derived``. Fields named in ``hidden`` are left
+    out, typically running totals that only feed a derived average.
+
+    Values are made JSON-friendly: floats are rounded to ``precision``
+    places, enums are reported by value, and nested snapshots, on their own
+    or as dict values, are converted recursively.
+    """
+
+    __dataclass_fields__: ClassVar[dict[str, Any]]
+
+    derived: ClassVar[tuple[str, ...]] = ()
+    hidden: ClassVar[tuple[str, ...]] = ()
+    precision: ClassVar[int] = 3
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict for health reports and structured logs."""
+        names = [f.name for f in fields(self) if f.name not in self.hidden]
+        names.extend(self.derived)
+        return {name: _report(getattr(self, name), self.precision) for name in names}
+
+
+def _report(value: Any, precision: int) -> Any:
+    if isinstance(value, StatsSnapshot):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: _report(item, precision) for key, item in value.items()}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, float):
+        return round(value, precision)
+    return value
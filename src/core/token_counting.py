@@ -67,6 +67,26 @@ def count_tokens(text: str) -> int:
     return len(tokens)
 
 
+def try_count_tokens(text: str) -> int | None:
+    """Count tokens in text, returning None if the encoding is unavailable.
+
+    tiktoken downloads its encoding on first use, which can fail. Callers
+    that store counts alongside data use this so a tokenizer problem never
+    fails the write; the count can be filled in later.
+
+    Args:
+        text: The text to count tokens in.
+
+    Returns:
+        The number of tokens in the text, or None if counting failed.
+    """
+    try:
+        return count_tokens(text)
+    except Exception as ex:
+        logger.warning("token_count_failed", error=str(ex))
+        return None
+
+
 def _extract_message_content(message: dict[str, Any]) -> str:
     """Extract text content from a message dictionary.
 
@@ -111,6 +111,9 @@ class Message:
         is_image_only_context: Whether this message is for image-only context.
             When True, the message is excluded from /prompt text context but
             still available for /describe_this and /modify_image commands.
+        token_count: Approximate token count of content. Computed once when
+            the message is saved; None on new messages lets the repository
+            count it.
     """
 
     channel_id: int
@@ -123,6 +126,32 @@ class Message:
     is_image_prompt: bool = False
     images: list[MessageImage] = field(default_factory=list)
     is_image_only_context: bool = False
+    token_count: int | None = None
+
+
+@dataclass
+class UsageEvent:
+    """Represents one command invocation to be recorded in the usage log.
+
+    Attributes:
+        user_id: The platform user ID who invoked the command.
+        username: The username at the time of the command (for reporting).
+        guild_id: The guild/server ID, or None for direct messages.
+        command_name: The command name (e.g., 'create_image', 'prompt').
+        command_type: The command type ('image' or 'text').
+        outcome: The outcome ('success', 'error', 'timeout', 'cancelled',
+            'rate_limited').
+        timestamp: When the command finished. Events are written in batches,
+            so this is captured up front rather than at insert time.
+    """
+
+    user_id: int
+    username: str
+    guild_id: int | None
+    command_name: str
+    command_type: str
+    outcome: str
+    timestamp: datetime
 
 
 # =============================================================================
@@ -279,6 +308,59 @@ class MessageRepository(Protocol):
         """
         ...
 
+    def get_visible_text_messages(
+        self,
+        channel_external_id: int,
+        vendor_name: str,
+    ) -> list[Message]:
+        """Get visible messages for building text context, without images.
+
+        Returns the same messages as get_visible_messages, but image payloads
+        are never read: every returned message has an empty images list. Use
+        load_message_images to fetch images for specific messages on demand.
+
+        Args:
+            channel_external_id: The external platform ID for the channel.
+            vendor_name: The vendor name to filter by.
+
+        Returns:
+            List of visible messages in chronological order.
+        """
+        ...
+
+    def load_message_images(
+        self,
+        message_ids: list[int],
+    ) -> dict[int, list[MessageImage]]:
+        """Load the images attached to the given messages.
+
+        This is the lazy counterpart to get_visible_text_messages for the
+        image-oriented paths that actually need image data.
+
+        Args:
+            message_ids: IDs of the messages to load images for.
+
+        Returns:
+            Mapping of message ID to its images. Messages without images,
+            or IDs that do not exist, are omitted.
+        """
+        ...
+
+    def get_context_token_count(self, channel_external_id: int) -> int:
+        """Get the total token count of a channel's text context.
+
+        The total covers every message get_visible_text_messages would return
+        for "All Models". It is maintained incrementally as messages are
+        saved and hidden, so reading it does not touch message rows.
+
+        Args:
+            channel_external_id: The external platform ID for the channel.
+
+        Returns:
+            Sum of the stored token counts, or 0 if the channel does not exist.
+        """
+        ...
+
     def get_latest_messages(
         self,
         channel_external_id: int,
@@ -367,6 +449,72 @@ class MessageRepository(Protocol):
         """
         ...
 
+    def reserve_summary_slot(self, channel_external_id: int, vendor_name: str) -> int:
+        """Reserve the position a background summary will take in the context.
+
+        Inserts a hidden SUMMARY_PROMPT user message followed by a hidden
+        placeholder assistant message. Messages saved after them stay after
+        the summary once it is filled in.
+
+        Args:
+            channel_external_id: The external platform ID for the channel.
+            vendor_name: The vendor the summary is saved under.
+
+        Returns:
+            The placeholder's message ID.
+        """
+        ...
+
+    def fill_summary_slot(
+        self,
+        channel_external_id: int,
+        slot_id: int,
+        summary: str,
+        token_count: int | None,
+    ) -> bool:
+        """Atomically replace the context before a slot with its summary.
+
+        Hides every message older than the slot and makes the slot's prompt
+        and the slot visible, the slot holding the summary text. Messages
+        newer than the slot are untouched.
+        Nothing changes if the context was cleared or summarized after the
+        slot was reserved.
+
+        Args:
+            channel_external_id: The external platform ID for the channel.
+            slot_id: ID returned by reserve_summary_slot.
+            summary: The summary text.
+            token_count: Token count of the summary, if known.
+
+        Returns:
+            True if the summary was swapped in.
+        """
+        ...
+
+    def release_summary_slot(self, slot_id: int) -> None:
+        """Delete a summary placeholder and its prompt if it was not filled.
+
+        Args:
+            slot_id: ID returned by reserve_summary_slot.
+        """
+        ...
+
+    def get_rolling_summary(self, channel_external_id: int) -> Message | None:
+        """Get the channel's rolling summary.
+
+        The most recently filled summary slot is the channel's rolling
+        summary: it covers every message older than itself, so the next
+        summary only needs the messages after it.
+
+        Args:
+            channel_external_id: The external platform ID for the channel.
+
+        Returns:
+            The summary message, or None if the channel has none or it has
+            since been cleared.
+        """
+        ...
+
 
 class RateLimitRepository(Protocol):
     """Protocol for rate limiting data operations.
@@ -554,6 +702,59 @@ class AsyncMessageRepository(Protocol):
         """
         ...
 
+    async def get_visible_text_messages(
+        self,
+        channel_external_id: int,
+        vendor_name: str,
+    ) -> list[Message]:
+        """Get visible messages for building text context, without images.
+
+        Returns the same messages as get_visible_messages, but image payloads
+        are never read: every returned message has an empty images list. Use
+        load_message_images to fetch images for specific messages on demand.
+
+        Args:
+            channel_external_id: The external platform ID for the channel.
+            vendor_name: The vendor name to filter by.
+
+        Returns:
+            List of visible messages in chronological order.
+        """
+        ...
+
+    async def load_message_images(
+        self,
+        message_ids: list[int],
+    ) -> dict[int, list[MessageImage]]:
+        """Load the images attached to the given messages.
+
+        This is the lazy counterpart to get_visible_text_messages for the
+        image-oriented paths that actually need image data.
+
+        Args:
+            message_ids: IDs of the messages to load images for.
+
+        Returns:
+            Mapping of message ID to its images. Messages without images,
+            or IDs that do not exist, are omitted.
+        """
+        ...
+
+    async def get_context_token_count(self, channel_external_id: int) -> int:
+        """Get the total token count of a channel's text context.
+
+        The total covers every message get_visible_text_messages would return
+        for "All Models". It is maintained incrementally as messages are
+        saved and hidden, so reading it does not touch message rows.
+
+        Args:
+            channel_external_id: The external platform ID for the channel.
+
+        Returns:
+            Sum of the stored token counts, or 0 if the channel does not exist.
+        """
+        ...
+
     async def get_latest_messages(
         self,
         channel_external_id: int,
@@ -613,7 +814,7 @@ class AsyncMessageRepository(Protocol):
         channel_external_id: int,
         vendor_name: str,
         window_size: int,
-    ) -> None:
+    ) -> int | None:
         """Mark messages outside the context window as inactive.
 
         Messages older than the window are set to visible=False, removing them
@@ -623,6 +824,10 @@ class AsyncMessageRepository(Protocol):
             channel_external_id: The external platform ID for the channel.
             vendor_name: The vendor name to filter by.
             window_size: Number of recent messages to keep active.
+
+        Returns:
+            The id below which the vendor's messages are now hidden, or None
+            if the window already covered every visible message.
         """
         ...
 
@@ -642,6 +847,72 @@ class AsyncMessageRepository(Protocol):
         """
         ...
 
+    async def reserve_summary_slot(self, channel_external_id: int, vendor_name: str) -> int:
+        """Reserve the position a background summary will take in the context.
+
+        Inserts a hidden SUMMARY_PROMPT user message followed by a hidden
+        placeholder assistant message. Messages saved after them stay after
+        the summary once it is filled in.
+
+        Args:
+            channel_external_id: The external platform ID for the channel.
+            vendor_name: The vendor the summary is saved under.
+
+        Returns:
+            The placeholder's message ID.
+        """
+        ...
+
+    async def fill_summary_slot(
+        self,
+        channel_external_id: int,
+        slot_id: int,
+        summary: str,
+        token_count: int | None,
+    ) -> bool:
+        """Atomically replace the context before a slot with its summary.
+
+        Hides every message older than the slot and makes the slot's prompt
+        and the slot visible, the slot holding the summary text. Messages
+        newer than the slot are untouched.
+        Nothing changes if the context was cleared or summarized after the
+        slot was reserved.
+
+        Args:
+            channel_external_id: The external platform ID for the channel.
+            slot_id: ID returned by reserve_summary_slot.
+            summary: The summary text.
+            token_count: Token count of the summary, if known.
+
+        Returns:
+            True if the summary was swapped in.
+        """
+        ...
+
+    async def release_summary_slot(self, slot_id: int) -> None:
+        """Delete a summary placeholder and its prompt if it was not filled.
+
+        Args:
+            slot_id: ID returned by reserve_summary_slot.
+        """
+        ...
+
+    async def get_rolling_summary(self, channel_external_id: int) -> Message | None:
+        """Get the channel's rolling summary.
+
+        The most recently filled summary slot is the channel's rolling
+        summary: it covers every message older than itself, so the next
+        summary only needs the messages after it.
+
+        Args:
+            channel_external_id: The external platform ID for the channel.
+
+        Returns:
+            The summary message, or None if the channel has none or it has
+            since been cleared.
+        """
+        ...
+
 
 class AsyncRateLimitRepository(Protocol):
     """Async protocol for rate limiting data operations.
@@ -8,14 +8,24 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncIterator
+from typing import Any
 
-from anthropic import APIStatusError, AsyncAnthropic
+from anthropic import APIStatusError
 
+from src.core.anthropic_clients import get_anthropic_client
+from src.core.bulkhead import get_bulkhead
+from src.core.circuit_breaker import get_circuit_breaker
 from src.core.logging import get_logger
 from src.core.providers import AIProvider, ChatMessage, ChatResponse
 
 logger = get_logger(__name__)
 
+# Marks the end of a prefix the API should cache for reuse by later requests
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Usage fields reported when prompt caching is in play
+_CACHE_USAGE_FIELDS = ("cache_creation_input_tokens", "cache_read_input_tokens")
+
 
 class AnthropicProvider:
     """Anthropic Claude API provider implementing AIProvider protocol.
@@ -27,11 +37,18 @@ class AnthropicProvider:
     The API key is injected via the constructor to support dependency
     injection and avoid direct environment variable access.
 
+    With prompt caching enabled, the system prompt and the conversation up to
+    the newest message are marked cacheable. The next turn resends the same
+    prefix plus the reply and a new prompt, so it is read from the cache
+    instead of being processed again. Prefixes shorter than the model's
+    minimum cacheable length are simply not cached.
+
     Attributes:
-        _client: The AsyncAnthropic client instance.
+        _client: The shared AsyncAnthropic client for the API key.
         _default_model: The default model to use for completions.
         _max_retries: Maximum retry attempts for transient errors.
         _backoff_factor: Exponential backoff multiplier for retries.
+        _prompt_caching: Whether requests carry cache_control markers.
     """
 
     def __init__(
@@ -40,6 +57,7 @@ class AnthropicProvider:
         default_model: str = "claude-sonnet-4-20250514",
         max_retries: int = 4,
         backoff_factor: float = 2.0,
+        prompt_caching: bool = False,
     ) -> None:
         """Initialize the Anthropic provider.
 
@@ -51,11 +69,14 @@ class AnthropicProvider:
                 Defaults to 4.
             backoff_factor: Base for exponential backoff between retries.
                 Defaults to 2.0 (so delays are 1, 2, 4, 8 seconds).
+            prompt_caching: Whether to mark the system prompt and history
+                prefix as cacheable. Defaults to False.
         """
-        self._client = AsyncAnthropic(api_key=api_key)
+        self._client = get_anthropic_client(api_key)
         self._default_model = default_model
         self._max_retries = max_retries
         self._backoff_factor = backoff_factor
+        self._prompt_caching = prompt_caching
 
     def _convert_messages(
         self, messages: list[ChatMessage]
@@ -84,6 +105,80 @@ class AnthropicProvider:
             })
         return anthropic_messages
 
+    def _request_params(
+        self,
+        messages: list[ChatMessage],
+        system_prompt: str | None,
+    ) -> dict[str, Any]:
+        """Build the messages and system arguments for an API request.
+
+        When prompt caching is enabled, the system prompt and the last
+        message are sent as content blocks carrying cache_control, which
+        caches the system prompt on its own and the whole conversation as a
+        second, longer prefix.
+
+        Args:
+            messages: The conversation history, oldest first.
+            system_prompt: Optional system prompt.
+
+        Returns:
+            Keyword arguments for messages.create or messages.stream. The
+            system key is omitted when there is no system prompt.
+        """
+        anthropic_messages: list[dict[str, Any]] = list(
+            self._convert_messages(messages)
+        )
+        system: str | list[dict[str, Any]] | None = system_prompt or None
+
+        if self._prompt_caching:
+            if system_prompt:
+                system = [
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": _CACHE_CONTROL,
+                    }
+                ]
+            if anthropic_messages:
+                last = anthropic_messages[-1]
+                anthropic_messages[-1] = {
+                    "role": last["role"],
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": last["content"],
+                            "cache_control": _CACHE_CONTROL,
+                        }
+                    ],
+                }
+
+        params: dict[str, Any] = {"messages": anthropic_messages}
+        if system:
+            params["system"] = system
+        return params
+
+    @staticmethod
+    def _usage_dict(usage: Any) -> dict[str, int]:
+        """Extract token counts, including prompt cache reads and writes.
+
+        Args:
+            usage: The usage object from an API response.
+
+        Returns:
+            Dict with input_tokens and output_tokens, plus
+            cache_creation_input_tokens and cache_read_input_tokens when the
+            API reported them.
+        """
+        result = {
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+        }
+        for name in _CACHE_USAGE_FIELDS:
+            value = getattr(usage, name, None)
+            if isinstance(value, int):
+                result[name] = value
+        return result
+
     async def chat(
         self,
         messages: list[ChatMessage],
@@ -106,27 +201,26 @@ class AnthropicProvider:
 
         Returns:
             A ChatResponse containing the generated text, model identifier,
-            and token usage statistics.
+            and token usage statistics. With prompt caching, usage also
+            includes cache_creation_input_tokens and cache_read_input_tokens.
 
         Raises:
             APIError: If the API call fails after all retries.
+            CircuitOpenError: If the Anthropic API is failing and calls are
+                being rejected without being sent.
         """
-        anthropic_messages = self._convert_messages(messages)
+        params = self._request_params(messages, system_prompt)
 
         for retry in range(self._max_retries):
             try:
-                if system_prompt:
+                async with (
+                    get_circuit_breaker("anthropic").guard(),
+                    get_bulkhead("anthropic").slot(),
+                ):
                     response = await self._client.messages.create(
                         model=self._default_model,
                         max_tokens=max_tokens,
-                        messages=anthropic_messages,  # type: ignore[arg-type]
-                        system=system_prompt,
-                    )
-                else:
-                    response = await self._client.messages.create(
-                        model=self._default_model,
-                        max_tokens=max_tokens,
-                        messages=anthropic_messages,  # type: ignore[arg-type]
+                        **params,
                     )
 
                 # Extract content - Anthropic returns a list of content blocks
@@ -134,13 +228,14 @@ class AnthropicProvider:
                 if response.content and hasattr(response.content[0], "text"):
                     content = response.content[0].text
 
+                usage = self._usage_dict(response.usage)
+                if self._prompt_caching:
+                    logger.debug("anthropic_prompt_cache", **usage)
+
                 return ChatResponse(
                     content=content,
                     model=response.model,
-                    usage={
-                        "input_tokens": response.usage.input_tokens,
-                        "output_tokens": response.usage.output_tokens,
-                    },
+                    usage=usage,
                 )
 
             except APIStatusError as ex:
@@ -182,23 +277,19 @@ class AnthropicProvider:
 
         Raises:
             APIError: If the API call fails.
+            CircuitOpenError: If the Anthropic API is failing and calls are
+                being rejected without being sent.
         """
-        anthropic_messages = self._convert_messages(messages)
-
-        if system_prompt:
-            stream_context = self._client.messages.stream(
-                model=self._default_model,
-                max_tokens=4096,
-                messages=anthropic_messages,  # type: ignore[arg-type]
-                system=system_prompt,
-            )
-        else:
-            stream_context = self._client.messages.stream(
-                model=self._default_model,
-                max_tokens=4096,
-                messages=anthropic_messages,  # type: ignore[arg-type]
-            )
-        async with stream_context as stream:
+        stream_context = self._client.messages.stream(
+            model=self._default_model,
+            max_tokens=4096,
+            **self._request_params(messages, system_prompt),
+        )
+        async with (
+            get_circuit_breaker("anthropic").guard(),
+            get_bulkhead("anthropic").slot(),
+            stream_context as stream,
+        ):
             async for text in stream.text_stream:
                 yield text
 
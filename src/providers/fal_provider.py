@@ -8,10 +8,17 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import fal_client
 
+from src.core.bulkhead import get_bulkhead
+from src.core.circuit_breaker import CircuitOpenError, get_circuit_breaker
 from src.core.errors import classify_error, is_retryable
 from src.core.logging import get_logger
 from src.core.providers import (
@@ -20,9 +27,20 @@ from src.core.providers import (
     ImageProvider,
     ImageRequest,
 )
+from src.core.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
+# Job status is polled quickly at first, backing off while a job runs
+POLL_INITIAL_INTERVAL_SECONDS = 0.25
+POLL_MAX_INTERVAL_SECONDS = 2.0
+POLL_BACKOFF_FACTOR = 1.5
+
+# Uploaded source images are reused by content hash. Fal keeps uploads far
+# longer than this; the TTL only bounds how stale a remembered URL can be.
+UPLOAD_CACHE_TTL_SECONDS = 24 * 60 * 60
+UPLOAD_CACHE_MAX_ENTRIES = 512
+
 
 class FalAIError(Exception):
     """Exception raised for Fal.AI API errors."""
@@ -59,6 +77,7 @@ class FalAIProvider:
         modify_model: str | None = None,
         max_retries: int = 3,
         base_delay: float = 1.0,
+        upload_cache_ttl: float = UPLOAD_CACHE_TTL_SECONDS,
     ) -> None:
         """Initialize the Fal.AI provider.
 
@@ -91,12 +110,19 @@ class FalAIProvider:
                 Defaults to 3.
             base_delay: Base delay in seconds for exponential backoff.
                 Defaults to 1.0.
+            upload_cache_ttl: Seconds an uploaded image's URL is reused for
+                identical bytes. 0 disables the upload cache.
         """
         self._api_key = api_key
         self._create_model = create_model or self.DEFAULT_CREATE_MODEL
         self._modify_model = modify_model or self.DEFAULT_MODIFY_MODEL
         self._max_retries = max_retries
         self._base_delay = base_delay
+        self._upload_cache_ttl = upload_cache_ttl
+        # SHA-256 of the image bytes -> (Fal URL, monotonic expiry)
+        self._upload_urls: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._uploads = SingleFlight()
+        self._clock = time.monotonic
 
         # Set the API key for fal_client
         # See docstring above for explanation of why this env var mutation
@@ -105,6 +131,43 @@ class FalAIProvider:
         os.environ["FAL_KEY"] = api_key
 
     async def _upload_image(self, image_data: bytes, filename: str) -> str:
+        """Get a Fal.AI URL for an image, uploading it only if needed.
+
+        Edits, variations and character-preserving flows send the same
+        source image again and again. Its URL is remembered by content
+        hash, and concurrent uploads of the same bytes share one request.
+
+        Args:
+            image_data: The raw image bytes.
+            filename: The filename for the uploaded image.
+
+        Returns:
+            The URL of the uploaded image.
+
+        Raises:
+            FalAIError: If the upload fails.
+        """
+        digest = hashlib.sha256(image_data).hexdigest()
+        cached = self._upload_urls.get(digest)
+        if cached is not None:
+            url, expires_at = cached
+            if expires_at > self._clock():
+                self._upload_urls.move_to_end(digest)
+                logger.debug("Reusing uploaded image %s", digest[:12])
+                return url
+            del self._upload_urls[digest]
+
+        url = await self._uploads.do(
+            digest, lambda: self._upload_image_uncached(image_data, filename)
+        )
+        if self._upload_cache_ttl > 0:
+            self._upload_urls[digest] = (url, self._clock() + self._upload_cache_ttl)
+            self._upload_urls.move_to_end(digest)
+            while len(self._upload_urls) > UPLOAD_CACHE_MAX_ENTRIES:
+                self._upload_urls.popitem(last=False)
+        return url
+
+    async def _upload_image_uncached(self, image_data: bytes, filename: str) -> str:
         """Upload an image to Fal.AI for use in image modification.
 
         Args:
@@ -119,21 +182,43 @@ class FalAIProvider:
         """
         logger.debug("Uploading image to Fal.AI...")
 
-        def do_upload() -> str:
-            return fal_client.upload(
+        try:
+            url = await fal_client.upload_async(
                 data=image_data,
                 content_type="image/jpeg",
                 file_name=filename,
             )
-
-        try:
-            url = await asyncio.to_thread(do_upload)
             logger.debug("Image uploaded successfully.")
             return url
         except Exception as ex:
             logger.error("Failed to upload image to Fal.AI: %s", ex)
             raise FalAIError(f"Failed to upload image: {ex}") from ex
 
+    def _check_circuit(self) -> None:
+        """Fail fast if Fal.AI is down, before doing any work for a job.
+
+        Raises:
+            FalAIError: If the Fal.AI circuit is open.
+        """
+        try:
+            get_circuit_breaker("fal").check()
+        except CircuitOpenError as ex:
+            raise FalAIError(f"Fal.AI unavailable: {ex}") from ex
+
+    @asynccontextmanager
+    async def _call_slot(self) -> AsyncIterator[None]:
+        """Hold a Fal.AI slot for one API call, guarded by the circuit breaker.
+
+        A slot covers a single request: the submission, one status check or
+        the result fetch. A job waiting in Fal's queue holds no slot between
+        polls, and neither does retry backoff.
+
+        Raises:
+            CircuitOpenError: If the Fal.AI circuit is open.
+        """
+        async with get_circuit_breaker("fal").guard(), get_bulkhead("fal").slot():
+            yield
+
     def _on_queue_update(self, update: Any) -> None:
         """Callback for queue status updates.
 
@@ -142,6 +227,31 @@ class FalAIProvider:
         """
         logger.debug("Fal.AI queue update: still waiting...")
 
+    async def _wait_for_result(self, handler: Any) -> Any:
+        """Poll a job's status until it completes, then fetch its result.
+
+        Runs entirely on the event loop: a job waiting in the queue holds
+        no thread, only a sleeping coroutine. Each status check and the
+        result fetch take their own slot; the sleeps between them hold none.
+
+        Args:
+            handler: The AsyncRequestHandle from fal_client.submit_async().
+
+        Returns:
+            The result of the job.
+        """
+        interval = POLL_INITIAL_INTERVAL_SECONDS
+        while True:
+            async with self._call_slot():
+                status = await handler.status()
+            if isinstance(status, fal_client.Completed):
+                break
+            self._on_queue_update(status)
+            await asyncio.sleep(interval)
+            interval = min(interval * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL_SECONDS)
+        async with self._call_slot():
+            return await handler.get()
+
     async def _poll_with_retry(
         self,
         handler: Any,
@@ -153,7 +263,7 @@ class FalAIProvider:
         This prevents double-charging when errors occur during result retrieval.
 
         Args:
-            handler: The SyncRequestHandle from fal_client.submit().
+            handler: The AsyncRequestHandle from fal_client.submit_async().
             operation_name: Human-readable name for logging (e.g., "image generation").
 
         Returns:
@@ -166,13 +276,7 @@ class FalAIProvider:
 
         for attempt in range(self._max_retries + 1):
             try:
-                # Poll for status updates, then get final result
-                def get_result() -> Any:
-                    for event in handler.iter_events(with_logs=True):
-                        self._on_queue_update(event)
-                    return handler.get()
-
-                return await asyncio.to_thread(get_result)
+                return await self._wait_for_result(handler)
             except Exception as ex:
                 last_error = ex
                 category = classify_error(ex)
@@ -238,6 +342,7 @@ class FalAIProvider:
             FalAIError: If the API call fails.
         """
         logger.debug("Generating image for prompt: %s", request.prompt)
+        self._check_circuit()
 
         # Build arguments for Fal.AI nano-banana-pro API
         arguments: dict[str, Any] = {
@@ -256,16 +361,16 @@ class FalAIProvider:
         # Step 1: Submit job ONCE (no retry - this is billable)
         # If submission fails, it's safe for caller to retry since no job was created
         try:
-            def do_submit() -> Any:
-                return fal_client.submit(
+            async with self._call_slot():
+                handler = await fal_client.submit_async(
                     application=self._create_model,
                     arguments=arguments,
                 )
-
-            handler = await asyncio.to_thread(do_submit)
             logger.debug(
                 "Job submitted with request_id: %s", handler.request_id
             )
+        except CircuitOpenError as ex:
+            raise FalAIError(f"Fal.AI unavailable: {ex}") from ex
         except Exception as ex:
             logger.error("Failed to submit image generation job: %s", ex)
             raise FalAIError(f"Failed to submit image generation: {ex}") from ex
@@ -324,22 +429,30 @@ class FalAIProvider:
             FalAIError: If the API call fails.
         """
         logger.debug("Modifying image with prompt: %s", request.prompt)
+        self._check_circuit()
 
         # Support both single image (image_data) and multiple images (image_data_list)
         image_data_list = request.image_data_list or [request.image_data]
 
-        # Upload all images and collect URLs
-        image_urls: list[str] = []
+        # Decode every image first so bad input fails before any upload
+        image_bytes_list: list[bytes] = []
         for i, img_data in enumerate(image_data_list):
             try:
-                image_bytes = base64.b64decode(img_data)
+                image_bytes_list.append(base64.b64decode(img_data))
             except Exception as ex:
                 raise FalAIError(
                     f"Invalid base64 image data for image {i + 1}: {ex}"
                 ) from ex
 
-            image_url = await self._upload_image(image_bytes, f"image_{i}.jpeg")
-            image_urls.append(image_url)
+        # Upload concurrently; gather keeps the URLs in image order
+        image_urls: list[str] = list(
+            await asyncio.gather(
+                *(
+                    self._upload_image(image_bytes, f"image_{i}.jpeg")
+                    for i, image_bytes in enumerate(image_bytes_list)
+                )
+            )
+        )
 
         logger.debug("Uploaded %d images for modification", len(image_urls))
 
@@ -359,17 +472,17 @@ class FalAIProvider:
         # Step 1: Submit job ONCE (no retry - this is billable)
         # If submission fails, it's safe for caller to retry since no job was created
         try:
-            def do_submit() -> Any:
-                return fal_client.submit(
+            async with self._call_slot():
+                handler = await fal_client.submit_async(
                     application=self._modify_model,
                     arguments=arguments,
                 )
-
-            handler = await asyncio.to_thread(do_submit)
             logger.debug(
                 "Modification job submitted with request_id: %s",
                 handler.request_id,
             )
+        except CircuitOpenError as ex:
+            raise FalAIError(f"Fal.AI unavailable: {ex}") from ex
         except Exception as ex:
             logger.error("Failed to submit image modification job: %s", ex)
             raise FalAIError(f"Failed to submit image modification: {ex}") from ex
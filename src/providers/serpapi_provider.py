@@ -11,10 +11,15 @@ from dataclasses import dataclass
 
 import aiohttp
 
+from src.core.bulkhead import get_bulkhead
+from src.core.circuit_breaker import CircuitOpenError, get_circuit_breaker
 from src.core.logging import get_logger
+from src.core.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
+_in_flight = SingleFlight()
+
 
 class SerpAPIError(Exception):
     """Exception raised for SerpAPI errors.
@@ -76,6 +81,19 @@ async def search_google_images(
             "Please set it or provide an api_key parameter."
         )
 
+    # Concurrent identical searches share one request; each caller gets
+    # its own list
+    results = await _in_flight.do(
+        (query, num_results, effective_api_key),
+        lambda: _search_google_images(query, num_results, effective_api_key),
+    )
+    return list(results)
+
+
+async def _search_google_images(
+    query: str, num_results: int, effective_api_key: str
+) -> list[GoogleImageResult]:
+    """Run one SerpAPI search. See search_google_images."""
     # Build request parameters
     params = {
         "engine": "google_images",
@@ -87,7 +105,11 @@ async def search_google_images(
     logger.debug("Searching Google Images for: %s", query)
 
     try:
-        async with aiohttp.ClientSession() as session:
+        async with (
+            get_circuit_breaker("serpapi").guard(),
+            get_bulkhead("serpapi").slot(),
+            aiohttp.ClientSession() as session,
+        ):
             async with session.get(
                 "https://serpapi.com/search",
                 params=params,
@@ -109,6 +131,9 @@ async def search_google_images(
     except aiohttp.ClientError as ex:
         logger.error("Network error during SerpAPI request: %s", ex)
         raise SerpAPIError(f"Network error during SerpAPI request: {ex}") from ex
+    except CircuitOpenError as ex:
+        logger.warning("Skipping SerpAPI request: %s", ex)
+        raise SerpAPIError(f"SerpAPI unavailable: {ex}") from ex
 
     # Check for API-level errors in response
     if "error" in data:
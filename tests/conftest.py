@@ -12,6 +12,34 @@ from tests.mocks.providers import MockAIProvider, MockImageProvider
 pytest_plugins = ["pytest_asyncio"]
 
 
+@pytest.fixture(autouse=True)
+def fresh_anthropic_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own Anthropic client registry.
+
+    Clients are cached process-wide, so without this a client built while
+    one test patched AsyncAnthropic would be handed to the next test.
+    """
+    monkeypatch.setattr("src.core.anthropic_clients._registry", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_haiku_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test an empty Haiku completion cache."""
+    monkeypatch.setattr("src.core.haiku_cache._cache", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_bulkheads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test with every provider bulkhead at its initial limit."""
+    monkeypatch.setattr("src.core.bulkhead._bulkheads", {})
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuit_breakers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test with every provider circuit closed."""
+    monkeypatch.setattr("src.core.circuit_breaker._breakers", {})
+
+
 @pytest.fixture
 def in_memory_db() -> Generator[sqlite3.Connection, None, None]:
     """Provide an in-memory SQLite database connection.
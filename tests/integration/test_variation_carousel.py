@@ -8,6 +8,7 @@ error handling scenarios.
 from __future__ import annotations
 
 import base64
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -102,6 +103,7 @@ def create_mock_rate_limiter(allowed: bool = True, wait_seconds: float = 0.0) ->
     rate_limiter = MagicMock()
     rate_check = MagicMock()
     rate_check.allowed = allowed
+    rate_check.remaining = 10 if allowed else 0
     rate_check.wait_seconds = wait_seconds
     rate_limiter.check = AsyncMock(return_value=rate_check)
     rate_limiter.record = AsyncMock()
@@ -139,6 +141,28 @@ def create_mock_image_provider(
     return provider
 
 
+def create_mock_batch(
+    *results: Any, error: Exception | None = None
+) -> Callable[..., AsyncIterator[Any]]:
+    """Create a stand-in for a batch variation generator.
+
+    Args:
+        results: Values to yield, in order.
+        error: Optional exception raised after the last value.
+
+    Returns:
+        An async generator function accepting any keyword arguments.
+    """
+
+    async def batch(**kwargs: Any) -> AsyncIterator[Any]:
+        for result in results:
+            yield result
+        if error is not None:
+            raise error
+
+    return batch
+
+
 # --- Test Classes ---
 
 
@@ -343,16 +367,19 @@ class TestVariationGeneration:
         )
 
         with patch(
-            "src.clients.discord.views.carousel.generate_variation_same_prompt",
-            new_callable=AsyncMock,
-            return_value=create_mock_image_data("variation"),
+            "src.clients.discord.views.carousel.generate_variations_same_prompt",
+            create_mock_batch(
+                create_mock_image_data("v1"),
+                create_mock_image_data("v2"),
+                create_mock_image_data("v3"),
+            ),
         ):
             await view.same_prompt_button.callback(interaction)
 
-        # Should have one variation now
-        assert len(view.variations) == 1
-        # Should have navigated to the new variation
-        assert view.current_index == 1
+        # Every remaining slot is filled in one click
+        assert len(view.variations) == 3
+        # Should have navigated to the newest variation
+        assert view.current_index == 3
 
     @pytest.mark.asyncio
     async def test_ai_remix_generates_variation(self) -> None:
@@ -376,9 +403,10 @@ class TestVariationGeneration:
         view.embed.add_field(name="Prompt", value="A beautiful sunset")
 
         with patch(
-            "src.clients.discord.views.carousel.generate_variation_remixed",
-            new_callable=AsyncMock,
-            return_value=("A gorgeous twilight", create_mock_image_data("variation")),
+            "src.clients.discord.views.carousel.generate_variations_remixed",
+            create_mock_batch(
+                ("A gorgeous twilight", create_mock_image_data("variation")),
+            ),
         ):
             await view.ai_remix_button.callback(interaction)
 
@@ -386,6 +414,7 @@ class TestVariationGeneration:
         assert len(view.variations) == 1
         # Should have navigated to the new variation
         assert view.current_index == 1
+        assert view.embed.fields[0].value == "A gorgeous twilight"
 
     @pytest.mark.asyncio
     async def test_max_variations_enforced(self) -> None:
@@ -515,9 +544,8 @@ class TestRateLimitHandling:
         view.embed = discord.Embed(title="Image Variations", description="Initial")
 
         with patch(
-            "src.clients.discord.views.carousel.generate_variation_same_prompt",
-            new_callable=AsyncMock,
-            side_effect=RateLimitExceededError(retry_after=300.0),
+            "src.clients.discord.views.carousel.generate_variations_same_prompt",
+            create_mock_batch(error=RateLimitExceededError(retry_after=300.0)),
         ):
             await view.same_prompt_button.callback(interaction)
 
@@ -544,9 +572,8 @@ class TestRateLimitHandling:
         view.embed = discord.Embed(title="Image Variations", description="Initial")
 
         with patch(
-            "src.clients.discord.views.carousel.generate_variation_remixed",
-            new_callable=AsyncMock,
-            side_effect=RateLimitExceededError(retry_after=120.0),
+            "src.clients.discord.views.carousel.generate_variations_remixed",
+            create_mock_batch(error=RateLimitExceededError(retry_after=120.0)),
         ):
             await view.ai_remix_button.callback(interaction)
 
@@ -577,15 +604,42 @@ class TestVariationErrors:
         view.embed = discord.Embed(title="Image Variations", description="Initial")
 
         with patch(
-            "src.clients.discord.views.carousel.generate_variation_same_prompt",
-            new_callable=AsyncMock,
-            side_effect=VariationError("Image generation timed out"),
+            "src.clients.discord.views.carousel.generate_variations_same_prompt",
+            create_mock_batch(error=VariationError("Image generation timed out")),
         ):
             await view.same_prompt_button.callback(interaction)
 
         # Check that the embed was updated with error message
         assert "Failed to generate variation" in str(view.embed.description)
 
+    @pytest.mark.asyncio
+    async def test_partial_batch_keeps_finished_variations(self) -> None:
+        """Test that variations finished before a failure stay in the carousel."""
+        interaction = create_mock_interaction()
+        view = VariationCarouselView(
+            interaction=interaction,
+            message=create_mock_message(),
+            user=create_mock_user(),
+            original_image=create_mock_image_data(),
+            prompt="Test",
+            rate_limiter=create_mock_rate_limiter(),
+            image_provider=create_mock_image_provider(),
+        )
+        view.embed = discord.Embed(title="Image Variations", description="Initial")
+
+        with patch(
+            "src.clients.discord.views.carousel.generate_variations_same_prompt",
+            create_mock_batch(
+                create_mock_image_data("v1"),
+                error=VariationError("Image generation timed out"),
+            ),
+        ):
+            await view.same_prompt_button.callback(interaction)
+
+        assert len(view.variations) == 1
+        assert "Failed to generate variation" in str(view.embed.description)
+        assert view.same_prompt_button.disabled is False
+
     @pytest.mark.asyncio
     async def test_missing_image_provider_shows_message(self) -> None:
         """Test that missing image provider shows appropriate message."""
@@ -1080,3 +1134,114 @@ class TestTimeoutBehavior:
 
         # Should not show error message since image was added
         assert "NOT added to context" not in str(view.embed.description or "")
+
+
+class TestBatchGeneration:
+    """Tests for filling the remaining variation slots in one click."""
+
+    def create_view(self) -> VariationCarouselView:
+        """Create a carousel with a truthy embed and a generation backend."""
+        interaction = create_mock_interaction()
+        view = VariationCarouselView(
+            interaction=interaction,
+            message=create_mock_message(),
+            user=create_mock_user(),
+            original_image=create_mock_image_data(),
+            prompt="Test",
+            rate_limiter=create_mock_rate_limiter(),
+            image_provider=create_mock_image_provider(),
+        )
+        view.embed = discord.Embed(title="Image Variations", description="Initial")
+        return view
+
+    @pytest.mark.asyncio
+    async def test_generate_buttons_show_batch_size(self) -> None:
+        """Test that the labels say how many images one click generates."""
+        view = self.create_view()
+
+        view._update_buttons()
+        assert view.same_prompt_button.label == "Same Prompt ×3"
+        assert view.ai_remix_button.label == "AI Remix ×3"
+
+        view.variations.append(create_mock_image_data("v1"))
+        view._update_buttons()
+        assert view.same_prompt_button.label == "Same Prompt ×2"
+
+        view.variations.extend([create_mock_image_data("v2")] * 2)
+        view._update_buttons()
+        assert view.same_prompt_button.label == "Same Prompt"
+        assert view.same_prompt_button.disabled is True
+
+    @pytest.mark.asyncio
+    async def test_buttons_stay_disabled_until_batch_finishes(self) -> None:
+        """Test that nothing can change the carousel mid-batch."""
+        view = self.create_view()
+        seen: list[tuple[bool, str]] = []
+
+        async def batch(**kwargs: Any) -> AsyncIterator[dict[str, str]]:
+            for name in ("v1", "v2", "v3"):
+                yield create_mock_image_data(name)
+                buttons = [
+                    child
+                    for child in view.children
+                    if isinstance(child, discord.ui.Button)
+                ]
+                seen.append(
+                    (
+                        all(button.disabled for button in buttons),
+                        str(view.embed.description if view.embed else ""),
+                    )
+                )
+
+        with patch(
+            "src.clients.discord.views.carousel.generate_variations_same_prompt", batch
+        ):
+            await view.same_prompt_button.callback(create_mock_interaction())
+
+        assert [disabled for disabled, _ in seen] == [True, True, True]
+        assert "(1/3 done)" in seen[0][1]
+        assert view.add_to_context_button.disabled is False
+        assert view.cancel_button.disabled is False
+        assert "done" not in str(view.embed.description if view.embed else "")
+
+    @pytest.mark.asyncio
+    async def test_stopped_view_closes_batch(self) -> None:
+        """Test that a view stopped mid-batch ends generation without redrawing."""
+        view = self.create_view()
+        closed = False
+
+        async def batch(**kwargs: Any) -> AsyncIterator[dict[str, str]]:
+            nonlocal closed
+            try:
+                yield create_mock_image_data("v1")
+                # The view times out while the next image is generating
+                view.stop()
+                yield create_mock_image_data("v2")
+                yield create_mock_image_data("v3")
+            finally:
+                closed = True
+
+        with patch(
+            "src.clients.discord.views.carousel.generate_variations_same_prompt", batch
+        ):
+            await view.same_prompt_button.callback(create_mock_interaction())
+            edits_after_stop = view.message.edit.await_count
+
+        assert closed is True
+        assert len(view.variations) == 1
+        # Initial status, then the first variation; nothing after the stop
+        assert edits_after_stop == 2
+
+    @pytest.mark.asyncio
+    async def test_trimmed_batch_is_reported(self) -> None:
+        """Test that a batch cut short by the rate limit says so."""
+        view = self.create_view()
+
+        with patch(
+            "src.clients.discord.views.carousel.generate_variations_same_prompt",
+            create_mock_batch(create_mock_image_data("v1")),
+        ):
+            await view.same_prompt_button.callback(create_mock_interaction())
+
+        assert "Generated 1 of 3" in str(view.embed.description if view.embed else "")
+        assert view.same_prompt_button.label == "Same Prompt ×2"
@@ -8,6 +8,7 @@ Features:
 - Configurable responses for predictable test behavior
 - Call tracking for assertions (call_count, last_messages, etc.)
 - Support for async iteration in streaming responses
+- Optional simulation of prompt caching usage fields
 """
 
 from collections.abc import AsyncIterator
@@ -34,6 +35,7 @@ class MockAIProvider:
         last_messages: The messages argument from the most recent call.
         last_system_prompt: The system_prompt argument from the most recent call.
         last_max_tokens: The max_tokens argument from the most recent chat() call.
+        prompt_caching: Whether chat() reports simulated prompt cache usage.
 
     Example:
         >>> provider = MockAIProvider(responses=["Hello!", "How can I help?"])
@@ -43,7 +45,11 @@ class MockAIProvider:
         >>> assert provider.last_messages[0].content == "Hi"
     """
 
-    def __init__(self, responses: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        responses: list[str] | None = None,
+        prompt_caching: bool = False,
+    ) -> None:
         """Initialize the mock AI provider.
 
         Args:
@@ -51,12 +57,20 @@ class MockAIProvider:
                 ["Mock response"]. The mock uses responses in order,
                 repeating the last one if more calls are made than
                 responses provided.
+            prompt_caching: If True, chat() behaves like AnthropicProvider
+                with prompt caching: each request caches its system prompt
+                and full prefix, and usage reports cache_read_input_tokens
+                for the longest previously cached prefix and
+                cache_creation_input_tokens for the rest. Tokens are counted
+                as words.
         """
         self.responses = responses or ["Mock response"]
         self.call_count = 0
         self.last_messages: list[ChatMessage] | None = None
         self.last_system_prompt: str | None = None
         self.last_max_tokens: int | None = None
+        self.prompt_caching = prompt_caching
+        self._cached_prefixes: set[tuple[tuple[str, str], ...]] = set()
 
     async def chat(
         self,
@@ -83,13 +97,45 @@ class MockAIProvider:
         self.last_system_prompt = system_prompt
         self.last_max_tokens = max_tokens
 
+        usage = {"input_tokens": 10, "output_tokens": 20}
+        if self.prompt_caching:
+            usage.update(self._simulate_cache(messages, system_prompt))
+
         response_idx = min(self.call_count - 1, len(self.responses) - 1)
         return ChatResponse(
             content=self.responses[response_idx],
             model="mock-model",
-            usage={"input_tokens": 10, "output_tokens": 20},
+            usage=usage,
         )
 
+    def _simulate_cache(
+        self,
+        messages: list[ChatMessage],
+        system_prompt: str | None,
+    ) -> dict[str, int]:
+        """Compute cache usage for a request and cache its prefixes."""
+        segments = [(msg.role, msg.content) for msg in messages]
+        if system_prompt:
+            segments.insert(0, ("system", system_prompt))
+
+        hit = 0
+        for end in range(len(segments), 0, -1):
+            if tuple(segments[:end]) in self._cached_prefixes:
+                hit = end
+                break
+
+        if system_prompt:
+            self._cached_prefixes.add(tuple(segments[:1]))
+        self._cached_prefixes.add(tuple(segments))
+        return {
+            "cache_read_input_tokens": sum(
+                len(text.split()) for _, text in segments[:hit]
+            ),
+            "cache_creation_input_tokens": sum(
+                len(text.split()) for _, text in segments[hit:]
+            ),
+        }
+
     async def chat_stream(
         self,
         messages: list[ChatMessage],
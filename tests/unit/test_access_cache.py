@@ -0,0 +1,132 @@
+"""Tests for the in-memory access control cache and its use in RepositoryAdapter."""
+
+from unittest.mock import patch
+
+import pytest_asyncio
+
+from src.adapters.access_cache import AccessControlCache
+from src.adapters.repository_compat import RepositoryAdapter
+from src.adapters.sqlite_repository import SQLiteRepository
+
+
+class TestAccessControlCache:
+    """Tests for AccessControlCache."""
+
+    def test_starts_unloaded(self) -> None:
+        """Test that a new cache is not used until loaded."""
+        assert AccessControlCache().loaded is False
+
+    def test_reload_replaces_lists(self) -> None:
+        """Test that a reload fills both lists."""
+        cache = AccessControlCache()
+        applied = cache.finish_reload(cache.start_reload(), {1, 2}, {2: "spam"})
+
+        assert applied is True
+        assert cache.loaded is True
+        assert cache.is_whitelisted(1)
+        assert not cache.is_banned(1)
+        assert cache.ban_reason(2) == "spam"
+        assert cache.stats().lookups == 3
+
+    def test_writes_update_lists(self) -> None:
+        """Test that write-through updates are visible immediately."""
+        cache = AccessControlCache()
+        cache.finish_reload(cache.start_reload(), set(), {})
+
+        cache.add_whitelisted(5)
+        cache.add_ban(5, "abuse")
+        assert cache.is_whitelisted(5) and cache.ban_reason(5) == "abuse"
+
+        cache.remove_ban(5)
+        cache.remove_whitelisted(5)
+        assert not cache.is_whitelisted(5) and not cache.is_banned(5)
+
+    def test_reload_racing_a_write_is_discarded(self) -> None:
+        """Test that lists read before a write do not overwrite it."""
+        cache = AccessControlCache()
+        cache.finish_reload(cache.start_reload(), set(), {})
+        token = cache.start_reload()
+        cache.add_ban(7, "abuse")
+
+        applied = cache.finish_reload(token, set(), {})
+
+        assert applied is False
+        assert cache.is_banned(7)
+        assert cache.stats().stale_reloads == 1
+
+    def test_reload_counts_drift(self) -> None:
+        """Test that entries changed outside the cache are counted as drift."""
+        cache = AccessControlCache()
+        cache.finish_reload(cache.start_reload(), {1}, {})
+
+        cache.finish_reload(cache.start_reload(), {2}, {3: "spam"})
+
+        assert cache.stats().drift == 3
+        assert cache.is_whitelisted(2) and not cache.is_whitelisted(1)
+
+
+@pytest_asyncio.fixture
+async def adapter() -> RepositoryAdapter:
+    """Provides an adapter over an in-memory repository."""
+    repo = SQLiteRepository(":memory:")
+    await repo.connect()
+    yield RepositoryAdapter(repo)
+    await repo.close()
+
+
+class TestAdapterAccessCache:
+    """Tests for access checks served from memory by RepositoryAdapter."""
+
+    async def test_unloaded_cache_queries_database(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that checks fall back to SQLite before the first load."""
+        await adapter._repo.add_to_whitelist(1, "user1", "admin")
+        assert await adapter.is_user_whitelisted(1) is True
+
+    async def test_loaded_checks_skip_database(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that a loaded cache answers every access check."""
+        await adapter.add_to_whitelist(1, "user1", "admin")
+        await adapter.add_ban(1, "user1", "spam", "admin")
+        await adapter.reload_access_lists()
+
+        with (
+            patch.object(adapter._repo, "is_user_whitelisted", side_effect=AssertionError),
+            patch.object(adapter._repo, "is_user_banned", side_effect=AssertionError),
+            patch.object(adapter._repo, "get_ban_reason", side_effect=AssertionError),
+        ):
+            assert await adapter.is_user_whitelisted(1) is True
+            assert await adapter.is_user_banned(1) is True
+            assert await adapter.get_ban_reason(1) == "spam"
+            assert await adapter.is_user_whitelisted(2) is False
+
+    async def test_admin_commands_write_through(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that ban and whitelist changes apply without a reload."""
+        await adapter.reload_access_lists()
+
+        await adapter.add_to_whitelist(1, "user1", "admin")
+        await adapter.add_ban(1, "user1", "spam", "admin")
+        assert await adapter.is_user_whitelisted(1) is True
+        assert await adapter.is_user_banned(1) is True
+
+        await adapter.remove_ban(1, "admin")
+        await adapter.remove_from_whitelist(1)
+        assert await adapter.is_user_banned(1) is False
+        assert await adapter.is_user_whitelisted(1) is False
+
+    async def test_reload_picks_up_external_changes(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that reconciling reads changes made directly in SQLite."""
+        await adapter.reload_access_lists()
+        await adapter._repo.add_to_whitelist(9, "user9", "admin")
+        assert await adapter.is_user_whitelisted(9) is False
+
+        await adapter.reload_access_lists()
+
+        assert await adapter.is_user_whitelisted(9) is True
+        assert adapter.access_cache_stats()["drift"] == 1
@@ -0,0 +1,142 @@
+"""Tests for the shared Anthropic client registry."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from anthropic import APITimeoutError, AsyncAnthropic
+
+from src.core.anthropic_clients import (
+    AnthropicClientRegistry,
+    AnthropicPoolLimits,
+    close_anthropic_clients,
+    get_anthropic_client,
+)
+from src.core.bulkhead import BULKHEAD_LIMITS, OVERLOAD_CATEGORIES
+from src.core.circuit_breaker import OUTAGE_CATEGORIES
+from src.core.errors import ErrorCategory, classify_error
+from src.providers.anthropic_provider import AnthropicProvider
+
+
+class TestAnthropicPoolLimits:
+    """Tests for AnthropicPoolLimits."""
+
+    def test_defaults_without_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that unset variables fall back to the defaults."""
+        monkeypatch.delenv("ANTHROPIC_MAX_CONNECTIONS", raising=False)
+        monkeypatch.delenv("ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS", raising=False)
+        monkeypatch.delenv("ANTHROPIC_KEEPALIVE_EXPIRY", raising=False)
+        assert AnthropicPoolLimits.from_env() == AnthropicPoolLimits()
+
+    def test_default_pool_covers_bulkhead_maxima(self) -> None:
+        """Test that every slot the Anthropic bulkheads admit gets a connection."""
+        admitted = sum(
+            BULKHEAD_LIMITS[name].maximum for name in ("anthropic", "haiku")
+        )
+        assert AnthropicPoolLimits().max_connections >= admitted
+
+    async def test_pool_timeout_counts_as_outage_not_overload(self) -> None:
+        """Test how a pool timeout through the SDK is classified.
+
+        It would not shrink the bulkhead, but the circuit breaker would count
+        it as an outage, which is why the pool covers every admitted call.
+        """
+
+        def exhausted_pool(request: httpx.Request) -> httpx.Response:
+            raise httpx.PoolTimeout("no connection available", request=request)
+
+        client = AsyncAnthropic(
+            api_key="test-key",
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(exhausted_pool)),
+        )
+        with pytest.raises(APITimeoutError) as exc_info:
+            await client.messages.create(
+                model="claude-haiku-4-5",
+                max_tokens=1,
+                messages=[{"role": "user", "content": "hi"}],
+            )
+
+        category = classify_error(exc_info.value)
+        assert category == ErrorCategory.NETWORK
+        assert category in OUTAGE_CATEGORIES
+        assert category not in OVERLOAD_CATEGORIES
+
+    def test_reads_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that limits are read from the environment."""
+        monkeypatch.setenv("ANTHROPIC_MAX_CONNECTIONS", "5")
+        monkeypatch.setenv("ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS", "2")
+        monkeypatch.setenv("ANTHROPIC_KEEPALIVE_EXPIRY", "12.5")
+
+        limits = AnthropicPoolLimits.from_env()
+
+        assert limits == AnthropicPoolLimits(5, 2, 12.5)
+        assert limits.to_httpx().max_keepalive_connections == 2
+
+
+class TestAnthropicClientRegistry:
+    """Tests for AnthropicClientRegistry."""
+
+    def test_reuses_client_per_key_and_timeout(self) -> None:
+        """Test that repeated lookups return the same client."""
+        registry = AnthropicClientRegistry(AnthropicPoolLimits())
+
+        first = registry.get("key", timeout=30.0)
+
+        assert registry.get("key", timeout=30.0) is first
+        assert registry.get("key") is not first
+        assert registry.get("other", timeout=30.0) is not first
+
+    def test_clients_share_one_pool(self) -> None:
+        """Test that every client is built on the same HTTP client."""
+        registry = AnthropicClientRegistry(AnthropicPoolLimits())
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_class:
+            registry.get("key")
+            registry.get("key", timeout=30.0)
+
+        pools = {id(call.kwargs["http_client"]) for call in mock_class.call_args_list}
+        assert len(pools) == 1
+
+    async def test_close_opens_new_pool_on_next_use(self) -> None:
+        """Test that clients obtained after close use a fresh pool."""
+        registry = AnthropicClientRegistry(AnthropicPoolLimits())
+        before = registry.get("key")
+
+        await registry.close()
+
+        assert registry.get("key") is not before
+
+    async def test_warm_up_failure_is_not_raised(self) -> None:
+        """Test that a failed warm-up is logged and reported, not raised."""
+        registry = AnthropicClientRegistry(AnthropicPoolLimits())
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_class:
+            mock_client = MagicMock()
+            mock_client.models.list = AsyncMock(side_effect=Exception("offline"))
+            mock_class.return_value = mock_client
+
+            assert await registry.warm_up("key") is False
+
+    async def test_warm_up_lists_one_model(self) -> None:
+        """Test that warm-up sends a single cheap request."""
+        registry = AnthropicClientRegistry(AnthropicPoolLimits())
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_class:
+            mock_client = MagicMock()
+            mock_client.models.list = AsyncMock()
+            mock_class.return_value = mock_client
+
+            assert await registry.warm_up("key") is True
+
+        mock_client.models.list.assert_awaited_once_with(limit=1)
+
+
+class TestGlobalRegistry:
+    """Tests for the process-wide registry functions."""
+
+    async def test_provider_shares_global_client(self) -> None:
+        """Test that the chat provider uses the same client as Haiku calls."""
+        provider = AnthropicProvider(api_key="key")
+
+        assert provider._client is get_anthropic_client("key")
+
+        await close_anthropic_clients()
+        assert get_anthropic_client("key") is not provider._client
@@ -25,15 +25,16 @@ class TestAnthropicProviderInit:
     def test_init_creates_client(self) -> None:
         """Test that initialization creates an AsyncAnthropic client."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             provider = AnthropicProvider(api_key="test-key")
-            mock_class.assert_called_once_with(api_key="test-key")
+            mock_class.assert_called_once()
+            assert mock_class.call_args.kwargs["api_key"] == "test-key"
             assert provider._default_model == "claude-sonnet-4-20250514"
 
     def test_init_custom_model(self) -> None:
         """Test initialization with custom default model."""
-        with patch("src.providers.anthropic_provider.AsyncAnthropic"):
+        with patch("src.core.anthropic_clients.AsyncAnthropic"):
             provider = AnthropicProvider(
                 api_key="test-key",
                 default_model="claude-opus-4-20250514",
@@ -42,7 +43,7 @@ class TestAnthropicProviderInit:
 
     def test_init_custom_retry_settings(self) -> None:
         """Test initialization with custom retry settings."""
-        with patch("src.providers.anthropic_provider.AsyncAnthropic"):
+        with patch("src.core.anthropic_clients.AsyncAnthropic"):
             provider = AnthropicProvider(
                 api_key="test-key",
                 max_retries=10,
@@ -58,7 +59,7 @@ class TestMessageConversion:
     @pytest.fixture
     def provider(self) -> AnthropicProvider:
         """Create a provider with mocked client."""
-        with patch("src.providers.anthropic_provider.AsyncAnthropic"):
+        with patch("src.core.anthropic_clients.AsyncAnthropic"):
             return AnthropicProvider(api_key="test-key")
 
     def test_convert_user_message(self, provider: AnthropicProvider) -> None:
@@ -130,7 +131,7 @@ class TestChatCompletion:
     ) -> tuple[AnthropicProvider, AsyncMock]:
         """Create a provider with mocked client that returns a response."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             mock_client = MagicMock()
             mock_create = AsyncMock(return_value=mock_response)
@@ -230,7 +231,7 @@ class TestChatCompletion:
     async def test_chat_empty_response_content(self) -> None:
         """Test handling of empty response content."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             mock_response = MagicMock()
             mock_response.content = []
@@ -251,6 +252,101 @@ class TestChatCompletion:
             assert result.content == ""
 
 
+class TestPromptCaching:
+    """Tests for cache_control markers and cache usage reporting."""
+
+    @pytest.fixture
+    def mock_create(self) -> AsyncMock:
+        """Create a messages.create mock that reports cache usage."""
+        response = MagicMock()
+        response.content = [MagicMock(text="Cached")]
+        response.model = "claude-sonnet-4-20250514"
+        response.usage = MagicMock()
+        response.usage.input_tokens = 5
+        response.usage.output_tokens = 20
+        response.usage.cache_creation_input_tokens = 300
+        response.usage.cache_read_input_tokens = 1200
+        return AsyncMock(return_value=response)
+
+    def make_provider(
+        self, mock_create: AsyncMock, prompt_caching: bool = True
+    ) -> AnthropicProvider:
+        """Create a provider whose client uses mock_create."""
+        with patch(
+            "src.core.anthropic_clients.AsyncAnthropic"
+        ) as mock_class:
+            mock_class.return_value.messages.create = mock_create
+            return AnthropicProvider(
+                api_key="test-key", prompt_caching=prompt_caching
+            )
+
+    @pytest.mark.asyncio
+    async def test_marks_system_prompt_and_last_message(
+        self, mock_create: AsyncMock
+    ) -> None:
+        """Test that the system prompt and history prefix are cacheable."""
+        provider = self.make_provider(mock_create)
+        messages = [
+            ChatMessage(role="user", content="Hello"),
+            ChatMessage(role="assistant", content="Hi"),
+            ChatMessage(role="user", content="How are you?"),
+        ]
+
+        await provider.chat(messages, system_prompt="Be helpful")
+
+        call_kwargs = mock_create.call_args.kwargs
+        assert call_kwargs["system"] == [
+            {
+                "type": "text",
+                "text": "Be helpful",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert call_kwargs["messages"] == [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi"},
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "How are you?",
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            },
+        ]
+
+    @pytest.mark.asyncio
+    async def test_records_cache_usage(self, mock_create: AsyncMock) -> None:
+        """Test that cache reads and writes are reported in usage."""
+        provider = self.make_provider(mock_create)
+
+        result = await provider.chat([ChatMessage(role="user", content="Hi")])
+
+        assert result.usage == {
+            "input_tokens": 5,
+            "output_tokens": 20,
+            "cache_creation_input_tokens": 300,
+            "cache_read_input_tokens": 1200,
+        }
+
+    @pytest.mark.asyncio
+    async def test_disabled_sends_plain_request(
+        self, mock_create: AsyncMock
+    ) -> None:
+        """Test that no cache_control markers are sent when disabled."""
+        provider = self.make_provider(mock_create, prompt_caching=False)
+
+        await provider.chat(
+            [ChatMessage(role="user", content="Hi")], system_prompt="Be helpful"
+        )
+
+        call_kwargs = mock_create.call_args.kwargs
+        assert call_kwargs["system"] == "Be helpful"
+        assert call_kwargs["messages"] == [{"role": "user", "content": "Hi"}]
+
+
 class TestErrorHandling:
     """Tests for error handling and retry logic."""
 
@@ -258,7 +354,7 @@ class TestErrorHandling:
     async def test_retry_on_529_error(self) -> None:
         """Test that 529 errors trigger retry with backoff."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             # First call throws 529, second succeeds
             mock_response = MagicMock()
@@ -295,7 +391,7 @@ class TestErrorHandling:
     async def test_exponential_backoff(self) -> None:
         """Test that backoff increases exponentially."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="Success")]
@@ -332,7 +428,7 @@ class TestErrorHandling:
     async def test_max_retries_exceeded(self) -> None:
         """Test that max retries raises error after exhaustion."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             mock_response_529 = MagicMock()
             mock_response_529.status_code = 529
@@ -363,7 +459,7 @@ class TestErrorHandling:
     async def test_non_retryable_error_raises_immediately(self) -> None:
         """Test that non-529 errors are raised immediately."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             mock_response_400 = MagicMock()
             mock_response_400.status_code = 400
@@ -396,7 +492,7 @@ class TestChatStream:
     async def test_chat_stream_yields_chunks(self) -> None:
         """Test that chat_stream yields text chunks."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             # Create an async iterator for the text_stream
             async def mock_text_stream():
@@ -426,7 +522,7 @@ class TestChatStream:
     async def test_chat_stream_passes_messages(self) -> None:
         """Test that chat_stream passes correctly formatted messages."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             async def mock_text_stream():
                 yield "test"
@@ -461,7 +557,7 @@ class TestChatStream:
     async def test_chat_stream_with_system_prompt(self) -> None:
         """Test that system prompt is passed to stream."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             async def mock_text_stream():
                 yield "test"
@@ -491,7 +587,7 @@ class TestChatStream:
     async def test_chat_stream_without_system_prompt(self) -> None:
         """Test that system parameter is omitted when no system prompt."""
         with patch(
-            "src.providers.anthropic_provider.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_class:
             async def mock_text_stream():
                 yield "test"
@@ -522,14 +618,14 @@ class TestProtocolCompliance:
 
     def test_provider_has_chat_method(self) -> None:
         """Test that provider has chat method."""
-        with patch("src.providers.anthropic_provider.AsyncAnthropic"):
+        with patch("src.core.anthropic_clients.AsyncAnthropic"):
             provider = AnthropicProvider(api_key="test-key")
             assert hasattr(provider, "chat")
             assert callable(provider.chat)
 
     def test_provider_has_chat_stream_method(self) -> None:
         """Test that provider has chat_stream method."""
-        with patch("src.providers.anthropic_provider.AsyncAnthropic"):
+        with patch("src.core.anthropic_clients.AsyncAnthropic"):
             provider = AnthropicProvider(api_key="test-key")
             assert hasattr(provider, "chat_stream")
             assert callable(provider.chat_stream)
@@ -1,7 +1,8 @@
 """Tests for the conversation API routes."""
 
+import json
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import FastAPI
@@ -10,6 +11,7 @@ from fastapi.testclient import TestClient
 from src.api.auth import AuthUser, get_current_user
 from src.api.routes.conversations import router
 from src.api.schemas import ChatCompletionRequest, ConversationCreate
+from src.core.conversation import ContextBuilder
 from src.core.providers import ChatResponse
 from src.core.rate_limit import RateLimitResult
 
@@ -19,8 +21,8 @@ def mock_repo():
     """Create a mock repository adapter."""
     repo = AsyncMock()
     repo.create_channel = AsyncMock()
-    repo.add_message = AsyncMock()
-    repo.get_visible_messages = AsyncMock(return_value=[])
+    repo.add_message = AsyncMock(return_value=7)
+    repo.get_visible_text_messages = AsyncMock(return_value=[])
     repo.clear_messages = AsyncMock()
     return repo
 
@@ -151,7 +153,7 @@ class TestGetConversation:
 
     def test_gets_empty_conversation(self, client, mock_repo):
         """Should return empty conversation when no messages."""
-        mock_repo.get_visible_messages.return_value = []
+        mock_repo.get_visible_text_messages.return_value = []
 
         response = client.get("/conversations/123")
 
@@ -162,7 +164,7 @@ class TestGetConversation:
 
     def test_gets_conversation_with_messages(self, client, mock_repo):
         """Should return conversation with messages."""
-        mock_repo.get_visible_messages.return_value = [
+        mock_repo.get_visible_text_messages.return_value = [
             {"message_type": "prompt", "message_data": "Hello"},
             {"message_type": "assistant", "message_data": "Hi there!"},
         ]
@@ -178,7 +180,7 @@ class TestGetConversation:
 
     def test_excludes_behavior_messages(self, client, mock_repo):
         """Should not include behavior messages in response."""
-        mock_repo.get_visible_messages.return_value = [
+        mock_repo.get_visible_text_messages.return_value = [
             {"message_type": "behavior", "message_data": "Be helpful"},
             {"message_type": "prompt", "message_data": "Hello"},
         ]
@@ -198,7 +200,7 @@ class TestSendMessage:
         self, client, mock_repo, mock_ai_provider, mock_rate_limiter
     ):
         """Should send message and return AI response."""
-        mock_repo.get_visible_messages.return_value = [
+        mock_repo.get_visible_text_messages.return_value = [
             {"message_type": "prompt", "message_data": "Hello"},
         ]
 
@@ -230,6 +232,29 @@ class TestSendMessage:
 
         assert response.status_code == 429
 
+    def test_context_windowed_to_token_budget(
+        self, app, client, mock_repo, mock_ai_provider
+    ):
+        """Should send only the recent messages that fit the token budget."""
+        from src.api.dependencies import get_context_builder
+
+        app.dependency_overrides[get_context_builder] = lambda: ContextBuilder(
+            max_tokens=100
+        )
+        mock_repo.get_visible_text_messages.return_value = [
+            {"message_type": "behavior", "message_data": "Be brief", "token_count": 10},
+            {"message_type": "prompt", "message_data": "old", "token_count": 80},
+            {"message_type": "assistant", "message_data": "reply", "token_count": 30},
+            {"message_type": "prompt", "message_data": "new", "token_count": 40},
+        ]
+
+        response = client.post("/conversations/123/messages", json={"content": "new"})
+
+        assert response.status_code == 200
+        messages = mock_ai_provider.chat.call_args.args[0]
+        assert [m.content for m in messages] == ["new"]
+        assert mock_ai_provider.chat.call_args.kwargs["system_prompt"] == "Be brief"
+
     def test_creates_channel_if_not_exists(self, client, mock_repo):
         """Should create channel if it doesn't exist."""
         response = client.post(
@@ -240,6 +265,139 @@ class TestSendMessage:
         mock_repo.create_channel.assert_called_once_with(456)
 
 
+def parse_sse(body: str) -> list[tuple[str, dict]]:
+    """Split a Server-Sent Events body into (event, data) pairs."""
+    events = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestStreamMessage:
+    """Tests for POST /conversations/{id}/messages:stream."""
+
+    @pytest.fixture
+    def connections(self, app):
+        """Override the WebSocket connection manager with a mock."""
+        from src.api.websocket import get_connection_manager
+
+        manager = MagicMock()
+        manager.send_to_conversation = AsyncMock(return_value=1)
+        app.dependency_overrides[get_connection_manager] = lambda: manager
+        return manager
+
+    @pytest.fixture
+    def streaming_provider(self, mock_ai_provider):
+        """Make the mock provider stream a fixed response."""
+
+        async def chat_stream(messages, *, system_prompt=None):
+            for chunk in ("Hel", "lo", "!"):
+                yield chunk
+
+        mock_ai_provider.chat_stream = MagicMock(side_effect=chat_stream)
+        return mock_ai_provider
+
+    def test_streams_chunks_then_done(
+        self, client, mock_repo, mock_rate_limiter, connections, streaming_provider
+    ):
+        """Should emit a chunk per delta and a done event with the message."""
+        response = client.post(
+            "/conversations/123/messages:stream", json={"content": "Hi"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        assert [e for e, _ in events] == ["chunk", "chunk", "chunk", "done"]
+        assert [d["delta"] for _, d in events[:3]] == ["Hel", "lo", "!"]
+        assert events[-1][1]["role"] == "assistant"
+        assert events[-1][1]["content"] == "Hello!"
+        mock_rate_limiter.record.assert_called_once()
+
+    def test_done_carries_saved_message_id(
+        self, client, mock_repo, connections, streaming_provider
+    ):
+        """Should report the ID the assistant message was stored under."""
+        mock_repo.get_visible_text_messages.return_value = [
+            {"message_type": "prompt", "message_data": "Hi", "token_count": 1}
+        ]
+        mock_repo.add_message.side_effect = [41, 42]
+
+        response = client.post(
+            "/conversations/123/messages:stream", json={"content": "Hi"}
+        )
+
+        events = parse_sse(response.text)
+        assert events[-1][1]["id"] == 42
+        new_message = connections.send_to_conversation.call_args.args[1]
+        assert new_message.payload["message"]["id"] == 42
+
+    def test_persists_assistant_message_once(
+        self, client, mock_repo, connections, streaming_provider
+    ):
+        """Should save the prompt and the complete response, nothing per chunk."""
+        client.post("/conversations/123/messages:stream", json={"content": "Hi"})
+
+        saved = [call.args for call in mock_repo.add_message.call_args_list]
+        assert saved == [
+            (123, "Anthropic", "prompt", False, "Hi"),
+            (123, "Anthropic", "assistant", False, "Hello!"),
+        ]
+
+    def test_mirrors_chunks_to_websocket(
+        self, client, connections, streaming_provider
+    ):
+        """Should forward each chunk and the final message to subscribers."""
+        client.post("/conversations/123/messages:stream", json={"content": "Hi"})
+
+        sent = [call.args for call in connections.send_to_conversation.call_args_list]
+        assert all(conversation_id == 123 for conversation_id, _ in sent)
+        assert [message.type for _, message in sent] == [
+            "message_chunk",
+            "message_chunk",
+            "message_chunk",
+            "new_message",
+        ]
+        assert sent[1][1].payload == {"conversation_id": 123, "index": 1, "delta": "lo"}
+
+    def test_failure_emits_error_without_saving(
+        self, client, mock_repo, mock_rate_limiter, mock_ai_provider, connections
+    ):
+        """Should end with an error event and not persist a partial response."""
+
+        async def chat_stream(messages, *, system_prompt=None):
+            yield "Partial"
+            raise RuntimeError("overloaded")
+
+        mock_ai_provider.chat_stream = MagicMock(side_effect=chat_stream)
+
+        response = client.post(
+            "/conversations/123/messages:stream", json={"content": "Hi"}
+        )
+
+        events = parse_sse(response.text)
+        assert [e for e, _ in events] == ["chunk", "error"]
+        assert mock_repo.add_message.call_count == 1
+        mock_rate_limiter.record.assert_not_called()
+
+    def test_rate_limited(self, client, mock_repo, mock_rate_limiter, connections):
+        """Should return 429 before starting a stream."""
+        mock_rate_limiter.check.return_value = RateLimitResult(
+            allowed=False,
+            remaining=0,
+            reset_at=datetime.now(UTC),
+            wait_seconds=60.0,
+        )
+
+        response = client.post(
+            "/conversations/123/messages:stream", json={"content": "Hi"}
+        )
+
+        assert response.status_code == 429
+        mock_repo.add_message.assert_not_called()
+
+
 class TestClearConversation:
     """Tests for DELETE /conversations/{id}."""
 
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
+import pytest_asyncio
 
+from src.adapters.repository_compat import RepositoryAdapter
+from src.adapters.sqlite_repository import SQLiteRepository
 from src.core.auto_summarization import (
     SUMMARIZATION_CONFIRMATION,
     THRESHOLD_WARNING,
@@ -14,7 +18,9 @@ from src.core.auto_summarization import (
     convert_context_to_chat_messages,
     get_auto_summarization_manager,
     perform_summarization,
+    summarize_channel,
 )
+from src.core.conversation import SUMMARY_PROMPT, ContextBuilder
 from src.core.haiku import SummarizationError
 
 
@@ -109,39 +115,19 @@ class TestCheckThresholdForSummarization:
 
     def test_returns_tuple(self) -> None:
         """Test that the function returns a tuple."""
-        result = check_threshold_for_summarization(
-            system_prompt="You are helpful.",
-            messages=[],
-            current_prompt="Hello",
-        )
-        assert isinstance(result, tuple)
-        assert len(result) == 2
+        result = check_threshold_for_summarization(42)
+        assert result == (42, False)
 
     def test_uses_default_threshold(self) -> None:
         """Test that default threshold of 10000 is used."""
-        count, exceeded = check_threshold_for_summarization(
-            system_prompt="",
-            messages=[],
-            current_prompt="Hello",
-        )
-        assert not exceeded  # Small text should not exceed 10k
-
-    def test_threshold_exceeded_with_long_text(self) -> None:
-        """Test that threshold is exceeded with very long text."""
-        # Generate text that exceeds 10k tokens
-        long_text = "word " * 3000  # ~3000 tokens per message
-        messages = [
-            {"role": "user", "content": long_text},
-            {"role": "assistant", "content": long_text},
-            {"role": "user", "content": long_text},
-            {"role": "assistant", "content": long_text},
-        ]
-
-        _, exceeded = check_threshold_for_summarization(
-            system_prompt="",
-            messages=messages,
-            current_prompt="",
-        )
+        _, at_limit = check_threshold_for_summarization(10000)
+        _, over_limit = check_threshold_for_summarization(10001)
+        assert not at_limit
+        assert over_limit
+
+    def test_custom_threshold(self) -> None:
+        """Test that a custom threshold is respected."""
+        _, exceeded = check_threshold_for_summarization(600, threshold=500)
         assert exceeded
 
 
@@ -262,6 +248,387 @@ class TestPerformSummarization:
                 await perform_summarization(messages)
 
 
+class TestBackgroundScheduling:
+    """Tests for running summarization as a background task."""
+
+    @pytest.mark.asyncio
+    async def test_schedule_runs_job_in_background(self) -> None:
+        """Test that schedule returns at once and the job runs afterwards."""
+        manager = AutoSummarizationManager()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def job() -> bool:
+            started.set()
+            await release.wait()
+            return True
+
+        assert manager.schedule(1, job) is True
+        assert manager.is_pending(1)
+        await started.wait()
+        assert not manager.pop_completed(1)
+
+        release.set()
+        await manager.wait(1)
+
+        assert not manager.is_pending(1)
+        assert manager.pop_completed(1) is True
+        assert manager.pop_completed(1) is False
+
+    @pytest.mark.asyncio
+    async def test_one_task_per_channel(self) -> None:
+        """Test that scheduling while a task runs is a no-op."""
+        manager = AutoSummarizationManager()
+        release = asyncio.Event()
+        calls = 0
+
+        async def job() -> bool:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return True
+
+        assert manager.schedule(1, job) is True
+        assert manager.schedule(1, job) is False
+        assert manager.schedule(2, job) is True
+        release.set()
+        await manager.wait(1)
+        await manager.wait(2)
+
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_job_clears_pending(self) -> None:
+        """Test that a failure is logged and allows a later retry."""
+        manager = AutoSummarizationManager()
+
+        async def job() -> bool:
+            raise SummarizationError("API error")
+
+        manager.schedule(1, job)
+        await manager.wait(1)
+
+        assert not manager.is_pending(1)
+        assert not manager.pop_completed(1)
+        assert manager.schedule(1, job) is True
+        await manager.wait(1)
+
+    @pytest.mark.asyncio
+    async def test_clear_pending_drops_unannounced_summary(self) -> None:
+        """Test that clearing history discards the pending confirmation."""
+        manager = AutoSummarizationManager()
+
+        async def job() -> bool:
+            return True
+
+        manager.schedule(1, job)
+        await manager.wait(1)
+        manager.clear_pending(1)
+
+        assert not manager.pop_completed(1)
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_running_tasks(self) -> None:
+        """Test that close cancels in-flight summarization."""
+        manager = AutoSummarizationManager()
+
+        async def job() -> bool:
+            await asyncio.Event().wait()
+            return True
+
+        manager.schedule(1, job)
+        await asyncio.sleep(0)
+        await manager.close()
+
+        assert not manager.is_pending(1)
+
+
+@pytest_asyncio.fixture
+async def adapter() -> RepositoryAdapter:
+    """Provides an adapter over an in-memory SQLite repository."""
+    repo = SQLiteRepository(":memory:")
+    await repo.connect()
+    await repo.create_vendor("Anthropic", "claude")
+    await repo.create_channel(12345)
+    yield RepositoryAdapter(repo)
+    await repo.close()
+
+
+class TestSummarizeChannel:
+    """Tests for summarize_channel against SQLite."""
+
+    @pytest.fixture(autouse=True)
+    def word_tokens(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Count one token per word so totals are easy to predict."""
+        counter = lambda text: len(text.split())  # noqa: E731
+        monkeypatch.setattr("src.adapters.sqlite_repository.try_count_tokens", counter)
+        monkeypatch.setattr("src.adapters.repository_compat.try_count_tokens", counter)
+
+    async def _context(self, adapter: RepositoryAdapter) -> list[str]:
+        rows = await adapter.get_visible_text_messages(12345, "All Models")
+        return [row["message_data"] for row in rows]
+
+    @pytest.mark.asyncio
+    async def test_replaces_context_with_summary(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that the context is replaced and the token total follows."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "one two")
+        await adapter.add_message(12345, "Anthropic", "assistant", False, "three")
+
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            return_value="short summary",
+        ) as mock_summarize:
+            assert await summarize_channel(adapter, 12345) is True
+
+        mock_summarize.assert_called_once_with(
+            [
+                {"role": "user", "content": "one two"},
+                {"role": "assistant", "content": "three"},
+            ],
+            None,
+        )
+        assert await self._context(adapter) == [SUMMARY_PROMPT, "short summary"]
+        assert await adapter.get_context_token_count(12345) == 5
+
+    @pytest.mark.asyncio
+    async def test_summary_reaches_built_context(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that the context sent to the model includes the summary."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "one two")
+        await adapter.add_message(12345, "Anthropic", "assistant", False, "three")
+
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            return_value="short summary",
+        ):
+            assert await summarize_channel(adapter, 12345) is True
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "next")
+
+        context = await adapter.get_visible_text_messages(12345, "All Models")
+        conversation = ContextBuilder().build_from_context(context)
+
+        assert [(m.role, m.content) for m in conversation.messages] == [
+            ("user", SUMMARY_PROMPT),
+            ("assistant", "short summary"),
+            ("user", "next"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_messages_arriving_during_summary_are_kept(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that concurrent messages survive and follow the summary."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "old prompt")
+
+        async def summarize_while_chatting(messages, guidance):
+            await adapter.add_message(12345, "Anthropic", "prompt", False, "new prompt")
+            return "summary"
+
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            side_effect=summarize_while_chatting,
+        ):
+            assert await summarize_channel(adapter, 12345) is True
+
+        assert await self._context(adapter) == [SUMMARY_PROMPT, "summary", "new prompt"]
+        assert await adapter.get_context_token_count(12345) == 6
+
+    @pytest.mark.asyncio
+    async def test_clear_during_summary_wins(self, adapter: RepositoryAdapter) -> None:
+        """Test that a summary is dropped if the history was cleared meanwhile."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "old prompt")
+
+        async def summarize_while_clearing(messages, guidance):
+            await adapter.clear_messages(12345, "All Models")
+            await adapter.add_message(12345, "Anthropic", "prompt", False, "fresh")
+            return "summary"
+
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            side_effect=summarize_while_clearing,
+        ):
+            assert await summarize_channel(adapter, 12345) is False
+
+        assert await self._context(adapter) == ["fresh"]
+        assert await adapter.get_context_token_count(12345) == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_leaves_context_untouched(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that a failed summary leaves the context and no placeholder."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "old prompt")
+
+        with (
+            patch(
+                "src.core.auto_summarization.haiku_summarize_conversation",
+                side_effect=SummarizationError("API error"),
+            ),
+            pytest.raises(SummarizationError),
+        ):
+            await summarize_channel(adapter, 12345)
+
+        assert await self._context(adapter) == ["old prompt"]
+        conn = adapter._repo._ensure_connected()
+        rows = conn.execute("SELECT message_data FROM channel_messages").fetchall()
+        assert [row[0] for row in rows] == ["old prompt"]
+
+    @pytest.mark.asyncio
+    async def test_cancellation_releases_slot(self, adapter: RepositoryAdapter) -> None:
+        """Test that cancelling a running summary removes its placeholder."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "old prompt")
+        started = asyncio.Event()
+
+        async def summarize_forever(messages, guidance):
+            started.set()
+            await asyncio.Event().wait()
+
+        manager = AutoSummarizationManager()
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            side_effect=summarize_forever,
+        ):
+            manager.schedule(12345, lambda: summarize_channel(adapter, 12345))
+            await started.wait()
+            await manager.close()
+
+        conn = adapter._repo._ensure_connected()
+        rows = conn.execute("SELECT message_data FROM channel_messages").fetchall()
+        assert [row[0] for row in rows] == ["old prompt"]
+
+    @pytest.mark.asyncio
+    async def test_rolling_summary_sends_only_new_messages(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that a second run folds only the new messages into the summary."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "one two")
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            return_value="first summary",
+        ):
+            assert await summarize_channel(adapter, 12345) is True
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "three four")
+
+        with patch(
+            "src.core.auto_summarization.haiku_extend_summary",
+            return_value="second summary",
+        ) as mock_extend:
+            assert await summarize_channel(adapter, 12345) is True
+
+        mock_extend.assert_called_once_with(
+            "first summary", [{"role": "user", "content": "three four"}], None
+        )
+        assert await self._context(adapter) == [SUMMARY_PROMPT, "second summary"]
+        rolling = await adapter.get_rolling_summary(12345)
+        assert rolling is not None
+        assert rolling["message_data"] == "second summary"
+        assert await adapter.get_context_token_count(12345) == 5
+
+    @pytest.mark.asyncio
+    async def test_rolling_summary_reaches_built_context(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that the model sees the rolling summary it will later extend."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "one two")
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            return_value="first summary",
+        ):
+            assert await summarize_channel(adapter, 12345) is True
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "three four")
+        await adapter.add_message(12345, "Anthropic", "assistant", False, "five")
+
+        with patch(
+            "src.core.auto_summarization.haiku_extend_summary",
+            return_value="second summary",
+        ):
+            assert await summarize_channel(adapter, 12345) is True
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "six")
+
+        context = await adapter.get_visible_text_messages(12345, "All Models")
+        conversation = ContextBuilder().build_from_context(context)
+
+        assert [(m.role, m.content) for m in conversation.messages] == [
+            ("user", SUMMARY_PROMPT),
+            ("assistant", "second summary"),
+            ("user", "six"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rolling_summary_without_new_messages_is_noop(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that nothing is sent when only the summary is in the context."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "one two")
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            return_value="summary",
+        ):
+            await summarize_channel(adapter, 12345)
+
+        with patch("src.core.auto_summarization.haiku_extend_summary") as mock_extend:
+            assert await summarize_channel(adapter, 12345) is False
+
+        mock_extend.assert_not_called()
+        assert await self._context(adapter) == [SUMMARY_PROMPT, "summary"]
+
+    @pytest.mark.asyncio
+    async def test_non_rolling_resummarizes_everything(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that rolling=False sends the old summary as part of the context."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "one")
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            return_value="summary",
+        ):
+            await summarize_channel(adapter, 12345)
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "two")
+
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            return_value="full summary",
+        ) as mock_summarize:
+            assert await summarize_channel(adapter, 12345, rolling=False) is True
+
+        mock_summarize.assert_called_once_with(
+            [
+                {"role": "user", "content": SUMMARY_PROMPT},
+                {"role": "assistant", "content": "summary"},
+                {"role": "user", "content": "two"},
+            ],
+            None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_rolling_summary(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that a clear starts the next summary from scratch."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "one")
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            return_value="summary",
+        ):
+            await summarize_channel(adapter, 12345)
+
+        await adapter.clear_messages(12345, "All Models")
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "fresh")
+
+        assert await adapter.get_rolling_summary(12345) is None
+        with patch(
+            "src.core.auto_summarization.haiku_summarize_conversation",
+            return_value="new summary",
+        ) as mock_summarize:
+            assert await summarize_channel(adapter, 12345) is True
+        mock_summarize.assert_called_once_with(
+            [{"role": "user", "content": "fresh"}], None
+        )
+
+
 class TestConstants:
     """Tests for module constants."""
 
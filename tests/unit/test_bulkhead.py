@@ -0,0 +1,154 @@
+"""Tests for the adaptive per-provider bulkhead."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from anthropic import APIStatusError
+
+from src.core.bulkhead import AdaptiveBulkhead, BulkheadLimits, get_bulkhead
+from src.core.providers import ChatMessage
+from src.providers.anthropic_provider import AnthropicProvider
+
+
+class FakeClock:
+    """Settable monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveBulkhead:
+    """Tests for AdaptiveBulkhead."""
+
+    async def test_admits_at_most_limit(self) -> None:
+        """Test that calls beyond the limit queue until a slot frees up."""
+        bulkhead = AdaptiveBulkhead("test", BulkheadLimits(initial=2, maximum=2))
+        release = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal running, peak
+            async with bulkhead.slot():
+                running += 1
+                peak = max(peak, running)
+                await release.wait()
+                running -= 1
+
+        tasks = [asyncio.create_task(call()) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert bulkhead.stats().queued == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        stats = bulkhead.stats()
+        assert peak == 2
+        assert (stats.acquired, stats.waited, stats.in_flight) == (5, 3, 0)
+
+    async def test_success_increases_additively(self) -> None:
+        """Test that a full window of successes adds about one slot."""
+        bulkhead = AdaptiveBulkhead("test", BulkheadLimits(initial=4, maximum=8))
+
+        for _ in range(4):
+            async with bulkhead.slot():
+                pass
+
+        assert 4.8 < bulkhead.limit < 5.0
+
+    async def test_overload_halves_once_per_cooldown(self) -> None:
+        """Test that a burst of overload errors cuts the limit only once."""
+        clock = FakeClock()
+        bulkhead = AdaptiveBulkhead(
+            "test", BulkheadLimits(initial=8), decrease_cooldown=5, clock=clock
+        )
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                async with bulkhead.slot():
+                    raise RuntimeError("529 overloaded")
+        assert bulkhead.limit == 4
+
+        clock.now += 10
+        with pytest.raises(TimeoutError):
+            async with bulkhead.slot():
+                raise TimeoutError()
+        assert bulkhead.limit == 2
+        assert bulkhead.stats().decreases == 2
+
+    async def test_limit_stays_within_bounds(self) -> None:
+        """Test that the limit never drops below the minimum."""
+        clock = FakeClock()
+        bulkhead = AdaptiveBulkhead(
+            "test", BulkheadLimits(initial=2, minimum=2), clock=clock
+        )
+
+        bulkhead.record_overload()
+
+        assert bulkhead.limit == 2
+
+    async def test_other_errors_leave_limit(self) -> None:
+        """Test that errors unrelated to load do not change the limit."""
+        bulkhead = AdaptiveBulkhead("test", BulkheadLimits(initial=4))
+
+        with pytest.raises(ValueError):
+            async with bulkhead.slot():
+                raise ValueError("400 bad request")
+
+        assert bulkhead.limit == 4
+
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Test that cancelling a queued call keeps the slot count right."""
+        bulkhead = AdaptiveBulkhead("test", BulkheadLimits(initial=1, maximum=1))
+        await bulkhead.acquire()
+        waiter = asyncio.create_task(bulkhead.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        bulkhead.release()
+
+        stats = bulkhead.stats()
+        assert (stats.in_flight, stats.queued) == (0, 0)
+        await asyncio.wait_for(bulkhead.acquire(), timeout=1)
+
+    def test_invalid_limits_rejected(self) -> None:
+        """Test that inconsistent bounds are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveBulkhead("test", BulkheadLimits(initial=4, maximum=2))
+
+
+class TestProviderBulkheads:
+    """Tests for bulkheads wired into providers."""
+
+    async def test_chat_overload_lowers_anthropic_limit(self) -> None:
+        """Test that a 529 from chat cuts the shared Anthropic limit."""
+        response_529 = MagicMock()
+        response_529.status_code = 529
+        error_529 = APIStatusError(message="Overloaded", response=response_529, body=None)
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Success")]
+        initial = get_bulkhead("anthropic").limit
+
+        with (
+            patch("src.core.anthropic_clients.AsyncAnthropic") as mock_class,
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(
+                side_effect=[error_529, mock_response]
+            )
+            mock_class.return_value = mock_client
+
+            provider = AnthropicProvider(api_key="test-key")
+            await provider.chat([ChatMessage(role="user", content="Hello")])
+
+        stats = get_bulkhead("anthropic").stats()
+        assert stats.decreases == 1
+        assert stats.limit < initial
+        assert stats.in_flight == 0
@@ -12,10 +12,13 @@ These tests verify the behavior of chat-related slash commands including:
 
 from __future__ import annotations
 
+import asyncio
 import sqlite3
+from collections.abc import AsyncIterator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import discord
 import pytest
 
 from src.clients.discord.commands.chat import (
@@ -85,9 +88,10 @@ def create_mock_bot() -> MagicMock:
     bot.repo.create_channel = AsyncMock()
     bot.repo.add_message = AsyncMock()
     bot.repo.add_message_with_images = AsyncMock()
-    bot.repo.get_visible_messages = AsyncMock(return_value=[])
+    bot.repo.get_visible_text_messages = AsyncMock(return_value=[])
     bot.repo.clear_messages = AsyncMock()
     bot.repo.deactivate_old_messages = AsyncMock()
+    bot.repo.get_context_token_count = AsyncMock(return_value=0)
     bot.repo.is_user_banned = AsyncMock(return_value=False)
     bot.repo.add_ban = AsyncMock()
     bot.repo.remove_ban = AsyncMock()
@@ -109,6 +113,13 @@ def create_mock_bot() -> MagicMock:
         return_value=MagicMock(content="Mock AI response")
     )
 
+    async def chat_stream(*args: Any, **kwargs: Any) -> AsyncIterator[str]:
+        for chunk in ("Mock ", "AI ", "response"):
+            yield chunk
+            await asyncio.sleep(0)
+
+    bot.ai_provider.chat_stream = MagicMock(side_effect=chat_stream)
+
     # Mock rate limiter
     bot.rate_limiter = AsyncMock()
     bot.rate_limiter.check = AsyncMock(
@@ -727,6 +738,51 @@ class TestPromptCommand:
 
             interaction.response.defer.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_prompt_streams_response(self, prompt_func: tuple) -> None:
+        """Test that the response is streamed into the embed, then finalized."""
+        func, bot = prompt_func
+        interaction = create_mock_interaction()
+        interaction.message = None
+
+        with (
+            patch("src.clients.discord.commands.chat.PROMPT_STREAMING", True),
+            patch("src.clients.discord.commands.chat.InfoEmbedView") as mock_view_class,
+        ):
+            mock_view = MagicMock()
+            mock_view.initialize = AsyncMock()
+            mock_view.message = None
+            mock_view.embed = discord.Embed(description="Thinking...")
+            mock_view.embed.add_field(name="Prompt", value="Hello")
+            mock_view_class.return_value = mock_view
+
+            await func(interaction, prompt="Hello")
+
+        bot.ai_provider.chat_stream.assert_called_once()
+        bot.ai_provider.chat.assert_not_called()
+        # The first chunk is rendered as soon as it arrives
+        first_edit = interaction.edit_original_response.call_args_list[0]
+        assert first_edit.kwargs["embed"].fields[1].name == "Response"
+        bot.repo.add_message.assert_any_call(
+            99999, "Anthropic", "assistant", False, "Mock AI response"
+        )
+        final_notes = mock_view_class.call_args.kwargs["notes"]
+        assert final_notes[1] == {"name": "Response", "value": "Mock AI response"}
+
+    @pytest.mark.asyncio
+    async def test_prompt_does_not_stream_by_default(self, prompt_func: tuple) -> None:
+        """Test that streaming is opt-in via PROMPT_STREAMING."""
+        func, bot = prompt_func
+        interaction = create_mock_interaction()
+        interaction.message = None
+
+        with patch("src.clients.discord.commands.chat.InfoEmbedView") as mock_view_class:
+            mock_view_class.return_value.initialize = AsyncMock()
+            await func(interaction, prompt="Hello")
+
+        bot.ai_provider.chat.assert_called_once()
+        bot.ai_provider.chat_stream.assert_not_called()
+
 
 # --- Clear Command Tests ---
 
@@ -918,7 +974,7 @@ class TestSummarizeCommand:
         interaction = create_mock_interaction()
 
         # Empty context - nothing to summarize
-        bot.repo.get_visible_messages.return_value = []
+        bot.repo.get_visible_text_messages.return_value = []
 
         with patch(
             "src.clients.discord.commands.chat.InfoEmbedView"
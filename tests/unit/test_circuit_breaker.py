@@ -0,0 +1,202 @@
+"""Tests for per-provider circuit breakers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    get_circuit_breaker,
+)
+from src.core.errors import ErrorCategory, classify_error
+from src.core.haiku import HaikuError, haiku_complete
+from src.core.providers import ChatMessage, ImageRequest
+from src.providers.anthropic_provider import AnthropicProvider
+from src.providers.fal_provider import FalAIError, FalAIProvider
+
+
+class FakeClock:
+    """Settable monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def fail_with(breaker: CircuitBreaker, error: Exception) -> None:
+    """Run one guarded call that raises error."""
+    with pytest.raises(type(error)):
+        async with breaker.guard():
+            raise error
+
+
+def open_circuit(provider: str) -> None:
+    """Trip a provider's shared circuit breaker."""
+    breaker = get_circuit_breaker(provider)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    async def test_opens_after_threshold(self) -> None:
+        """Test that consecutive outage errors open the circuit."""
+        breaker = CircuitBreaker("test", failure_threshold=3)
+
+        for _ in range(2):
+            await fail_with(breaker, ConnectionError("Connection refused"))
+        assert breaker.state == CircuitState.CLOSED
+
+        await fail_with(breaker, ConnectionError("Connection refused"))
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.stats().opened == 1
+
+    async def test_open_circuit_fails_fast(self) -> None:
+        """Test that an open circuit rejects calls without running them."""
+        breaker = CircuitBreaker(
+            "test", failure_threshold=1, recovery_timeout=30, clock=FakeClock()
+        )
+        await fail_with(breaker, TimeoutError("timed out"))
+        call = AsyncMock()
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            async with breaker.guard():
+                await call()
+
+        call.assert_not_awaited()
+        assert exc_info.value.provider == "test"
+        assert exc_info.value.retry_after == 30
+        assert breaker.stats().rejected == 1
+
+    async def test_success_resets_failure_count(self) -> None:
+        """Test that only consecutive failures count toward the threshold."""
+        breaker = CircuitBreaker("test", failure_threshold=2)
+
+        await fail_with(breaker, ConnectionError("Connection refused"))
+        async with breaker.guard():
+            pass
+        await fail_with(breaker, ConnectionError("Connection refused"))
+
+        assert breaker.state == CircuitState.CLOSED
+
+    async def test_non_outage_errors_do_not_count(self) -> None:
+        """Test that errors showing the provider is up are not failures."""
+        breaker = CircuitBreaker("test", failure_threshold=1)
+
+        await fail_with(breaker, ValueError("bad request"))
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.stats().consecutive_failures == 0
+
+    async def test_successful_probe_closes_circuit(self) -> None:
+        """Test that a probe after the recovery timeout can close the circuit."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=30, clock=clock)
+        await fail_with(breaker, ConnectionError("Connection refused"))
+
+        clock.now += 30
+        assert breaker.state == CircuitState.HALF_OPEN
+        async with breaker.guard():
+            pass
+
+        assert breaker.state == CircuitState.CLOSED
+
+    async def test_failed_probe_reopens_circuit(self) -> None:
+        """Test that a failing probe opens the circuit for another timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=30, clock=clock)
+        for _ in range(3):
+            await fail_with(breaker, ConnectionError("Connection refused"))
+
+        clock.now += 30
+        await fail_with(breaker, ConnectionError("Connection still refused"))
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.stats().opened == 2
+        assert breaker.stats().retry_after == 30
+
+    async def test_one_probe_at_a_time(self) -> None:
+        """Test that calls are rejected while the probe is in flight."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=30, clock=clock)
+        await fail_with(breaker, ConnectionError("Connection refused"))
+        clock.now += 30
+        release = asyncio.Event()
+
+        async def probe() -> None:
+            async with breaker.guard():
+                await release.wait()
+
+        task = asyncio.create_task(probe())
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            async with breaker.guard():
+                pass
+        release.set()
+        await task
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_classified_as_service_unavailable(self) -> None:
+        """Test that classify_error keeps the category of CircuitOpenError."""
+        assert classify_error(CircuitOpenError("fal")) == ErrorCategory.SERVICE_UNAVAILABLE
+
+    def test_shared_per_provider(self) -> None:
+        """Test that each provider has one breaker per process."""
+        assert get_circuit_breaker("fal") is get_circuit_breaker("fal")
+        assert get_circuit_breaker("fal") is not get_circuit_breaker("serpapi")
+
+
+class TestProviderCircuitBreakers:
+    """Tests for circuit breakers wired into providers."""
+
+    async def test_anthropic_chat_fails_fast(self) -> None:
+        """Test that chat raises CircuitOpenError without calling the API."""
+        open_circuit("anthropic")
+
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_class:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock()
+            mock_class.return_value = mock_client
+
+            provider = AnthropicProvider(api_key="test-key")
+            with pytest.raises(CircuitOpenError):
+                await provider.chat([ChatMessage(role="user", content="Hello")])
+
+        mock_client.messages.create.assert_not_awaited()
+
+    async def test_haiku_raises_haiku_error(self) -> None:
+        """Test that an open Haiku circuit surfaces as HaikuError."""
+        open_circuit("haiku")
+
+        with (
+            patch("src.core.anthropic_clients.AsyncAnthropic") as mock_class,
+            patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}),
+        ):
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock()
+            mock_class.return_value = mock_client
+
+            with pytest.raises(HaikuError, match="unavailable"):
+                await haiku_complete("sys", "a cat")
+
+        mock_client.messages.create.assert_not_awaited()
+
+    async def test_fal_raises_fal_error(self) -> None:
+        """Test that an open Fal.AI circuit skips submission."""
+        open_circuit("fal")
+
+        with patch(
+            "src.providers.fal_provider.fal_client.submit_async"
+        ) as mock_submit:
+            provider = FalAIProvider(api_key="test-key")
+            with pytest.raises(FalAIError, match="unavailable"):
+                await provider.generate(ImageRequest(prompt="a cat"))
+
+        mock_submit.assert_not_called()
@@ -88,7 +88,7 @@ class TestScreenSearchQuery:
     async def test_allowed_query_returns_allowed(self) -> None:
         """Test that an allowed query returns ScreeningResult(allowed=True, reason=None)."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock API response for allowed query
             mock_response = MagicMock()
@@ -104,11 +104,38 @@ class TestScreenSearchQuery:
             assert result.allowed is True
             assert result.reason is None
 
+    @pytest.mark.asyncio
+    async def test_repeated_query_uses_cached_verdict(self) -> None:
+        """Test that a verdict is reused, but a failure is not cached."""
+        with patch(
+            "src.core.anthropic_clients.AsyncAnthropic"
+        ) as mock_client_class:
+            mock_response = MagicMock()
+            mock_response.content = [
+                MagicMock(text='{"allowed": false, "reason": "Harmful"}')
+            ]
+
+            mock_client = MagicMock()
+            mock_create = AsyncMock(
+                side_effect=[Exception("Network error"), mock_response]
+            )
+            mock_client.messages.create = mock_create
+            mock_client_class.return_value = mock_client
+
+            with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+                failed = await screen_search_query("bad query")
+                first = await screen_search_query("bad query")
+                second = await screen_search_query("bad query")
+
+            assert failed.reason == "Screening service unavailable"
+            assert first == second == ScreeningResult(allowed=False, reason="Harmful")
+            assert mock_create.await_count == 2
+
     @pytest.mark.asyncio
     async def test_blocked_query_returns_blocked_with_reason(self) -> None:
         """Test that a blocked query returns ScreeningResult(allowed=False, reason='...')."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock API response for blocked query
             mock_response = MagicMock()
@@ -132,7 +159,7 @@ class TestScreenSearchQuery:
     async def test_api_error_returns_service_unavailable(self) -> None:
         """Test that API error returns blocked with 'service unavailable' reason."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock API error
             mock_response_500 = MagicMock()
@@ -157,7 +184,7 @@ class TestScreenSearchQuery:
     async def test_json_parse_error_returns_service_unavailable(self) -> None:
         """Test that JSON parse error returns blocked with 'service unavailable' reason."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock response with invalid JSON
             mock_response = MagicMock()
@@ -189,7 +216,7 @@ class TestScreenSearchQuery:
     async def test_empty_response_returns_service_unavailable(self) -> None:
         """Test that empty API response returns blocked with 'service unavailable' reason."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock empty response
             mock_response = MagicMock()
@@ -211,7 +238,7 @@ class TestScreenSearchQuery:
     ) -> None:
         """Test that response missing 'allowed' field returns blocked."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock response with valid JSON but missing 'allowed' field
             mock_response = MagicMock()
@@ -233,7 +260,7 @@ class TestScreenSearchQuery:
     async def test_blocked_without_reason_uses_default(self) -> None:
         """Test that blocked response without reason uses default message."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock response blocked but no reason provided
             mock_response = MagicMock()
@@ -253,7 +280,7 @@ class TestScreenSearchQuery:
     async def test_uses_correct_model(self) -> None:
         """Test that the correct Haiku model is used."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text='{"allowed": true}')]
@@ -274,7 +301,7 @@ class TestScreenSearchQuery:
     async def test_query_included_in_prompt(self) -> None:
         """Test that the query is included in the message to the API."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text='{"allowed": true}')]
@@ -299,7 +326,7 @@ class TestScreenSearchQuery:
     ) -> None:
         """Test that unexpected exceptions return blocked with 'service unavailable'."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock unexpected exception
             mock_client = MagicMock()
@@ -318,7 +345,7 @@ class TestScreenSearchQuery:
     async def test_whitespace_in_json_response(self) -> None:
         """Test that JSON response with whitespace is parsed correctly."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock response with whitespace around JSON
             mock_response = MagicMock()
@@ -340,7 +367,7 @@ class TestScreenSearchQuery:
     async def test_markdown_wrapped_json_with_language_tag(self) -> None:
         """Test that JSON wrapped in ```json ... ``` is parsed correctly."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock response with markdown code block and language tag
             mock_response = MagicMock()
@@ -362,7 +389,7 @@ class TestScreenSearchQuery:
     async def test_markdown_wrapped_json_without_language_tag(self) -> None:
         """Test that JSON wrapped in ``` ... ``` is parsed correctly."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock response with markdown code block without language tag
             mock_response = MagicMock()
@@ -384,7 +411,7 @@ class TestScreenSearchQuery:
     async def test_markdown_wrapped_blocked_response(self) -> None:
         """Test that blocked JSON wrapped in markdown is parsed correctly."""
         with patch(
-            "src.core.content_screening.AsyncAnthropic"
+            "src.core.anthropic_clients.AsyncAnthropic"
         ) as mock_client_class:
             # Mock blocked response with markdown wrapper
             mock_response = MagicMock()
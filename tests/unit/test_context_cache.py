@@ -0,0 +1,287 @@
+"""Tests for the per-channel context cache and its use in RepositoryAdapter."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from src.adapters.context_cache import ContextCache
+from src.adapters.repository_compat import RepositoryAdapter
+from src.adapters.sqlite_repository import SQLiteRepository
+from src.ports.repositories import Message
+
+
+def make_message(message_id: int, text: str = "hello") -> dict:
+    """Build a context message dict like RepositoryAdapter produces."""
+    return {
+        "channel_message_id": message_id,
+        "message_type": "prompt",
+        "message_data": text,
+        "message_images": "[]",
+        "message_timestamp": "2026-01-01 00:00:00",
+    }
+
+
+class TestContextCache:
+    """Tests for ContextCache."""
+
+    def test_miss_then_hit(self) -> None:
+        """Test that a loaded context is served from memory and counted."""
+        cache = ContextCache()
+        assert cache.get(1, "All Models") is None
+
+        token = cache.start_load(1)
+        cache.finish_load(1, "All Models", token, [make_message(1)])
+
+        assert cache.get(1, "All Models") == [make_message(1)]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_ratio == 0.5
+
+    def test_get_returns_copies(self) -> None:
+        """Test that callers cannot mutate the cached context."""
+        cache = ContextCache()
+        cache.finish_load(1, "All Models", cache.start_load(1), [make_message(1)])
+
+        cache.get(1, "All Models")[0]["message_data"] = "mutated"  # type: ignore[index]
+
+        assert cache.get(1, "All Models") == [make_message(1)]
+
+    def test_append_updates_matching_views_only(self) -> None:
+        """Test that appends reach the vendor's view and the all-vendors view."""
+        cache = ContextCache()
+        cache.finish_load(1, "All Models", cache.start_load(1), [])
+        cache.finish_load(1, "Anthropic", cache.start_load(1), [])
+        cache.finish_load(1, "OpenAI", cache.start_load(1), [])
+
+        cache.append(1, "Anthropic", make_message(7))
+
+        assert cache.get(1, "All Models") == [make_message(7)]
+        assert cache.get(1, "Anthropic") == [make_message(7)]
+        assert cache.get(1, "OpenAI") == []
+
+    def test_append_to_uncached_channel_is_ignored(self) -> None:
+        """Test that appending to an uncached channel does not create an entry."""
+        cache = ContextCache()
+        cache.append(1, "Anthropic", make_message(7))
+        assert cache.get(1, "All Models") is None
+
+    def test_invalidate_drops_channel(self) -> None:
+        """Test that invalidation removes the channel and its bytes."""
+        cache = ContextCache()
+        cache.finish_load(1, "All Models", cache.start_load(1), [make_message(1)])
+
+        cache.invalidate(1)
+
+        assert cache.get(1, "All Models") is None
+        stats = cache.stats()
+        assert stats.invalidations == 1
+        assert stats.bytes == 0
+
+    def test_load_racing_a_write_is_discarded(self) -> None:
+        """Test that a load started before a write is not cached."""
+        cache = ContextCache()
+        token = cache.start_load(1)
+        cache.append(1, "Anthropic", make_message(2))
+
+        cache.finish_load(1, "All Models", token, [make_message(1)])
+
+        assert cache.get(1, "All Models") is None
+
+    def test_append_skips_message_already_loaded(self) -> None:
+        """Test that a load finishing before the write-through is not doubled."""
+        cache = ContextCache()
+        token = cache.start_load(1)
+        cache.finish_load(1, "All Models", token, [make_message(1), make_message(2)])
+
+        cache.append(1, "Anthropic", make_message(2))
+
+        assert cache.get(1, "All Models") == [make_message(1), make_message(2)]
+
+    def test_trim_keeps_messages_from_watermark(self) -> None:
+        """Test that trimming drops older messages and their bytes only."""
+        cache = ContextCache()
+        messages = [make_message(i) for i in (1, 2, 3)]
+        cache.finish_load(1, "All Models", cache.start_load(1), messages)
+        size = cache.stats().bytes
+
+        cache.trim(1, 3)
+
+        assert cache.get(1, "All Models") == [make_message(3)]
+        stats = cache.stats()
+        assert stats.invalidations == 0
+        assert stats.bytes == size // 3
+
+    def test_failed_load_is_not_cached(self) -> None:
+        """Test that a failed load leaves the channel uncached."""
+        cache = ContextCache()
+        cache.finish_load(1, "All Models", cache.start_load(1), None)
+        assert cache.get(1, "All Models") is None
+
+    def test_lru_eviction_by_channel_count(self) -> None:
+        """Test that the least recently used channel is evicted first."""
+        cache = ContextCache(max_channels=2)
+        for channel_id in (1, 2):
+            cache.finish_load(channel_id, "All Models", cache.start_load(channel_id), [])
+        cache.get(1, "All Models")  # 2 becomes least recently used
+        cache.finish_load(3, "All Models", cache.start_load(3), [])
+
+        assert cache.get(2, "All Models") is None
+        assert cache.get(1, "All Models") == []
+        assert cache.stats().evictions == 1
+
+    def test_eviction_by_bytes(self) -> None:
+        """Test that channels are evicted to stay within the byte budget."""
+        cache = ContextCache(max_bytes=2000)
+        cache.finish_load(1, "All Models", cache.start_load(1), [make_message(1, "x" * 1000)])
+        cache.finish_load(2, "All Models", cache.start_load(2), [make_message(2, "y" * 1000)])
+
+        assert cache.get(1, "All Models") is None
+        assert cache.get(2, "All Models") is not None
+        assert cache.stats().bytes <= 2000
+
+    def test_invalid_limits_rejected(self) -> None:
+        """Test that non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            ContextCache(max_channels=0)
+
+
+@pytest_asyncio.fixture
+async def adapter() -> RepositoryAdapter:
+    """Provides an adapter over an in-memory repository with one vendor."""
+    repo = SQLiteRepository(":memory:")
+    await repo.connect()
+    await repo.create_vendor("Anthropic", "claude")
+    await repo.create_channel(12345)
+    yield RepositoryAdapter(repo)
+    await repo.close()
+
+
+class TestAdapterContextCache:
+    """Tests for write-through caching in RepositoryAdapter."""
+
+    async def test_hot_channel_reads_without_database(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that a cached channel builds context with no DB read."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "Hi")
+        first = await adapter.get_visible_text_messages(12345, "All Models")
+        await adapter.add_message(12345, "Anthropic", "assistant", False, "Hello")
+
+        with patch.object(
+            adapter._repo, "get_visible_text_messages", side_effect=AssertionError
+        ):
+            cached = await adapter.get_visible_text_messages(12345, "All Models")
+
+        assert [m["message_data"] for m in first] == ["Hi"]
+        assert [m["message_data"] for m in cached] == ["Hi", "Hello"]
+        assert adapter.context_cache_stats()["hits"] == 1
+
+    async def test_cached_context_matches_database(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that written-through context matches what SQLite returns."""
+        await adapter.get_visible_text_messages(12345, "All Models")
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "Hi")
+        await adapter.add_message(12345, "Anthropic", "prompt", True, "image prompt")
+        await adapter.add_message(12345, "Anthropic", "assistant", False, "Hello")
+
+        cached = await adapter.get_visible_text_messages(12345, "All Models")
+        stored = await adapter._repo.get_visible_text_messages(12345, "All Models")
+
+        assert [m["channel_message_id"] for m in cached] == [m.id for m in stored]
+
+    @pytest.mark.parametrize("vendor", ["All Models", "Anthropic"])
+    async def test_context_changes_invalidate(
+        self, adapter: RepositoryAdapter, vendor: str
+    ) -> None:
+        """Test that clearing, or deactivating one vendor, drops the context."""
+        for text in ("one", "two", "three"):
+            await adapter.add_message(12345, "Anthropic", "prompt", False, text)
+        await adapter.get_visible_text_messages(12345, "All Models")
+
+        if vendor == "All Models":
+            await adapter.clear_messages(12345, vendor)
+            expected: list[str] = []
+        else:
+            await adapter.deactivate_old_messages(12345, vendor, 1)
+            expected = ["three"]
+
+        context = await adapter.get_visible_text_messages(12345, "All Models")
+        assert [m["message_data"] for m in context] == expected
+        assert adapter.context_cache_stats()["invalidations"] == 1
+
+    async def test_sliding_window_trims_instead_of_invalidating(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that a steady-state /prompt loop keeps hitting the cache."""
+        window = 4
+        for turn in range(10):
+            await adapter.add_message(12345, "Anthropic", "prompt", False, f"q{turn}")
+            context = await adapter.get_visible_text_messages(12345, "All Models")
+            if len(context) >= window:
+                await adapter.deactivate_old_messages(12345, "All Models", window)
+            await adapter.add_message(
+                12345, "Anthropic", "assistant", False, f"a{turn}"
+            )
+
+        cached = await adapter.get_visible_text_messages(12345, "All Models")
+        stored = await adapter._repo.get_visible_text_messages(12345, "All Models")
+        stats = adapter.context_cache_stats()
+        assert [m["channel_message_id"] for m in cached] == [m.id for m in stored]
+        assert (stats["misses"], stats["hits"], stats["invalidations"]) == (1, 10, 0)
+
+    async def test_load_after_commit_does_not_duplicate_message(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test a load that reads a new row before it is written through."""
+        save = adapter._repo.save_message
+        loaded: list[list[str]] = []
+
+        async def save_then_load(message: Message) -> int:
+            message_id = await save(message)
+            # Another command reads the context between commit and append
+            context = await adapter.get_visible_text_messages(12345, "All Models")
+            loaded.append([m["message_data"] for m in context])
+            return message_id
+
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "Hi")
+        with patch.object(adapter._repo, "save_message", side_effect=save_then_load):
+            await adapter.add_message(12345, "Anthropic", "assistant", False, "Hello")
+
+        cached = await adapter.get_visible_text_messages(12345, "All Models")
+        assert loaded == [["Hi", "Hello"]]
+        assert [m["message_data"] for m in cached] == ["Hi", "Hello"]
+
+    async def test_summarization_replacement_rebuilds_context(
+        self, adapter: RepositoryAdapter
+    ) -> None:
+        """Test that replacing history with a summary is reflected."""
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "long history")
+        await adapter.get_visible_text_messages(12345, "All Models")
+
+        await adapter.clear_messages(12345, "All Models")
+        await adapter.add_message(12345, "Anthropic", "assistant", False, "summary")
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "next")
+
+        context = await adapter.get_visible_text_messages(12345, "All Models")
+        assert [m["message_data"] for m in context] == ["summary", "next"]
+
+    async def test_message_counted_off_the_event_loop(
+        self, adapter: RepositoryAdapter, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the count shared by SQLite and the cache is taken off the loop."""
+        counted_on: list[threading.Thread] = []
+
+        def count(text: str) -> int:
+            counted_on.append(threading.current_thread())
+            return len(text.split())
+
+        monkeypatch.setattr("src.adapters.repository_compat.try_count_tokens", count)
+        await adapter.get_visible_text_messages(12345, "All Models")
+        await adapter.add_message(12345, "Anthropic", "prompt", False, "one two")
+
+        cached = await adapter.get_visible_text_messages(12345, "All Models")
+        assert counted_on and threading.current_thread() not in counted_on
+        assert cached[0]["token_count"] == 2
@@ -170,3 +170,78 @@ class TestWindowingEdgeCases:
         # ChatMessage only has role and content, no timestamp
         assert context.messages[0].role == "user"
         assert context.messages[0].content == "content"
+
+
+def row(message_type: str, text: str, token_count: int | None = None) -> dict:
+    """Build a repository context row."""
+    return {"message_type": message_type, "message_data": text, "token_count": token_count}
+
+
+class TestBuildFromContext:
+    """Tests for token-budget windowing of repository context."""
+
+    def test_uses_stored_token_counts(self):
+        """Stored counts, not the character heuristic, drive the window."""
+        builder = ContextBuilder(max_tokens=100)
+        context = [
+            row("prompt", "a", 60),
+            row("assistant", "b", 30),
+            row("prompt", "c", 50),
+            row("assistant", "d", 40),
+        ]
+        result = builder.build_from_context(context)
+        assert [m.content for m in result.messages] == ["c", "d"]
+        assert result.total_tokens_estimate == 90
+
+    def test_extracts_system_prompt_and_counts_it(self):
+        """The latest behavior message becomes the system prompt and uses budget."""
+        builder = ContextBuilder(max_tokens=100)
+        context = [
+            row("behavior", "old", 5),
+            row("behavior", "be brief", 60),
+            row("prompt", "a", 30),
+            row("assistant", "b", 30),
+            row("prompt", "c", 30),
+        ]
+        result = builder.build_from_context(context)
+        assert result.system_prompt == "be brief"
+        assert [m.content for m in result.messages] == ["c"]
+        assert result.total_tokens_estimate == 90
+
+    def test_window_starts_with_user_message(self):
+        """A window that would open on an assistant turn is trimmed to a user turn."""
+        builder = ContextBuilder(max_tokens=30)
+        context = [
+            row("prompt", "a", 10),
+            row("assistant", "b", 10),
+            row("prompt", "c", 10),
+            row("assistant", "d", 10),
+        ]
+        result = builder.build_from_context(context)
+        assert [m.role for m in result.messages] == ["user", "assistant"]
+        assert result.total_tokens_estimate == 20
+
+    def test_newest_message_always_kept(self):
+        """An oversized prompt is still sent rather than an empty conversation."""
+        builder = ContextBuilder(max_tokens=10)
+        result = builder.build_from_context([row("prompt", "huge", 500)])
+        assert [m.content for m in result.messages] == ["huge"]
+
+    def test_respects_max_messages(self):
+        """The message limit applies alongside the token budget."""
+        builder = ContextBuilder(max_messages=3)
+        context = [row("prompt" if i % 2 == 0 else "assistant", str(i), 1) for i in range(9)]
+        result = builder.build_from_context(context)
+        assert [m.content for m in result.messages] == ["6", "7", "8"]
+
+    def test_estimates_missing_counts(self):
+        """Rows without a stored count fall back to estimate_tokens."""
+        builder = ContextBuilder()
+        result = builder.build_from_context([row("prompt", "x" * 40)])
+        assert result.total_tokens_estimate == 10
+
+    def test_empty_context(self):
+        """Empty context builds an empty conversation."""
+        result = ContextBuilder().build_from_context([])
+        assert result.messages == []
+        assert result.system_prompt is None
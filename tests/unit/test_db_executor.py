@@ -0,0 +1,104 @@
+"""Unit tests for the dedicated database executor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import pytest_asyncio
+
+from src.adapters.db_executor import DatabaseExecutor
+
+
+@pytest_asyncio.fixture
+async def executor() -> DatabaseExecutor:
+    """Provide an executor with two reader threads, shut down after the test."""
+    db_executor = DatabaseExecutor(reader_threads=2)
+    yield db_executor
+    await db_executor.shutdown()
+
+
+class TestDatabaseExecutor:
+    """Tests for DatabaseExecutor lanes."""
+
+    async def test_run_read_returns_result(self, executor: DatabaseExecutor) -> None:
+        """Reads should return the function's result."""
+        assert await executor.run_read(lambda x: x * 2, 21) == 42
+
+    async def test_run_write_propagates_exception(
+        self, executor: DatabaseExecutor
+    ) -> None:
+        """Exceptions raised on the writer thread should reach the caller."""
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await executor.run_write(fail)
+
+        assert executor.stats()["writer"]["completed"] == 1
+
+    async def test_writes_run_in_submission_order(
+        self, executor: DatabaseExecutor
+    ) -> None:
+        """The single writer thread should apply writes in order."""
+        order: list[int] = []
+
+        def append(i: int) -> None:
+            time.sleep(0.001)
+            order.append(i)
+
+        await asyncio.gather(*(executor.run_write(append, i) for i in range(20)))
+
+        assert order == list(range(20))
+
+    async def test_uses_named_threads(self, executor: DatabaseExecutor) -> None:
+        """Work should run on the executor's own threads, not the default pool."""
+
+        def name() -> str:
+            return threading.current_thread().name
+
+        assert (await executor.run_read(name)).startswith("db-reader")
+        assert (await executor.run_write(name)).startswith("db-writer")
+
+    async def test_stats_record_queue_wait(self, executor: DatabaseExecutor) -> None:
+        """A write stuck behind a slow write should report queueing time."""
+        release = threading.Event()
+
+        slow = asyncio.ensure_future(executor.run_write(release.wait, 5))
+        queued = asyncio.ensure_future(executor.run_write(lambda: None))
+        await asyncio.sleep(0.05)
+
+        stats = executor.stats()["writer"]
+        assert stats["in_flight"] == 1
+        assert stats["queue_depth"] == 1
+
+        release.set()
+        await asyncio.gather(slow, queued)
+
+        stats = executor.stats()["writer"]
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["completed"] == 2
+        assert stats["max_wait_ms"] >= 40
+
+    async def test_cancelled_queued_job_is_not_double_counted(
+        self, executor: DatabaseExecutor
+    ) -> None:
+        """Cancelling a queued job should leave queue depth consistent."""
+        release = threading.Event()
+
+        slow = asyncio.ensure_future(executor.run_write(release.wait, 5))
+        queued = asyncio.ensure_future(executor.run_write(lambda: None))
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        release.set()
+        await slow
+
+        await asyncio.sleep(0.05)
+        assert executor.stats()["writer"]["queue_depth"] == 0
+
+    def test_rejects_zero_reader_threads(self) -> None:
+        """At least one reader thread is required."""
+        with pytest.raises(ValueError, match="reader_threads"):
+            DatabaseExecutor(reader_threads=0)
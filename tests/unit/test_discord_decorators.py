@@ -1,7 +1,7 @@
 """Tests for Discord command decorators."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -13,6 +13,7 @@ from src.clients.discord.decorators import (
     _log_usage,
     count_command,
 )
+from src.ports.repositories import UsageEvent
 
 
 class TestCommandClassification:
@@ -98,10 +99,7 @@ class TestLogUsage:
     def mock_bot(self) -> MagicMock:
         """Create a mock Discord bot."""
         bot = MagicMock()
-        bot.repo = AsyncMock()
-        bot.repo.is_user_whitelisted = AsyncMock(return_value=True)
-        bot.repo.is_user_banned = AsyncMock(return_value=False)
-        bot.repo.log_command_usage = AsyncMock()
+        bot.usage_logger = MagicMock()
         return bot
 
     @pytest.fixture
@@ -116,64 +114,42 @@ class TestLogUsage:
         return interaction
 
     @pytest.mark.asyncio
-    async def test_logs_usage_for_whitelisted_user(
+    async def test_queues_usage_event(
         self, mock_bot: MagicMock, mock_interaction: MagicMock
     ) -> None:
-        """Test that usage is logged for whitelisted, non-banned users."""
-        await _log_usage(mock_interaction, "prompt", "success")
-
-        mock_bot.repo.log_command_usage.assert_called_once_with(
-            user_id=123456789,
-            username="testuser",
-            guild_id=987654321,
-            command_name="prompt",
-            command_type="text",
-            outcome="success",
-        )
-
-    @pytest.mark.asyncio
-    async def test_skips_logging_for_non_whitelisted_user(
-        self, mock_bot: MagicMock, mock_interaction: MagicMock
-    ) -> None:
-        """Test that usage is not logged for non-whitelisted users."""
-        mock_bot.repo.is_user_whitelisted.return_value = False
-
-        await _log_usage(mock_interaction, "prompt", "success")
-
-        mock_bot.repo.log_command_usage.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_skips_logging_for_banned_user(
-        self, mock_bot: MagicMock, mock_interaction: MagicMock
-    ) -> None:
-        """Test that usage is not logged for banned users."""
-        mock_bot.repo.is_user_banned.return_value = True
-
-        await _log_usage(mock_interaction, "prompt", "success")
-
-        mock_bot.repo.log_command_usage.assert_not_called()
+        """Test that a tracked command queues a usage event."""
+        _log_usage(mock_interaction, "prompt", "success")
+
+        mock_bot.usage_logger.record.assert_called_once()
+        event = mock_bot.usage_logger.record.call_args.args[0]
+        assert isinstance(event, UsageEvent)
+        assert event.user_id == 123456789
+        assert event.username == "testuser"
+        assert event.guild_id == 987654321
+        assert event.command_name == "prompt"
+        assert event.command_type == "text"
+        assert event.outcome == "success"
+        assert event.timestamp.tzinfo is not None
 
     @pytest.mark.asyncio
     async def test_skips_logging_for_untracked_command(
         self, mock_bot: MagicMock, mock_interaction: MagicMock
     ) -> None:
         """Test that usage is not logged for untracked commands."""
-        await _log_usage(mock_interaction, "ban", "success")
+        _log_usage(mock_interaction, "ban", "success")
 
-        mock_bot.repo.log_command_usage.assert_not_called()
-        # Should not even check whitelist for untracked commands
-        mock_bot.repo.is_user_whitelisted.assert_not_called()
+        mock_bot.usage_logger.record.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_logs_image_command_type(
         self, mock_bot: MagicMock, mock_interaction: MagicMock
     ) -> None:
         """Test that image commands are logged with 'image' type."""
-        await _log_usage(mock_interaction, "create_image", "success")
+        _log_usage(mock_interaction, "create_image", "success")
 
-        mock_bot.repo.log_command_usage.assert_called_once()
-        call_kwargs = mock_bot.repo.log_command_usage.call_args.kwargs
-        assert call_kwargs["command_type"] == "image"
+        mock_bot.usage_logger.record.assert_called_once()
+        event = mock_bot.usage_logger.record.call_args.args[0]
+        assert event.command_type == "image"
 
     @pytest.mark.asyncio
     async def test_logs_various_outcomes(
@@ -183,21 +159,21 @@ class TestLogUsage:
         outcomes = ["success", "error", "timeout", "cancelled", "rate_limited"]
 
         for outcome in outcomes:
-            mock_bot.repo.log_command_usage.reset_mock()
-            await _log_usage(mock_interaction, "prompt", outcome)
+            mock_bot.usage_logger.record.reset_mock()
+            _log_usage(mock_interaction, "prompt", outcome)
 
-            call_kwargs = mock_bot.repo.log_command_usage.call_args.kwargs
-            assert call_kwargs["outcome"] == outcome
+            event = mock_bot.usage_logger.record.call_args.args[0]
+            assert event.outcome == outcome
 
     @pytest.mark.asyncio
     async def test_handles_logging_failure_gracefully(
         self, mock_bot: MagicMock, mock_interaction: MagicMock
     ) -> None:
         """Test that logging failures don't raise exceptions."""
-        mock_bot.repo.log_command_usage.side_effect = Exception("DB error")
+        mock_bot.usage_logger.record.side_effect = Exception("logger error")
 
         # Should not raise
-        await _log_usage(mock_interaction, "prompt", "success")
+        _log_usage(mock_interaction, "prompt", "success")
 
 
 class TestCountCommandDecorator:
@@ -207,10 +183,7 @@ class TestCountCommandDecorator:
     def mock_bot(self) -> MagicMock:
         """Create a mock Discord bot."""
         bot = MagicMock()
-        bot.repo = AsyncMock()
-        bot.repo.is_user_whitelisted = AsyncMock(return_value=True)
-        bot.repo.is_user_banned = AsyncMock(return_value=False)
-        bot.repo.log_command_usage = AsyncMock()
+        bot.usage_logger = MagicMock()
         return bot
 
     @pytest.fixture
@@ -238,10 +211,10 @@ class TestCountCommandDecorator:
         result = await prompt(mock_interaction)
 
         assert result == "result"
-        mock_bot.repo.log_command_usage.assert_called_once()
-        call_kwargs = mock_bot.repo.log_command_usage.call_args.kwargs
-        assert call_kwargs["outcome"] == "success"
-        assert call_kwargs["command_name"] == "prompt"
+        mock_bot.usage_logger.record.assert_called_once()
+        event = mock_bot.usage_logger.record.call_args.args[0]
+        assert event.outcome == "success"
+        assert event.command_name == "prompt"
 
     @pytest.mark.asyncio
     async def test_failed_command_logs_error(
@@ -256,9 +229,9 @@ class TestCountCommandDecorator:
         with pytest.raises(ValueError):
             await prompt(mock_interaction)
 
-        mock_bot.repo.log_command_usage.assert_called_once()
-        call_kwargs = mock_bot.repo.log_command_usage.call_args.kwargs
-        assert call_kwargs["outcome"] == "error"
+        mock_bot.usage_logger.record.assert_called_once()
+        event = mock_bot.usage_logger.record.call_args.args[0]
+        assert event.outcome == "error"
 
     @pytest.mark.asyncio
     async def test_timeout_command_logs_timeout(
@@ -273,9 +246,9 @@ class TestCountCommandDecorator:
         with pytest.raises(TimeoutError):
             await prompt(mock_interaction)
 
-        mock_bot.repo.log_command_usage.assert_called_once()
-        call_kwargs = mock_bot.repo.log_command_usage.call_args.kwargs
-        assert call_kwargs["outcome"] == "timeout"
+        mock_bot.usage_logger.record.assert_called_once()
+        event = mock_bot.usage_logger.record.call_args.args[0]
+        assert event.outcome == "timeout"
 
     @pytest.mark.asyncio
     async def test_cancelled_command_logs_cancelled(
@@ -290,9 +263,9 @@ class TestCountCommandDecorator:
         with pytest.raises(asyncio.CancelledError):
             await prompt(mock_interaction)
 
-        mock_bot.repo.log_command_usage.assert_called_once()
-        call_kwargs = mock_bot.repo.log_command_usage.call_args.kwargs
-        assert call_kwargs["outcome"] == "cancelled"
+        mock_bot.usage_logger.record.assert_called_once()
+        event = mock_bot.usage_logger.record.call_args.args[0]
+        assert event.outcome == "cancelled"
 
     @pytest.mark.asyncio
     async def test_rate_limited_command_logs_rate_limited(
@@ -312,9 +285,9 @@ class TestCountCommandDecorator:
         with pytest.raises(RateLimitError):
             await prompt(mock_interaction)
 
-        mock_bot.repo.log_command_usage.assert_called_once()
-        call_kwargs = mock_bot.repo.log_command_usage.call_args.kwargs
-        assert call_kwargs["outcome"] == "rate_limited"
+        mock_bot.usage_logger.record.assert_called_once()
+        event = mock_bot.usage_logger.record.call_args.args[0]
+        assert event.outcome == "rate_limited"
 
     @pytest.mark.asyncio
     async def test_preserves_function_metadata(self) -> None:
@@ -341,4 +314,4 @@ class TestCountCommandDecorator:
         await ban(mock_interaction)
 
         # Untracked command - should not log
-        mock_bot.repo.log_command_usage.assert_not_called()
+        mock_bot.usage_logger.record.assert_not_called()
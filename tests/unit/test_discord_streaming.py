@@ -0,0 +1,167 @@
+"""Tests for throttled rendering of streamed responses."""
+
+import asyncio
+
+import pytest
+
+from src.clients.discord.streaming import ThrottledStreamEditor, stream_preview
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestThrottledStreamEditor:
+    """Tests for ThrottledStreamEditor."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def renders(self) -> list[str]:
+        return []
+
+    @pytest.fixture
+    def editor(self, clock: FakeClock, renders: list[str]) -> ThrottledStreamEditor:
+        async def render(text: str) -> None:
+            renders.append(text)
+
+        return ThrottledStreamEditor(
+            render, interval=0.75, token_threshold=200, clock=clock
+        )
+
+    async def test_first_chunk_renders_immediately(
+        self, editor: ThrottledStreamEditor, renders: list[str]
+    ) -> None:
+        """Test that the first chunk is shown without waiting."""
+        editor.feed("Hello")
+        await asyncio.sleep(0)
+        assert renders == ["Hello"]
+        await editor.close()
+
+    async def test_chunks_coalesce_within_interval(
+        self, editor: ThrottledStreamEditor, clock: FakeClock, renders: list[str]
+    ) -> None:
+        """Test that chunks arriving within the interval share one edit."""
+        editor.feed("a")
+        await asyncio.sleep(0)
+        for chunk in ("b", "c", "d"):
+            clock.now += 0.1
+            editor.feed(chunk)
+            await asyncio.sleep(0)
+        assert renders == ["a"]
+
+        clock.now += 0.5
+        editor.feed("e")
+        await asyncio.sleep(0)
+        assert renders == ["a", "abcde"]
+        await editor.close()
+
+    async def test_token_threshold_renders_early(
+        self, editor: ThrottledStreamEditor, renders: list[str]
+    ) -> None:
+        """Test that a large backlog is rendered before the interval."""
+        editor.feed("a")
+        await asyncio.sleep(0)
+        editor.feed("x" * 799)
+        await asyncio.sleep(0)
+        assert len(renders) == 1
+        editor.feed("x")
+        await asyncio.sleep(0)
+        assert len(renders) == 2
+        await editor.close()
+
+    async def test_flush_renders_only_pending_text(
+        self, editor: ThrottledStreamEditor, renders: list[str]
+    ) -> None:
+        """Test that flush renders leftovers and is a no-op otherwise."""
+        editor.feed("a")
+        await asyncio.sleep(0)
+        editor.feed("b")
+        await editor.flush()
+        await editor.flush()
+        assert renders == ["a", "ab"]
+        assert editor.text == "ab"
+
+    async def test_slow_edit_does_not_block_feed(self, clock: FakeClock) -> None:
+        """Test that chunks keep flowing while an edit is in flight."""
+        release = asyncio.Event()
+        renders: list[str] = []
+
+        async def render(text: str) -> None:
+            renders.append(text)
+            await release.wait()
+
+        editor = ThrottledStreamEditor(render, interval=0.75, clock=clock)
+        editor.feed("a")
+        await asyncio.sleep(0)
+        for chunk in ("b", "c"):
+            clock.now += 1.0
+            editor.feed(chunk)
+            await asyncio.sleep(0)
+        assert renders == ["a"]
+
+        release.set()
+        await editor.flush()
+        # Both requests made during the slow edit collapse into the newest text
+        assert renders == ["a", "abc"]
+        assert editor.edits == 2
+
+    async def test_close_drops_pending_but_waits_for_edit_in_flight(
+        self, clock: FakeClock
+    ) -> None:
+        """Test that close lets the current edit finish and skips queued ones."""
+        release = asyncio.Event()
+        renders: list[str] = []
+
+        async def render(text: str) -> None:
+            renders.append(text)
+            await release.wait()
+
+        editor = ThrottledStreamEditor(render, interval=0.75, clock=clock)
+        editor.feed("a")
+        await asyncio.sleep(0)
+        clock.now += 1.0
+        editor.feed("b")
+
+        closing = asyncio.create_task(editor.close())
+        await asyncio.sleep(0)
+        assert not closing.done()
+        release.set()
+        await closing
+        assert renders == ["a"]
+        assert editor.edits == 1
+
+    async def test_failed_render_does_not_stop_stream(self, clock: FakeClock) -> None:
+        """Test that an edit error is logged and streaming continues."""
+
+        async def render(text: str) -> None:
+            raise RuntimeError("rate limited")
+
+        editor = ThrottledStreamEditor(render, clock=clock)
+        editor.feed("a")
+        await asyncio.sleep(0)
+        clock.now += 1.0
+        editor.feed("b")
+        await editor.flush()
+        assert editor.text == "ab"
+        assert editor.edits == 0
+
+
+class TestStreamPreview:
+    """Tests for stream_preview."""
+
+    def test_short_text_unchanged(self) -> None:
+        """Test that text within the limit is returned as is."""
+        assert stream_preview("hello", limit=10) == "hello"
+
+    def test_long_text_keeps_tail(self) -> None:
+        """Test that long text keeps its newest characters."""
+        assert stream_preview("abcdefghij", limit=5) == "…ghij"
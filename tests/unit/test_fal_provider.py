@@ -11,12 +11,15 @@ Tests the Fal.AI image generation provider implementation including:
 
 from __future__ import annotations
 
+import asyncio
 import base64
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import fal_client
 import pytest
 
+from src.core.bulkhead import BULKHEAD_LIMITS, get_bulkhead
 from src.core.providers import (
     GeneratedImage,
     ImageModifyRequest,
@@ -24,20 +27,22 @@ from src.core.providers import (
 )
 from src.providers.fal_provider import FalAIError, FalAIProvider
 
+COMPLETED = fal_client.Completed(logs=None, metrics={})
+
 
 def create_mock_handler(result: dict[str, Any]) -> MagicMock:
-    """Create a mock handler that simulates fal_client.submit() return value.
+    """Create a mock handler that simulates fal_client.submit_async() return value.
 
     Args:
         result: The result dict to return from handler.get()
 
     Returns:
-        A MagicMock configured to behave like SyncRequestHandle
+        A MagicMock configured to behave like AsyncRequestHandle
     """
     handler = MagicMock()
     handler.request_id = "test-request-id-12345"
-    handler.iter_events.return_value = iter([])  # No events, just complete
-    handler.get.return_value = result
+    handler.status = AsyncMock(return_value=COMPLETED)  # Already complete
+    handler.get = AsyncMock(return_value=result)
     return handler
 
 
@@ -100,7 +105,7 @@ class TestImageGeneration:
         mock_handler = create_mock_handler(mock_fal_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -122,7 +127,7 @@ class TestImageGeneration:
         mock_handler = create_mock_handler(mock_fal_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -140,7 +145,7 @@ class TestImageGeneration:
         mock_handler = create_mock_handler(mock_fal_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -169,7 +174,7 @@ class TestImageGeneration:
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -188,7 +193,7 @@ class TestImageGeneration:
         mock_handler = create_mock_handler(mock_fal_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -210,7 +215,7 @@ class TestImageGeneration:
         mock_handler = create_mock_handler(mock_fal_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -228,7 +233,7 @@ class TestImageGeneration:
         mock_handler = create_mock_handler(mock_fal_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -247,7 +252,7 @@ class TestImageGeneration:
         mock_handler = create_mock_handler(mock_fal_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -270,7 +275,7 @@ class TestImageGeneration:
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -290,7 +295,7 @@ class TestImageGeneration:
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -335,9 +340,9 @@ class TestImageModification:
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_upload.return_value = "https://fal.ai/uploaded.jpg"
             mock_submit.return_value = mock_handler
@@ -361,9 +366,9 @@ class TestImageModification:
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_upload.return_value = "https://fal.ai/uploaded.jpg"
             mock_submit.return_value = mock_handler
@@ -388,9 +393,9 @@ class TestImageModification:
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_upload.return_value = "https://fal.ai/uploaded.jpg"
             mock_submit.return_value = mock_handler
@@ -414,9 +419,9 @@ class TestImageModification:
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_upload.return_value = "https://fal.ai/uploaded.jpg"
             mock_submit.return_value = mock_handler
@@ -439,9 +444,9 @@ class TestImageModification:
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_upload.return_value = "https://fal.ai/uploaded.jpg"
             mock_submit.return_value = mock_handler
@@ -466,9 +471,9 @@ class TestImageModification:
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_upload.return_value = "https://fal.ai/uploaded.jpg"
             mock_submit.return_value = mock_handler
@@ -516,7 +521,7 @@ class TestErrorHandling:
     ) -> None:
         """Test that API errors during submission are wrapped in FalAIError."""
         with patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.side_effect = Exception("API connection failed")
 
@@ -537,7 +542,7 @@ class TestErrorHandling:
         image_data = base64.b64encode(b"test").decode("utf-8")
 
         with patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload:
             mock_upload.side_effect = Exception("Upload failed")
 
@@ -556,9 +561,9 @@ class TestErrorHandling:
         image_data = base64.b64encode(b"test").decode("utf-8")
 
         with patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_upload.return_value = "https://fal.ai/uploaded.jpg"
             mock_submit.side_effect = Exception("Modification failed")
@@ -595,7 +600,7 @@ class TestRetryBehavior:
     ) -> None:
         """Test that submission errors are NOT retried (prevents double-charging)."""
         with patch("asyncio.sleep") as mock_sleep, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.side_effect = Exception("Network error: connection reset")
 
@@ -617,11 +622,11 @@ class TestRetryBehavior:
         """Test that network errors during polling trigger retries."""
         mock_handler = MagicMock()
         mock_handler.request_id = "test-id"
-        # iter_events fails with network error
-        mock_handler.iter_events.side_effect = Exception("Network error: connection reset")
+        # status fails with network error
+        mock_handler.status = AsyncMock(side_effect=Exception("Network error: connection reset"))
 
         with patch("asyncio.sleep") as mock_sleep, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -632,8 +637,8 @@ class TestRetryBehavior:
 
             # Submit called once (not retried)
             assert mock_submit.call_count == 1
-            # iter_events retried 4 times (1 initial + 3 retries)
-            assert mock_handler.iter_events.call_count == 4
+            # status retried 4 times (1 initial + 3 retries)
+            assert mock_handler.status.call_count == 4
             # Sleep called 3 times between retries
             assert mock_sleep.call_count == 3
             assert "after 4 attempts" in str(exc_info.value)
@@ -645,10 +650,10 @@ class TestRetryBehavior:
         """Test that rate limit errors (429) during polling trigger retries."""
         mock_handler = MagicMock()
         mock_handler.request_id = "test-id"
-        mock_handler.iter_events.side_effect = Exception("HTTP 429: rate limit exceeded")
+        mock_handler.status = AsyncMock(side_effect=Exception("HTTP 429: rate limit exceeded"))
 
         with patch("asyncio.sleep") as mock_sleep, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -659,7 +664,7 @@ class TestRetryBehavior:
 
             # Submit called once, polling retried
             assert mock_submit.call_count == 1
-            assert mock_handler.iter_events.call_count == 4
+            assert mock_handler.status.call_count == 4
             assert mock_sleep.call_count == 3
 
     @pytest.mark.asyncio
@@ -669,10 +674,10 @@ class TestRetryBehavior:
         """Test that 503 errors during polling trigger retries."""
         mock_handler = MagicMock()
         mock_handler.request_id = "test-id"
-        mock_handler.iter_events.side_effect = Exception("HTTP 503: service unavailable")
+        mock_handler.status = AsyncMock(side_effect=Exception("HTTP 503: service unavailable"))
 
         with patch("asyncio.sleep") as mock_sleep, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -683,7 +688,7 @@ class TestRetryBehavior:
 
             # Submit called once, polling retried
             assert mock_submit.call_count == 1
-            assert mock_handler.iter_events.call_count == 4
+            assert mock_handler.status.call_count == 4
             assert mock_sleep.call_count == 3
 
     @pytest.mark.asyncio
@@ -693,10 +698,10 @@ class TestRetryBehavior:
         """Test that authentication errors (401) during polling fail immediately."""
         mock_handler = MagicMock()
         mock_handler.request_id = "test-id"
-        mock_handler.iter_events.side_effect = Exception("HTTP 401: unauthorized")
+        mock_handler.status = AsyncMock(side_effect=Exception("HTTP 401: unauthorized"))
 
         with patch("asyncio.sleep") as mock_sleep, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -707,7 +712,7 @@ class TestRetryBehavior:
 
             # Should fail immediately without retries
             assert mock_submit.call_count == 1
-            assert mock_handler.iter_events.call_count == 1
+            assert mock_handler.status.call_count == 1
             assert mock_sleep.call_count == 0
             # Should NOT say "after X attempts"
             assert "after" not in str(exc_info.value).lower() or "attempts" not in str(exc_info.value).lower()
@@ -719,10 +724,10 @@ class TestRetryBehavior:
         """Test that bad request errors (400) during polling fail immediately."""
         mock_handler = MagicMock()
         mock_handler.request_id = "test-id"
-        mock_handler.iter_events.side_effect = Exception("HTTP 400: bad request")
+        mock_handler.status = AsyncMock(side_effect=Exception("HTTP 400: bad request"))
 
         with patch("asyncio.sleep") as mock_sleep, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -733,7 +738,7 @@ class TestRetryBehavior:
 
             # Should fail immediately without retries
             assert mock_submit.call_count == 1
-            assert mock_handler.iter_events.call_count == 1
+            assert mock_handler.status.call_count == 1
             assert mock_sleep.call_count == 0
 
     @pytest.mark.asyncio
@@ -743,10 +748,10 @@ class TestRetryBehavior:
         """Test that forbidden errors (403) during polling fail immediately."""
         mock_handler = MagicMock()
         mock_handler.request_id = "test-id"
-        mock_handler.iter_events.side_effect = Exception("HTTP 403: forbidden")
+        mock_handler.status = AsyncMock(side_effect=Exception("HTTP 403: forbidden"))
 
         with patch("asyncio.sleep") as mock_sleep, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -757,7 +762,7 @@ class TestRetryBehavior:
 
             # Should fail immediately without retries
             assert mock_submit.call_count == 1
-            assert mock_handler.iter_events.call_count == 1
+            assert mock_handler.status.call_count == 1
             assert mock_sleep.call_count == 0
 
     @pytest.mark.asyncio
@@ -768,10 +773,10 @@ class TestRetryBehavior:
         mock_handler = MagicMock()
         mock_handler.request_id = "test-id"
         # Use "connection" to trigger NETWORK classification (retryable)
-        mock_handler.iter_events.side_effect = Exception("connection error")
+        mock_handler.status = AsyncMock(side_effect=Exception("connection error"))
 
         with patch("asyncio.sleep") as mock_sleep, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -801,15 +806,17 @@ class TestRetryBehavior:
         mock_handler = MagicMock()
         mock_handler.request_id = "test-id"
         # Fail twice with network error (retryable), then succeed
-        mock_handler.iter_events.side_effect = [
-            Exception("connection reset"),
-            Exception("connection reset"),
-            iter([]),  # Success - no events
-        ]
-        mock_handler.get.return_value = mock_response
+        mock_handler.status = AsyncMock(
+            side_effect=[
+                Exception("connection reset"),
+                Exception("connection reset"),
+                COMPLETED,  # Success
+            ]
+        )
+        mock_handler.get = AsyncMock(return_value=mock_response)
 
         with patch("asyncio.sleep") as mock_sleep, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_submit.return_value = mock_handler
 
@@ -818,8 +825,8 @@ class TestRetryBehavior:
 
             # Submit called once (not retried)
             assert mock_submit.call_count == 1
-            # iter_events called 3 times (2 failures + 1 success)
-            assert mock_handler.iter_events.call_count == 3
+            # status called 3 times (2 failures + 1 success)
+            assert mock_handler.status.call_count == 3
             # Should have slept twice (between failures)
             assert mock_sleep.call_count == 2
             # Should return successful result
@@ -837,12 +844,12 @@ class TestRetryBehavior:
         mock_handler = MagicMock()
         mock_handler.request_id = "test-id"
         # Use "connection" to trigger NETWORK classification (retryable)
-        mock_handler.iter_events.side_effect = Exception("connection error")
+        mock_handler.status = AsyncMock(side_effect=Exception("connection error"))
 
         with patch("asyncio.sleep") as mock_sleep, patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_upload.return_value = "https://fal.ai/uploaded.jpg"
             mock_submit.return_value = mock_handler
@@ -855,10 +862,120 @@ class TestRetryBehavior:
             # Submit called once (not retried to prevent double-charging)
             assert mock_submit.call_count == 1
             # Polling retried 4 times (1 initial + 3 retries)
-            assert mock_handler.iter_events.call_count == 4
+            assert mock_handler.status.call_count == 4
             assert mock_sleep.call_count == 3
 
 
+class TestAsyncPolling:
+    """Tests for the thread-free submit/status/result path."""
+
+    @pytest.mark.asyncio
+    async def test_polls_with_backoff_until_completed(self) -> None:
+        """Test that status is polled with growing intervals and no threads."""
+        provider = FalAIProvider(api_key="test-key")
+        mock_handler = create_mock_handler({"images": []})
+        mock_handler.status = AsyncMock(
+            side_effect=[
+                fal_client.Queued(position=2),
+                fal_client.InProgress(logs=None),
+                fal_client.InProgress(logs=None),
+                COMPLETED,
+            ]
+        )
+
+        with patch("asyncio.sleep") as mock_sleep, patch(
+            "asyncio.to_thread", side_effect=AssertionError("thread used")
+        ), patch(
+            "src.providers.fal_provider.fal_client.submit_async"
+        ) as mock_submit:
+            mock_submit.return_value = mock_handler
+
+            await provider.generate(ImageRequest(prompt="Test"))
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == [0.25, 0.375, 0.5625]
+        mock_handler.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_poll_interval_is_capped(self) -> None:
+        """Test that a long-running job is polled at most every 2 seconds."""
+        provider = FalAIProvider(api_key="test-key")
+        mock_handler = create_mock_handler({"images": []})
+        mock_handler.status = AsyncMock(
+            side_effect=[fal_client.InProgress(logs=None)] * 10 + [COMPLETED]
+        )
+
+        with patch("asyncio.sleep") as mock_sleep:
+            await provider._wait_for_result(mock_handler)
+
+        assert mock_sleep.call_args_list[-1].args[0] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_no_slot_held_between_polls(self) -> None:
+        """Test that a queued job gives its bulkhead slot back while it waits."""
+        provider = FalAIProvider(api_key="test-key")
+        mock_handler = create_mock_handler({"images": []})
+        mock_handler.status = AsyncMock(
+            side_effect=[fal_client.Queued(position=1), COMPLETED]
+        )
+        in_flight_while_sleeping: list[int] = []
+
+        async def record_sleep(delay: float) -> None:
+            in_flight_while_sleeping.append(get_bulkhead("fal").stats().in_flight)
+
+        with patch("asyncio.sleep", side_effect=record_sleep), patch(
+            "src.providers.fal_provider.fal_client.submit_async"
+        ) as mock_submit:
+            mock_submit.return_value = mock_handler
+
+            await provider.generate(ImageRequest(prompt="Test"))
+
+        assert in_flight_while_sleeping == [0]
+        # Submission, two status checks and the result fetch
+        assert get_bulkhead("fal").stats().acquired == 4
+
+    @pytest.mark.asyncio
+    async def test_queued_jobs_beyond_bulkhead_limit(self) -> None:
+        """Test that jobs waiting in Fal's queue do not cap submissions."""
+        provider = FalAIProvider(api_key="test-key")
+        job_count = BULKHEAD_LIMITS["fal"].initial + 2
+        release = asyncio.Event()
+
+        def make_handler() -> MagicMock:
+            handler = create_mock_handler({"images": []})
+
+            async def status() -> Any:
+                return COMPLETED if release.is_set() else fal_client.Queued(position=1)
+
+            handler.status = AsyncMock(side_effect=status)
+            return handler
+
+        waiting = 0
+        all_waiting = asyncio.Event()
+
+        async def wait_for_release(delay: float) -> None:
+            nonlocal waiting
+            waiting += 1
+            if waiting == job_count:
+                all_waiting.set()
+            await release.wait()
+
+        with patch("asyncio.sleep", side_effect=wait_for_release), patch(
+            "src.providers.fal_provider.fal_client.submit_async",
+            side_effect=lambda **kwargs: make_handler(),
+        ) as mock_submit:
+            jobs = [
+                asyncio.create_task(provider.generate(ImageRequest(prompt=f"Test {i}")))
+                for i in range(job_count)
+            ]
+            await asyncio.wait_for(all_waiting.wait(), timeout=1.0)
+
+            assert mock_submit.call_count == job_count
+            assert get_bulkhead("fal").stats().in_flight == 0
+            release.set()
+            await asyncio.gather(*jobs)
+
+
 class TestGetModels:
     """Tests for get_models functionality."""
 
@@ -936,18 +1053,29 @@ class TestMultiImageModification:
         jpeg_bytes = bytes([0xFF, 0xD8, 0xFF, 0xE0])
         return base64.b64encode(jpeg_bytes).decode("utf-8")
 
+    @pytest.fixture
+    def distinct_images(self) -> list[str]:
+        """Create three different base64 images."""
+        return [
+            base64.b64encode(bytes([0xFF, 0xD8, 0xFF, 0xE0, i])).decode("utf-8")
+            for i in range(3)
+        ]
+
     @pytest.mark.asyncio
     async def test_modify_with_image_data_list(
-        self, provider: FalAIProvider, sample_image_data: str
+        self,
+        provider: FalAIProvider,
+        sample_image_data: str,
+        distinct_images: list[str],
     ) -> None:
         """Test that modify uploads multiple images when image_data_list is provided."""
         mock_response = {"images": [{"url": "https://fal.ai/modified.jpg"}]}
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_upload.side_effect = [
                 "https://fal.ai/uploaded_0.jpg",
@@ -959,7 +1087,7 @@ class TestMultiImageModification:
             request = ImageModifyRequest(
                 image_data=sample_image_data,  # Required for backward compat
                 prompt="Combine these images",
-                image_data_list=[sample_image_data, sample_image_data, sample_image_data],
+                image_data_list=distinct_images,
             )
             await provider.modify(request)
 
@@ -976,16 +1104,19 @@ class TestMultiImageModification:
 
     @pytest.mark.asyncio
     async def test_modify_image_data_list_filenames(
-        self, provider: FalAIProvider, sample_image_data: str
+        self,
+        provider: FalAIProvider,
+        sample_image_data: str,
+        distinct_images: list[str],
     ) -> None:
         """Test that multi-image upload uses correct filenames."""
         mock_response = {"images": [{"url": "https://fal.ai/modified.jpg"}]}
         mock_handler = create_mock_handler(mock_response)
 
         with patch(
-            "src.providers.fal_provider.fal_client.upload"
+            "src.providers.fal_provider.fal_client.upload_async"
         ) as mock_upload, patch(
-            "src.providers.fal_provider.fal_client.submit"
+            "src.providers.fal_provider.fal_client.submit_async"
         ) as mock_submit:
             mock_upload.return_value = "https://fal.ai/uploaded.jpg"
             mock_submit.return_value = mock_handler
@@ -993,7 +1124,7 @@ class TestMultiImageModification:
             request = ImageModifyRequest(
                 image_data=sample_image_data,
                 prompt="Test",
-                image_data_list=[sample_image_data, sample_image_data],
+                image_data_list=distinct_images[:2],
             )
             await provider.modify(request)
 
@@ -1022,3 +1153,89 @@ class TestMultiImageModification:
         error_msg = str(exc_info.value).lower()
         assert "invalid base64" in error_msg
         assert "image 1" in error_msg
+
+
+class TestUploadCache:
+    """Tests for reusing uploaded source images by content hash."""
+
+    @pytest.fixture
+    def image_data(self) -> str:
+        """Create sample base64 image data."""
+        return base64.b64encode(bytes([0xFF, 0xD8, 0xFF, 0xE0])).decode("utf-8")
+
+    @pytest.mark.asyncio
+    async def test_repeated_edit_skips_upload(self, image_data: str) -> None:
+        """Test that editing the same image twice uploads it once."""
+        provider = FalAIProvider(api_key="test-key")
+        handler = create_mock_handler({"images": [{"url": "https://fal.ai/out.jpg"}]})
+
+        with patch(
+            "src.providers.fal_provider.fal_client.upload_async",
+            AsyncMock(return_value="https://fal.ai/source.jpg"),
+        ) as mock_upload, patch(
+            "src.providers.fal_provider.fal_client.submit_async",
+            AsyncMock(return_value=handler),
+        ) as mock_submit:
+            for prompt in ("make it blue", "make it red"):
+                await provider.modify(
+                    ImageModifyRequest(image_data=image_data, prompt=prompt)
+                )
+
+        mock_upload.assert_awaited_once()
+        for call in mock_submit.call_args_list:
+            assert call.kwargs["arguments"]["image_urls"] == [
+                "https://fal.ai/source.jpg"
+            ]
+
+    @pytest.mark.asyncio
+    async def test_cached_url_expires(self, image_data: str) -> None:
+        """Test that the image is uploaded again once its TTL has passed."""
+        provider = FalAIProvider(api_key="test-key", upload_cache_ttl=60)
+        provider._clock = MagicMock(side_effect=[0, 10, 100, 100])
+        image_bytes = base64.b64decode(image_data)
+
+        with patch(
+            "src.providers.fal_provider.fal_client.upload_async",
+            AsyncMock(side_effect=["https://fal.ai/a.jpg", "https://fal.ai/b.jpg"]),
+        ) as mock_upload:
+            assert await provider._upload_image(image_bytes, "x") == "https://fal.ai/a.jpg"
+            assert await provider._upload_image(image_bytes, "x") == "https://fal.ai/a.jpg"
+            assert await provider._upload_image(image_bytes, "x") == "https://fal.ai/b.jpg"
+
+        assert mock_upload.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_images_upload_concurrently(self) -> None:
+        """Test that multi-image uploads overlap instead of running in turn."""
+        provider = FalAIProvider(api_key="test-key")
+        images = [base64.b64encode(bytes([i])).decode("utf-8") for i in range(3)]
+        handler = create_mock_handler({"images": [{"url": "https://fal.ai/out.jpg"}]})
+        in_flight = 0
+        peak = 0
+
+        async def slow_upload(data: bytes, **kwargs: Any) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"https://fal.ai/{data[0]}.jpg"
+
+        with patch(
+            "src.providers.fal_provider.fal_client.upload_async", slow_upload
+        ), patch(
+            "src.providers.fal_provider.fal_client.submit_async",
+            AsyncMock(return_value=handler),
+        ) as mock_submit:
+            await provider.modify(
+                ImageModifyRequest(
+                    image_data=images[0], prompt="combine", image_data_list=images
+                )
+            )
+
+        assert peak == 3
+        assert mock_submit.call_args.kwargs["arguments"]["image_urls"] == [
+            "https://fal.ai/0.jpg",
+            "https://fal.ai/1.jpg",
+            "https://fal.ai/2.jpg",
+        ]
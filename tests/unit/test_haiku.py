@@ -21,7 +21,7 @@ class TestHaikuComplete:
     @pytest.mark.asyncio
     async def test_returns_text_response(self) -> None:
         """Test that haiku_complete returns the text content from the API."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="Hello, world!")]
 
@@ -40,7 +40,7 @@ class TestHaikuComplete:
     @pytest.mark.asyncio
     async def test_uses_correct_model(self) -> None:
         """Test that haiku_complete uses the correct Haiku model."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -61,7 +61,7 @@ class TestHaikuComplete:
     @pytest.mark.asyncio
     async def test_passes_system_prompt(self) -> None:
         """Test that haiku_complete passes the system prompt correctly."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -82,7 +82,7 @@ class TestHaikuComplete:
     @pytest.mark.asyncio
     async def test_passes_user_message(self) -> None:
         """Test that haiku_complete passes the user message correctly."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -106,7 +106,7 @@ class TestHaikuComplete:
     @pytest.mark.asyncio
     async def test_uses_default_max_tokens(self) -> None:
         """Test that haiku_complete uses default max_tokens of 1024."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -127,7 +127,7 @@ class TestHaikuComplete:
     @pytest.mark.asyncio
     async def test_uses_custom_max_tokens(self) -> None:
         """Test that haiku_complete respects custom max_tokens."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -166,7 +166,7 @@ class TestHaikuComplete:
     @pytest.mark.asyncio
     async def test_raises_error_on_empty_response(self) -> None:
         """Test that haiku_complete raises HaikuError on empty response."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = []
 
@@ -190,7 +190,7 @@ class TestHaikuVision:
     @pytest.mark.asyncio
     async def test_returns_text_response(self) -> None:
         """Test that haiku_vision returns the text content from the API."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="A beautiful sunset")]
 
@@ -209,7 +209,7 @@ class TestHaikuVision:
     @pytest.mark.asyncio
     async def test_passes_image_in_correct_format(self) -> None:
         """Test that haiku_vision passes the image in the correct format."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -236,7 +236,7 @@ class TestHaikuVision:
     @pytest.mark.asyncio
     async def test_uses_default_media_type(self) -> None:
         """Test that haiku_vision uses default media type of image/jpeg."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -259,7 +259,7 @@ class TestHaikuVision:
     @pytest.mark.asyncio
     async def test_uses_custom_media_type(self) -> None:
         """Test that haiku_vision respects custom media type."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -283,7 +283,7 @@ class TestHaikuVision:
     @pytest.mark.asyncio
     async def test_includes_user_message_when_provided(self) -> None:
         """Test that haiku_vision includes user_message when provided."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -329,7 +329,7 @@ class TestRetryLogic:
     @pytest.mark.asyncio
     async def test_retries_on_529_error(self) -> None:
         """Test that the API retries on 529 (overloaded) error."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response_success = MagicMock()
             mock_response_success.content = [MagicMock(text="Success")]
 
@@ -360,7 +360,7 @@ class TestRetryLogic:
     @pytest.mark.asyncio
     async def test_retries_on_500_error(self) -> None:
         """Test that the API retries on 500 (server error)."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response_success = MagicMock()
             mock_response_success.content = [MagicMock(text="Success")]
 
@@ -390,7 +390,7 @@ class TestRetryLogic:
     @pytest.mark.asyncio
     async def test_raises_after_max_retries(self) -> None:
         """Test that the API raises HaikuError after max retries."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response_529 = MagicMock()
             mock_response_529.status_code = 529
             error_529 = APIStatusError(
@@ -416,7 +416,7 @@ class TestRetryLogic:
     @pytest.mark.asyncio
     async def test_no_retry_on_400_error(self) -> None:
         """Test that the API does not retry on 400 (bad request) error."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response_400 = MagicMock()
             mock_response_400.status_code = 400
             error_400 = APIStatusError(
@@ -443,7 +443,7 @@ class TestRetryLogic:
     @pytest.mark.asyncio
     async def test_retries_on_timeout(self) -> None:
         """Test that the API retries on timeout error."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response_success = MagicMock()
             mock_response_success.content = [MagicMock(text="Success")]
 
@@ -466,7 +466,7 @@ class TestRetryLogic:
     @pytest.mark.asyncio
     async def test_raises_after_timeout_retries_exhausted(self) -> None:
         """Test that the API raises HaikuError after timeout retries exhausted."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_client = MagicMock()
             mock_client.messages.create = AsyncMock(
                 side_effect=TimeoutError("Timeout")
@@ -490,7 +490,7 @@ class TestHaikuDescribeImage:
     @pytest.mark.asyncio
     async def test_returns_description(self) -> None:
         """Test that haiku_describe_image returns a description."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [
                 MagicMock(text="Digital art style, vibrant colors. A cat on a chair.")
@@ -509,7 +509,7 @@ class TestHaikuDescribeImage:
     @pytest.mark.asyncio
     async def test_strips_whitespace(self) -> None:
         """Test that haiku_describe_image strips leading/trailing whitespace."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [
                 MagicMock(text="  Description with whitespace  ")
@@ -528,7 +528,7 @@ class TestHaikuDescribeImage:
     @pytest.mark.asyncio
     async def test_uses_image_description_system_prompt(self) -> None:
         """Test that haiku_describe_image uses the correct system prompt."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -550,7 +550,7 @@ class TestHaikuDescribeImage:
     @pytest.mark.asyncio
     async def test_uses_max_tokens_512(self) -> None:
         """Test that haiku_describe_image uses max_tokens of 512."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -569,7 +569,7 @@ class TestHaikuDescribeImage:
     @pytest.mark.asyncio
     async def test_uses_default_jpeg_media_type(self) -> None:
         """Test that haiku_describe_image uses jpeg as default media type."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -590,7 +590,7 @@ class TestHaikuDescribeImage:
     @pytest.mark.asyncio
     async def test_accepts_png_media_type(self) -> None:
         """Test that haiku_describe_image accepts PNG media type."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="response")]
 
@@ -627,7 +627,7 @@ class TestHaikuDescribeImage:
     @pytest.mark.asyncio
     async def test_raises_image_description_error_on_timeout(self) -> None:
         """Test that haiku_describe_image raises ImageDescriptionError on timeout."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_client = MagicMock()
             mock_client.messages.create = AsyncMock(side_effect=TimeoutError("Timeout"))
             mock_client_class.return_value = mock_client
@@ -643,7 +643,7 @@ class TestHaikuDescribeImage:
     @pytest.mark.asyncio
     async def test_raises_image_description_error_on_empty_response(self) -> None:
         """Test that haiku_describe_image raises ImageDescriptionError on empty response."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = []
 
@@ -661,7 +661,7 @@ class TestHaikuDescribeImage:
     @pytest.mark.asyncio
     async def test_raises_image_description_error_on_api_error(self) -> None:
         """Test that haiku_describe_image raises ImageDescriptionError on API error."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response_400 = MagicMock()
             mock_response_400.status_code = 400
             error_400 = APIStatusError(
@@ -0,0 +1,168 @@
+"""Tests for the Haiku completion cache and its SQLite tier."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.adapters.sqlite_repository import SQLiteRepository
+from src.core.haiku import haiku_complete
+from src.core.haiku_cache import HaikuCache, make_cache_key
+
+
+class FakeClock:
+    """Settable wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_key_depends_on_every_part(self) -> None:
+        """Test that model, system prompt and input all change the key."""
+        base = make_cache_key("model", "system", "input")
+        assert base.startswith("model:")
+        assert make_cache_key("other", "system", "input") != base
+        assert make_cache_key("model", "other", "input") != base
+        assert make_cache_key("model", "system", "other") != base
+
+
+class TestHaikuCache:
+    """Tests for HaikuCache."""
+
+    async def test_miss_then_hit(self) -> None:
+        """Test that a stored completion is returned and counted."""
+        cache = HaikuCache()
+        assert await cache.get("refine", "m", "sys", "cat") is None
+
+        await cache.put("refine", "m", "sys", "cat", "orange tabby cat")
+
+        assert await cache.get("refine", "m", "sys", "cat") == "orange tabby cat"
+        stats = cache.stats()
+        assert stats.features["refine"].to_dict()["hit_ratio"] == 0.5
+        assert stats.to_dict()["entries"] == 1
+
+    async def test_entries_expire_per_feature(self) -> None:
+        """Test that each feature's TTL applies to its own entries."""
+        clock = FakeClock()
+        cache = HaikuCache(ttls={"refine": 10, "describe": 100}, clock=clock)
+        await cache.put("refine", "m", "sys", "a", "refined")
+        await cache.put("describe", "m", "sys", "b", "described")
+
+        clock.now += 50
+
+        assert await cache.get("refine", "m", "sys", "a") is None
+        assert await cache.get("describe", "m", "sys", "b") == "described"
+
+    async def test_zero_ttl_opts_feature_out(self) -> None:
+        """Test that remix is never cached or counted."""
+        cache = HaikuCache()
+        await cache.put("remix", "m", "sys", "prompt", "remixed")
+
+        assert await cache.get("remix", "m", "sys", "prompt") is None
+        assert cache.stats().entries == 0
+        assert "remix" not in cache.stats().features
+
+    async def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted first."""
+        cache = HaikuCache(max_entries=2)
+        await cache.put("refine", "m", "sys", "a", "A")
+        await cache.put("refine", "m", "sys", "b", "B")
+        await cache.get("refine", "m", "sys", "a")  # b becomes least recent
+        await cache.put("refine", "m", "sys", "c", "C")
+
+        assert await cache.get("refine", "m", "sys", "b") is None
+        assert await cache.get("refine", "m", "sys", "a") == "A"
+        assert cache.stats().evictions == 1
+
+    async def test_store_failure_is_a_miss(self) -> None:
+        """Test that a failing persistent tier does not break lookups."""
+        cache = HaikuCache()
+        store = AsyncMock()
+        store.get_cached_completion.side_effect = Exception("disk full")
+        store.put_cached_completion.side_effect = Exception("disk full")
+        cache.attach_store(store)
+
+        await cache.put("refine", "m", "sys", "a", "A")
+        cache.clear()
+
+        assert await cache.get("refine", "m", "sys", "a") is None
+
+    def test_invalid_size_rejected(self) -> None:
+        """Test that a non-positive size is rejected."""
+        with pytest.raises(ValueError):
+            HaikuCache(max_entries=0)
+
+
+class TestPersistentTier:
+    """Tests for the SQLite-backed tier."""
+
+    async def test_survives_memory_loss(self) -> None:
+        """Test that a new process is answered from SQLite."""
+        repo = SQLiteRepository(":memory:")
+        await repo.connect()
+        try:
+            first = HaikuCache()
+            first.attach_store(repo)
+            await first.put("describe", "m", "sys", "image", "a cat")
+
+            restarted = HaikuCache()
+            restarted.attach_store(repo)
+
+            assert await restarted.get("describe", "m", "sys", "image") == "a cat"
+            assert await restarted.get("describe", "m", "sys", "image") == "a cat"
+            stats = restarted.stats().features["describe"]
+            assert (stats.persistent_hits, stats.hits) == (1, 1)
+        finally:
+            await repo.close()
+
+    async def test_expired_rows_are_ignored(self) -> None:
+        """Test that an expired persisted entry is a miss."""
+        repo = SQLiteRepository(":memory:")
+        await repo.connect()
+        try:
+            clock = FakeClock()
+            cache = HaikuCache(ttls={"describe": 10}, clock=clock)
+            cache.attach_store(repo)
+            await cache.put("describe", "m", "sys", "image", "a cat")
+            cache.clear()
+            clock.now += 60
+
+            assert await cache.get("describe", "m", "sys", "image") is None
+        finally:
+            await repo.close()
+
+
+class TestHaikuCompleteCaching:
+    """Tests for cache_feature in haiku_complete."""
+
+    async def test_repeat_request_skips_api(self) -> None:
+        """Test that an identical cached request is not sent twice."""
+        with (
+            patch(
+                "src.core.haiku._call_haiku_api", AsyncMock(return_value="refined")
+            ) as mock_call,
+            patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}),
+        ):
+            for _ in range(2):
+                result = await haiku_complete("sys", "a cat", cache_feature="refine")
+
+        assert result == "refined"
+        mock_call.assert_awaited_once()
+
+    async def test_uncached_by_default(self) -> None:
+        """Test that requests without cache_feature always call the API."""
+        with (
+            patch(
+                "src.core.haiku._call_haiku_api", AsyncMock(return_value="text")
+            ) as mock_call,
+            patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}),
+        ):
+            await haiku_complete("sys", "a cat")
+            await haiku_complete("sys", "a cat")
+
+        assert mock_call.await_count == 2
@@ -4,6 +4,7 @@ import asyncio
 
 import pytest
 
+from src.core.circuit_breaker import CircuitBreaker
 from src.core.health import (
     HealthChecker,
     HealthReport,
@@ -301,3 +302,34 @@ class TestHealthChecker:
         assert ok_check.status == ServiceStatus.HEALTHY
         assert fail_check.status == ServiceStatus.UNHEALTHY
         assert "Boom" in fail_check.message
+
+    async def test_circuit_breakers_in_details(self) -> None:
+        """Should report circuit breaker stats with the service check."""
+        checker = HealthChecker()
+
+        async def check_api():
+            return ServiceCheck(name="api", status=ServiceStatus.HEALTHY)
+
+        checker.add_check("api", check_api)
+        checker.add_circuit_breakers("api", CircuitBreaker("chat"))
+
+        result = await checker.check_one("api")
+        assert result.status == ServiceStatus.HEALTHY
+        assert result.details["circuit_breakers"]["chat"]["state"] == "closed"
+
+    async def test_open_circuit_degrades_check(self) -> None:
+        """Should mark a passing check degraded while a circuit is open."""
+        checker = HealthChecker()
+        breaker = CircuitBreaker("chat", failure_threshold=1)
+        breaker.record_failure()
+
+        async def check_api():
+            return ServiceCheck(name="api", status=ServiceStatus.HEALTHY)
+
+        checker.add_check("api", check_api)
+        checker.add_circuit_breakers("api", breaker, CircuitBreaker("search"))
+
+        result = await checker.check_one("api")
+        assert result.status == ServiceStatus.DEGRADED
+        assert result.message == "Circuit open: chat"
+        assert result.details["circuit_breakers"]["chat"]["state"] == "open"
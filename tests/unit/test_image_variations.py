@@ -0,0 +1,248 @@
+"""Tests for batch variation generation."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.haiku import HaikuError
+from src.core.image_variations import (
+    RateLimitExceededError,
+    VariationError,
+    generate_variations_remixed,
+    generate_variations_same_prompt,
+    remix_prompts,
+)
+from src.core.providers import GeneratedImage, ImageRequest
+from src.core.rate_limit import (
+    InMemoryRateLimitStorage,
+    RateLimit,
+    SlidingWindowRateLimiter,
+)
+
+
+def make_image(name: str) -> GeneratedImage:
+    """Create a generated image whose data identifies it."""
+    return GeneratedImage(url=f"data:image/jpeg;base64,{name}")
+
+
+def make_rate_limiter(max_requests: int) -> SlidingWindowRateLimiter:
+    """Create a real limiter allowing max_requests images per hour."""
+    return SlidingWindowRateLimiter(
+        InMemoryRateLimitStorage(), {"image": RateLimit(max_requests, 3600)}
+    )
+
+
+@pytest.fixture(autouse=True)
+def skip_compression() -> Any:
+    """Pass image data through compress_image unchanged."""
+    with patch("src.core.image_variations.compress_image", side_effect=lambda b64: b64):
+        yield
+
+
+async def collect(batch: Any) -> list[Any]:
+    """Drain an async generator into a list."""
+    return [item async for item in batch]
+
+
+class TestSamePromptBatch:
+    """Tests for generate_variations_same_prompt."""
+
+    async def test_uses_num_images_in_one_request(self) -> None:
+        """Test that a text-to-image batch is a single provider call."""
+        provider = MagicMock()
+        provider.generate = AsyncMock(
+            return_value=[make_image("a"), make_image("b"), make_image("c")]
+        )
+        limiter = make_rate_limiter(10)
+
+        images = await collect(
+            generate_variations_same_prompt("a cat", provider, 1, 3, limiter)
+        )
+
+        assert [image["image"] for image in images] == ["a", "b", "c"]
+        provider.generate.assert_awaited_once_with(
+            ImageRequest(prompt="a cat", num_images=3)
+        )
+        assert (await limiter.check(1, "image")).remaining == 7
+
+    async def test_tops_up_when_model_ignores_num_images(self) -> None:
+        """Test that missing images are generated by further calls."""
+        provider = MagicMock()
+        provider.generate = AsyncMock(return_value=[make_image("x")])
+
+        images = await collect(generate_variations_same_prompt("a cat", provider, 1, 3))
+
+        assert len(images) == 3
+        assert provider.generate.await_count == 3
+
+    async def test_reference_images_run_concurrently_under_cap(self) -> None:
+        """Test that modify calls overlap but never exceed max_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def modify(request: Any) -> list[GeneratedImage]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [make_image("m")]
+
+        provider = MagicMock()
+        provider.modify = modify
+
+        images = await collect(
+            generate_variations_same_prompt(
+                "a cat", provider, 1, 3, reference_images=["src"], max_concurrency=2
+            )
+        )
+
+        assert len(images) == 3
+        assert peak == 2
+
+    async def test_batch_trimmed_to_rate_limit(self) -> None:
+        """Test that each image counts against the limit on its own."""
+        provider = MagicMock()
+        provider.generate = AsyncMock(return_value=[make_image("a"), make_image("b")])
+        limiter = make_rate_limiter(2)
+
+        images = await collect(
+            generate_variations_same_prompt("a cat", provider, 1, 3, limiter)
+        )
+
+        assert len(images) == 2
+        assert provider.generate.call_args.args[0].num_images == 2
+        with pytest.raises(RateLimitExceededError):
+            await collect(generate_variations_same_prompt("a cat", provider, 1, 1, limiter))
+
+    async def test_failure_raised_after_successes(self) -> None:
+        """Test that finished variations are yielded before the error."""
+        provider = MagicMock()
+        provider.modify = AsyncMock(side_effect=[[make_image("ok")], Exception("boom")])
+        limiter = make_rate_limiter(10)
+        images: list[dict[str, str]] = []
+
+        with pytest.raises(VariationError, match="boom"):
+            async for image in generate_variations_same_prompt(
+                "a cat", provider, 1, 2, limiter, reference_images=["src"]
+            ):
+                images.append(image)
+
+        assert len(images) == 1
+        assert (await limiter.check(1, "image")).remaining == 9
+
+
+    async def test_closing_early_cancels_remaining_calls(self) -> None:
+        """Test that aclose stops the batch without charging unfinished images."""
+        release = asyncio.Event()
+        calls = 0
+        cancelled = 0
+
+        async def modify(request: Any) -> list[GeneratedImage]:
+            nonlocal calls, cancelled
+            calls += 1
+            if calls > 1:
+                try:
+                    await release.wait()
+                except asyncio.CancelledError:
+                    cancelled += 1
+                    raise
+            return [make_image("m")]
+
+        provider = MagicMock()
+        provider.modify = modify
+        limiter = make_rate_limiter(10)
+
+        batch = generate_variations_same_prompt(
+            "a cat", provider, 1, 3, limiter, reference_images=["src"]
+        )
+        assert (await anext(batch))["image"] == "m"
+        await batch.aclose()
+        release.set()
+        await asyncio.sleep(0)
+
+        assert cancelled == 2
+        assert (await limiter.check(1, "image")).remaining == 9
+
+
+class TestRemixPrompts:
+    """Tests for batched remixing."""
+
+    async def test_one_call_asks_for_exactly_count(self) -> None:
+        """Test that one Haiku call serves the whole request, with no extras."""
+        response = '```json\n["dusk cat", "dawn cat", "foggy cat", "rainy cat"]\n```'
+        with patch(
+            "src.core.image_variations.haiku_complete", AsyncMock(return_value=response)
+        ) as mock_haiku:
+            remixes = await remix_prompts("cat", 3)
+
+        assert remixes == ["dusk cat", "dawn cat", "foggy cat"]
+        mock_haiku.assert_awaited_once()
+        assert "Number of variations: 3" in mock_haiku.call_args.kwargs["user_message"]
+
+    async def test_invalid_entries_dropped(self) -> None:
+        """Test that duplicates, blanks, non-strings and the original are dropped."""
+        response = '["dusk cat", "dusk cat", "", 7, "cat", "dawn cat"]'
+        with patch(
+            "src.core.image_variations.haiku_complete", AsyncMock(return_value=response)
+        ):
+            remixes = await remix_prompts("cat", 2)
+
+        assert remixes == ["dusk cat", "dawn cat"]
+
+    async def test_falls_back_to_single_remixes(self) -> None:
+        """Test that an unusable batch response falls back per remix."""
+        with (
+            patch(
+                "src.core.image_variations.haiku_complete",
+                AsyncMock(return_value="Sorry, here are some ideas"),
+            ),
+            patch(
+                "src.core.image_variations.remix_prompt",
+                AsyncMock(side_effect=["dusk cat", "dawn cat"]),
+            ) as mock_single,
+        ):
+            remixes = await remix_prompts("cat", 2)
+
+        assert remixes == ["dusk cat", "dawn cat"]
+        assert mock_single.await_count == 2
+
+    async def test_failed_batch_call_falls_back(self) -> None:
+        """Test that a failed batch call still yields remixes via fallback."""
+        with (
+            patch(
+                "src.core.image_variations.haiku_complete",
+                AsyncMock(side_effect=HaikuError("overloaded")),
+            ),
+            patch(
+                "src.core.image_variations.remix_prompt",
+                AsyncMock(return_value="dusk cat"),
+            ) as mock_single,
+        ):
+            remixes = await remix_prompts("cat", 1)
+
+        assert remixes == ["dusk cat"]
+        mock_single.assert_awaited_once()
+
+
+class TestRemixedBatch:
+    """Tests for generate_variations_remixed."""
+
+    async def test_each_variation_gets_its_own_remix(self) -> None:
+        """Test that every variation is generated from a separate remix."""
+        provider = MagicMock()
+        provider.generate = AsyncMock(return_value=[make_image("r")])
+
+        with patch(
+            "src.core.image_variations.haiku_complete",
+            AsyncMock(return_value='["dusk", "dawn", "fog", "rain", "snow"]'),
+        ) as mock_haiku:
+            results = await collect(generate_variations_remixed("a cat", provider, 1, 2))
+
+        mock_haiku.assert_awaited_once()
+        assert sorted(prompt for prompt, _ in results) == ["dawn", "dusk"]
+        prompts = {call.args[0].prompt for call in provider.generate.call_args_list}
+        assert prompts == {"dawn", "dusk"}
+        assert "Number of variations: 2" in mock_haiku.call_args.kwargs["user_message"]
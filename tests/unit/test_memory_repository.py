@@ -10,6 +10,7 @@ All tests verify that the in-memory implementation behaves the same as SQLite.
 import pytest_asyncio
 
 from src.adapters.memory_repository import MemoryRepository
+from src.core.conversation import SUMMARY_PROMPT
 from src.ports.repositories import (
     ApiKey,
     Channel,
@@ -235,6 +236,25 @@ class TestMessageRepository:
         assert messages[0].images[0].url == "https://example.com/image1.png"
         assert messages[0].images[1].url == "https://example.com/image2.png"
 
+    async def test_get_visible_text_messages_omits_images(
+        self, repo_with_channel_and_vendor: MemoryRepository
+    ) -> None:
+        """Test that the text context query returns messages without images."""
+        repo = repo_with_channel_and_vendor
+        vendor = await repo.get_vendor("Anthropic")
+        assert vendor is not None
+        message_id = await repo.save_message_with_images(
+            Message(channel_id=12345, vendor_id=vendor.id, message_type="prompt", content="Look"),
+            ["https://example.com/image1.png"],
+        )
+
+        messages = await repo.get_visible_text_messages(12345, "Anthropic")
+        assert [m.content for m in messages] == ["Look"]
+        assert messages[0].images == []
+
+        images = await repo.load_message_images([message_id])
+        assert images[message_id][0].url == "https://example.com/image1.png"
+
     async def test_get_visible_messages(
         self, repo_with_channel_and_vendor: MemoryRepository
     ) -> None:
@@ -565,6 +585,85 @@ class TestMessageRepository:
         assert len(images) == 2
 
 
+class TestSummarySlots:
+    """Tests for reserving and filling background summary slots."""
+
+    async def _save(self, repo: MemoryRepository, content: str) -> int:
+        vendor = await repo.get_vendor("Anthropic")
+        assert vendor is not None
+        return await repo.save_message(
+            Message(
+                channel_id=12345,
+                vendor_id=vendor.id,
+                message_type="prompt",
+                content=content,
+                token_count=1,
+            )
+        )
+
+    async def test_fill_replaces_older_messages_only(
+        self, repo_with_channel_and_vendor: MemoryRepository
+    ) -> None:
+        """Test that the summary hides older messages and keeps newer ones."""
+        repo = repo_with_channel_and_vendor
+        await self._save(repo, "old")
+        slot_id = await repo.reserve_summary_slot(12345, "Anthropic")
+        await self._save(repo, "new")
+
+        assert await repo.fill_summary_slot(12345, slot_id, "summary", 1) is True
+
+        messages = await repo.get_visible_text_messages(12345, "All Models")
+        assert [(m.message_type, m.content) for m in messages] == [
+            ("prompt", SUMMARY_PROMPT),
+            ("assistant", "summary"),
+            ("prompt", "new"),
+        ]
+        prompt_tokens = messages[0].token_count or 0
+        assert await repo.get_context_token_count(12345) == prompt_tokens + 2
+
+    async def test_clear_supersedes_slot(
+        self, repo_with_channel_and_vendor: MemoryRepository
+    ) -> None:
+        """Test that a full clear makes an outstanding slot unfillable."""
+        repo = repo_with_channel_and_vendor
+        await self._save(repo, "old")
+        slot_id = await repo.reserve_summary_slot(12345, "Anthropic")
+        await repo.clear_messages(12345, "All Models")
+
+        assert await repo.fill_summary_slot(12345, slot_id, "summary", 1) is False
+        assert await repo.get_visible_text_messages(12345, "All Models") == []
+
+    async def test_release_removes_placeholder(
+        self, repo_with_channel_and_vendor: MemoryRepository
+    ) -> None:
+        """Test that a released slot leaves no trace and cannot be filled."""
+        repo = repo_with_channel_and_vendor
+        await self._save(repo, "old")
+        slot_id = await repo.reserve_summary_slot(12345, "Anthropic")
+
+        await repo.release_summary_slot(slot_id)
+
+        assert await repo.fill_summary_slot(12345, slot_id, "summary", 1) is False
+        assert len(repo._messages) == 1
+
+    async def test_filled_slot_becomes_rolling_summary(
+        self, repo_with_channel_and_vendor: MemoryRepository
+    ) -> None:
+        """Test that the last filled slot is the rolling summary until a clear."""
+        repo = repo_with_channel_and_vendor
+        await self._save(repo, "old")
+        assert await repo.get_rolling_summary(12345) is None
+        slot_id = await repo.reserve_summary_slot(12345, "Anthropic")
+        await repo.fill_summary_slot(12345, slot_id, "summary", 1)
+
+        summary = await repo.get_rolling_summary(12345)
+        assert summary is not None
+        assert (summary.id, summary.content) == (slot_id, "summary")
+
+        await repo.clear_messages(12345, "All Models")
+        assert await repo.get_rolling_summary(12345) is None
+
+
 # =============================================================================
 # RateLimitRepository Tests
 # =============================================================================
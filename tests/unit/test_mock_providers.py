@@ -119,6 +119,48 @@ class TestMockAIProviderChat:
         assert response.content == "Only one"
 
 
+class TestMockAIProviderPromptCaching:
+    """Tests for MockAIProvider's simulated prompt cache usage."""
+
+    async def test_usage_has_no_cache_fields_by_default(self) -> None:
+        """Verify cache fields only appear when prompt caching is enabled."""
+        provider = MockAIProvider()
+        response = await provider.chat([ChatMessage(role="user", content="Hi")])
+        assert "cache_read_input_tokens" not in response.usage
+
+    async def test_next_turn_reads_previous_prefix(self) -> None:
+        """Verify a follow-up turn reads the prior conversation from cache."""
+        provider = MockAIProvider(prompt_caching=True)
+        first = [ChatMessage(role="user", content="hello there")]
+
+        response = await provider.chat(first, system_prompt="be brief")
+        assert response.usage["cache_read_input_tokens"] == 0
+        assert response.usage["cache_creation_input_tokens"] == 4
+
+        second = [
+            *first,
+            ChatMessage(role="assistant", content="hi"),
+            ChatMessage(role="user", content="how are you"),
+        ]
+        response = await provider.chat(second, system_prompt="be brief")
+        assert response.usage["cache_read_input_tokens"] == 4
+        assert response.usage["cache_creation_input_tokens"] == 4
+
+    async def test_changed_history_reuses_system_prompt_only(self) -> None:
+        """Verify a different history still reads the cached system prompt."""
+        provider = MockAIProvider(prompt_caching=True)
+        await provider.chat(
+            [ChatMessage(role="user", content="one")], system_prompt="be brief"
+        )
+
+        response = await provider.chat(
+            [ChatMessage(role="user", content="two")], system_prompt="be brief"
+        )
+
+        assert response.usage["cache_read_input_tokens"] == 2
+        assert response.usage["cache_creation_input_tokens"] == 1
+
+
 class TestMockAIProviderStream:
     """Tests for MockAIProvider.chat_stream() method."""
 
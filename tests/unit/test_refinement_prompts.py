@@ -65,7 +65,7 @@ class TestGenerationPromptIntegration:
     @pytest.mark.asyncio
     async def test_refines_simple_prompt(self) -> None:
         """Test that a simple prompt gets refined with technical details."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             # Simulate Haiku returning a refined prompt
             mock_response = MagicMock()
             mock_response.content = [
@@ -94,7 +94,7 @@ class TestGenerationPromptIntegration:
     @pytest.mark.asyncio
     async def test_refines_vague_prompt(self) -> None:
         """Test that a vague prompt gets refined with specific details."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [
                 MagicMock(text="Cyberpunk cityscape, neon pink and blue lights, rain-slicked streets, night, wide angle, dense skyscrapers")
@@ -125,7 +125,7 @@ class TestModificationPromptIntegration:
     @pytest.mark.asyncio
     async def test_refines_simple_edit(self) -> None:
         """Test that a simple edit description gets refined with specifics."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [
                 MagicMock(text="Reduce brightness 40%, increase contrast 20%, add subtle shadow overlay")
@@ -153,7 +153,7 @@ class TestModificationPromptIntegration:
     @pytest.mark.asyncio
     async def test_refines_object_addition(self) -> None:
         """Test that object addition requests get refined."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [
                 MagicMock(text="Add red baseball cap on subject's head, adjust shadows to match existing lighting")
@@ -0,0 +1,120 @@
+"""Tests for singleflight de-duplication and its use by providers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.content_screening import screen_search_query
+from src.core.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        """Test that callers with the same key await a single call."""
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        waiters = [asyncio.create_task(flight.do("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["result"] * 3
+        assert calls == 1
+        stats = flight.stats()
+        assert (stats.calls, stats.shared, stats.in_flight) == (1, 2, 0)
+
+    async def test_different_keys_run_separately(self) -> None:
+        """Test that distinct keys are not merged."""
+        flight = SingleFlight()
+
+        results = await asyncio.gather(
+            flight.do("a", AsyncMock(return_value=1)),
+            flight.do("b", AsyncMock(return_value=2)),
+        )
+
+        assert results == [1, 2]
+        assert flight.stats().calls == 2
+
+    async def test_finished_key_starts_fresh_call(self) -> None:
+        """Test that a completed call is not reused by later callers."""
+        flight = SingleFlight()
+        fetch = AsyncMock(side_effect=["first", "second"])
+
+        assert await flight.do("key", fetch) == "first"
+        assert await flight.do("key", fetch) == "second"
+
+    async def test_exception_reaches_every_caller(self) -> None:
+        """Test that a failed shared call raises for all waiters."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fail() -> None:
+            await release.wait()
+            raise ValueError("boom")
+
+        waiters = [asyncio.create_task(flight.do("key", fail)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_cancelled_caller_does_not_cancel_call(self) -> None:
+        """Test that other waiters still get the result."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestScreeningDeduplication:
+    """Tests for singleflight in screen_search_query."""
+
+    async def test_concurrent_screenings_share_one_request(self) -> None:
+        """Test that a burst of identical queries makes one API call."""
+        release = asyncio.Event()
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text='{"allowed": true}')]
+
+        async def create(**kwargs: object) -> MagicMock:
+            await release.wait()
+            return mock_response
+
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(side_effect=create)
+            mock_client_class.return_value = mock_client
+
+            with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+                waiters = [
+                    asyncio.create_task(screen_search_query("cute puppies"))
+                    for _ in range(3)
+                ]
+                await asyncio.sleep(0.01)
+                release.set()
+                results = await asyncio.gather(*waiters)
+
+        assert all(result.allowed for result in results)
+        assert mock_client.messages.create.await_count == 1
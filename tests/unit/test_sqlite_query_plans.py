@@ -0,0 +1,106 @@
+"""Query-plan regression tests for SQLiteRepository.
+
+Runs EXPLAIN QUERY PLAN on every hot query and fails if any of them falls
+back to a full scan of a table that grows with usage. The vendors table is
+a handful of rows loaded from allowed_vendors.json, so scans of it are fine.
+"""
+
+import sqlite3
+
+import pytest
+import pytest_asyncio
+
+from src.adapters import sqlite_repository
+from src.adapters.sqlite_repository import SQLiteRepository
+
+# Tables whose size grows with history; a SCAN of these is a regression
+GROWING_TABLES = ("channels", "channel_messages")
+
+HOT_QUERIES = [
+    "_SELECT_CHANNEL",
+    "_INSERT_MESSAGE",
+    "_INSERT_MESSAGE_WITH_IMAGES",
+    "_SELECT_VISIBLE_MESSAGES",
+    "_SELECT_VISIBLE_TEXT_MESSAGES",
+    "_SELECT_LATEST_MESSAGES",
+    "_SELECT_LATEST_IMAGES",
+    "_SELECT_HAS_IMAGES_IN_CONTEXT",
+    "_SELECT_WINDOW_START",
+    "_SELECT_NEXT_MESSAGE_ID",
+    "_ADVANCE_VISIBLE_FROM_ID",
+    "_HIDE_VENDOR_MESSAGES_BEFORE",
+    "_SELECT_CONTEXT_TOKEN_COUNT",
+    "_SELECT_UNCOUNTED_MESSAGES",
+    "_COUNT_RECENT_TEXT_REQUESTS",
+    "_COUNT_RECENT_IMAGE_REQUESTS",
+]
+
+
+@pytest_asyncio.fixture
+async def conn() -> sqlite3.Connection:
+    """Provides the connection of a freshly migrated in-memory repository."""
+    repo = SQLiteRepository(":memory:")
+    await repo.connect()
+    yield repo._ensure_connected()
+    await repo.close()
+
+
+def query_plan(conn: sqlite3.Connection, sql: str) -> list[str]:
+    """Return the detail column of EXPLAIN QUERY PLAN for sql."""
+    params = (1,) * sql.count("?")
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+@pytest.mark.parametrize("query_name", HOT_QUERIES)
+async def test_hot_query_does_not_scan_growing_tables(
+    conn: sqlite3.Connection, query_name: str
+) -> None:
+    """Test that a hot query only searches channels and channel_messages."""
+    plan = query_plan(conn, getattr(sqlite_repository, query_name))
+
+    scans = [
+        step
+        for step in plan
+        if any(step.startswith(f"SCAN {table}") for table in GROWING_TABLES)
+    ]
+    assert not scans, f"{query_name} scans a growing table: {plan}"
+
+
+@pytest.mark.parametrize(
+    "query_name",
+    [
+        "_SELECT_VISIBLE_TEXT_MESSAGES",
+        "_SELECT_LATEST_IMAGES",
+        "_SELECT_HAS_IMAGES_IN_CONTEXT",
+        "_SELECT_WINDOW_START",
+    ],
+)
+async def test_context_queries_range_scan_from_watermark(
+    conn: sqlite3.Connection, query_name: str
+) -> None:
+    """Test that context queries start at the channel's visibility watermark."""
+    plan = query_plan(conn, getattr(sqlite_repository, query_name))
+
+    assert any(
+        "idx_channel_messages_window (channel_id=? AND channel_message_id>?)" in step
+        for step in plan
+    )
+
+
+async def test_rate_limit_counts_use_type_index(conn: sqlite3.Connection) -> None:
+    """Test that the rate-limit counts range-scan the type/timestamp index."""
+    plan = query_plan(conn, sqlite_repository._COUNT_RECENT_TEXT_REQUESTS)
+
+    assert any(
+        "idx_channel_messages_type" in step and "message_timestamp>" in step
+        for step in plan
+    )
+
+
+async def test_channel_lookup_uses_unique_index(conn: sqlite3.Connection) -> None:
+    """Test that looking a channel up by discord_id uses its unique index."""
+    plan = query_plan(conn, sqlite_repository._SELECT_CHANNEL)
+
+    assert len(plan) == 1
+    assert plan[0].startswith("SEARCH channels USING")
+    assert "idx_channels_discord_id (discord_id=?)" in plan[0]
@@ -7,12 +7,23 @@ and RateLimitRepository protocols.
 All tests use an in-memory SQLite database for isolation and speed.
 """
 
+import asyncio
+import base64
+import hashlib
+import json
 import sqlite3
+import threading
 
 import pytest
 import pytest_asyncio
 
-from src.adapters.sqlite_repository import SQLiteRepository
+from src.adapters.sqlite_repository import (
+    _CREATE_CHANNEL_MESSAGES_TABLE,
+    _CREATE_CHANNELS_TABLE,
+    _CREATE_VENDORS_TABLE,
+    _SCHEMA_MIGRATIONS,
+    SQLiteRepository,
+)
 from src.ports.repositories import (
     ApiKey,
     Channel,
@@ -811,11 +822,12 @@ class TestEdgeCases:
         """Test that async context manager properly manages connection."""
         async with SQLiteRepository(":memory:") as repo:
             # Should be connected and usable
+            assert repo.is_connected is True
             channel = await repo.create_channel(12345)
             assert channel.external_id == 12345
 
         # After exiting context, connection should be closed
-        # We can't easily test this directly, but verify no exception was raised
+        assert repo.is_connected is False
 
     async def test_clear_messages_preserves_other_channels(
         self, repo: SQLiteRepository
@@ -1497,3 +1509,805 @@ class TestSearchRejectionRepository:
         assert "idx_search_rejections_user_id" in indexes
         assert "idx_search_rejections_channel_id" in indexes
         assert "idx_search_rejections_created_at" in indexes
+
+
+# =============================================================================
+# WAL Mode Tests
+# =============================================================================
+
+
+@pytest_asyncio.fixture
+async def wal_repo(tmp_path) -> SQLiteRepository:
+    """Provides a file-backed repository running in WAL mode.
+
+    Yields:
+        SQLiteRepository: A connected repository with a two-connection reader pool.
+    """
+    async with SQLiteRepository(
+        tmp_path / "wal.db", wal_mode=True, read_pool_size=2
+    ) as repository:
+        yield repository
+
+
+class TestWalMode:
+    """Tests for the WAL reader pool / single writer connection mode."""
+
+    async def test_enables_wal_journal(self, wal_repo: SQLiteRepository) -> None:
+        """Test that the writer connection runs in WAL journal mode."""
+        conn = wal_repo._ensure_connected()
+        row = conn.execute("PRAGMA journal_mode").fetchone()
+
+        assert wal_repo.wal_mode is True
+        assert row[0] == "wal"
+
+    async def test_memory_database_falls_back_to_single_connection(self) -> None:
+        """Test that :memory: ignores wal_mode since connections can't share it."""
+        async with SQLiteRepository(":memory:", wal_mode=True) as repo:
+            assert repo.wal_mode is False
+            assert repo._readers == []
+            channel = await repo.create_channel(12345)
+            assert await repo.get_channel(12345) == channel
+
+    async def test_readers_are_read_only(self, wal_repo: SQLiteRepository) -> None:
+        """Test that pooled reader connections reject writes."""
+        assert len(wal_repo._readers) == 2
+
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            wal_repo._readers[0].execute("INSERT INTO channels(discord_id) VALUES (1)")
+
+    async def test_reads_see_committed_writes(self, wal_repo: SQLiteRepository) -> None:
+        """Test that a read issued after a write observes the committed row."""
+        await wal_repo.create_channel(12345)
+        vendor = await wal_repo.create_vendor("Anthropic", "claude-3-sonnet")
+
+        await wal_repo.save_message(
+            Message(
+                channel_id=12345,
+                vendor_id=vendor.id,
+                message_type="prompt",
+                content="Hello",
+            )
+        )
+
+        messages = await wal_repo.get_visible_messages(12345, "Anthropic")
+        assert [m.content for m in messages] == ["Hello"]
+
+    async def test_concurrent_writes_are_serialized(
+        self, wal_repo: SQLiteRepository
+    ) -> None:
+        """Test that many concurrent writes all land without lock errors."""
+        await wal_repo.create_channel(12345)
+        vendor = await wal_repo.create_vendor("Anthropic", "claude-3-sonnet")
+
+        ids = await asyncio.gather(
+            *(
+                wal_repo.save_message(
+                    Message(
+                        channel_id=12345,
+                        vendor_id=vendor.id,
+                        message_type="prompt",
+                        content=f"Message {i}",
+                    )
+                )
+                for i in range(50)
+            )
+        )
+
+        assert len(set(ids)) == 50
+        messages = await wal_repo.get_visible_messages(12345, "Anthropic")
+        assert len(messages) == 50
+
+    async def test_concurrent_channel_creation_does_not_duplicate(
+        self, wal_repo: SQLiteRepository
+    ) -> None:
+        """Test that racing creates for one channel produce a single row."""
+        channels = await asyncio.gather(
+            *(wal_repo.create_channel(12345) for _ in range(10))
+        )
+
+        assert len({c.id for c in channels}) == 1
+
+    async def test_failed_write_rolls_back(self, wal_repo: SQLiteRepository) -> None:
+        """Test that an exception inside a write leaves no partial changes."""
+        await wal_repo.add_ban(1, "user", "spam", "admin")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await wal_repo.add_ban(1, "user", "spam again", "admin")
+
+        conn = wal_repo._ensure_connected()
+        history = conn.execute("SELECT COUNT(*) FROM ban_history").fetchone()[0]
+        assert history == 1
+
+    async def test_close_drains_writer_and_readers(self, tmp_path) -> None:
+        """Test that close stops the writer task and closes all connections."""
+        repo = SQLiteRepository(tmp_path / "close.db", wal_mode=True)
+        await repo.connect()
+        await repo.create_channel(12345)
+
+        await repo.close()
+
+        assert repo._executor is None
+        assert repo._readers == []
+        with pytest.raises(RuntimeError, match="Database not connected"):
+            await repo.get_channel(12345)
+
+    def test_rejects_invalid_pool_size(self) -> None:
+        """Test that a non-positive reader pool size is rejected."""
+        with pytest.raises(ValueError, match="read_pool_size"):
+            SQLiteRepository(":memory:", read_pool_size=0)
+
+    async def test_executor_stats_track_both_lanes(
+        self, wal_repo: SQLiteRepository
+    ) -> None:
+        """Test that reads and writes are counted on their own lanes."""
+        writes_before = wal_repo.executor_stats()["writer"]["completed"]
+
+        await wal_repo.create_channel(12345)
+        await wal_repo.get_channel(12345)
+
+        stats = wal_repo.executor_stats()
+        assert stats["reader"]["threads"] == 2
+        assert stats["writer"]["threads"] == 1
+        assert stats["writer"]["completed"] > writes_before
+        assert stats["reader"]["completed"] >= 1
+        assert stats["reader"]["queue_depth"] == 0
+
+    async def test_db_work_does_not_use_default_executor(
+        self, wal_repo: SQLiteRepository
+    ) -> None:
+        """Test that queries run on the repository's own threads."""
+        import threading
+
+        def thread_name_sync(conn: sqlite3.Connection) -> str:
+            return threading.current_thread().name
+
+        assert (await wal_repo._read(thread_name_sync)).startswith("db-reader")
+        assert (await wal_repo._write(thread_name_sync)).startswith("db-writer")
+
+
+# =============================================================================
+# Image Blob Store Tests
+# =============================================================================
+
+
+def _b64(data: bytes) -> str:
+    """Encode bytes as a base64 string like the image pipeline does."""
+    return base64.b64encode(data).decode("ascii")
+
+
+def _migration_version(name: str) -> int:
+    """Return the user_version a schema migration sets when it is applied."""
+    return [migration for migration, _steps in _SCHEMA_MIGRATIONS].index(name) + 1
+
+
+class TestImageBlobStore:
+    """Tests for content-addressed storage of message images."""
+
+    async def _save_image_message(
+        self, repo: SQLiteRepository, images: list[dict], content: str = "Image"
+    ) -> int:
+        vendor = await repo.get_vendor("Anthropic")
+        assert vendor is not None
+        return await repo.save_message_with_images(
+            Message(
+                channel_id=12345,
+                vendor_id=vendor.id,
+                message_type="prompt",
+                content=content,
+            ),
+            images,
+        )
+
+    async def test_message_row_stores_reference_not_payload(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that the message row keeps only a blob reference."""
+        repo = repo_with_channel_and_vendor
+        payload = b"\x89PNG fake image bytes"
+        await self._save_image_message(repo, [{"filename": "a.jpeg", "image": _b64(payload)}])
+
+        conn = repo._ensure_connected()
+        stored = json.loads(
+            conn.execute("SELECT message_images FROM channel_messages").fetchone()[0]
+        )
+        assert stored == [
+            {"filename": "a.jpeg", "blob": hashlib.sha256(payload).hexdigest()}
+        ]
+        blob = conn.execute("SELECT data, byte_size FROM image_blobs").fetchone()
+        assert blob["data"] == payload
+        assert blob["byte_size"] == len(payload)
+
+    async def test_get_latest_images_loads_payload(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that image queries return the original base64 payload."""
+        repo = repo_with_channel_and_vendor
+        image = {"filename": "a.jpeg", "image": _b64(b"pixels"), "source_url": "https://x"}
+        await self._save_image_message(repo, [image])
+
+        messages = await repo.get_latest_images(12345, "Anthropic", limit=10)
+
+        assert messages[0].images[0].url == image
+
+    async def test_identical_images_are_deduplicated(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that the same bytes are stored once and reference-counted."""
+        repo = repo_with_channel_and_vendor
+        image = {"filename": "a.jpeg", "image": _b64(b"same bytes")}
+        await self._save_image_message(repo, [image, image])
+        await self._save_image_message(repo, [image])
+
+        stats = await repo.get_image_blob_stats()
+        assert stats == {"blob_count": 1, "total_bytes": len(b"same bytes")}
+        conn = repo._ensure_connected()
+        assert conn.execute("SELECT ref_count FROM image_blobs").fetchone()[0] == 2
+
+    async def test_deleting_messages_releases_blobs(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that purging the last referencing message drops the blob."""
+        repo = repo_with_channel_and_vendor
+        image = {"filename": "a.jpeg", "image": _b64(b"bytes")}
+        first = await self._save_image_message(repo, [image])
+        second = await self._save_image_message(repo, [image])
+        conn = repo._ensure_connected()
+
+        conn.execute("DELETE FROM channel_messages WHERE channel_message_id = ?", (first,))
+        assert conn.execute("SELECT ref_count FROM image_blobs").fetchone()[0] == 1
+
+        conn.execute("DELETE FROM channel_messages WHERE channel_message_id = ?", (second,))
+        assert conn.execute("SELECT COUNT(*) FROM image_blobs").fetchone()[0] == 0
+
+    async def test_non_canonical_base64_stays_inline(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that payloads that would not round-trip are left untouched."""
+        repo = repo_with_channel_and_vendor
+        image = {"filename": "a.jpeg", "image": "not base64!"}
+        await self._save_image_message(repo, [image])
+
+        messages = await repo.get_latest_images(12345, "Anthropic", limit=10)
+
+        assert messages[0].images[0].url == image
+        assert (await repo.get_image_blob_stats())["blob_count"] == 0
+
+    async def test_legacy_inline_images_migrated_on_connect(self, tmp_path) -> None:
+        """Test that rows written before the blob store are converted."""
+        db_path = tmp_path / "legacy.db"
+        image = {"filename": "old.jpeg", "image": _b64(b"legacy bytes")}
+        async with SQLiteRepository(db_path) as repo:
+            await repo.create_channel(12345)
+            vendor = await repo.create_vendor("Anthropic", "claude")
+            conn = repo._ensure_connected()
+            conn.execute(
+                "INSERT INTO channel_messages(channel_id, vendor_id, message_type, "
+                "message_data, message_images) VALUES (1, ?, 'prompt', 'old', ?)",
+                (vendor.id, json.dumps([image])),
+            )
+            # Roll the database back to just before the blob migration
+            version = _migration_version("inline_image_blobs") - 1
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+
+        async with SQLiteRepository(db_path) as repo:
+            conn = repo._ensure_connected()
+            stored = conn.execute("SELECT message_images FROM channel_messages").fetchone()[0]
+            assert '"image"' not in stored
+            messages = await repo.get_latest_images(12345, "Anthropic", limit=10)
+            assert messages[0].images[0].url == image
+
+    async def test_inline_image_migration_runs_once(self, tmp_path) -> None:
+        """Test that the blob migration is not repeated on later connects."""
+        db_path = tmp_path / "app.db"
+        image = {"filename": "late.jpeg", "image": _b64(b"late bytes")}
+        async with SQLiteRepository(db_path) as repo:
+            await repo.create_channel(12345)
+            vendor = await repo.create_vendor("Anthropic", "claude")
+            conn = repo._ensure_connected()
+            conn.execute(
+                "INSERT INTO channel_messages(channel_id, vendor_id, message_type, "
+                "message_data, message_images) VALUES (1, ?, 'prompt', 'late', ?)",
+                (vendor.id, json.dumps([image])),
+            )
+            conn.commit()
+
+        async with SQLiteRepository(db_path) as repo:
+            conn = repo._ensure_connected()
+            stored = conn.execute("SELECT message_images FROM channel_messages").fetchone()[0]
+            assert json.loads(stored) == [image]
+
+
+# =============================================================================
+# Text Context Query Tests
+# =============================================================================
+
+
+class TestTextContextQueries:
+    """Tests for the text-only context query and the lazy image loader."""
+
+    async def _save_messages(self, repo: SQLiteRepository) -> tuple[int, int]:
+        vendor = await repo.get_vendor("Anthropic")
+        assert vendor is not None
+        text_id = await repo.save_message(
+            Message(channel_id=12345, vendor_id=vendor.id, message_type="prompt", content="Hi")
+        )
+        image_id = await repo.save_message_with_images(
+            Message(
+                channel_id=12345,
+                vendor_id=vendor.id,
+                message_type="prompt",
+                content="Look",
+            ),
+            [{"filename": "a.jpeg", "image": _b64(b"pixels")}],
+        )
+        return text_id, image_id
+
+    async def test_text_messages_match_visible_messages_without_images(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that the text query returns the same rows with no images."""
+        repo = repo_with_channel_and_vendor
+        await self._save_messages(repo)
+
+        visible = await repo.get_visible_messages(12345, "All Models")
+        text = await repo.get_visible_text_messages(12345, "All Models")
+
+        assert [m.id for m in text] == [m.id for m in visible]
+        assert [m.content for m in text] == ["Hi", "Look"]
+        assert all(m.images == [] for m in text)
+
+    async def test_text_messages_never_read_image_columns(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that the text query does not touch image data at all."""
+        repo = repo_with_channel_and_vendor
+        await self._save_messages(repo)
+        columns_read: set[tuple[str, str]] = set()
+
+        def authorizer(action: int, arg1, arg2, db_name, trigger) -> int:
+            if action == sqlite3.SQLITE_READ:
+                columns_read.add((arg1, arg2))
+            return sqlite3.SQLITE_OK
+
+        conn = repo._ensure_connected()
+        conn.set_authorizer(authorizer)
+        try:
+            await repo.get_visible_text_messages(12345, "All Models")
+        finally:
+            conn.set_authorizer(None)
+
+        assert ("channel_messages", "message_data") in columns_read
+        assert ("channel_messages", "message_images") not in columns_read
+        assert not any(table == "image_blobs" for table, _ in columns_read)
+
+    async def test_load_message_images_resolves_payloads(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that images are loaded on demand for the requested messages."""
+        repo = repo_with_channel_and_vendor
+        text_id, image_id = await self._save_messages(repo)
+
+        images = await repo.load_message_images([text_id, image_id, 999])
+
+        assert list(images) == [image_id]
+        assert images[image_id][0].url == {"filename": "a.jpeg", "image": _b64(b"pixels")}
+
+    async def test_load_message_images_empty_ids(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that an empty ID list returns an empty mapping."""
+        assert await repo_with_channel_and_vendor.load_message_images([]) == {}
+
+
+# =============================================================================
+# Schema Migration Tests
+# =============================================================================
+
+
+class TestSchemaMigrations:
+    """Tests for versioned schema migrations tracked by PRAGMA user_version."""
+
+    async def test_fresh_database_is_at_latest_version(
+        self, repo: SQLiteRepository
+    ) -> None:
+        """Test that a new database has every migration applied."""
+        conn = repo._ensure_connected()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        assert version == len(_SCHEMA_MIGRATIONS)
+
+    async def test_indexes_created(self, repo: SQLiteRepository) -> None:
+        """Test that the migration indexes exist."""
+        conn = repo._ensure_connected()
+        names = {
+            row["name"]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        assert {
+            "idx_channels_discord_id",
+            "idx_channel_messages_window",
+            "idx_channel_messages_type",
+        } <= names
+        assert "idx_channel_messages_context" not in names
+
+    async def test_discord_id_is_unique(self, repo: SQLiteRepository) -> None:
+        """Test that a second row for the same discord_id is rejected."""
+        await repo.create_channel(12345)
+        conn = repo._ensure_connected()
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO channels(discord_id) VALUES (12345)")
+
+    async def test_duplicate_channels_merged_on_upgrade(self, tmp_path) -> None:
+        """Test that pre-existing duplicate channels are merged before indexing."""
+        db_path = tmp_path / "legacy.db"
+        legacy = sqlite3.connect(db_path)
+        legacy.execute(_CREATE_CHANNELS_TABLE)
+        legacy.execute(_CREATE_VENDORS_TABLE)
+        legacy.execute(_CREATE_CHANNEL_MESSAGES_TABLE)
+        legacy.executescript(
+            """
+            INSERT INTO channels(discord_id) VALUES (12345), (12345), (67890);
+            INSERT INTO vendors(vendor_name, vendor_model_name)
+                VALUES ('Anthropic', 'claude');
+            INSERT INTO channel_messages(channel_id, vendor_id, message_type, message_data)
+                VALUES (1, 1, 'prompt', 'first'), (2, 1, 'prompt', 'on duplicate');
+            """
+        )
+        legacy.close()
+
+        async with SQLiteRepository(db_path) as repo:
+            conn = repo._ensure_connected()
+            rows = conn.execute(
+                "SELECT channel_id, discord_id FROM channels ORDER BY channel_id"
+            ).fetchall()
+            assert [tuple(row) for row in rows] == [(1, 12345), (3, 67890)]
+            messages = await repo.get_visible_messages(12345, "Anthropic")
+            assert sorted(m.content for m in messages) == ["first", "on duplicate"]
+
+    async def test_applied_migrations_are_not_rerun(self, tmp_path) -> None:
+        """Test that reconnecting leaves an up-to-date database untouched."""
+        db_path = tmp_path / "app.db"
+        async with SQLiteRepository(db_path):
+            pass
+
+        async with SQLiteRepository(db_path) as repo:
+            conn = repo._ensure_connected()
+            conn.execute("DROP INDEX idx_channel_messages_type")
+            conn.commit()
+
+        async with SQLiteRepository(db_path) as repo:
+            conn = repo._ensure_connected()
+            assert conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE name = 'idx_channel_messages_type'"
+            ).fetchone()[0] == 0
+
+
+# =============================================================================
+# Visibility Watermark Tests
+# =============================================================================
+
+
+class TestVisibilityWatermark:
+    """Tests for windowing via the per-channel visible_from_id watermark."""
+
+    async def _add_messages(
+        self, repo: SQLiteRepository, vendor_name: str, count: int
+    ) -> list[int]:
+        vendor = await repo.get_vendor(vendor_name)
+        assert vendor is not None
+        return [
+            await repo.save_message(
+                Message(
+                    channel_id=12345,
+                    vendor_id=vendor.id,
+                    message_type="prompt",
+                    content=f"{vendor_name} {i}",
+                )
+            )
+            for i in range(count)
+        ]
+
+    def _watermark(self, repo: SQLiteRepository) -> int:
+        conn = repo._ensure_connected()
+        return conn.execute(
+            "SELECT visible_from_id FROM channels WHERE discord_id = 12345"
+        ).fetchone()[0]
+
+    async def test_deactivate_moves_watermark_without_rewriting_rows(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that windowing only updates the channel's watermark."""
+        repo = repo_with_channel_and_vendor
+        ids = await self._add_messages(repo, "Anthropic", 5)
+
+        await repo.deactivate_old_messages(12345, "All Models", 2)
+
+        assert self._watermark(repo) == ids[3]
+        conn = repo._ensure_connected()
+        hidden = conn.execute(
+            "SELECT COUNT(*) FROM channel_messages WHERE visible = FALSE"
+        ).fetchone()[0]
+        assert hidden == 0
+        messages = await repo.get_visible_text_messages(12345, "All Models")
+        assert [m.id for m in messages] == ids[3:]
+
+    async def test_watermark_never_moves_backwards(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that a larger window does not bring hidden messages back."""
+        repo = repo_with_channel_and_vendor
+        ids = await self._add_messages(repo, "Anthropic", 5)
+
+        await repo.deactivate_old_messages(12345, "All Models", 2)
+        await repo.deactivate_old_messages(12345, "All Models", 10)
+
+        messages = await repo.get_visible_messages(12345, "All Models")
+        assert [m.id for m in messages] == ids[3:]
+
+    async def test_window_skips_individually_hidden_messages(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that messages hidden by the image limit do not count toward the window."""
+        repo = repo_with_channel_and_vendor
+        ids = await self._add_messages(repo, "Anthropic", 4)
+        await repo.deactivate_image_messages(12345, [ids[3]])
+
+        await repo.deactivate_old_messages(12345, "All Models", 2)
+
+        messages = await repo.get_visible_messages(12345, "All Models")
+        assert [m.id for m in messages] == ids[1:3]
+
+    async def test_clear_then_new_messages(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that clearing hides history and later messages are visible."""
+        repo = repo_with_channel_and_vendor
+        await self._add_messages(repo, "Anthropic", 3)
+
+        await repo.clear_messages(12345, "All Models")
+        assert await repo.get_visible_messages(12345, "All Models") == []
+
+        new_ids = await self._add_messages(repo, "Anthropic", 1)
+        messages = await repo.get_visible_messages(12345, "All Models")
+        assert [m.id for m in messages] == new_ids
+
+    async def test_vendor_window_hides_only_that_vendor(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that a per-vendor window leaves other vendors and the watermark alone."""
+        repo = repo_with_channel_and_vendor
+        await repo.create_vendor("OpenAI", "gpt")
+        anthropic_ids = await self._add_messages(repo, "Anthropic", 3)
+        openai_ids = await self._add_messages(repo, "OpenAI", 2)
+
+        await repo.deactivate_old_messages(12345, "Anthropic", 1)
+
+        assert self._watermark(repo) == 0
+        messages = await repo.get_visible_messages(12345, "All Models")
+        assert [m.id for m in messages] == anthropic_ids[2:] + openai_ids
+
+    async def test_upgrade_backfills_watermark(self, tmp_path) -> None:
+        """Test that existing channels start their window at the oldest visible message."""
+        db_path = tmp_path / "legacy.db"
+        legacy = sqlite3.connect(db_path)
+        legacy.execute(_CREATE_CHANNELS_TABLE)
+        legacy.execute(_CREATE_VENDORS_TABLE)
+        legacy.execute(_CREATE_CHANNEL_MESSAGES_TABLE)
+        legacy.executescript(
+            """
+            INSERT INTO channels(discord_id) VALUES (12345), (67890);
+            INSERT INTO vendors(vendor_name, vendor_model_name)
+                VALUES ('Anthropic', 'claude');
+            INSERT INTO channel_messages(channel_id, vendor_id, message_type, visible)
+                VALUES (1, 1, 'prompt', FALSE), (1, 1, 'prompt', FALSE),
+                       (1, 1, 'prompt', TRUE), (2, 1, 'prompt', FALSE);
+            """
+        )
+        legacy.commit()
+        legacy.close()
+
+        async with SQLiteRepository(db_path) as repo:
+            conn = repo._ensure_connected()
+            rows = conn.execute(
+                "SELECT discord_id, visible_from_id FROM channels ORDER BY discord_id"
+            ).fetchall()
+            assert [tuple(row) for row in rows] == [(12345, 3), (67890, 5)]
+            messages = await repo.get_visible_messages(12345, "All Models")
+            assert [m.id for m in messages] == [3]
+
+
+class TestTokenAccounting:
+    """Tests for stored token counts and the per-channel running total."""
+
+    @pytest.fixture(autouse=True)
+    def word_tokens(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Count one token per word so totals are easy to predict."""
+        monkeypatch.setattr(
+            "src.adapters.sqlite_repository.try_count_tokens",
+            lambda text: len(text.split()),
+        )
+
+    async def _add(
+        self,
+        repo: SQLiteRepository,
+        content: str,
+        vendor_name: str = "Anthropic",
+        **flags: bool,
+    ) -> int:
+        vendor = await repo.get_vendor(vendor_name)
+        assert vendor is not None
+        return await repo.save_message(
+            Message(
+                channel_id=12345,
+                vendor_id=vendor.id,
+                message_type="prompt",
+                content=content,
+                **flags,
+            )
+        )
+
+    async def test_count_stored_and_returned(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that each message's count is stored once and read back."""
+        repo = repo_with_channel_and_vendor
+        await self._add(repo, "one two three")
+
+        messages = await repo.get_visible_text_messages(12345, "All Models")
+
+        assert [m.token_count for m in messages] == [3]
+        assert await repo.get_context_token_count(12345) == 3
+
+    async def test_count_taken_before_write_is_queued(
+        self,
+        repo_with_channel_and_vendor: SQLiteRepository,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that tokenizing runs on a reader thread, off the loop and writer."""
+        repo = repo_with_channel_and_vendor
+        counted_on: list[threading.Thread] = []
+
+        def count(text: str) -> int:
+            counted_on.append(threading.current_thread())
+            return len(text.split())
+
+        monkeypatch.setattr("src.adapters.sqlite_repository.try_count_tokens", count)
+        await self._add(repo, "one two")
+
+        assert len(counted_on) == 1
+        assert counted_on[0] is not threading.current_thread()
+        assert counted_on[0].name.startswith("db-reader")
+        assert await repo.get_context_token_count(12345) == 2
+
+    async def test_caller_count_is_reused(
+        self,
+        repo_with_channel_and_vendor: SQLiteRepository,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a count set on the message is stored without recounting."""
+        repo = repo_with_channel_and_vendor
+        vendor = await repo.get_vendor("Anthropic")
+        assert vendor is not None
+
+        def fail(text: str) -> int:
+            raise AssertionError("message was counted twice")
+
+        monkeypatch.setattr("src.adapters.sqlite_repository.try_count_tokens", fail)
+        await repo.save_message(
+            Message(
+                channel_id=12345,
+                vendor_id=vendor.id,
+                message_type="prompt",
+                content="one two three",
+                token_count=7,
+            )
+        )
+
+        assert await repo.get_context_token_count(12345) == 7
+
+    async def test_total_excludes_image_prompts_and_image_only_context(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that only text-context messages add to the total."""
+        repo = repo_with_channel_and_vendor
+        await self._add(repo, "a b")
+        await self._add(repo, "draw a cat", is_image_prompt=True)
+        await self._add(repo, "image only", is_image_only_context=True)
+
+        assert await repo.get_context_token_count(12345) == 2
+
+    async def test_window_and_clear_update_total(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that moving the watermark subtracts the hidden messages."""
+        repo = repo_with_channel_and_vendor
+        for content in ("a", "b c", "d e f"):
+            await self._add(repo, content)
+
+        await repo.deactivate_old_messages(12345, "All Models", 2)
+        assert await repo.get_context_token_count(12345) == 5
+
+        await repo.clear_messages(12345, "All Models")
+        assert await repo.get_context_token_count(12345) == 0
+
+        await self._add(repo, "g h")
+        assert await repo.get_context_token_count(12345) == 2
+
+    async def test_per_row_hides_update_total(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that vendor windows and image-limit hides subtract their rows."""
+        repo = repo_with_channel_and_vendor
+        await repo.create_vendor("OpenAI", "gpt")
+        first = await self._add(repo, "a b")
+        await self._add(repo, "c d e", vendor_name="OpenAI")
+        await self._add(repo, "f")
+
+        await repo.deactivate_old_messages(12345, "Anthropic", 1)
+        assert await repo.get_context_token_count(12345) == 4
+
+        # Already hidden; must not be subtracted twice
+        await repo.deactivate_image_messages(12345, [first])
+        assert await repo.get_context_token_count(12345) == 4
+
+    async def test_total_matches_visible_context(
+        self, repo_with_channel_and_vendor: SQLiteRepository
+    ) -> None:
+        """Test that the running total equals a recount of the context."""
+        repo = repo_with_channel_and_vendor
+        for i in range(12):
+            await self._add(repo, "word " * (i + 1))
+            await repo.deactivate_old_messages(12345, "All Models", 5)
+
+        messages = await repo.get_visible_text_messages(12345, "All Models")
+        assert await repo.get_context_token_count(12345) == sum(
+            m.token_count or 0 for m in messages
+        )
+
+    async def test_failed_count_does_not_fail_save(
+        self,
+        repo_with_channel_and_vendor: SQLiteRepository,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a tokenizer failure stores NULL instead of raising."""
+        repo = repo_with_channel_and_vendor
+        monkeypatch.setattr(
+            "src.adapters.sqlite_repository.try_count_tokens", lambda text: None
+        )
+
+        await self._add(repo, "one two")
+
+        messages = await repo.get_visible_text_messages(12345, "All Models")
+        assert messages[0].token_count is None
+        assert await repo.get_context_token_count(12345) == 0
+
+    async def test_upgrade_backfills_counts(self, tmp_path) -> None:
+        """Test that existing messages are counted and totals rebuilt on connect."""
+        db_path = tmp_path / "legacy.db"
+        legacy = sqlite3.connect(db_path)
+        legacy.execute(_CREATE_CHANNELS_TABLE)
+        legacy.execute(_CREATE_VENDORS_TABLE)
+        legacy.execute(_CREATE_CHANNEL_MESSAGES_TABLE)
+        legacy.executescript(
+            """
+            INSERT INTO channels(discord_id) VALUES (12345);
+            INSERT INTO vendors(vendor_name, vendor_model_name)
+                VALUES ('Anthropic', 'claude');
+            INSERT INTO channel_messages(
+                channel_id, vendor_id, message_type, message_data, visible
+            )
+            VALUES (1, 1, 'prompt', 'old hidden text', FALSE),
+                   (1, 1, 'prompt', 'one two', TRUE),
+                   (1, 1, 'assistant', 'three four five', TRUE);
+            """
+        )
+        legacy.commit()
+        legacy.close()
+
+        async with SQLiteRepository(db_path) as repo:
+            conn = repo._ensure_connected()
+            counts = conn.execute(
+                "SELECT token_count FROM channel_messages ORDER BY channel_message_id"
+            ).fetchall()
+            assert [row[0] for row in counts] == [3, 2, 3]
+            assert await repo.get_context_token_count(12345) == 5
@@ -0,0 +1,72 @@
+"""Tests for the shared metrics snapshot formatter."""
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+from src.adapters.db_executor import LaneStats
+from src.core.bulkhead import BulkheadStats
+from src.core.stats import StatsSnapshot
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class ChildStats(StatsSnapshot):
+    ratio: float = 0.0
+
+
+@dataclass
+class ParentStats(StatsSnapshot):
+    derived = ("doubled",)
+    hidden = ("total",)
+    precision = 2
+
+    count: int = 0
+    total: float = 0.0
+    color: Color = Color.RED
+    child: ChildStats = field(default_factory=ChildStats)
+    children: dict[str, ChildStats] = field(default_factory=dict)
+
+    @property
+    def doubled(self) -> float:
+        return self.total * 2
+
+
+class TestStatsSnapshot:
+    """Tests for StatsSnapshot.to_dict."""
+
+    def test_formats_fields_and_derived_properties(self) -> None:
+        """Test hidden fields, rounding, enums and derived values."""
+        stats = ParentStats(count=3, total=1.23456)
+
+        assert stats.to_dict() == {
+            "count": 3,
+            "color": "red",
+            "child": {"ratio": 0.0},
+            "children": {},
+            "doubled": 2.47,
+        }
+
+    def test_nested_snapshots_use_their_own_precision(self) -> None:
+        """Test that nested snapshots are converted recursively."""
+        stats = ParentStats(children={"a": ChildStats(ratio=1 / 3)})
+
+        assert stats.to_dict()["children"] == {"a": {"ratio": 0.333}}
+
+    def test_existing_reports_keep_their_keys(self) -> None:
+        """Test that converted snapshots report the same keys as before."""
+        bulkhead = BulkheadStats(acquired=2, total_wait_seconds=0.003).to_dict()
+        lane = LaneStats(threads=2, completed=4, total_wait_ms=1.0).to_dict()
+
+        assert bulkhead["mean_wait_ms"] == 1.5
+        assert "total_wait_seconds" not in bulkhead
+        assert lane == {
+            "threads": 2,
+            "queue_depth": 0,
+            "in_flight": 0,
+            "completed": 4,
+            "max_wait_ms": 0.0,
+            "avg_wait_ms": 0.25,
+        }
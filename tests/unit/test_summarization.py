@@ -9,11 +9,13 @@ import pytest
 from src.core.haiku import (
     SummarizationError,
     _format_conversation_for_summary,
+    haiku_extend_summary,
     haiku_summarize_conversation,
 )
 from src.core.prompts.summarization import (
     GUIDANCE_TEMPLATE,
     SUMMARIZATION_PROMPT,
+    build_rolling_summarization_prompt,
     build_summarization_prompt,
 )
 
@@ -108,7 +110,7 @@ class TestHaikuSummarizeConversation:
     @pytest.mark.asyncio
     async def test_returns_summary_response(self) -> None:
         """Test that summarization returns the API response."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="Summary of conversation: Test")]
 
@@ -126,7 +128,7 @@ class TestHaikuSummarizeConversation:
     @pytest.mark.asyncio
     async def test_passes_formatted_conversation(self) -> None:
         """Test that conversation is formatted and passed to API."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="Summary")]
 
@@ -151,7 +153,7 @@ class TestHaikuSummarizeConversation:
     @pytest.mark.asyncio
     async def test_uses_summarization_prompt(self) -> None:
         """Test that summarization prompt is used as system prompt."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="Summary")]
 
@@ -173,7 +175,7 @@ class TestHaikuSummarizeConversation:
     @pytest.mark.asyncio
     async def test_includes_guidance_in_prompt(self) -> None:
         """Test that guidance is included in system prompt when provided."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="Summary")]
 
@@ -214,7 +216,7 @@ class TestHaikuSummarizeConversation:
     @pytest.mark.asyncio
     async def test_strips_whitespace_from_result(self) -> None:
         """Test that result is stripped of leading/trailing whitespace."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="  Summary with spaces  \n")]
 
@@ -243,7 +245,7 @@ class TestHaikuSummarizeConversation:
     @pytest.mark.asyncio
     async def test_raises_on_timeout(self) -> None:
         """Test that timeout raises SummarizationError."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_client = MagicMock()
             mock_client.messages.create = AsyncMock(side_effect=TimeoutError())
             mock_client_class.return_value = mock_client
@@ -259,7 +261,7 @@ class TestHaikuSummarizeConversation:
     @pytest.mark.asyncio
     async def test_uses_adequate_max_tokens(self) -> None:
         """Test that max_tokens is set high enough for summaries."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="Summary")]
 
@@ -278,6 +280,47 @@ class TestHaikuSummarizeConversation:
             assert call_kwargs["max_tokens"] >= 1024
 
 
+class TestHaikuExtendSummary:
+    """Tests for the haiku_extend_summary function."""
+
+    @pytest.mark.asyncio
+    async def test_sends_summary_and_new_messages(self) -> None:
+        """Test that the existing summary and new messages are both sent."""
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
+            mock_response = MagicMock()
+            mock_response.content = [MagicMock(text="Summary of conversation: v2")]
+
+            mock_client = MagicMock()
+            mock_create = AsyncMock(return_value=mock_response)
+            mock_client.messages.create = mock_create
+            mock_client_class.return_value = mock_client
+
+            with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+                result = await haiku_extend_summary(
+                    "Summary of conversation: v1",
+                    [{"role": "user", "content": "Next question"}],
+                )
+
+        assert result == "Summary of conversation: v2"
+        call_kwargs = mock_create.call_args.kwargs
+        assert call_kwargs["system"] == build_rolling_summarization_prompt()
+        user_message = call_kwargs["messages"][0]["content"]
+        assert "Existing summary:\nSummary of conversation: v1" in user_message
+        assert "New messages:\nUser: Next question" in user_message
+
+    @pytest.mark.asyncio
+    async def test_raises_on_no_new_messages(self) -> None:
+        """Test that extending with nothing new raises SummarizationError."""
+        with pytest.raises(SummarizationError, match="No new messages"):
+            await haiku_extend_summary("Summary", [])
+
+    def test_rolling_prompt_includes_guidance(self) -> None:
+        """Test that guidance is added to the rolling prompt."""
+        result = build_rolling_summarization_prompt("the deploy")
+        assert "the deploy" in result
+        assert "{guidance_section}" not in result
+
+
 class TestSummarizationPromptContent:
     """Tests for the content of the summarization prompt."""
 
@@ -342,7 +385,7 @@ class TestSummarizationWithSampleConversation:
         self, sample_conversation: list[dict[str, str]]
     ) -> None:
         """Test that sample conversation is summarized correctly."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [
                 MagicMock(
@@ -370,7 +413,7 @@ class TestSummarizationWithSampleConversation:
         self, sample_conversation: list[dict[str, str]]
     ) -> None:
         """Test that guidance focuses the summary on specific aspects."""
-        with patch("src.core.haiku.AsyncAnthropic") as mock_client_class:
+        with patch("src.core.anthropic_clients.AsyncAnthropic") as mock_client_class:
             mock_response = MagicMock()
             mock_response.content = [MagicMock(text="Summary")]
 
@@ -0,0 +1,166 @@
+"""Tests for the batched background usage logger."""
+
+import asyncio
+import sqlite3
+from datetime import UTC, datetime
+
+import pytest
+
+from src.adapters.sqlite_repository import SQLiteRepository
+from src.adapters.usage_logger import UsageLogger
+from src.ports.repositories import UsageEvent
+
+
+def make_event(user_id: int = 1, outcome: str = "success") -> UsageEvent:
+    """Build a usage event for a text command."""
+    return UsageEvent(
+        user_id=user_id,
+        username=f"user{user_id}",
+        guild_id=None,
+        command_name="prompt",
+        command_type="text",
+        outcome=outcome,
+        timestamp=datetime.now(UTC),
+    )
+
+
+class RecordingSink:
+    """Sink that records each batch it receives."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[UsageEvent]] = []
+        self.fail = fail
+
+    async def __call__(self, events: list[UsageEvent]) -> int:
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append(list(events))
+        return len(events)
+
+
+class TestUsageLogger:
+    """Tests for UsageLogger."""
+
+    async def test_record_does_not_write_immediately(self) -> None:
+        """Test that recording only buffers the event."""
+        sink = RecordingSink()
+        usage_logger = UsageLogger(sink, batch_size=10)
+
+        usage_logger.record(make_event())
+
+        assert sink.batches == []
+        assert usage_logger.stats().pending == 1
+
+    async def test_full_batch_triggers_flush(self) -> None:
+        """Test that reaching batch_size wakes the background task."""
+        sink = RecordingSink()
+        usage_logger = UsageLogger(sink, batch_size=3, flush_interval=60)
+        usage_logger.start()
+        try:
+            for user_id in range(3):
+                usage_logger.record(make_event(user_id))
+            await asyncio.sleep(0.05)
+        finally:
+            await usage_logger.close()
+
+        assert [len(batch) for batch in sink.batches] == [3]
+
+    async def test_interval_flushes_partial_batch(self) -> None:
+        """Test that events are written after flush_interval even below batch_size."""
+        sink = RecordingSink()
+        usage_logger = UsageLogger(sink, batch_size=100, flush_interval=0.02)
+        usage_logger.start()
+        try:
+            usage_logger.record(make_event())
+            await asyncio.sleep(0.1)
+            assert [len(batch) for batch in sink.batches] == [1]
+        finally:
+            await usage_logger.close()
+
+    async def test_close_flushes_everything_in_batches(self) -> None:
+        """Test that shutdown writes all buffered events."""
+        sink = RecordingSink()
+        usage_logger = UsageLogger(sink, batch_size=2, flush_interval=60)
+
+        for user_id in range(5):
+            usage_logger.record(make_event(user_id))
+        await usage_logger.close()
+
+        assert [len(batch) for batch in sink.batches] == [2, 2, 1]
+        stats = usage_logger.stats()
+        assert (stats.written, stats.pending) == (5, 0)
+
+    async def test_full_buffer_drops_oldest(self) -> None:
+        """Test that the ring buffer keeps the newest events."""
+        sink = RecordingSink()
+        usage_logger = UsageLogger(sink, batch_size=10, capacity=3)
+
+        for user_id in range(5):
+            usage_logger.record(make_event(user_id))
+        await usage_logger.flush()
+
+        assert [event.user_id for event in sink.batches[0]] == [2, 3, 4]
+        assert usage_logger.stats().dropped == 2
+
+    async def test_failed_write_keeps_events(self) -> None:
+        """Test that a failed batch is requeued ahead of newer events."""
+        sink = RecordingSink(fail=True)
+        usage_logger = UsageLogger(sink, batch_size=10)
+        usage_logger.record(make_event(1))
+        await usage_logger.flush()
+
+        sink.fail = False
+        usage_logger.record(make_event(2))
+        await usage_logger.flush()
+
+        assert [event.user_id for event in sink.batches[0]] == [1, 2]
+        assert usage_logger.stats().failed_batches == 1
+
+    async def test_invalid_settings_rejected(self) -> None:
+        """Test that invalid sizes and intervals are rejected."""
+        with pytest.raises(ValueError):
+            UsageLogger(RecordingSink(), batch_size=0)
+        with pytest.raises(ValueError):
+            UsageLogger(RecordingSink(), flush_interval=0)
+
+
+class TestUsageBatchWrite:
+    """Tests for SQLiteRepository.log_command_usage_batch."""
+
+    async def test_batch_keeps_only_whitelisted_unbanned_users(self) -> None:
+        """Test that eligibility is checked inside the batched INSERT."""
+        repo = SQLiteRepository(":memory:")
+        await repo.connect()
+        try:
+            await repo.add_to_whitelist(1, "user1", "admin")
+            await repo.add_to_whitelist(2, "user2", "admin")
+            await repo.add_ban(2, "user2", "spam", "admin")
+
+            written = await repo.log_command_usage_batch(
+                [make_event(1), make_event(2), make_event(3), make_event(1)]
+            )
+
+            assert written == 2
+            top = await repo.get_top_users_by_usage(None)
+            assert [(row["user_id"], row["text_count"]) for row in top] == [(1, 2)]
+        finally:
+            await repo.close()
+
+    async def test_batch_stores_event_timestamp(self) -> None:
+        """Test that the time of the command, not of the flush, is stored."""
+        repo = SQLiteRepository(":memory:")
+        await repo.connect()
+        try:
+            await repo.add_to_whitelist(1, "user1", "admin")
+            event = make_event(1)
+            event.timestamp = datetime(2026, 3, 4, 5, 6, 7, tzinfo=UTC)
+
+            await repo.log_command_usage_batch([event])
+
+            def query_sync(conn: sqlite3.Connection) -> str:
+                row = conn.execute("SELECT timestamp FROM usage_log").fetchone()
+                return str(row[0])
+
+            assert await repo._read(query_sync) == "2026-03-04 05:06:07"
+        finally:
+            await repo.close()